@@ -0,0 +1,139 @@
+#!/usr/bin/env python3
+"""Benchmark for deduplicating entities predicted on overlapping text chunks.
+
+Simulates the predictions of a NER model on long documents split into
+overlapping chunks (100 chunks per document by default): every entity in an
+overlap region is predicted twice, by both adjacent chunks, with slightly
+different scores. Times ``BaseTextChunker.deduplicate_overlapping_entities``
+against the previous pairwise implementation, which compares each prediction
+with every kept prediction, and checks that both return the same entities.
+
+Usage::
+
+    python benchmarks/analyzer_chunk_deduplication.py --chunks 100 --documents 20
+"""
+
+import argparse
+import random
+import time
+from typing import List
+
+from presidio_analyzer import RecognizerResult
+from presidio_analyzer.chunkers import CharacterBasedTextChunker
+
+ENTITY_TYPES = ["PERSON", "LOCATION", "DATE_TIME", "ORGANIZATION", "PHONE_NUMBER"]
+
+
+def generate_predictions(
+    n_chunks: int,
+    chunk_size: int,
+    chunk_overlap: int,
+    entities_per_chunk: int,
+    rnd: random.Random,
+) -> List[RecognizerResult]:
+    """Generate the predictions of all chunks of one document."""
+    step = chunk_size - chunk_overlap
+    predictions = []
+    for chunk_index in range(n_chunks):
+        chunk_start = chunk_index * step
+        for _ in range(entities_per_chunk):
+            start = chunk_start + rnd.randint(0, chunk_size - 20)
+            entity = RecognizerResult(
+                entity_type=rnd.choice(ENTITY_TYPES),
+                start=start,
+                end=start + rnd.randint(3, 20),
+                score=rnd.uniform(0.5, 1.0),
+            )
+            predictions.append(entity)
+            if start - chunk_start >= step and chunk_index + 1 < n_chunks:
+                # The entity is in the overlap, so the next chunk predicts it too
+                predictions.append(
+                    RecognizerResult(
+                        entity_type=entity.entity_type,
+                        start=entity.start,
+                        end=entity.end,
+                        score=max(0.0, entity.score - rnd.uniform(0.0, 0.1)),
+                    )
+                )
+    return predictions
+
+
+def pairwise_deduplicate(
+    predictions: List[RecognizerResult], overlap_threshold: float = 0.5
+) -> List[RecognizerResult]:
+    """Compare each prediction with all kept ones (previous implementation)."""
+    unique = []
+    for pred in sorted(predictions, key=lambda p: p.score, reverse=True):
+        is_duplicate = False
+        for kept in unique:
+            if pred.entity_type == kept.entity_type:
+                overlap_start = max(pred.start, kept.start)
+                overlap_end = min(pred.end, kept.end)
+                if overlap_start < overlap_end:
+                    overlap_len = overlap_end - overlap_start
+                    pred_len = pred.end - pred.start
+                    kept_len = kept.end - kept.start
+                    if pred_len <= 0 or kept_len <= 0:
+                        continue
+                    if overlap_len / min(pred_len, kept_len) > overlap_threshold:
+                        is_duplicate = True
+                        break
+        if not is_duplicate:
+            unique.append(pred)
+    return sorted(unique, key=lambda p: p.start)
+
+
+def main() -> None:
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--chunks", type=int, default=100, help="Chunks per document")
+    parser.add_argument("--documents", type=int, default=20)
+    parser.add_argument("--chunk-size", type=int, default=250)
+    parser.add_argument("--chunk-overlap", type=int, default=50)
+    parser.add_argument("--entities-per-chunk", type=int, default=8)
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+
+    rnd = random.Random(args.seed)
+    documents = [
+        generate_predictions(
+            args.chunks,
+            args.chunk_size,
+            args.chunk_overlap,
+            args.entities_per_chunk,
+            rnd,
+        )
+        for _ in range(args.documents)
+    ]
+    n_predictions = sum(len(predictions) for predictions in documents)
+    print(
+        f"{args.documents} documents x {args.chunks} chunks, "
+        f"{n_predictions / args.documents:.0f} predictions per document"
+    )
+
+    chunker = CharacterBasedTextChunker(
+        chunk_size=args.chunk_size, chunk_overlap=args.chunk_overlap
+    )
+
+    start = time.perf_counter()
+    results = [chunker.deduplicate_overlapping_entities(p) for p in documents]
+    indexed_seconds = time.perf_counter() - start
+
+    start = time.perf_counter()
+    reference_results = [pairwise_deduplicate(p) for p in documents]
+    pairwise_seconds = time.perf_counter() - start
+
+    for result, reference in zip(results, reference_results):
+        assert [id(r) for r in result] == [id(r) for r in reference]
+
+    n_kept = sum(len(result) for result in results)
+    print(f"Kept {n_kept} of {n_predictions} predictions")
+    print(
+        f"pairwise: {pairwise_seconds * 1000 / args.documents:8.2f} ms/document\n"
+        f"indexed:  {indexed_seconds * 1000 / args.documents:8.2f} ms/document "
+        f"({pairwise_seconds / indexed_seconds:.1f}x faster)"
+    )
+
+
+if __name__ == "__main__":
+    main()
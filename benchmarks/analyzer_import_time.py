@@ -0,0 +1,107 @@
+#!/usr/bin/env python3
+"""Benchmark for the import time of presidio-analyzer (cold start).
+
+Runs each import scenario in a fresh interpreter with ``python -X importtime``
+(several times, keeping the fastest run), and reports the total import time,
+the number of imported presidio modules, and the slowest modules imported by
+the scenario (by self time). Use ``--output`` to save the results as JSON,
+e.g. to compare two revisions.
+
+Usage::
+
+    python benchmarks/analyzer_import_time.py --repeat 5 --top 10
+"""
+
+import argparse
+import json
+import subprocess
+import sys
+from typing import Dict, List, Tuple
+
+SCENARIOS = {
+    "package": "import presidio_analyzer",
+    "one recognizer": (
+        "from presidio_analyzer.predefined_recognizers import EmailRecognizer"
+    ),
+    "recognizer by name": (
+        "from presidio_analyzer.recognizer_registry.recognizers_loader_utils "
+        "import RecognizerListLoader\n"
+        "RecognizerListLoader.get_existing_recognizer_cls('EmailRecognizer')"
+    ),
+    "analyzer engine": "from presidio_analyzer import AnalyzerEngine",
+}
+
+
+def run_importtime(code: str) -> List[Tuple[str, int, int]]:
+    """Run code in a fresh interpreter and parse its -X importtime output.
+
+    :return: (module, self microseconds, cumulative microseconds) per import.
+    """
+    completed = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    imports = []
+    for line in completed.stderr.splitlines():
+        if not line.startswith("import time:") or "[us]" in line:
+            continue
+        self_us, cumulative_us, module = line[len("import time:") :].split("|")
+        imports.append((module.strip(), int(self_us), int(cumulative_us)))
+    return imports
+
+
+def measure(code: str, repeat: int) -> Dict:
+    """Measure a scenario, keeping the run with the lowest total import time."""
+    best = None
+    for _ in range(repeat):
+        imports = run_importtime(code)
+        # Top-level imports have no indentation, their cumulative times add up
+        total_us = sum(
+            cumulative for module, _, cumulative in imports if module == module.lstrip()
+        )
+        if best is None or total_us < best[0]:
+            best = (total_us, imports)
+
+    total_us, imports = best
+    return {
+        "total_ms": total_us / 1000,
+        "modules": len(imports),
+        "presidio_modules": sum(
+            1 for module, _, _ in imports if module.strip().startswith("presidio")
+        ),
+        "slowest": [
+            {"module": module.strip(), "self_ms": self_us / 1000}
+            for module, self_us, _ in sorted(imports, key=lambda i: -i[1])
+        ],
+    }
+
+
+def main() -> None:
+    """Run the benchmark and print the import time of each scenario."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--top", type=int, default=5)
+    parser.add_argument("--output", help="Path of a JSON file to save results to")
+    args = parser.parse_args()
+
+    results = {}
+    for name, code in SCENARIOS.items():
+        result = measure(code, args.repeat)
+        result["slowest"] = result["slowest"][: args.top]
+        results[name] = result
+        print(
+            f"{name:>20}: {result['total_ms']:8.1f} ms, {result['modules']} modules "
+            f"({result['presidio_modules']} presidio)"
+        )
+        for slow in result["slowest"]:
+            print(f"{'':>22}{slow['self_ms']:8.1f} ms  {slow['module']}")
+
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(results, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
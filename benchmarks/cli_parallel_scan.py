@@ -0,0 +1,110 @@
+#!/usr/bin/env python3
+"""Benchmark for scanning a repository with presidio-cli in parallel.
+
+Generates a synthetic repository (10k source and text files by default, a
+fraction of them with PII), then scans it the way ``presidio`` does with each
+of the given ``--jobs`` values, reporting the throughput (files/sec) of each
+run and checking that all runs report the same problems in the same order.
+Requires the spaCy model of the configuration (``en_core_web_lg`` by default).
+
+Usage::
+
+    python benchmarks/cli_parallel_scan.py --files 10000 --jobs 1 2 4 8
+"""
+
+import argparse
+import random
+import tempfile
+import time
+from pathlib import Path
+
+from presidio_cli.cli import analyze_files, find_files_recursively, load_config
+
+FIRST_NAMES = ["John", "Jane", "Alice", "Bob", "Maria", "David", "Sarah", "Ahmed"]
+LAST_NAMES = ["Smith", "Johnson", "Williams", "Brown", "Garcia", "Miller", "Cohen"]
+CODE_LINES = [
+    "def handler(event, context):",
+    "    return {'status': 200, 'body': json.dumps(event)}",
+    "for item in items:",
+    "    total += item.price * item.quantity",
+    "# TODO: refactor this module",
+    "logger.info('processing batch %s', batch_id)",
+    "",
+]
+
+
+def generate_repository(root: Path, n_files: int, seed: int = 42) -> None:
+    """Write ``n_files`` synthetic files to ``root``, ~20% of them with PII."""
+    rnd = random.Random(seed)
+    for i in range(n_files):
+        directory = root / f"pkg{i % 50}" / f"module{i % 7}"
+        directory.mkdir(parents=True, exist_ok=True)
+        lines = [rnd.choice(CODE_LINES) for _ in range(rnd.randint(10, 60))]
+        if rnd.random() < 0.2:
+            first, last = rnd.choice(FIRST_NAMES), rnd.choice(LAST_NAMES)
+            lines.insert(
+                rnd.randrange(len(lines)),
+                f"# contact {first} {last} at {first.lower()}.{last.lower()}"
+                f"@example.com or (212) 555-{rnd.randint(1000, 9999)}",
+            )
+        suffix = ".py" if i % 3 else ".md"
+        (directory / f"file{i}{suffix}").write_text("\n".join(lines) + "\n")
+
+
+def main() -> None:
+    """Run the benchmark and print a throughput report."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--files", type=int, default=10_000)
+    parser.add_argument("--jobs", type=int, nargs="+", default=[1, 2, 4])
+    parser.add_argument(
+        "--config-data",
+        default="extends: default",
+        help="presidio-cli configuration (as YAML source)",
+    )
+    parser.add_argument(
+        "--workdir", type=Path, default=None, help="Defaults to a temporary directory"
+    )
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        root = args.workdir or Path(tmp)
+        start = time.perf_counter()
+        generate_repository(root, args.files)
+        print(f"generated {args.files} files in {time.perf_counter() - start:.1f}s")
+
+        conf = load_config(config_data=args.config_data)
+        files = sorted(find_files_recursively([str(root)], conf))
+
+        reference = None
+        for jobs in args.jobs:
+            run_args = argparse.Namespace(
+                jobs=jobs,
+                config_data=args.config_data,
+                config_file=None,
+                threshold=None,
+                cache=None,
+                window_lines=None,
+            )
+            start = time.perf_counter()
+            problems = [
+                (
+                    file,
+                    [(p.line, p.column, p.type, p.score) for p in file_problems],
+                )
+                for file, file_problems in analyze_files(files, conf, run_args)
+            ]
+            elapsed = time.perf_counter() - start
+
+            n_problems = sum(len(file_problems) for _, file_problems in problems)
+            print(
+                f"jobs={jobs:<3} {len(files) / elapsed:10.1f} files/sec "
+                f"({elapsed:.1f}s, {n_problems} problems)"
+            )
+            if reference is None:
+                reference = problems
+            elif problems != reference:
+                raise RuntimeError(f"jobs={jobs} reported different problems")
+
+
+if __name__ == "__main__":
+    main()
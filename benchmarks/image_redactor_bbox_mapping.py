@@ -0,0 +1,172 @@
+#!/usr/bin/env python3
+"""Benchmark for mapping analyzer results to the bounding boxes of OCR words.
+
+Generates a synthetic dense page (2,500 OCR words with 300 entities of one to
+three words by default) and times
+``ImageAnalyzerEngine.map_analyzer_results_to_bounding_boxes`` against the
+previous implementation, which compared every OCR word with every analyzer
+result, and checks that both return the same bounding boxes.
+
+Usage::
+
+    python benchmarks/image_redactor_bbox_mapping.py --words 2500 --entities 300
+"""
+
+import argparse
+import random
+import time
+from typing import List, Tuple
+
+from presidio_analyzer import RecognizerResult
+from presidio_image_redactor import ImageAnalyzerEngine
+from presidio_image_redactor.entities import ImageRecognizerResult
+
+VOCABULARY = ["the", "patient", "was", "seen", "on", "for", "a", "follow-up", ""]
+ENTITY_WORDS = ["John", "Smith", "555-123-4567", "jane.doe@example.com", "Boston"]
+
+
+def make_page(
+    n_words: int, n_entities: int, seed: int = 42
+) -> Tuple[dict, str, List[RecognizerResult]]:
+    """Create OCR results of a page and the analyzer results of its text."""
+    rnd = random.Random(seed)
+    words = [rnd.choice(VOCABULARY) for _ in range(n_words)]
+    spans = set()
+    while len(spans) < n_entities:
+        start = rnd.randrange(n_words - 3)
+        spans.add((start, start + rnd.randint(1, 3)))
+    for start, end in spans:
+        words[start:end] = [rnd.choice(ENTITY_WORDS) for _ in range(start, end)]
+
+    offsets = [0]
+    for word in words:
+        offsets.append(offsets[-1] + len(word) + 1)
+    analyzer_results = [
+        RecognizerResult("PII", offsets[start], offsets[end] - 1, 0.85)
+        for start, end in spans
+    ]
+    ocr_result = {
+        "left": [(i % 20) * 50 for i in range(n_words)],
+        "top": [(i // 20) * 30 for i in range(n_words)],
+        "width": [len(word) * 8 for word in words],
+        "height": [20] * n_words,
+        "conf": [90.0] * n_words,
+        "text": words,
+    }
+    return ocr_result, " ".join(words), analyzer_results
+
+
+def previous_map_analyzer_results_to_bounding_boxes(
+    text_analyzer_results: List[RecognizerResult],
+    ocr_result: dict,
+    text: str,
+    allow_list: List[str],
+) -> List[ImageRecognizerResult]:
+    """Map entities to OCR words (previous implementation)."""
+    if (not ocr_result) or (not text_analyzer_results):
+        return []
+
+    bboxes = []
+    proc_indexes = 0
+    indexes = len(text_analyzer_results)
+
+    pos = 0
+    iter_ocr = enumerate(ocr_result["text"])
+    for index, word in iter_ocr:
+        if not word:
+            pos += 1
+        else:
+            for element in text_analyzer_results:
+                text_element = text[element.start : element.end]
+                # check position and text of ocr word matches recognized entity
+                if (max(pos, element.start) < min(element.end, pos + len(word))) and (
+                    (text_element in word) or (word in text_element)
+                ):
+                    yes_make_bbox_for_word = (
+                        (word is not None)
+                        and (word != "")
+                        and (word.isspace() is False)
+                        and (word not in allow_list)
+                    )
+                    # Do not add bbox for standalone spaces / empty strings
+                    if yes_make_bbox_for_word:
+                        bboxes.append(
+                            ImageRecognizerResult(
+                                element.entity_type,
+                                element.start,
+                                element.end,
+                                element.score,
+                                ocr_result["left"][index],
+                                ocr_result["top"][index],
+                                ocr_result["width"][index],
+                                ocr_result["height"][index],
+                            )
+                        )
+
+                        # add bounding boxes for all words in ocr dict
+                        # contained within the text of recognized entity
+                        # based on relative position in the full text
+                        while pos + len(word) < element.end:
+                            prev_word = word
+                            index, word = next(iter_ocr)
+                            yes_make_bbox_for_word = (
+                                (word is not None)
+                                and (word != "")
+                                and (word.isspace() is False)
+                                and (word not in allow_list)
+                            )
+                            if yes_make_bbox_for_word:
+                                bboxes.append(
+                                    ImageRecognizerResult(
+                                        element.entity_type,
+                                        element.start,
+                                        element.end,
+                                        element.score,
+                                        ocr_result["left"][index],
+                                        ocr_result["top"][index],
+                                        ocr_result["width"][index],
+                                        ocr_result["height"][index],
+                                    )
+                                )
+                            pos += len(prev_word) + 1
+                        proc_indexes += 1
+
+            if proc_indexes == indexes:
+                break
+            pos += len(word) + 1
+
+    return bboxes
+
+
+def main() -> None:
+    """Run the benchmark and print the mapping latency of both implementations."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--words", type=int, default=2500)
+    parser.add_argument("--entities", type=int, default=300)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    ocr_result, text, analyzer_results = make_page(args.words, args.entities)
+    print(f"Page: {args.words} OCR words, {args.entities} analyzer results")
+
+    results = {}
+    durations = {}
+    for name, func in [
+        ("previous", previous_map_analyzer_results_to_bounding_boxes),
+        ("current", ImageAnalyzerEngine.map_analyzer_results_to_bounding_boxes),
+    ]:
+        start = time.perf_counter()
+        for _ in range(args.repeat):
+            results[name] = func(analyzer_results, ocr_result, text, [])
+        durations[name] = (time.perf_counter() - start) / args.repeat
+        print(
+            f"{name:>8}: {durations[name] * 1000:8.2f} ms, "
+            f"{len(results[name])} bounding boxes"
+        )
+
+    assert results["previous"] == results["current"]
+    print(f"Speedup: {durations['previous'] / durations['current']:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
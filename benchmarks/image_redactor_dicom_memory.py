@@ -0,0 +1,135 @@
+#!/usr/bin/env python3
+"""Memory and time benchmark for redacting the pixel data of a DICOM instance.
+
+Builds a synthetic multi-frame greyscale instance (512x512x200 frames by
+default) and runs the pixel-data part of ``DicomImageRedactorEngine``
+redaction on it: copying the instance, decoding and rescaling the pixel data
+for OCR, selecting the mask color and applying the masks. OCR and text analysis
+are not run, as they are identical in both paths. Compares the current
+implementation with the previous one, which deep-copied the instance twice
+(including the decoded pixel array) and rescaled all frames at once in float,
+and checks that both produce the same pixel data.
+
+Usage::
+
+    python benchmarks/image_redactor_dicom_memory.py --frames 200
+"""
+
+import argparse
+import time
+import tracemalloc
+from copy import deepcopy
+
+import numpy as np
+import pydicom
+from presidio_image_redactor import DicomImageRedactorEngine
+from pydicom.dataset import FileDataset, FileMetaDataset
+from pydicom.uid import ExplicitVRLittleEndian, generate_uid
+
+BBOXES = [
+    {"top": 10, "left": 10, "width": 200, "height": 30},
+    {"top": 470, "left": 300, "width": 150, "height": 25},
+]
+
+
+def make_instance(rows: int, columns: int, frames: int, seed: int = 42) -> FileDataset:
+    """Create a synthetic uncompressed 16-bit MONOCHROME2 multi-frame instance."""
+    file_meta = FileMetaDataset()
+    file_meta.MediaStorageSOPClassUID = pydicom.uid.UID("1.2.840.10008.5.1.4.1.1.7")
+    file_meta.MediaStorageSOPInstanceUID = generate_uid()
+    file_meta.TransferSyntaxUID = ExplicitVRLittleEndian
+
+    instance = FileDataset(None, {}, file_meta=file_meta, preamble=b"\0" * 128)
+    instance.SOPClassUID = file_meta.MediaStorageSOPClassUID
+    instance.SOPInstanceUID = file_meta.MediaStorageSOPInstanceUID
+    instance.PatientName = "Doe^John"
+    instance.Rows = rows
+    instance.Columns = columns
+    instance.NumberOfFrames = frames
+    instance.SamplesPerPixel = 1
+    instance.PhotometricInterpretation = "MONOCHROME2"
+    instance.BitsAllocated = 16
+    instance.BitsStored = 12
+    instance.HighBit = 11
+    instance.PixelRepresentation = 0
+
+    rnd = np.random.default_rng(seed)
+    pixels = rnd.integers(0, 4096, size=(frames, rows, columns), dtype=np.uint16)
+    instance.PixelData = pixels.tobytes()
+    return instance
+
+
+def previous_rescale(instance: FileDataset) -> np.ndarray:
+    """Rescale the whole pixel array at once (previous implementation)."""
+    image_2d_float = instance.pixel_array.astype(float)
+    image_2d_scaled = (
+        (image_2d_float.max() - image_2d_float)
+        / (image_2d_float.max() - image_2d_float.min())
+    ) * 255.0
+    return np.uint8(image_2d_scaled)
+
+
+def previous_redaction(image: FileDataset) -> FileDataset:
+    """Pixel-data steps of the previous implementation."""
+    engine = DicomImageRedactorEngine
+    instance = deepcopy(image)
+    previous_rescale(instance)
+    redacted_instance = deepcopy(instance)
+    box_color = engine._get_most_common_pixel_value(instance, 0.75, "contrast")
+    for bbox in BBOXES:
+        top, left = bbox["top"], bbox["left"]
+        redacted_instance.pixel_array[
+            top : top + bbox["height"], left : left + bbox["width"]
+        ] = box_color
+    redacted_instance.PixelData = redacted_instance.pixel_array.tobytes()
+    return redacted_instance
+
+
+def current_redaction(image: FileDataset) -> FileDataset:
+    """Pixel-data steps of DicomImageRedactorEngine.redact_and_return_bbox."""
+    engine = DicomImageRedactorEngine
+    instance = engine._copy_dicom_instance(image)
+    engine._rescale_dcm_pixel_array(instance, True)
+    return engine._add_redact_box(instance, BBOXES, 0.75, "contrast", in_place=True)
+
+
+def measure(func, image: FileDataset):
+    """Return the result, duration (s) and peak traced memory (bytes) of func."""
+    tracemalloc.start()
+    start = time.perf_counter()
+    result = func(image)
+    duration = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return result, duration, peak
+
+
+def main() -> None:
+    """Run the benchmark and print a memory and time report."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=512)
+    parser.add_argument("--columns", type=int, default=512)
+    parser.add_argument("--frames", type=int, default=200)
+    args = parser.parse_args()
+
+    image = make_instance(args.rows, args.columns, args.frames)
+    mb = 1024 * 1024
+    print(
+        f"Instance: {args.rows}x{args.columns}x{args.frames} frames, "
+        f"PixelData {len(image.PixelData) / mb:.0f} MiB"
+    )
+
+    results = {}
+    for name, func in [
+        ("previous", previous_redaction),
+        ("current", current_redaction),
+    ]:
+        results[name], duration, peak = measure(func, image)
+        print(f"{name:>8}: {duration:6.2f} s, peak memory {peak / mb:7.0f} MiB")
+
+    assert results["previous"].PixelData == results["current"].PixelData
+    assert image.PixelData != results["current"].PixelData
+
+
+if __name__ == "__main__":
+    main()
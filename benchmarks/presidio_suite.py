@@ -0,0 +1,511 @@
+#!/usr/bin/env python3
+"""Benchmark suite of the Presidio analyzer, anonymizer, structured and image paths.
+
+Generates a deterministic synthetic PII corpus (see ``synthetic_pii_corpus.py``)
+and measures, for each analyzer configuration:
+
+- ``analyze``: ``AnalyzerEngine.analyze`` latency per language and document length
+- ``batch``: ``BatchAnalyzerEngine.analyze_iterator`` throughput per language
+- ``structured``: analysis and anonymization of a DataFrame with presidio-structured
+- ``image``: ``ImageRedactorEngine.redact`` on synthetic images (requires tesseract)
+
+and ``AnonymizerEngine.anonymize`` latency (``anonymize``) with the PII spans of
+the corpus, for several operators. The analyzer configurations are:
+
+- ``regex``: predefined pattern recognizers only, with a blank spaCy pipeline
+- ``spacy``: the spaCy NLP engine (``en_core_web_lg``, ``es/de_core_news_md``)
+- ``slim``: the slim spaCy NLP engine (``*_sm`` models, no NER)
+- ``transformers``: the transformers NLP engine (English only)
+
+Configurations, languages and scenarios whose models or packages are not
+installed are reported as skipped (models are never downloaded). Use
+``--output`` to save the results as JSON, and ``--compare`` to compare them
+with the results of another commit.
+
+Usage::
+
+    python benchmarks/presidio_suite.py --documents 10 --output results.json
+    python benchmarks/presidio_suite.py --configurations regex --compare results.json
+"""
+
+import argparse
+import importlib.metadata
+import json
+import platform
+import random
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Tuple
+
+from presidio_analyzer import AnalyzerEngine, BatchAnalyzerEngine, RecognizerResult
+from presidio_analyzer.nlp_engine import NlpEngineProvider, SpacyNlpEngine
+from presidio_analyzer.recognizer_registry import RecognizerRegistry
+from synthetic_pii_corpus import (
+    DOCUMENT_LENGTHS,
+    LANGUAGES,
+    Document,
+    generate_corpus,
+    pii_generators,
+)
+
+CONFIGURATIONS = ["regex", "spacy", "slim", "transformers"]
+SCENARIOS = ["analyze", "batch", "anonymize", "structured", "image"]
+
+# spaCy model of each language, per configuration
+SPACY_MODELS = {
+    "spacy": {"en": "en_core_web_lg", "es": "es_core_news_md", "de": "de_core_news_md"},
+    "slim": {"en": "en_core_web_sm", "es": "es_core_news_sm", "de": "de_core_news_sm"},
+    "transformers": {"en": "en_core_web_sm"},
+}
+TRANSFORMERS_MODEL = "StanfordAIMI/stanford-deidentifier-base"
+
+PACKAGES = [
+    "presidio-analyzer",
+    "presidio-anonymizer",
+    "presidio-structured",
+    "presidio-image-redactor",
+    "spacy",
+    "transformers",
+]
+
+
+def create_analyzer(
+    configuration: str, languages: List[str], workdir: Path
+) -> Tuple[AnalyzerEngine, List[str]]:
+    """Create the analyzer engine of a configuration.
+
+    :return: The engine, and the languages it supports among the given ones.
+    """
+    import spacy
+
+    if configuration == "regex":
+        models = []
+        for language in languages:
+            # A blank pipeline only tokenizes, and never needs to be downloaded
+            path = workdir / f"blank_{language}"
+            spacy.blank(language).to_disk(path)
+            models.append({"lang_code": language, "model_name": str(path)})
+        nlp_engine = SpacyNlpEngine(models=models)
+        nlp_engine.load()
+    else:
+        models = [
+            {"lang_code": language, "model_name": model_name}
+            for language, model_name in SPACY_MODELS[configuration].items()
+            if language in languages and spacy.util.is_package(model_name)
+        ]
+        if not models:
+            raise RuntimeError(
+                f"no spaCy model of the {configuration} configuration is installed "
+                f"for {languages}"
+            )
+        if configuration == "transformers":
+            for model in models:
+                model["model_name"] = {
+                    "spacy": model["model_name"],
+                    "transformers": TRANSFORMERS_MODEL,
+                }
+        nlp_engine = NlpEngineProvider(
+            nlp_configuration={"nlp_engine_name": configuration, "models": models}
+        ).create_engine()
+
+    supported_languages = [model["lang_code"] for model in models]
+    registry = RecognizerRegistry(supported_languages=supported_languages)
+    registry.load_predefined_recognizers(
+        languages=supported_languages, nlp_engine=nlp_engine
+    )
+    if configuration == "regex":
+        registry.remove_recognizer("SpacyRecognizer")
+    analyzer = AnalyzerEngine(
+        registry=registry,
+        nlp_engine=nlp_engine,
+        supported_languages=supported_languages,
+    )
+    return analyzer, supported_languages
+
+
+def summarize(
+    latencies: List[float], n_items: int, n_chars: int, elapsed: float
+) -> Dict:
+    """Summarize the timings of a scenario."""
+    result = {
+        "status": "ok",
+        "items": n_items,
+        "seconds": elapsed,
+        "items_per_sec": n_items / elapsed,
+        "chars_per_sec": n_chars / elapsed,
+    }
+    if latencies:
+        latencies = sorted(latencies)
+
+        def percentile(q: float) -> float:
+            return 1000 * latencies[min(len(latencies) - 1, int(len(latencies) * q))]
+
+        result["latency_ms"] = {
+            "mean": 1000 * sum(latencies) / len(latencies),
+            "p50": percentile(0.5),
+            "p95": percentile(0.95),
+            "max": 1000 * latencies[-1],
+        }
+    return result
+
+
+def recall(documents: List[Document], results: List[List[RecognizerResult]]) -> float:
+    """Proportion of the PII of the documents overlapped by a result of its type."""
+    n_entities = 0
+    n_found = 0
+    for document, document_results in zip(documents, results):
+        for entity_type, start, end in document.entities:
+            n_entities += 1
+            n_found += any(
+                r.entity_type == entity_type and r.start < end and start < r.end
+                for r in document_results
+            )
+    return n_found / n_entities if n_entities else 1.0
+
+
+def bench_analyze(
+    analyzer: AnalyzerEngine, documents: List[Document], language: str
+) -> Dict:
+    """Time AnalyzerEngine.analyze on each document."""
+    analyzer.analyze(documents[0].text, language=language)  # warm up
+    latencies = []
+    results = []
+    start = time.perf_counter()
+    for document in documents:
+        call_start = time.perf_counter()
+        results.append(analyzer.analyze(document.text, language=language))
+        latencies.append(time.perf_counter() - call_start)
+    elapsed = time.perf_counter() - start
+
+    n_chars = sum(len(document.text) for document in documents)
+    result = summarize(latencies, len(documents), n_chars, elapsed)
+    result["recall"] = recall(documents, results)
+    return result
+
+
+def bench_batch(
+    analyzer: AnalyzerEngine,
+    documents: List[Document],
+    language: str,
+    batch_size: int,
+) -> Dict:
+    """Time BatchAnalyzerEngine.analyze_iterator on all the documents."""
+    batch_analyzer = BatchAnalyzerEngine(analyzer)
+    texts = [document.text for document in documents]
+    batch_analyzer.analyze_iterator(texts[:1], language=language)  # warm up
+    start = time.perf_counter()
+    results = batch_analyzer.analyze_iterator(
+        texts, language=language, batch_size=batch_size
+    )
+    elapsed = time.perf_counter() - start
+
+    result = summarize([], len(texts), sum(len(text) for text in texts), elapsed)
+    result["recall"] = recall(documents, results)
+    return result
+
+
+def bench_anonymize(documents: List[Document], operators_name: str) -> Dict:
+    """Time AnonymizerEngine.anonymize on each document, with its PII spans."""
+    from presidio_anonymizer import AnonymizerEngine
+    from presidio_anonymizer.entities import OperatorConfig
+
+    operators = {"DEFAULT": OperatorConfig("replace")}
+    if operators_name == "mixed":
+        operators.update(
+            {
+                "PERSON": OperatorConfig(
+                    "mask", {"masking_char": "*", "chars_to_mask": 4, "from_end": True}
+                ),
+                "EMAIL_ADDRESS": OperatorConfig("hash"),
+                "CREDIT_CARD": OperatorConfig("redact"),
+            }
+        )
+    anonymizer = AnonymizerEngine()
+    analyzer_results = [
+        [
+            RecognizerResult(entity_type, start, end, 1.0)
+            for entity_type, start, end in document.entities
+        ]
+        for document in documents
+    ]
+    anonymizer.anonymize(documents[0].text, analyzer_results[0], operators)  # warm up
+
+    latencies = []
+    start = time.perf_counter()
+    for document, results in zip(documents, analyzer_results):
+        call_start = time.perf_counter()
+        anonymizer.anonymize(document.text, results, operators)
+        latencies.append(time.perf_counter() - call_start)
+    elapsed = time.perf_counter() - start
+
+    n_chars = sum(len(document.text) for document in documents)
+    return summarize(latencies, len(documents), n_chars, elapsed)
+
+
+def bench_structured(analyzer: AnalyzerEngine, n_rows: int, seed: int) -> Dict:
+    """Time the analysis and anonymization of a DataFrame with presidio-structured."""
+    import pandas as pd
+    from presidio_anonymizer.entities import OperatorConfig
+    from presidio_structured import PandasAnalysisBuilder, StructuredEngine
+
+    generators = pii_generators("en", random.Random(seed))
+    df = pd.DataFrame(
+        {
+            "name": [generators["PERSON"]() for _ in range(n_rows)],
+            "email": [generators["EMAIL_ADDRESS"]() for _ in range(n_rows)],
+            "phone": [generators["PHONE_NUMBER"]() for _ in range(n_rows)],
+            "city": [generators["LOCATION"]() for _ in range(n_rows)],
+            "amount": [str(i * 7 % 1000) for i in range(n_rows)],
+        }
+    )
+    builder = PandasAnalysisBuilder(analyzer)
+    engine = StructuredEngine()
+    operators = {"DEFAULT": OperatorConfig("replace")}
+
+    start = time.perf_counter()
+    analysis = builder.generate_analysis(df)
+    analysis_seconds = time.perf_counter() - start
+    engine.anonymize(df, analysis, operators)
+    elapsed = time.perf_counter() - start
+
+    n_chars = int(df.apply(lambda column: column.str.len().sum()).sum())
+    result = summarize([], n_rows, n_chars, elapsed)
+    result["analysis_seconds"] = analysis_seconds
+    result["entity_mapping"] = analysis.entity_mapping
+    return result
+
+
+def bench_image(
+    analyzer: AnalyzerEngine, documents: List[Document], n_images: int
+) -> Dict:
+    """Time ImageRedactorEngine.redact on images of the text of short documents."""
+    from PIL import Image, ImageDraw, ImageFont
+    from presidio_image_redactor import ImageAnalyzerEngine, ImageRedactorEngine
+
+    font = ImageFont.load_default(size=24)
+    images = []
+    for i in range(n_images):
+        image = Image.new("RGB", (1600, 600), "white")
+        draw = ImageDraw.Draw(image)
+        for line_no, document in enumerate(documents[i * 4 : i * 4 + 4]):
+            for part_no in range(0, len(document.text), 100):
+                y = 20 + (line_no * 3 + part_no // 100) * 40
+                draw.text(
+                    (20, y), document.text[part_no : part_no + 100], "black", font
+                )
+        images.append(image)
+
+    engine = ImageRedactorEngine(ImageAnalyzerEngine(analyzer_engine=analyzer))
+    engine.redact(images[0])  # warm up
+    latencies = []
+    start = time.perf_counter()
+    for image in images:
+        call_start = time.perf_counter()
+        engine.redact(image)
+        latencies.append(time.perf_counter() - call_start)
+    elapsed = time.perf_counter() - start
+    return summarize(latencies, len(images), 0, elapsed)
+
+
+def skip(name: str, error: Exception) -> Dict:
+    """Report a benchmark which cannot run here (e.g. missing model or package)."""
+    reason = f"{type(error).__name__}: {error}"
+    print(f"{name:<34} skipped ({reason.splitlines()[0]})")
+    return {"name": name, "status": "skipped", "reason": reason}
+
+
+def run(name: str, bench: Callable[[], Dict]) -> Dict:
+    """Run a benchmark, reporting it as skipped if it cannot run here."""
+    try:
+        result = {"name": name, **bench()}
+    except Exception as e:
+        return skip(name, e)
+
+    latency = result.get("latency_ms", {})
+    print(
+        f"{name:<34} {result['items_per_sec']:10.1f} items/sec "
+        f"{result['chars_per_sec'] / 1000:10.1f} kchars/sec"
+        + (f"  p50 {latency['p50']:8.2f} ms" if latency else "")
+        + (f"  recall {result['recall']:.2f}" if "recall" in result else "")
+    )
+    return result
+
+
+def get_metadata(args: argparse.Namespace) -> Dict:
+    """Describe the environment of the run, to compare results across commits."""
+    try:
+        commit = subprocess.run(
+            ["git", "rev-parse", "HEAD"],
+            cwd=Path(__file__).parent,
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        commit = None
+
+    versions = {}
+    for package in PACKAGES:
+        try:
+            versions[package] = importlib.metadata.version(package)
+        except importlib.metadata.PackageNotFoundError:
+            versions[package] = None
+
+    return {
+        "commit": commit,
+        "time": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+        "python": sys.version.split()[0],
+        "platform": platform.platform(),
+        "processor": platform.processor() or platform.machine(),
+        "versions": versions,
+        "arguments": {
+            k: v for k, v in vars(args).items() if k not in ("output", "compare")
+        },
+    }
+
+
+def compare(results: List[Dict], baseline_path: str, tolerance: float) -> None:
+    """Print the throughput of each benchmark relative to a previous run."""
+    with open(baseline_path) as f:
+        baseline = json.load(f)
+    previous = {r["name"]: r for r in baseline["results"] if r["status"] == "ok"}
+    print(f"\nCompared with {baseline_path} ({baseline['metadata'].get('commit')}):")
+    for result in results:
+        old = previous.get(result["name"])
+        if result["status"] != "ok" or old is None:
+            continue
+        ratio = result["items_per_sec"] / old["items_per_sec"]
+        flag = "  slower" if ratio < 1 - tolerance else ""
+        print(f"{result['name']:<34} {ratio:6.2f}x{flag}")
+
+
+def main() -> None:
+    """Run the benchmark suite and print a throughput report."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--configurations", nargs="+", choices=CONFIGURATIONS, default=CONFIGURATIONS
+    )
+    parser.add_argument("--scenarios", nargs="+", choices=SCENARIOS, default=SCENARIOS)
+    parser.add_argument(
+        "--languages", nargs="+", choices=list(LANGUAGES), default=list(LANGUAGES)
+    )
+    parser.add_argument(
+        "--lengths",
+        nargs="+",
+        choices=list(DOCUMENT_LENGTHS),
+        default=list(DOCUMENT_LENGTHS),
+    )
+    parser.add_argument(
+        "--documents",
+        type=int,
+        default=10,
+        help="Number of documents of each language and length",
+    )
+    parser.add_argument("--pii-density", type=float, default=0.3)
+    parser.add_argument("--batch-size", type=int, default=32)
+    parser.add_argument("--rows", type=int, default=1000, help="Rows of the DataFrame")
+    parser.add_argument("--images", type=int, default=3)
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--output", help="Path of a JSON file to save results to")
+    parser.add_argument("--compare", help="Path of the JSON results of a previous run")
+    parser.add_argument(
+        "--tolerance",
+        type=float,
+        default=0.1,
+        help="Relative slowdown reported when comparing results",
+    )
+    args = parser.parse_args()
+
+    corpus = generate_corpus(
+        args.documents, args.languages, args.lengths, args.pii_density, args.seed
+    )
+    n_entities = sum(len(document.entities) for document in corpus)
+    print(f"Generated {len(corpus)} documents with {n_entities} PII values")
+
+    def select(language: Optional[str] = None, length: Optional[str] = None):
+        return [
+            document
+            for document in corpus
+            if language in (None, document.language)
+            and length in (None, document.length)
+        ]
+
+    results = []
+    if "anonymize" in args.scenarios:
+        for operators_name in ("replace", "mixed"):
+            for length in args.lengths:
+                results.append(
+                    run(
+                        f"anonymize/{operators_name}/all/{length}",
+                        lambda o=operators_name, le=length: bench_anonymize(
+                            select(length=le), o
+                        ),
+                    )
+                )
+
+    with tempfile.TemporaryDirectory() as tmp:
+        for configuration in args.configurations:
+            try:
+                analyzer, languages = create_analyzer(
+                    configuration, args.languages, Path(tmp)
+                )
+            except Exception as e:
+                results.append(skip(configuration, e))
+                continue
+
+            for language in args.languages:
+                if language not in languages:
+                    error = RuntimeError(f"no {configuration} model for {language}")
+                    results.append(skip(f"{configuration}/{language}", error))
+                    continue
+                if "analyze" in args.scenarios:
+                    for length in args.lengths:
+                        results.append(
+                            run(
+                                f"analyze/{configuration}/{language}/{length}",
+                                lambda la=language, le=length: bench_analyze(
+                                    analyzer, select(la, le), la
+                                ),
+                            )
+                        )
+                if "batch" in args.scenarios:
+                    results.append(
+                        run(
+                            f"batch/{configuration}/{language}",
+                            lambda la=language: bench_batch(
+                                analyzer, select(la), la, args.batch_size
+                            ),
+                        )
+                    )
+
+            if "en" in languages and "structured" in args.scenarios:
+                results.append(
+                    run(
+                        f"structured/{configuration}/en",
+                        lambda: bench_structured(analyzer, args.rows, args.seed),
+                    )
+                )
+            if "en" in languages and "image" in args.scenarios:
+                results.append(
+                    run(
+                        f"image/{configuration}/en",
+                        lambda: bench_image(
+                            analyzer,
+                            generate_corpus(4 * args.images, ["en"], ["short"]),
+                            args.images,
+                        ),
+                    )
+                )
+
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump({"metadata": get_metadata(args), "results": results}, f, indent=2)
+    if args.compare:
+        compare(results, args.compare, args.tolerance)
+
+
+if __name__ == "__main__":
+    main()
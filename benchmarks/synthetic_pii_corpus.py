@@ -0,0 +1,259 @@
+#!/usr/bin/env python3
+"""Deterministic synthetic PII corpus generator for the Presidio benchmarks.
+
+Generates documents in several languages (English, Spanish and German) and
+lengths (short, medium and long), made of filler sentences and sentences with
+PII (names, emails, phone numbers, credit cards, IBANs, IP addresses, dates
+and locations) in the given proportion. The same seed always generates the
+same corpus, and each document comes with the spans of the PII it contains.
+Used by ``presidio_suite.py``, and can write the corpus as JSON Lines.
+
+Usage::
+
+    python benchmarks/synthetic_pii_corpus.py --documents 100 --output corpus.jsonl
+"""
+
+import argparse
+import json
+import random
+import re
+from dataclasses import asdict, dataclass, field
+from typing import Callable, Dict, List, Tuple
+
+# Approximate number of characters of a document of each length
+DOCUMENT_LENGTHS = {"short": 200, "medium": 2_000, "long": 20_000}
+
+LANGUAGES = {
+    "en": {
+        "first_names": ["John", "Jane", "Alice", "Robert", "Maria", "David", "Sarah"],
+        "last_names": ["Smith", "Johnson", "Williams", "Brown", "Miller", "Cohen"],
+        "locations": ["London", "New York", "Seattle", "Chicago", "Boston"],
+        "country": "GB",
+        "phone": lambda rnd: f"(212) 555-{rnd.randint(1000, 9999)}",
+        "date": lambda rnd: f"{rnd.randint(1, 12)}/{rnd.randint(1, 28)}/2024",
+        "fillers": [
+            "The quarterly report is attached for your review.",
+            "We will discuss the roadmap in the next meeting.",
+            "The build finished without errors after the last change.",
+            "Thanks again for your patience while we looked into this.",
+            "Let me know if you have any questions about the proposal.",
+            "The new dashboard makes it easier to follow the release.",
+        ],
+        "templates": [
+            "Please contact {PERSON} at {EMAIL_ADDRESS} about the invoice.",
+            "{PERSON} called from {PHONE_NUMBER} on {DATE_TIME}.",
+            "The card {CREDIT_CARD} was charged for the order shipped to {LOCATION}.",
+            "A login from {IP_ADDRESS} was recorded for {EMAIL_ADDRESS}.",
+            "Wire the refund to {IBAN_CODE}, account holder {PERSON}.",
+        ],
+    },
+    "es": {
+        "first_names": ["José", "María", "Carmen", "Javier", "Lucía", "Pablo"],
+        "last_names": ["García", "Fernández", "López", "Martínez", "Sánchez"],
+        "locations": ["Madrid", "Barcelona", "Sevilla", "Valencia", "Bilbao"],
+        "country": "ES",
+        "phone": lambda rnd: (
+            f"+34 6{rnd.randint(10, 99)} {rnd.randint(100, 999)} "
+            f"{rnd.randint(100, 999)}"
+        ),
+        "date": lambda rnd: f"{rnd.randint(1, 28)}/{rnd.randint(1, 12)}/2024",
+        "fillers": [
+            "El informe trimestral está adjunto para su revisión.",
+            "Hablaremos de la planificación en la próxima reunión.",
+            "La compilación terminó sin errores después del último cambio.",
+            "Gracias de nuevo por su paciencia mientras lo revisábamos.",
+            "Avíseme si tiene alguna pregunta sobre la propuesta.",
+        ],
+        "templates": [
+            "Por favor, contacte con {PERSON} en {EMAIL_ADDRESS} sobre la factura.",
+            "{PERSON} llamó desde el {PHONE_NUMBER} el {DATE_TIME}.",
+            "Se cobró el pedido enviado a {LOCATION} a la tarjeta {CREDIT_CARD}.",
+            "Se registró un acceso desde {IP_ADDRESS} para {EMAIL_ADDRESS}.",
+            "Transfiera el reembolso a {IBAN_CODE}, titular {PERSON}.",
+        ],
+    },
+    "de": {
+        "first_names": ["Hans", "Anna", "Lukas", "Sophie", "Jonas", "Lena"],
+        "last_names": ["Müller", "Schmidt", "Schneider", "Fischer", "Weber"],
+        "locations": ["Berlin", "München", "Hamburg", "Köln", "Frankfurt"],
+        "country": "DE",
+        "phone": lambda rnd: f"+49 30 {rnd.randint(1000000, 9999999)}",
+        "date": lambda rnd: f"{rnd.randint(1, 28)}.{rnd.randint(1, 12)}.2024",
+        "fillers": [
+            "Der Quartalsbericht ist zur Durchsicht angehängt.",
+            "Wir besprechen die Planung im nächsten Termin.",
+            "Der Build lief nach der letzten Änderung ohne Fehler durch.",
+            "Vielen Dank nochmals für Ihre Geduld.",
+            "Melden Sie sich, wenn Sie Fragen zum Angebot haben.",
+        ],
+        "templates": [
+            "Bitte kontaktieren Sie {PERSON} unter {EMAIL_ADDRESS} wegen der Rechnung.",
+            "{PERSON} hat am {DATE_TIME} von {PHONE_NUMBER} angerufen.",
+            "Die Karte {CREDIT_CARD} wurde für die Bestellung nach {LOCATION} "
+            "belastet.",
+            "Eine Anmeldung von {IP_ADDRESS} wurde für {EMAIL_ADDRESS} erfasst.",
+            "Überweisen Sie die Erstattung auf {IBAN_CODE}, Inhaber {PERSON}.",
+        ],
+    },
+}
+
+# Bank code letters and number of digits of the BBAN of IBANs of each country
+IBAN_BBAN_FORMATS = {"GB": ("NWBK", 14), "ES": ("", 20), "DE": ("", 18)}
+
+PLACEHOLDER_REGEX = re.compile(r"{([A-Z_]+)}")
+
+
+@dataclass
+class Document:
+    """A synthetic document, with the spans of the PII it contains."""
+
+    language: str
+    length: str
+    text: str
+    #: (entity type, start, end) of each PII value in the text
+    entities: List[Tuple[str, int, int]] = field(default_factory=list)
+
+
+def luhn_credit_card(rnd: random.Random) -> str:
+    """Generate a Visa card number with a valid Luhn checksum."""
+    digits = [4] + [rnd.randint(0, 9) for _ in range(14)]
+    total = 0
+    for i, digit in enumerate(reversed(digits)):
+        if i % 2 == 0:
+            digit *= 2
+            if digit > 9:
+                digit -= 9
+        total += digit
+    digits.append((10 - total % 10) % 10)
+    number = "".join(str(d) for d in digits)
+    return " ".join(number[i : i + 4] for i in range(0, 16, 4))
+
+
+def iban(rnd: random.Random, country: str) -> str:
+    """Generate an IBAN of a country of IBAN_BBAN_FORMATS, with valid check digits."""
+    bank_code, n_digits = IBAN_BBAN_FORMATS[country]
+    bban = bank_code + "".join(str(rnd.randint(0, 9)) for _ in range(n_digits))
+    digits = "".join(str(int(c, 36)) for c in bban + country + "00")
+    check = 98 - int(digits) % 97
+    return f"{country}{check:02d}{bban}"
+
+
+def pii_generators(language: str, rnd: random.Random) -> Dict[str, Callable[[], str]]:
+    """Return a function generating a value of each entity type."""
+    data = LANGUAGES[language]
+
+    def person():
+        return f"{rnd.choice(data['first_names'])} {rnd.choice(data['last_names'])}"
+
+    def email():
+        last_name = rnd.choice(data["last_names"]).lower()
+        return f"{rnd.choice('jamsd')}.{last_name}{rnd.randint(1, 999)}@example.com"
+
+    return {
+        "PERSON": person,
+        "EMAIL_ADDRESS": email,
+        "PHONE_NUMBER": lambda: data["phone"](rnd),
+        "CREDIT_CARD": lambda: luhn_credit_card(rnd),
+        "IBAN_CODE": lambda: iban(rnd, data["country"]),
+        "IP_ADDRESS": lambda: ".".join(str(rnd.randint(1, 254)) for _ in range(4)),
+        "DATE_TIME": lambda: data["date"](rnd),
+        "LOCATION": lambda: rnd.choice(data["locations"]),
+    }
+
+
+def generate_document(
+    language: str, length: str, pii_density: float, rnd: random.Random
+) -> Document:
+    """Generate a document of about DOCUMENT_LENGTHS[length] characters.
+
+    :param language: Language of the document (a key of LANGUAGES).
+    :param length: Length of the document (a key of DOCUMENT_LENGTHS).
+    :param pii_density: Proportion of the sentences containing PII.
+    :param rnd: Random generator.
+    """
+    data = LANGUAGES[language]
+    generators = pii_generators(language, rnd)
+    document = Document(language=language, length=length, text="")
+    parts = []
+    size = 0
+    while size < DOCUMENT_LENGTHS[length]:
+        if parts:
+            parts.append(" ")
+            size += 1
+        if rnd.random() >= pii_density:
+            sentence = rnd.choice(data["fillers"])
+            parts.append(sentence)
+            size += len(sentence)
+            continue
+
+        template = rnd.choice(data["templates"])
+        cursor = 0
+        for match in PLACEHOLDER_REGEX.finditer(template):
+            literal = template[cursor : match.start()]
+            parts.append(literal)
+            size += len(literal)
+            value = generators[match.group(1)]()
+            document.entities.append((match.group(1), size, size + len(value)))
+            parts.append(value)
+            size += len(value)
+            cursor = match.end()
+        parts.append(template[cursor:])
+        size += len(template) - cursor
+
+    document.text = "".join(parts)
+    return document
+
+
+def generate_corpus(
+    n_documents: int,
+    languages: List[str] = None,
+    lengths: List[str] = None,
+    pii_density: float = 0.3,
+    seed: int = 42,
+) -> List[Document]:
+    """Generate n_documents documents of each language and length.
+
+    The documents of a language and length only depend on the seed, not on the
+    other languages and lengths generated.
+
+    :param n_documents: Number of documents of each language and length.
+    :param languages: Languages of the documents, defaults to all LANGUAGES.
+    :param lengths: Lengths of the documents, defaults to all DOCUMENT_LENGTHS.
+    :param pii_density: Proportion of the sentences containing PII.
+    :param seed: Seed of the random generator.
+    """
+    corpus = []
+    for language in languages or list(LANGUAGES):
+        for length in lengths or list(DOCUMENT_LENGTHS):
+            rnd = random.Random(f"{seed}-{language}-{length}")
+            corpus.extend(
+                generate_document(language, length, pii_density, rnd)
+                for _ in range(n_documents)
+            )
+    return corpus
+
+
+def main() -> None:
+    """Generate a corpus and write it as JSON Lines."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--documents", type=int, default=100)
+    parser.add_argument("--languages", nargs="+", choices=list(LANGUAGES))
+    parser.add_argument("--lengths", nargs="+", choices=list(DOCUMENT_LENGTHS))
+    parser.add_argument("--pii-density", type=float, default=0.3)
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--output", required=True, help="Path of the JSON Lines file")
+    args = parser.parse_args()
+
+    corpus = generate_corpus(
+        args.documents, args.languages, args.lengths, args.pii_density, args.seed
+    )
+    with open(args.output, "w", encoding="utf-8") as f:
+        for document in corpus:
+            f.write(json.dumps(asdict(document), ensure_ascii=False))
+            f.write("\n")
+    n_entities = sum(len(document.entities) for document in corpus)
+    print(f"Wrote {len(corpus)} documents with {n_entities} PII values")
+
+
+if __name__ == "__main__":
+    main()
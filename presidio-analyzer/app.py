@@ -14,8 +14,20 @@ from presidio_analyzer import (
     AnalyzerRequest,
     BatchAnalyzerEngine,
 )
+from presidio_analyzer.analyzer_metrics import AnalyzerMetrics
+from presidio_analyzer.app_tracer import SampledAppTracer
 from werkzeug.exceptions import HTTPException
 
+try:
+    from presidio_analyzer.metrics_exporters import PrometheusMetricsCollector
+    from prometheus_client import (
+        CONTENT_TYPE_LATEST,
+        CollectorRegistry,
+        generate_latest,
+    )
+except ImportError:
+    generate_latest = None
+
 DEFAULT_PORT = "3000"
 DEFAULT_BATCH_SIZE = "500"
 DEFAULT_N_PROCESS = "1"
@@ -48,13 +60,33 @@ class Server:
         recognizer_registry_conf_file = (
             os.environ.get("RECOGNIZER_REGISTRY_CONF_FILE") or None
         )
+        # Restoring a snapshot saved by an earlier worker is faster than
+        # creating the engine, e.g. when workers are recycled or scaled out
+        snapshot_file = os.environ.get("ANALYZER_SNAPSHOT_FILE") or None
 
         self.logger.info("Starting analyzer engine")
         self.engine: AnalyzerEngine = AnalyzerEngineProvider(
             analyzer_engine_conf_file=analyzer_conf_file,
             nlp_engine_conf_file=nlp_engine_conf_file,
             recognizer_registry_conf_file=recognizer_registry_conf_file,
-        ).create_engine()
+        ).create_engine(snapshot_path=snapshot_file)
+
+        # Latency and match metrics of the analyzer, served by /metrics
+        if os.environ.get("ANALYZER_METRICS", "false").lower() == "true":
+            self.engine.metrics = AnalyzerMetrics()
+
+        # Sampled decision process tracing, e.g. to investigate slow requests
+        trace_sample_rate = os.environ.get("ANALYZER_TRACE_SAMPLE_RATE") or None
+        if trace_sample_rate:
+            latency_threshold = os.environ.get("ANALYZER_TRACE_LATENCY_THRESHOLD")
+            self.engine.app_tracer = SampledAppTracer(
+                sample_rate=int(trace_sample_rate),
+                latency_threshold=float(latency_threshold)
+                if latency_threshold
+                else None,
+                output_path=os.environ.get("ANALYZER_TRACE_FILE") or None,
+            )
+            self.engine.log_decision_process = True
 
         self.batch_engine = BatchAnalyzerEngine(self.engine)
         self.logger.info(WELCOME_MESSAGE)
@@ -160,6 +192,23 @@ class Server:
                 )
                 return jsonify(error=e.args[0]), 500
 
+        @self.app.route("/metrics", methods=["GET"])
+        def metrics() -> Tuple[str, int]:
+            """Return the latency and match metrics of the analyzer.
+
+            In the Prometheus text format when prometheus_client is installed,
+            unless format=json is requested, and as JSON otherwise.
+            """
+            if self.engine.metrics is None:
+                return jsonify(error="Metrics are disabled"), 404
+            if generate_latest is not None and request.args.get("format") != "json":
+                registry = CollectorRegistry(auto_describe=False)
+                registry.register(PrometheusMetricsCollector(self.engine.metrics))
+                return Response(
+                    generate_latest(registry), 200, mimetype=CONTENT_TYPE_LATEST
+                )
+            return jsonify(self.engine.metrics.get_stats()), 200
+
         @self.app.errorhandler(HTTPException)
         def http_exception(e):
             return jsonify(error=e.description), e.code
@@ -3,22 +3,59 @@
 
 import logging
 
-from presidio_analyzer.analysis_explanation import AnalysisExplanation
-from presidio_analyzer.recognizer_result import RecognizerResult
-from presidio_analyzer.dict_analyzer_result import DictAnalyzerResult
-from presidio_analyzer.entity_recognizer import EntityRecognizer
-from presidio_analyzer.local_recognizer import LocalRecognizer
-from presidio_analyzer.pattern import Pattern
-from presidio_analyzer.pattern_recognizer import PatternRecognizer
-from presidio_analyzer.remote_recognizer import RemoteRecognizer
-from presidio_analyzer.lm_recognizer import LMRecognizer
-from presidio_analyzer.recognizer_registry import RecognizerRegistry
-from presidio_analyzer.analyzer_engine import AnalyzerEngine
-from presidio_analyzer.batch_analyzer_engine import BatchAnalyzerEngine
-from presidio_analyzer.analyzer_request import AnalyzerRequest
-from presidio_analyzer.context_aware_enhancers import ContextAwareEnhancer
-from presidio_analyzer.context_aware_enhancers import LemmaContextAwareEnhancer
-from presidio_analyzer.analyzer_engine_provider import AnalyzerEngineProvider
+from presidio_analyzer.lazy_imports import lazy_imports
+
+# Module of each public class, imported lazily (PEP 562) the first time it is
+# accessed, so that e.g. importing a recognizer does not import the NLP engines
+_IMPORTS = {
+    "AnalysisExplanation": "presidio_analyzer.analysis_explanation",
+    "RecognizerResult": "presidio_analyzer.recognizer_result",
+    "DictAnalyzerResult": "presidio_analyzer.dict_analyzer_result",
+    "EntityRecognizer": "presidio_analyzer.entity_recognizer",
+    "LocalRecognizer": "presidio_analyzer.local_recognizer",
+    "Pattern": "presidio_analyzer.pattern",
+    "PatternRecognizer": "presidio_analyzer.pattern_recognizer",
+    "RemoteRecognizer": "presidio_analyzer.remote_recognizer",
+    "LMRecognizer": "presidio_analyzer.lm_recognizer",
+    "RecognizerRegistry": "presidio_analyzer.recognizer_registry",
+    "AnalyzerEngine": "presidio_analyzer.analyzer_engine",
+    "BatchAnalyzerEngine": "presidio_analyzer.batch_analyzer_engine",
+    "AnalyzerRequest": "presidio_analyzer.analyzer_request",
+    "ContextAwareEnhancer": "presidio_analyzer.context_aware_enhancers",
+    "LemmaContextAwareEnhancer": "presidio_analyzer.context_aware_enhancers",
+    "AnalyzerEngineProvider": "presidio_analyzer.analyzer_engine_provider",
+    "AnalyzerMetrics": "presidio_analyzer.analyzer_metrics",
+}
+
+# Submodules, which are also imported lazily as attributes of the package
+_IMPORTS.update(
+    (name, f"presidio_analyzer.{name}")
+    for name in (
+        "analysis_explanation",
+        "analyzer_engine",
+        "analyzer_engine_provider",
+        "analyzer_request",
+        "app_tracer",
+        "batch_analyzer_engine",
+        "chunkers",
+        "context_aware_enhancers",
+        "dict_analyzer_result",
+        "entity_recognizer",
+        "input_validation",
+        "llm_utils",
+        "lm_recognizer",
+        "local_recognizer",
+        "nlp_engine",
+        "pattern",
+        "pattern_recognizer",
+        "predefined_recognizers",
+        "recognizer_registry",
+        "recognizer_result",
+        "remote_recognizer",
+    )
+)
+
+__getattr__, __dir__ = lazy_imports(__name__, _IMPORTS)
 
 # Define default loggers behavior
 
@@ -51,4 +88,5 @@ __all__ = [
     "LemmaContextAwareEnhancer",
     "BatchAnalyzerEngine",
     "AnalyzerEngineProvider",
+    "AnalyzerMetrics",
 ]
@@ -1,15 +1,26 @@
-import json
 import logging
 import os
 from collections import Counter
-from typing import List, Optional
+from typing import Dict, List, Optional
 
 import regex as re
 
 from presidio_analyzer import (
     EntityRecognizer,
+    PatternRecognizer,
     RecognizerResult,
 )
+from presidio_analyzer.analyzer_metrics import (
+    ALLOW_LIST_STAGE,
+    CONTEXT_ENHANCEMENT_STAGE,
+    DEDUPLICATION_STAGE,
+    NLP_STAGE,
+    NO_REQUEST_METRICS,
+    RECOGNIZER_LOADING_STAGE,
+    REGISTRY_STAGE,
+    TRACING_STAGE,
+    AnalyzerMetrics,
+)
 from presidio_analyzer.app_tracer import AppTracer
 from presidio_analyzer.context_aware_enhancers import (
     ContextAwareEnhancer,
@@ -45,6 +56,9 @@ class AnalyzerEngine:
     :param context_aware_enhancer: instance of type ContextAwareEnhancer for enhancing
     confidence score based on context words, (LemmaContextAwareEnhancer will be created
     by default if None passed)
+    :param metrics: instance of type AnalyzerMetrics, recording the latency of each
+    stage and recognizer of each request, and the matches of pattern recognizers.
+    Metrics are not recorded if None passed.
     """
 
     def __init__(
@@ -56,6 +70,7 @@ class AnalyzerEngine:
         default_score_threshold: float = 0,
         supported_languages: List[str] = None,
         context_aware_enhancer: Optional[ContextAwareEnhancer] = None,
+        metrics: Optional[AnalyzerMetrics] = None,
     ):
         if not supported_languages:
             supported_languages = ["en"]
@@ -100,6 +115,12 @@ class AnalyzerEngine:
 
         self.registry = registry
 
+        # Compile the regexes of the pattern recognizers now rather than on
+        # the first request
+        for recognizer in self.registry.recognizers:
+            if isinstance(recognizer, PatternRecognizer):
+                recognizer.compile_patterns()
+
         self.log_decision_process = log_decision_process
         self.default_score_threshold = default_score_threshold
 
@@ -111,6 +132,7 @@ class AnalyzerEngine:
             context_aware_enhancer = LemmaContextAwareEnhancer()
 
         self.context_aware_enhancer = context_aware_enhancer
+        self.metrics = metrics
 
     def get_recognizers(self, language: Optional[str] = None) -> List[EntityRecognizer]:
         """
@@ -161,6 +183,7 @@ class AnalyzerEngine:
         allow_list_match: Optional[str] = "exact",
         regex_flags: Optional[int] = re.DOTALL | re.MULTILINE | re.IGNORECASE,
         nlp_artifacts: Optional[NlpArtifacts] = None,
+        recognizer_results: Optional[Dict[str, List[RecognizerResult]]] = None,
     ) -> List[RecognizerResult]:
         """
         Find PII entities in text using different PII recognizers for a given language.
@@ -185,6 +208,9 @@ class AnalyzerEngine:
         - if `exact`, results which exactly match any value in the allow_list would be allowed and not be returned as potential PII.
         :param regex_flags: regex flags to be used for when allow_list_match is "regex"
         :param nlp_artifacts: precomputed NlpArtifacts
+        :param recognizer_results: precomputed results of some of the recognizers,
+        keyed by recognizer id (e.g. computed for a batch of texts by
+        BatchAnalyzerEngine). These recognizers are not run again.
         :return: an array of the found entities in the text
 
         :Example:
@@ -203,68 +229,101 @@ class AnalyzerEngine:
 
         """  # noqa: E501
 
-        all_fields = not entities
-
-        recognizers = self.registry.get_recognizers(
-            language=language,
-            entities=entities,
-            all_fields=all_fields,
-            ad_hoc_recognizers=ad_hoc_recognizers,
-        )
+        if self.metrics is not None:
+            request_metrics = self.metrics.start_request(language)
+        else:
+            request_metrics = NO_REQUEST_METRICS
 
-        if all_fields:
-            # Since all_fields=True, list all entities by iterating
-            # over all recognizers
-            entities = self.get_supported_entities(language=language)
+        if self.log_decision_process:
+            request_trace = self.app_tracer.start_request(correlation_id)
+        else:
+            request_trace = None
 
-        # run the nlp pipeline over the given text, store the results in
-        # a NlpArtifacts instance
-        if not nlp_artifacts:
-            nlp_artifacts = self.nlp_engine.process_text(text, language)
+        try:
+            all_fields = not entities
 
-        if self.log_decision_process:
-            self.app_tracer.trace(
-                correlation_id, "nlp artifacts:" + nlp_artifacts.to_json()
+            recognizers = self.registry.get_recognizers(
+                language=language,
+                entities=entities,
+                all_fields=all_fields,
+                ad_hoc_recognizers=ad_hoc_recognizers,
             )
 
-        results = []
-        for recognizer in recognizers:
-            # Lazy loading of the relevant recognizers
-            if not recognizer.is_loaded:
-                recognizer.load()
-                recognizer.is_loaded = True
-
-            # analyze using the current recognizer and append the results
-            current_results = recognizer.analyze(
-                text=text, entities=entities, nlp_artifacts=nlp_artifacts
+            if all_fields:
+                # Since all_fields=True, list all entities by iterating
+                # over all recognizers
+                entities = self.get_supported_entities(language=language)
+
+            # run the nlp pipeline over the given text, store the results in
+            # a NlpArtifacts instance
+            request_metrics.lap(REGISTRY_STAGE)
+            if not nlp_artifacts:
+                nlp_artifacts = self.nlp_engine.process_text(text, language)
+            request_metrics.lap(NLP_STAGE)
+
+            if request_trace is not None:
+                request_trace.trace_nlp_artifacts(nlp_artifacts)
+                request_metrics.lap(TRACING_STAGE)
+
+            results = []
+            for recognizer in recognizers:
+                # Lazy loading of the relevant recognizers
+                if not recognizer.is_loaded:
+                    recognizer.load()
+                    recognizer.is_loaded = True
+                    request_metrics.lap(RECOGNIZER_LOADING_STAGE)
+
+                # analyze using the current recognizer and append the results
+                if recognizer_results and recognizer.id in recognizer_results:
+                    current_results = recognizer_results[recognizer.id]
+                else:
+                    current_results = recognizer.analyze(
+                        text=text, entities=entities, nlp_artifacts=nlp_artifacts
+                    )
+                request_metrics.lap_recognizer(
+                    recognizer, len(current_results) if current_results else 0
+                )
+                if request_trace is not None:
+                    request_trace.trace_recognizer(recognizer, current_results)
+                if current_results:
+                    # add recognizer name to recognition metadata inside results
+                    # if not exists
+                    self.__add_recognizer_id_if_not_exists(current_results, recognizer)
+                    results.extend(current_results)
+
+            results = self._enhance_using_context(
+                text, results, nlp_artifacts, recognizers, context
             )
-            if current_results:
-                # add recognizer name to recognition metadata inside results
-                # if not exists
-                self.__add_recognizer_id_if_not_exists(current_results, recognizer)
-                results.extend(current_results)
-
-        results = self._enhance_using_context(
-            text, results, nlp_artifacts, recognizers, context
-        )
+            request_metrics.lap(CONTEXT_ENHANCEMENT_STAGE)
 
-        if self.log_decision_process:
-            self.app_tracer.trace(
-                correlation_id,
-                json.dumps([str(result.to_dict()) for result in results]),
-            )
+            if request_trace is not None:
+                request_trace.trace_results(CONTEXT_ENHANCEMENT_STAGE, results)
+                request_metrics.lap(TRACING_STAGE)
 
-        # Remove duplicates or low score results
-        results = EntityRecognizer.remove_duplicates(results)
-        results = self.__remove_low_scores(results, score_threshold)
+            # Remove duplicates or low score results
+            results = EntityRecognizer.remove_duplicates(results)
+            results = self.__remove_low_scores(results, score_threshold)
+            request_metrics.lap(DEDUPLICATION_STAGE)
 
-        if allow_list:
-            results = self._remove_allow_list(
-                results, allow_list, text, regex_flags, allow_list_match
-            )
+            if allow_list:
+                results = self._remove_allow_list(
+                    results, allow_list, text, regex_flags, allow_list_match
+                )
+                request_metrics.lap(ALLOW_LIST_STAGE)
+
+            if request_trace is not None:
+                self.app_tracer.end_request(request_trace, results)
+                request_metrics.lap(TRACING_STAGE)
+
+            if not return_decision_process:
+                results = self.__remove_decision_process(results)
 
-        if not return_decision_process:
-            results = self.__remove_decision_process(results)
+            if self.metrics is not None:
+                self.metrics.end_request(request_metrics)
+        finally:
+            if self.metrics is not None:
+                # Restores the metrics of the enclosing request if analyze failed
+                self.metrics.stop_request(request_metrics)
 
         return results
 
@@ -1,16 +1,30 @@
+import hashlib
+import importlib.metadata
+import json
 import logging
+import os
+import pickle
+import platform
+import tempfile
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Union
 
 import yaml
 
-from presidio_analyzer import AnalyzerEngine, RecognizerRegistry
+from presidio_analyzer import AnalyzerEngine, PatternRecognizer, RecognizerRegistry
 from presidio_analyzer.input_validation import ConfigurationValidator
 from presidio_analyzer.nlp_engine import NlpEngine, NlpEngineProvider
 from presidio_analyzer.recognizer_registry import RecognizerRegistryProvider
 
 logger = logging.getLogger("presidio-analyzer")
 
+# Version of the snapshot files, to change when their format changes
+SNAPSHOT_FORMAT_VERSION = "1"
+
+# Packages whose objects are stored in snapshots. A snapshot is only restored
+# with the same versions of these packages as when it was saved.
+SNAPSHOT_PACKAGES = ("presidio-analyzer", "regex", "spacy", "stanza", "transformers")
+
 
 class AnalyzerEngineProvider:
     """
@@ -78,12 +92,22 @@ class AnalyzerEngineProvider:
 
         return configuration
 
-    def create_engine(self) -> AnalyzerEngine:
+    def create_engine(
+        self, snapshot_path: Optional[Union[Path, str]] = None
+    ) -> AnalyzerEngine:
         """
         Load Presidio Analyzer from yaml configuration file.
 
+        :param snapshot_path: Path of an engine snapshot (see save_snapshot).
+        If the snapshot exists and was saved with the same configuration and
+        package versions, the engine is restored from it. Otherwise, the
+        engine is created from the configuration and saved to snapshot_path.
         :return: analyzer engine initialized with yaml configuration
         """
+        if snapshot_path:
+            analyzer = self.load_snapshot(snapshot_path)
+            if analyzer is not None:
+                return analyzer
 
         nlp_engine = self._load_nlp_engine()
         supported_languages = self.configuration.get("supported_languages", ["en"])
@@ -100,6 +124,140 @@ class AnalyzerEngineProvider:
             default_score_threshold=default_score_threshold,
         )
 
+        if snapshot_path:
+            self.save_snapshot(analyzer, snapshot_path)
+
+        return analyzer
+
+    def get_configuration_hash(self) -> str:
+        """
+        Return a hash of the configuration the engine is created from.
+
+        Includes the analyzer configuration and the content of the NLP engine
+        and recognizer registry configuration files.
+        """
+        digest = hashlib.sha256()
+        digest.update(
+            json.dumps(self.configuration, sort_keys=True, default=str).encode()
+        )
+        for conf_file in (
+            self.nlp_engine_conf_file,
+            self.recognizer_registry_conf_file,
+        ):
+            digest.update(b"\0")
+            if conf_file:
+                digest.update(Path(conf_file).read_bytes())
+        return digest.hexdigest()
+
+    @staticmethod
+    def get_snapshot_versions() -> Dict[str, Optional[str]]:
+        """Return the versions of the snapshot format, Python and packages."""
+        versions = {
+            "format": SNAPSHOT_FORMAT_VERSION,
+            "python": platform.python_version(),
+        }
+        for package in SNAPSHOT_PACKAGES:
+            try:
+                versions[package] = importlib.metadata.version(package)
+            except importlib.metadata.PackageNotFoundError:
+                versions[package] = None
+        return versions
+
+    def save_snapshot(
+        self, analyzer: AnalyzerEngine, snapshot_path: Union[Path, str]
+    ) -> bool:
+        """
+        Save an analyzer engine, created with this configuration, to a file.
+
+        The snapshot stores the engine as created (recognizers with their
+        compiled patterns and deny-list regexes, and the loaded NLP engine),
+        with the configuration hash and package versions, so that it can be
+        restored by load_snapshot (e.g. in each worker process) instead of
+        creating the engine again. The file is written atomically.
+
+        :param analyzer: The analyzer engine to save.
+        :param snapshot_path: Path of the snapshot file.
+        :return: True if the snapshot was saved, False if the engine could not
+        be serialized (e.g. because of an NLP engine holding a remote client).
+        """
+        for recognizer in analyzer.registry.recognizers:
+            if isinstance(recognizer, PatternRecognizer):
+                recognizer.compile_patterns()
+
+        header = {
+            "versions": self.get_snapshot_versions(),
+            "configuration_hash": self.get_configuration_hash(),
+        }
+        try:
+            content = pickle.dumps(header) + pickle.dumps(analyzer)
+        except (pickle.PicklingError, TypeError, AttributeError):
+            logger.warning(
+                "Analyzer engine cannot be saved to a snapshot", exc_info=True
+            )
+            return False
+
+        # Write to a temporary file first, so that other processes never
+        # read a partially written snapshot
+        snapshot_path = Path(snapshot_path)
+        snapshot_path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=snapshot_path.parent, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(content)
+            os.replace(tmp_path, snapshot_path)
+        except OSError:
+            logger.warning(
+                f"Could not write analyzer snapshot {snapshot_path}", exc_info=True
+            )
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            return False
+
+        logger.info(f"Saved analyzer engine snapshot to {snapshot_path}")
+        return True
+
+    def load_snapshot(
+        self, snapshot_path: Union[Path, str]
+    ) -> Optional[AnalyzerEngine]:
+        """
+        Restore an analyzer engine saved by save_snapshot.
+
+        Snapshots are pickle files: only load snapshots from trusted locations.
+
+        :param snapshot_path: Path of the snapshot file.
+        :return: The restored analyzer engine, or None if the file does not
+        exist, cannot be read, or was saved with another configuration or
+        other package versions.
+        """
+        try:
+            with open(snapshot_path, "rb") as f:
+                header = pickle.load(f)
+                if header.get("versions") != self.get_snapshot_versions():
+                    logger.info(
+                        f"Ignoring analyzer snapshot {snapshot_path} "
+                        f"saved with other package versions"
+                    )
+                    return None
+                if header.get("configuration_hash") != self.get_configuration_hash():
+                    logger.info(
+                        f"Ignoring analyzer snapshot {snapshot_path} "
+                        f"saved with another configuration"
+                    )
+                    return None
+                analyzer = pickle.load(f)
+        except FileNotFoundError:
+            return None
+        except Exception:
+            logger.warning(
+                f"Ignoring unreadable analyzer snapshot {snapshot_path}", exc_info=True
+            )
+            return None
+
+        if not isinstance(analyzer, AnalyzerEngine):
+            logger.warning(f"Ignoring invalid analyzer snapshot {snapshot_path}")
+            return None
+
+        logger.info(f"Restored analyzer engine from snapshot {snapshot_path}")
         return analyzer
 
     def _load_recognizer_registry(
@@ -0,0 +1,272 @@
+"""Latency and match metrics of the analyzer, per request and cumulative.
+
+When an AnalyzerEngine is created with an AnalyzerMetrics instance, each call
+to ``analyze`` records the time spent in each stage of the analysis (recognizer
+selection, NLP, each recognizer, context enhancement, deduplication and
+allow-list filtering), and the number of results of each recognizer. Pattern
+recognizers also count their regex matches, and the matches validated and
+invalidated by their checksum/validation logic.
+
+Usage:
+    from presidio_analyzer import AnalyzerEngine
+    from presidio_analyzer.analyzer_metrics import AnalyzerMetrics
+
+    analyzer = AnalyzerEngine(metrics=AnalyzerMetrics())
+    analyzer.analyze("My phone number is 212-555-5555", language="en")
+    print(analyzer.metrics.get_stats())
+"""
+
+import threading
+import time
+from contextvars import ContextVar, Token
+from typing import TYPE_CHECKING, Callable, Dict, List, Optional, Tuple
+
+if TYPE_CHECKING:
+    from presidio_analyzer import EntityRecognizer
+
+# Stages of AnalyzerEngine.analyze
+REGISTRY_STAGE = "registry"
+NLP_STAGE = "nlp"
+RECOGNIZER_LOADING_STAGE = "recognizer_loading"
+RECOGNIZERS_STAGE = "recognizers"
+CONTEXT_ENHANCEMENT_STAGE = "context_enhancement"
+DEDUPLICATION_STAGE = "deduplication"
+ALLOW_LIST_STAGE = "allow_list"
+TRACING_STAGE = "tracing"
+TOTAL_STAGE = "total"
+
+RECOGNIZER_COUNTERS = ("results", "matches", "validated", "invalidated")
+
+
+class RequestMetrics:
+    """Metrics of a single analyze request.
+
+    Stages are timed as laps: ``lap(stage)`` records the time elapsed since the
+    previous lap (or the start of the request) as spent in this stage.
+
+    :param language: Language of the request.
+    """
+
+    def __init__(self, language: str):
+        self.language = language
+        #: Seconds spent in each stage
+        self.stages: Dict[str, float] = {}
+        #: Seconds spent and counters of each (recognizer name, language)
+        self.recognizers: Dict[Tuple[str, str], Dict[str, float]] = {}
+        self._start_time = time.perf_counter()
+        self._lap_time = self._start_time
+        # Token restoring the current request metrics, set by start_request
+        self._context_token: Optional[Token] = None
+
+    def lap(self, stage: str) -> None:
+        """
+        Record the time elapsed since the previous lap as spent in a stage.
+
+        :param stage: Name of the stage.
+        """
+        now = time.perf_counter()
+        self.stages[stage] = self.stages.get(stage, 0.0) + now - self._lap_time
+        self._lap_time = now
+
+    def lap_recognizer(self, recognizer: "EntityRecognizer", n_results: int) -> None:
+        """
+        Record the time elapsed since the previous lap as spent in a recognizer.
+
+        :param recognizer: The recognizer which was run.
+        :param n_results: Number of results returned by the recognizer.
+        """
+        now = time.perf_counter()
+        seconds = now - self._lap_time
+        self._lap_time = now
+        self.stages[RECOGNIZERS_STAGE] = (
+            self.stages.get(RECOGNIZERS_STAGE, 0.0) + seconds
+        )
+        recognizer_metrics = self._get_recognizer_metrics(recognizer)
+        recognizer_metrics["seconds"] += seconds
+        recognizer_metrics["results"] += n_results
+
+    def record_matches(
+        self,
+        recognizer: "EntityRecognizer",
+        matches: int,
+        validated: int,
+        invalidated: int,
+    ) -> None:
+        """
+        Record the regex matches of a pattern recognizer.
+
+        :param recognizer: The pattern recognizer.
+        :param matches: Number of (non-empty) matches of its patterns.
+        :param validated: Number of matches validated by validate_result.
+        :param invalidated: Number of matches invalidated by validate_result
+            or invalidate_result.
+        """
+        recognizer_metrics = self._get_recognizer_metrics(recognizer)
+        recognizer_metrics["matches"] += matches
+        recognizer_metrics["validated"] += validated
+        recognizer_metrics["invalidated"] += invalidated
+
+    def finish(self) -> None:
+        """Record the total time of the request."""
+        self.stages[TOTAL_STAGE] = time.perf_counter() - self._start_time
+
+    def to_dict(self) -> Dict:
+        """Serialize the metrics of the request to a dictionary."""
+        return {
+            "language": self.language,
+            "stages": dict(self.stages),
+            "recognizers": [
+                {"name": name, "language": language, **recognizer_metrics}
+                for (name, language), recognizer_metrics in self.recognizers.items()
+            ],
+        }
+
+    def _get_recognizer_metrics(
+        self, recognizer: "EntityRecognizer"
+    ) -> Dict[str, float]:
+        key = (recognizer.name, recognizer.supported_language)
+        recognizer_metrics = self.recognizers.get(key)
+        if recognizer_metrics is None:
+            recognizer_metrics = dict.fromkeys(("seconds",) + RECOGNIZER_COUNTERS, 0)
+            self.recognizers[key] = recognizer_metrics
+        return recognizer_metrics
+
+
+class _NoRequestMetrics(RequestMetrics):
+    """Metrics of a request when metrics are disabled, recording nothing."""
+
+    def __init__(self):
+        super().__init__(language="")
+
+    def lap(self, stage: str) -> None:
+        """Record nothing."""
+
+    def lap_recognizer(self, recognizer: "EntityRecognizer", n_results: int) -> None:
+        """Record nothing."""
+
+
+#: Used by AnalyzerEngine when it has no metrics
+NO_REQUEST_METRICS = _NoRequestMetrics()
+
+# Metrics of the request being analyzed in the current thread/context, so
+# recognizers can record their matches without changing their interface
+_current_request_metrics: ContextVar[Optional[RequestMetrics]] = ContextVar(
+    "presidio_request_metrics", default=None
+)
+
+
+def get_current_request_metrics() -> Optional[RequestMetrics]:
+    """Return the metrics of the request being analyzed, if metrics are enabled."""
+    return _current_request_metrics.get()
+
+
+class AnalyzerMetrics:
+    """Thread-safe cumulative metrics of the requests of an AnalyzerEngine.
+
+    :param on_request: Optional callback called with the RequestMetrics of
+        each request, e.g. to log slow requests or export per-request metrics.
+    """
+
+    def __init__(self, on_request: Optional[Callable[[RequestMetrics], None]] = None):
+        self.on_request = on_request
+        self._lock = threading.Lock()
+        self.reset()
+
+    def start_request(self, language: str) -> RequestMetrics:
+        """
+        Start recording the metrics of a request.
+
+        :param language: Language of the request.
+        :return: The metrics of the request, to pass to end_request.
+        """
+        request_metrics = RequestMetrics(language)
+        request_metrics._context_token = _current_request_metrics.set(request_metrics)
+        return request_metrics
+
+    def end_request(self, request_metrics: RequestMetrics) -> None:
+        """
+        Stop recording the metrics of a request, and add them to the totals.
+
+        :param request_metrics: The metrics returned by start_request.
+        """
+        request_metrics.finish()
+        self.stop_request(request_metrics)
+
+        with self._lock:
+            self._requests += 1
+            for stage, seconds in request_metrics.stages.items():
+                totals = self._stages.setdefault(
+                    stage, {"count": 0, "seconds": 0.0, "max_seconds": 0.0}
+                )
+                totals["count"] += 1
+                totals["seconds"] += seconds
+                totals["max_seconds"] = max(totals["max_seconds"], seconds)
+            for key, recognizer_metrics in request_metrics.recognizers.items():
+                totals = self._recognizers.get(key)
+                if totals is None:
+                    totals = dict.fromkeys(
+                        ("count", "seconds", "max_seconds") + RECOGNIZER_COUNTERS, 0
+                    )
+                    self._recognizers[key] = totals
+                totals["count"] += 1
+                totals["max_seconds"] = max(
+                    totals["max_seconds"], recognizer_metrics["seconds"]
+                )
+                for counter, value in recognizer_metrics.items():
+                    totals[counter] += value
+
+        if self.on_request is not None:
+            self.on_request(request_metrics)
+
+    def stop_request(self, request_metrics: RequestMetrics) -> None:
+        """
+        Stop recording the metrics of a request, without adding them to the totals.
+
+        Restores the current request metrics to their value before
+        start_request, e.g. when the request failed. Does nothing if the
+        request was already ended.
+
+        :param request_metrics: The metrics returned by start_request.
+        """
+        if request_metrics._context_token is not None:
+            _current_request_metrics.reset(request_metrics._context_token)
+            request_metrics._context_token = None
+
+    def get_stats(self) -> Dict:
+        """
+        Return the cumulative metrics of all the requests.
+
+        :return: The number of requests, the count, total and maximum seconds
+            of each stage, and of each recognizer (slowest first) with its
+            numbers of results, matches, validated and invalidated matches.
+        """
+        with self._lock:
+            recognizers: List[Dict] = [
+                {"name": name, "language": language, **totals}
+                for (name, language), totals in self._recognizers.items()
+            ]
+            return {
+                "requests": self._requests,
+                "stages": {
+                    stage: dict(totals) for stage, totals in self._stages.items()
+                },
+                "recognizers": sorted(recognizers, key=lambda r: -r["seconds"]),
+            }
+
+    def reset(self) -> None:
+        """Reset all the metrics."""
+        with self._lock:
+            self._requests = 0
+            self._stages: Dict[str, Dict[str, float]] = {}
+            self._recognizers: Dict[Tuple[str, str], Dict[str, float]] = {}
+
+    def __getstate__(self) -> Dict:
+        """Drop the lock when pickling, e.g. in an analyzer engine snapshot."""
+        state = self.__dict__.copy()
+        del state["_lock"]
+        return state
+
+    def __setstate__(self, state: Dict) -> None:
+        """Recreate the lock when unpickling."""
+        self.__dict__.update(state)
+        self._lock = threading.Lock()
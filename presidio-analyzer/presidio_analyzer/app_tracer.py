@@ -1,4 +1,133 @@
+import itertools
+import json
 import logging
+import threading
+import time
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple
+
+if TYPE_CHECKING:
+    from presidio_analyzer import EntityRecognizer, RecognizerResult
+    from presidio_analyzer.nlp_engine import NlpArtifacts
+
+
+class RequestTrace:
+    """
+    Compact events of the decision process of a single analyze request.
+
+    Events are kept as small tuples of the values needed to explain the
+    decisions (entity types, spans, scores and recognizer names), and are only
+    serialized when the trace is exported.
+
+    :param request_id: A unique ID, to correlate across calls.
+    """
+
+    def __init__(self, request_id: str):
+        self.request_id = request_id
+        self.timestamp = time.time()
+        #: (event name, seconds since the start of the request, fields)
+        self.events: List[Tuple[str, float, Dict[str, Any]]] = []
+        self._start_time = time.perf_counter()
+
+    def add_event(self, name: str, **fields) -> None:
+        """
+        Record an event of the request.
+
+        :param name: Name of the event.
+        :param fields: JSON serializable values of the event.
+        """
+        self.events.append((name, time.perf_counter() - self._start_time, fields))
+
+    def trace_nlp_artifacts(self, nlp_artifacts: "NlpArtifacts") -> None:
+        """Record the tokens count and the entities found by the NLP engine."""
+        self.add_event(
+            "nlp",
+            tokens=len(nlp_artifacts.tokens) if nlp_artifacts.tokens else 0,
+            entities=[
+                [entity.label_, entity.start_char, entity.end_char]
+                for entity in nlp_artifacts.entities
+            ],
+        )
+
+    def trace_recognizer(
+        self, recognizer: "EntityRecognizer", results: List["RecognizerResult"]
+    ) -> None:
+        """Record the number of results of a recognizer."""
+        self.add_event(
+            "recognizer",
+            recognizer=recognizer.name,
+            results=len(results) if results else 0,
+        )
+
+    def trace_results(self, name: str, results: List["RecognizerResult"]) -> None:
+        """
+        Record the results at a stage of the analysis.
+
+        :param name: Name of the event, e.g. the stage after which it is recorded.
+        :param results: The results, recorded as [entity type, start, end, score,
+            recognizer name] lists.
+        """
+        self.add_event(name, results=self._compact_results(results))
+
+    def elapsed(self) -> float:
+        """Return the seconds elapsed since the start of the request."""
+        return time.perf_counter() - self._start_time
+
+    def to_rows(self) -> List[Dict[str, Any]]:
+        """
+        Return one flat dictionary per event, e.g. to write as JSON Lines.
+
+        Every row has the request_id, timestamp (of the start of the request),
+        event and offset_ms columns, followed by the fields of the event.
+        """
+        return [
+            {
+                "request_id": self.request_id,
+                "timestamp": self.timestamp,
+                "event": name,
+                "offset_ms": round(offset * 1000, 3),
+                **fields,
+            }
+            for name, offset, fields in self.events
+        ]
+
+    @staticmethod
+    def _compact_results(results: List["RecognizerResult"]) -> List[List]:
+        return [
+            [
+                result.entity_type,
+                result.start,
+                result.end,
+                round(result.score, 4),
+                (result.recognition_metadata or {}).get("recognizer_name"),
+            ]
+            for result in results
+        ]
+
+
+class _AppTracerRequestTrace(RequestTrace):
+    """Request trace writing the NLP artifacts and results to AppTracer.trace."""
+
+    def __init__(self, app_tracer: "AppTracer", request_id: str):
+        super().__init__(request_id)
+        self.app_tracer = app_tracer
+
+    def trace_nlp_artifacts(self, nlp_artifacts: "NlpArtifacts") -> None:
+        """Trace the serialized NLP artifacts."""
+        self.app_tracer.trace(
+            self.request_id, "nlp artifacts:" + nlp_artifacts.to_json()
+        )
+
+    def trace_recognizer(
+        self, recognizer: "EntityRecognizer", results: List["RecognizerResult"]
+    ) -> None:
+        """Trace nothing."""
+
+    def trace_results(self, name: str, results: List["RecognizerResult"]) -> None:
+        """Trace the serialized results."""
+        self.app_tracer.trace(
+            self.request_id,
+            json.dumps([str(result.to_dict()) for result in results]),
+        )
 
 
 class AppTracer:
@@ -25,3 +154,142 @@ class AppTracer:
         """
         if self.enabled:
             self.logger.info("[%s][%s]", request_id, trace_data)
+
+    def start_request(self, request_id: str) -> Optional[RequestTrace]:
+        """
+        Start tracing the decision process of an analyze request.
+
+        The AppTracer writes the serialized NLP artifacts and results of every
+        request with `trace`.
+        :param request_id: A unique ID, to correlate across calls.
+        :return: The trace of the request, or None if it is not traced.
+        """
+        return _AppTracerRequestTrace(self, request_id)
+
+    def end_request(
+        self,
+        request_trace: Optional[RequestTrace],
+        results: List["RecognizerResult"],
+    ) -> None:
+        """
+        End tracing an analyze request.
+
+        :param request_trace: The trace returned by start_request.
+        :param results: The results returned by the analyzer.
+        """
+
+
+class SampledAppTracer(AppTracer):
+    """
+    Structured, sampled tracer of the decision process.
+
+    Only traces one in `sample_rate` requests, and of those only exports the
+    requests which took at least `latency_threshold` seconds, so tracing can be
+    left enabled in production. The events of the traced requests are compact
+    (entity types, spans, scores and recognizer names, instead of the
+    serialized NLP artifacts and results of the AppTracer), and are only
+    serialized for the exported requests.
+
+    The exported requests are appended to `output_path` as JSON Lines, one flat
+    row per event (see RequestTrace.to_rows), which can be loaded for offline
+    analysis e.g. with `pandas.read_json(output_path, lines=True)`. Without an
+    output path, the rows are written to the "decision_process" logger.
+
+    :param sample_rate: Trace one in sample_rate requests.
+    :param latency_threshold: Only export the traced requests which took at
+        least this number of seconds. All traced requests are exported if None.
+    :param output_path: Path of the JSON Lines file to append the traces to.
+    :param enabled: Whether tracing should be activated.
+    """
+
+    def __init__(
+        self,
+        sample_rate: int = 1,
+        latency_threshold: Optional[float] = None,
+        output_path: Optional[str] = None,
+        enabled: bool = True,
+    ):
+        if sample_rate < 1:
+            raise ValueError(f"sample_rate must be at least 1, got {sample_rate}")
+        if latency_threshold is not None and latency_threshold < 0:
+            raise ValueError(
+                f"latency_threshold must be non-negative, got {latency_threshold}"
+            )
+        super().__init__(enabled=enabled)
+        self.sample_rate = sample_rate
+        self.latency_threshold = latency_threshold
+        self.output_path = output_path
+        self._counter = itertools.count()
+        self._lock = threading.Lock()
+        self._file = None
+
+    def start_request(self, request_id: str) -> Optional[RequestTrace]:
+        """
+        Start tracing the decision process of an analyze request, if sampled.
+
+        :param request_id: A unique ID, to correlate across calls.
+        :return: The trace of the request, or None if it is not traced.
+        """
+        if not self.enabled or next(self._counter) % self.sample_rate:
+            return None
+        return RequestTrace(request_id)
+
+    def end_request(
+        self,
+        request_trace: Optional[RequestTrace],
+        results: List["RecognizerResult"],
+    ) -> None:
+        """
+        End tracing an analyze request, and export it if slow enough.
+
+        :param request_trace: The trace returned by start_request.
+        :param results: The results returned by the analyzer.
+        """
+        if request_trace is None:
+            return
+        elapsed = request_trace.elapsed()
+        if self.latency_threshold is not None and elapsed < self.latency_threshold:
+            return
+
+        request_trace.trace_results("results", results)
+        request_trace.add_event("end", total_ms=round(elapsed * 1000, 3))
+        self.export(request_trace)
+
+    def export(self, request_trace: RequestTrace) -> None:
+        """
+        Write the events of a request to the output file, or to the logger.
+
+        :param request_trace: The trace of the request.
+        """
+        lines = [json.dumps(row) for row in request_trace.to_rows()]
+        if self.output_path is None:
+            for line in lines:
+                self.trace(request_trace.request_id, line)
+            return
+
+        with self._lock:
+            if self._file is None:
+                self._file = open(self.output_path, "a", encoding="utf-8")
+            self._file.write("\n".join(lines) + "\n")
+            self._file.flush()
+
+    def close(self) -> None:
+        """Close the output file."""
+        with self._lock:
+            if self._file is not None:
+                self._file.close()
+                self._file = None
+
+    def __getstate__(self) -> Dict:
+        """Drop the lock, counter and file when pickling, e.g. in a snapshot."""
+        state = self.__dict__.copy()
+        del state["_lock"]
+        del state["_counter"]
+        state["_file"] = None
+        return state
+
+    def __setstate__(self, state: Dict) -> None:
+        """Recreate the lock and counter when unpickling."""
+        self.__dict__.update(state)
+        self._lock = threading.Lock()
+        self._counter = itertools.count()
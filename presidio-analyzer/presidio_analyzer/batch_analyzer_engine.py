@@ -1,7 +1,13 @@
 import logging
+from copy import copy
 from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple, Union
 
-from presidio_analyzer import AnalyzerEngine, DictAnalyzerResult, RecognizerResult
+from presidio_analyzer import (
+    AnalyzerEngine,
+    DictAnalyzerResult,
+    EntityRecognizer,
+    RecognizerResult,
+)
 from presidio_analyzer.nlp_engine import NlpArtifacts
 
 logger = logging.getLogger("presidio-analyzer")
@@ -55,15 +61,39 @@ class BatchAnalyzerEngine:
             )
         )
 
-        list_results = []
-        for text, nlp_artifacts in nlp_artifacts_batch:
-            results = self.analyzer_engine.analyze(
-                text=str(text), nlp_artifacts=nlp_artifacts, language=language, **kwargs
-            )
-
-            list_results.append(results)
+        batch_recognizers = self._get_batch_recognizers(language, **kwargs)
+        if not batch_recognizers:
+            return [
+                self.analyzer_engine.analyze(
+                    text=str(text),
+                    nlp_artifacts=nlp_artifacts,
+                    language=language,
+                    **kwargs,
+                )
+                for text, nlp_artifacts in nlp_artifacts_batch
+            ]
 
-        return list_results
+        # Run the recognizers supporting batches once on all the texts
+        batch = [
+            (str(text), nlp_artifacts) for text, nlp_artifacts in nlp_artifacts_batch
+        ]
+        batch_results = self._analyze_batch_recognizers(
+            batch_recognizers,
+            texts=[text for text, _ in batch],
+            nlp_artifacts=[nlp_artifacts for _, nlp_artifacts in batch],
+            language=language,
+            entities=kwargs.get("entities"),
+        )
+        return [
+            self.analyzer_engine.analyze(
+                text=text,
+                nlp_artifacts=nlp_artifacts,
+                language=language,
+                recognizer_results=recognizer_results,
+                **kwargs,
+            )
+            for (text, nlp_artifacts), recognizer_results in zip(batch, batch_results)
+        ]
 
     def analyze_dict(
         self,
@@ -78,6 +108,9 @@ class BatchAnalyzerEngine:
         Analyze a dictionary of keys (strings) and values/iterable of values.
 
         Non-string values are returned as is.
+        All scalar values in the dictionary (including nested dictionaries
+        and lists) are first collected and analyzed as one batch through
+        the NLP engine, then re-nested into the dictionary structure.
 
         :param input_dict: The input dictionary for analysis
         :param language: Input language
@@ -92,17 +125,86 @@ class BatchAnalyzerEngine:
         See `AnalyzerEngine.analyze` for the full list.
         """
 
-        context = []
-        if "context" in kwargs:
-            context = kwargs["context"]
-            del kwargs["context"]
+        results = self.analyze_dicts(
+            input_dicts=[input_dict],
+            language=language,
+            keys_to_skip=keys_to_skip,
+            batch_size=batch_size,
+            n_process=n_process,
+            **kwargs,
+        )
+        yield from next(results)
+
+    def analyze_dicts(
+        self,
+        input_dicts: Iterable[Dict[str, Union[Any, Iterable[Any]]]],
+        language: str,
+        keys_to_skip: Optional[List[str]] = None,
+        batch_size: int = 1,
+        n_process: int = 1,
+        **kwargs,
+    ) -> Iterator[Iterator[DictAnalyzerResult]]:
+        """
+        Analyze a collection of dictionaries (e.g. a list of JSON records).
+
+        The scalar values of all dictionaries are analyzed as one batch,
+        and identical values sharing the same key context are analyzed once.
+        The output for each dictionary is the same as `analyze_dict`.
+
+        :param input_dicts: The input dictionaries for analysis
+        :param language: Input language
+        :param keys_to_skip: Keys to ignore during analysis
+        :param batch_size: Batch size to process in a single iteration
+        :param n_process: Number of processors to use. Defaults to `1`
+        :param kwargs: Additional keyword arguments
+        for the `AnalyzerEngine.analyze` method.
+        :return: An iterator with one iterator of DictAnalyzerResult per dictionary
+        """
+
+        context = kwargs.pop("context", None) or []
 
         if not keys_to_skip:
             keys_to_skip = []
 
+        leaves: List[Tuple[str, List[str]]] = []
+        skeletons = [
+            self._flatten_dict(input_dict, context, keys_to_skip, leaves)
+            for input_dict in input_dicts
+        ]
+
+        leaf_results = self._analyze_leaves(
+            leaves=leaves,
+            language=language,
+            batch_size=batch_size,
+            n_process=n_process,
+            **kwargs,
+        )
+
+        for skeleton in skeletons:
+            yield self._nest_results(skeleton, leaf_results)
+
+    def _flatten_dict(
+        self,
+        input_dict: Dict[str, Any],
+        context: List[str],
+        keys_to_skip: List[str],
+        leaves: List[Tuple[str, List[str]]],
+    ) -> List[Tuple[str, Any, Any]]:
+        """
+        Collect the scalar values of a dictionary into a flat list of leaves.
+
+        :param input_dict: The dictionary to flatten
+        :param context: Context words of the current nesting level
+        :param keys_to_skip: Keys to ignore at the current nesting level
+        :param leaves: List of (text, context) tuples the values are appended to
+        :return: A list of (key, value, node) tuples describing the structure,
+        where node is None for skipped values, the leaf index for scalars,
+        a range of leaf indices for lists and a nested list for dictionaries.
+        """
+        skeleton = []
         for key, value in input_dict.items():
             if not value or key in keys_to_skip:
-                yield DictAnalyzerResult(key=key, value=value, recognizer_results=[])
+                skeleton.append((key, value, None))
                 continue  # skip this key as requested
 
             # Add the key as an additional context
@@ -110,31 +212,187 @@ class BatchAnalyzerEngine:
             specific_context.append(key)
 
             if type(value) in (str, int, bool, float):
-                results: List[RecognizerResult] = self.analyzer_engine.analyze(
-                    text=str(value), language=language, context=[key], **kwargs
-                )
+                skeleton.append((key, value, len(leaves)))
+                leaves.append((str(value), [key]))
             elif isinstance(value, dict):
                 new_keys_to_skip = self._get_nested_keys_to_skip(key, keys_to_skip)
-                results = self.analyze_dict(
-                    input_dict=value,
-                    language=language,
-                    context=specific_context,
-                    keys_to_skip=new_keys_to_skip,
-                    **kwargs,
+                nested_skeleton = self._flatten_dict(
+                    value, specific_context, new_keys_to_skip, leaves
                 )
+                skeleton.append((key, value, nested_skeleton))
             elif isinstance(value, Iterable):
-                # Recursively iterate nested dicts
+                start = len(leaves)
+                for text in self._validate_types(value):
+                    leaves.append((str(text), specific_context))
+                skeleton.append((key, value, range(start, len(leaves))))
+            else:
+                raise ValueError(f"type {type(value)} is unsupported.")
+
+        return skeleton
+
+    def _analyze_leaves(
+        self,
+        leaves: List[Tuple[str, List[str]]],
+        language: str,
+        batch_size: int,
+        n_process: int,
+        **kwargs,
+    ) -> List[List[RecognizerResult]]:
+        """
+        Analyze all leaves, running the NLP engine once per distinct text.
+
+        :param leaves: List of (text, context) tuples
+        :param language: Input language
+        :param batch_size: Batch size to process in a single iteration
+        :param n_process: Number of processors to use
+        :param kwargs: Additional parameters for the `AnalyzerEngine.analyze` method.
+        :return: A list of recognizer results per leaf
+        """
+
+        # Group leaves by text, then by context, so that each distinct text
+        # is processed once by the NLP engine and each distinct
+        # (text, context) pair is processed once by the recognizers.
+        leaves_by_text: Dict[str, Dict[Tuple[str, ...], List[int]]] = {}
+        for leaf_index, (text, context) in enumerate(leaves):
+            leaves_by_text.setdefault(text, {}).setdefault(tuple(context), []).append(
+                leaf_index
+            )
+
+        unique_texts = list(leaves_by_text.keys())
+        nlp_artifacts_batch: Iterator[Tuple[str, NlpArtifacts]] = (
+            self.analyzer_engine.nlp_engine.process_batch(
+                texts=unique_texts,
+                language=language,
+                batch_size=batch_size,
+                n_process=n_process,
+            )
+        )
+
+        batch_recognizers = self._get_batch_recognizers(language, **kwargs)
+        if batch_recognizers:
+            # Run the recognizers supporting batches once on all the texts
+            nlp_artifacts_batch = list(nlp_artifacts_batch)
+            batch_results = self._analyze_batch_recognizers(
+                batch_recognizers,
+                texts=unique_texts,
+                nlp_artifacts=[
+                    nlp_artifacts for _, nlp_artifacts in nlp_artifacts_batch
+                ],
+                language=language,
+                entities=kwargs.get("entities"),
+            )
+        else:
+            batch_results = [None] * len(unique_texts)
 
-                results: List[List[RecognizerResult]] = self.analyze_iterator(
-                    texts=value,
+        leaf_results: List[List[RecognizerResult]] = [[] for _ in leaves]
+        for text, (_, nlp_artifacts), recognizer_results in zip(
+            unique_texts, nlp_artifacts_batch, batch_results
+        ):
+            for context_index, (context, leaf_indices) in enumerate(
+                leaves_by_text[text].items()
+            ):
+                if recognizer_results and context_index > 0:
+                    # Results are updated by the context enhancement
+                    recognizer_results = {
+                        recognizer_id: [copy(result) for result in results]
+                        for recognizer_id, results in recognizer_results.items()
+                    }
+                results = self.analyzer_engine.analyze(
+                    text=text,
+                    nlp_artifacts=nlp_artifacts,
                     language=language,
-                    context=specific_context,
-                    n_process=n_process,
-                    batch_size=batch_size,
+                    context=list(context),
+                    recognizer_results=recognizer_results,
                     **kwargs,
                 )
+                leaf_results[leaf_indices[0]] = results
+                for leaf_index in leaf_indices[1:]:
+                    leaf_results[leaf_index] = [copy(result) for result in results]
+
+        return leaf_results
+
+    def _get_batch_recognizers(
+        self,
+        language: str,
+        entities: Optional[List[str]] = None,
+        ad_hoc_recognizers: Optional[List[EntityRecognizer]] = None,
+        **kwargs,
+    ) -> List[EntityRecognizer]:
+        """
+        Return the recognizers of a request which implement `analyze_batch`.
+
+        :param language: Input language
+        :param entities: The entities of the request
+        :param ad_hoc_recognizers: The ad hoc recognizers of the request
+        :param kwargs: The other parameters of the request
+        """
+        recognizers = self.analyzer_engine.registry.get_recognizers(
+            language=language,
+            entities=entities,
+            all_fields=not entities,
+            ad_hoc_recognizers=ad_hoc_recognizers,
+        )
+        return [
+            recognizer
+            for recognizer in recognizers
+            if callable(getattr(recognizer, "analyze_batch", None))
+        ]
+
+    def _analyze_batch_recognizers(
+        self,
+        recognizers: List[EntityRecognizer],
+        texts: List[str],
+        nlp_artifacts: List[NlpArtifacts],
+        language: str,
+        entities: Optional[List[str]] = None,
+    ) -> List[Dict[str, List[RecognizerResult]]]:
+        """
+        Run recognizers implementing `analyze_batch` once on all the texts.
+
+        :param recognizers: The recognizers implementing `analyze_batch`
+        :param texts: The texts to analyze
+        :param nlp_artifacts: The NlpArtifacts of each text
+        :param language: Input language
+        :param entities: The entities of the request
+        :return: The results of each recognizer (keyed by recognizer id),
+        for each text
+        """
+        if not entities:
+            entities = self.analyzer_engine.get_supported_entities(language=language)
+
+        batch_results: List[Dict[str, List[RecognizerResult]]] = [{} for _ in texts]
+        for recognizer in recognizers:
+            if not recognizer.is_loaded:
+                recognizer.load()
+                recognizer.is_loaded = True
+            recognizer_results = recognizer.analyze_batch(
+                texts=texts, entities=entities, nlp_artifacts=nlp_artifacts
+            )
+            for text_results, results in zip(batch_results, recognizer_results):
+                text_results[recognizer.id] = results
+
+        return batch_results
+
+    def _nest_results(
+        self,
+        skeleton: List[Tuple[str, Any, Any]],
+        leaf_results: List[List[RecognizerResult]],
+    ) -> Iterator[DictAnalyzerResult]:
+        """
+        Lazily rebuild the dictionary structure from the analyzed leaves.
+
+        :param skeleton: The structure returned by `_flatten_dict`
+        :param leaf_results: The recognizer results per leaf
+        """
+        for key, value, node in skeleton:
+            if node is None:
+                results = []
+            elif isinstance(node, int):
+                results = leaf_results[node]
+            elif isinstance(node, range):
+                results = [leaf_results[leaf_index] for leaf_index in node]
             else:
-                raise ValueError(f"type {type(value)} is unsupported.")
+                results = self._nest_results(node, leaf_results)
 
             yield DictAnalyzerResult(key=key, value=value, recognizer_results=results)
 
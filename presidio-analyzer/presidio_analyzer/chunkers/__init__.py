@@ -5,11 +5,17 @@ from presidio_analyzer.chunkers.character_based_text_chunker import (
     CharacterBasedTextChunker,
 )
 from presidio_analyzer.chunkers.text_chunker_provider import TextChunkerProvider
+from presidio_analyzer.chunkers.token_based_text_chunker import (
+    SentenceTokenBasedTextChunker,
+    TokenBasedTextChunker,
+)
 
 __all__ = [
     "BaseTextChunker",
     "TextChunk",
     "CharacterBasedTextChunker",
     "TextChunkerProvider",
+    "TokenBasedTextChunker",
+    "SentenceTokenBasedTextChunker",
 ]
 
@@ -1,10 +1,12 @@
 """Abstract base class for text chunking strategies."""
 from abc import ABC, abstractmethod
+from bisect import bisect_left, bisect_right
 from dataclasses import dataclass
-from typing import TYPE_CHECKING, Callable, List
+from typing import TYPE_CHECKING, Callable, Dict, List, Optional
 
 if TYPE_CHECKING:
     from presidio_analyzer import RecognizerResult
+    from presidio_analyzer.nlp_engine import NlpArtifacts
 
 
 @dataclass
@@ -40,6 +42,21 @@ class BaseTextChunker(ABC):
         """
         pass
 
+    def chunk_with_nlp_artifacts(
+        self, text: str, nlp_artifacts: Optional["NlpArtifacts"] = None
+    ) -> List[TextChunk]:
+        """Split text into chunks, using NLP artifacts when the strategy needs them.
+
+        The default implementation ignores the NLP artifacts and calls chunk().
+        Chunkers that can benefit from the NLP engine's output (e.g. sentence
+        boundaries) override this method.
+
+        :param text: The input text to split
+        :param nlp_artifacts: NLP artifacts computed for the same text, if any
+        :return: List of TextChunk objects with text and position data
+        """
+        return self.chunk(text)
+
     def predict_with_chunking(
         self,
         text: str,
@@ -64,6 +81,95 @@ class BaseTextChunker(ABC):
         predictions = self._process_chunks(chunks, predict_func)
         return self.deduplicate_overlapping_entities(predictions)
 
+    def predict_batch_with_chunking(
+        self,
+        texts: List[str],
+        predict_batch_func: Callable[[List[str]], List[List["RecognizerResult"]]],
+        batch_size: int = 8,
+        nlp_artifacts: Optional[List[Optional["NlpArtifacts"]]] = None,
+    ) -> List[List["RecognizerResult"]]:
+        """Process multiple texts, batching the chunks of all texts together.
+
+        All chunks of all texts are sorted by length and passed to
+        predict_batch_func in batches of up to batch_size chunks, so that
+        chunks of similar length are padded together by the model.
+        Predictions are then mapped back to their texts and deduplicated.
+
+        :param texts: Input texts to process
+        :param predict_batch_func: Function that takes a list of texts and
+            returns a list of RecognizerResult lists, one per input text
+        :param batch_size: Maximum number of chunks per predict_batch_func call
+        :param nlp_artifacts: Optional NLP artifacts, one per text,
+            passed to chunk_with_nlp_artifacts()
+        :return: List of RecognizerResult lists with correct offsets, per text
+        """
+        if batch_size < 1:
+            raise ValueError("batch_size must be greater than 0")
+        if nlp_artifacts is None:
+            nlp_artifacts = [None] * len(texts)
+        elif len(nlp_artifacts) != len(texts):
+            raise ValueError("nlp_artifacts must have the same length as texts")
+
+        texts_chunks = []
+        for text, text_nlp_artifacts in zip(texts, nlp_artifacts):
+            chunks = self.chunk_with_nlp_artifacts(text, text_nlp_artifacts)
+            if len(chunks) == 1:
+                # Short text is processed as is, without chunking
+                chunks = [TextChunk(text=text, start=0, end=len(text))]
+            texts_chunks.append(chunks)
+
+        all_chunks = [
+            (text_index, chunk)
+            for text_index, chunks in enumerate(texts_chunks)
+            for chunk in chunks
+        ]
+        chunks_predictions = self._predict_in_length_buckets(
+            [chunk.text for _, chunk in all_chunks], predict_batch_func, batch_size
+        )
+
+        texts_predictions = [[] for _ in texts]
+        for (text_index, chunk), chunk_predictions in zip(
+            all_chunks, chunks_predictions
+        ):
+            texts_predictions[text_index].extend(
+                self._adjust_offsets(chunk, chunk_predictions)
+            )
+
+        return [
+            self.deduplicate_overlapping_entities(predictions)
+            if len(chunks) > 1
+            else predictions
+            for chunks, predictions in zip(texts_chunks, texts_predictions)
+        ]
+
+    @staticmethod
+    def _predict_in_length_buckets(
+        texts: List[str],
+        predict_batch_func: Callable[[List[str]], List[List["RecognizerResult"]]],
+        batch_size: int,
+    ) -> List[List["RecognizerResult"]]:
+        """Call predict_batch_func on batches of texts of similar length.
+
+        :param texts: Texts to predict on
+        :param predict_batch_func: Function that takes a list of texts and
+            returns a list of RecognizerResult lists, one per input text
+        :param batch_size: Maximum number of texts per predict_batch_func call
+        :return: List of RecognizerResult lists, in the order of the input texts
+        """
+        order = sorted(range(len(texts)), key=lambda i: len(texts[i]), reverse=True)
+        predictions: List[List["RecognizerResult"]] = [[] for _ in texts]
+        for batch_start in range(0, len(order), batch_size):
+            batch_indices = order[batch_start : batch_start + batch_size]
+            batch_predictions = predict_batch_func([texts[i] for i in batch_indices])
+            if len(batch_predictions) != len(batch_indices):
+                raise ValueError(
+                    f"Expected {len(batch_indices)} predictions from batch "
+                    f"prediction function, got {len(batch_predictions)}"
+                )
+            for i, text_predictions in zip(batch_indices, batch_predictions):
+                predictions[i] = text_predictions
+        return predictions
+
     def _process_chunks(
         self,
         chunks: List[TextChunk],
@@ -76,28 +182,41 @@ class BaseTextChunker(ABC):
             RecognizerResult objects
         :return: List of RecognizerResult with adjusted offsets
         """
-        from presidio_analyzer import RecognizerResult
-
         all_predictions = []
 
         for chunk in chunks:
             chunk_predictions = process_func(chunk.text)
-
-            # Create new RecognizerResult objects with adjusted offsets
-            # to avoid mutating the original predictions
-            for pred in chunk_predictions:
-                adjusted_pred = RecognizerResult(
-                    entity_type=pred.entity_type,
-                    start=pred.start + chunk.start,
-                    end=pred.end + chunk.start,
-                    score=pred.score,
-                    analysis_explanation=pred.analysis_explanation,
-                    recognition_metadata=pred.recognition_metadata,
-                )
-                all_predictions.append(adjusted_pred)
+            all_predictions.extend(self._adjust_offsets(chunk, chunk_predictions))
 
         return all_predictions
 
+    @staticmethod
+    def _adjust_offsets(
+        chunk: TextChunk, chunk_predictions: List["RecognizerResult"]
+    ) -> List["RecognizerResult"]:
+        """Shift chunk-relative predictions to positions in the original text.
+
+        New RecognizerResult objects are created to avoid mutating the
+        original predictions.
+
+        :param chunk: The chunk the predictions were made on
+        :param chunk_predictions: Predictions with offsets relative to the chunk
+        :return: List of RecognizerResult with adjusted offsets
+        """
+        from presidio_analyzer import RecognizerResult
+
+        return [
+            RecognizerResult(
+                entity_type=pred.entity_type,
+                start=pred.start + chunk.start,
+                end=pred.end + chunk.start,
+                score=pred.score,
+                analysis_explanation=pred.analysis_explanation,
+                recognition_metadata=pred.recognition_metadata,
+            )
+            for pred in chunk_predictions
+        ]
+
     def deduplicate_overlapping_entities(
         self,
         predictions: List["RecognizerResult"],
@@ -105,6 +224,15 @@ class BaseTextChunker(ABC):
     ) -> List["RecognizerResult"]:
         """Remove duplicate entities from overlapping chunks.
 
+        Predictions are visited by descending score, and a prediction is
+        dropped if it overlaps an already kept prediction of the same entity
+        type by more than overlap_threshold of the shorter of the two.
+
+        Kept predictions are indexed by start position per entity type, so
+        each prediction is only compared with the kept predictions that can
+        overlap it (those starting less than the longest kept span before it),
+        instead of with all kept predictions.
+
         :param predictions: List of RecognizerResult objects
         :param overlap_threshold: Overlap ratio threshold to consider duplicates
             (default: 0.5)
@@ -116,31 +244,65 @@ class BaseTextChunker(ABC):
         # Sort by score descending to keep highest scoring entities
         sorted_preds = sorted(predictions, key=lambda p: p.score, reverse=True)
         unique = []
+        # Per entity type: kept starts and predictions sorted by start,
+        # and the length of the longest kept span
+        kept_starts: Dict[str, List[int]] = {}
+        kept_preds: Dict[str, List["RecognizerResult"]] = {}
+        max_kept_len: Dict[str, int] = {}
 
         for pred in sorted_preds:
-            is_duplicate = False
-            for kept in unique:
-                # Check if same entity type and overlapping positions
-                if pred.entity_type == kept.entity_type:
-                    overlap_start = max(pred.start, kept.start)
-                    overlap_end = min(pred.end, kept.end)
-
-                    if overlap_start < overlap_end:
-                        # Calculate overlap ratio
-                        overlap_len = overlap_end - overlap_start
-                        pred_len = pred.end - pred.start
-                        kept_len = kept.end - kept.start
-
-                        if pred_len <= 0 or kept_len <= 0:
-                            continue
-
-                        # Check if overlap exceeds threshold
-                        if overlap_len / min(pred_len, kept_len) > overlap_threshold:
-                            is_duplicate = True
-                            break
-
-            if not is_duplicate:
-                unique.append(pred)
+            starts = kept_starts.setdefault(pred.entity_type, [])
+            kept = kept_preds.setdefault(pred.entity_type, [])
+            pred_len = pred.end - pred.start
+
+            if pred_len > 0 and self._overlaps_kept(
+                pred,
+                starts,
+                kept,
+                max_kept_len.get(pred.entity_type, 0),
+                overlap_threshold,
+            ):
+                continue
+
+            unique.append(pred)
+            if pred_len > 0:
+                # Zero-length spans never overlap, so they are not indexed
+                index = bisect_right(starts, pred.start)
+                starts.insert(index, pred.start)
+                kept.insert(index, pred)
+                max_kept_len[pred.entity_type] = max(
+                    max_kept_len.get(pred.entity_type, 0), pred_len
+                )
 
         # Sort by position for consistent output
         return sorted(unique, key=lambda p: p.start)
+
+    @staticmethod
+    def _overlaps_kept(
+        pred: "RecognizerResult",
+        kept_starts: List[int],
+        kept_preds: List["RecognizerResult"],
+        max_kept_len: int,
+        overlap_threshold: float,
+    ) -> bool:
+        """Check whether pred duplicates one of the kept predictions.
+
+        :param pred: Prediction with a positive length
+        :param kept_starts: Start positions of kept_preds, sorted
+        :param kept_preds: Kept predictions of the same entity type,
+            with positive lengths, sorted by start
+        :param max_kept_len: Length of the longest kept prediction
+        :param overlap_threshold: Overlap ratio threshold to consider duplicates
+        """
+        pred_len = pred.end - pred.start
+        # Only spans starting in (pred.start - max_kept_len, pred.end) can overlap
+        first = bisect_right(kept_starts, pred.start - max_kept_len)
+        last = bisect_left(kept_starts, pred.end)
+        for kept in kept_preds[first:last]:
+            overlap_len = min(pred.end, kept.end) - max(pred.start, kept.start)
+            if overlap_len <= 0:
+                continue
+            kept_len = kept.end - kept.start
+            if overlap_len / min(pred_len, kept_len) > overlap_threshold:
+                return True
+        return False
@@ -7,12 +7,18 @@ from presidio_analyzer.chunkers.base_chunker import BaseTextChunker
 from presidio_analyzer.chunkers.character_based_text_chunker import (
     CharacterBasedTextChunker,
 )
+from presidio_analyzer.chunkers.token_based_text_chunker import (
+    SentenceTokenBasedTextChunker,
+    TokenBasedTextChunker,
+)
 
 logger = logging.getLogger("presidio-analyzer")
 
 # Registry mapping chunker type names to classes
 _CHUNKER_REGISTRY: Dict[str, Type[BaseTextChunker]] = {
     "character": CharacterBasedTextChunker,
+    "token": TokenBasedTextChunker,
+    "sentence": SentenceTokenBasedTextChunker,
 }
 
 
@@ -23,6 +29,7 @@ class TextChunkerProvider:
         Example::
 
             {"chunker_type": "character", "chunk_size": 300, "chunk_overlap": 75}
+            {"chunker_type": "token", "max_tokens": 512, "token_overlap": 32}
 
     If no configuration provided, uses character-based chunker with default params
     tuned for boundary coverage (chunk_size=250, chunk_overlap=50).
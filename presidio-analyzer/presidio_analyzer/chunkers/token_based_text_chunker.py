@@ -0,0 +1,277 @@
+"""Token-based text chunkers that respect a model's maximum sequence length."""
+
+import logging
+from bisect import bisect_left, bisect_right
+from typing import TYPE_CHECKING, Any, List, Optional, Tuple
+
+from presidio_analyzer.chunkers.base_chunker import BaseTextChunker, TextChunk
+
+if TYPE_CHECKING:
+    from presidio_analyzer.nlp_engine import NlpArtifacts
+
+logger = logging.getLogger("presidio-analyzer")
+
+DEFAULT_MAX_TOKENS = 512
+# Tokenizers without a real limit report a huge sentinel as model_max_length
+_MAX_SANE_MODEL_LENGTH = 100_000
+
+
+class TokenBasedTextChunker(BaseTextChunker):
+    """Split text into chunks of at most max_tokens model tokens.
+
+    Character-based chunks may exceed the model's maximum sequence length
+    for token-dense text (numbers, non-latin scripts), in which case the model
+    silently truncates them. This chunker measures chunks with the model's own
+    tokenizer and packs as many tokens as the model accepts into each chunk,
+    with an overlap of token_overlap tokens between consecutive chunks.
+
+    The tokenizer must be a HuggingFace fast tokenizer (or any callable
+    returning an ``offset_mapping`` the same way). Recognizers using this
+    chunker inject their model's tokenizer when the model is loaded,
+    so it can be left empty when the chunker is passed to a recognizer.
+
+    :param tokenizer: Tokenizer used to measure chunks
+    :param tokenizer_name: Name or path of a HuggingFace tokenizer,
+        loaded on first use if tokenizer is not provided
+    :param max_tokens: Maximum tokens per chunk, including special tokens.
+        Defaults to the tokenizer's model_max_length.
+    :param token_overlap: Number of tokens to overlap between chunks
+    """
+
+    def __init__(
+        self,
+        tokenizer: Optional[Any] = None,
+        tokenizer_name: Optional[str] = None,
+        max_tokens: Optional[int] = None,
+        token_overlap: int = 32,
+    ):
+        if max_tokens is not None and max_tokens <= 0:
+            raise ValueError("max_tokens must be greater than 0")
+        if token_overlap < 0:
+            raise ValueError("token_overlap must be non-negative")
+        if max_tokens is not None and token_overlap >= max_tokens:
+            raise ValueError("token_overlap must be less than max_tokens")
+
+        self._tokenizer = tokenizer
+        self._tokenizer_name = tokenizer_name
+        self._max_tokens = max_tokens
+        self._token_overlap = token_overlap
+
+    @property
+    def tokenizer(self) -> Optional[Any]:
+        """Tokenizer used to measure chunks, loaded from tokenizer_name if needed."""
+        if self._tokenizer is None and self._tokenizer_name:
+            self._tokenizer = self._load_tokenizer(self._tokenizer_name)
+        return self._tokenizer
+
+    @tokenizer.setter
+    def tokenizer(self, tokenizer: Any) -> None:
+        self._tokenizer = tokenizer
+
+    @property
+    def has_tokenizer(self) -> bool:
+        """Whether a tokenizer was provided or can be loaded by name."""
+        return self._tokenizer is not None or bool(self._tokenizer_name)
+
+    @property
+    def max_tokens(self) -> int:
+        """Maximum tokens per chunk, including the model's special tokens."""
+        if self._max_tokens is not None:
+            return self._max_tokens
+        model_max_length = getattr(self.tokenizer, "model_max_length", None)
+        if model_max_length and model_max_length < _MAX_SANE_MODEL_LENGTH:
+            return int(model_max_length)
+        return DEFAULT_MAX_TOKENS
+
+    @property
+    def token_overlap(self) -> int:
+        """Number of tokens to overlap between chunks."""
+        return self._token_overlap
+
+    def chunk(self, text: str) -> List[TextChunk]:
+        """Split text into chunks of at most max_tokens tokens.
+
+        :param text: The input text to chunk
+        :return: List of TextChunk objects with text and position information
+        """
+        return self._chunk(text, sentence_starts=[])
+
+    def _chunk(self, text: str, sentence_starts: List[int]) -> List[TextChunk]:
+        """Pack tokens into chunks, preferring to cut at sentence starts.
+
+        :param text: The input text to chunk
+        :param sentence_starts: Sorted character offsets of sentence starts,
+            at which chunks are preferably cut
+        :return: List of TextChunk objects with text and position information
+        """
+        if not text:
+            return []
+
+        offsets = self._token_offsets(text)
+        if not offsets:
+            return []
+
+        window = self._window_size()
+        token_starts = [start for start, _ in offsets]
+        boundaries = sorted(
+            {bisect_left(token_starts, char_start) for char_start in sentence_starts}
+            - {0}
+        )
+
+        chunks = []
+        start = previous_end = 0
+        n_tokens = len(offsets)
+        while start < n_tokens:
+            end = self._sentence_end(start, previous_end, window, n_tokens, boundaries)
+            if end is None and boundaries and start < previous_end:
+                # The overlap leaves no room for a whole new sentence, drop it
+                end = self._sentence_end(
+                    previous_end, previous_end, window, n_tokens, boundaries
+                )
+                if end is not None:
+                    start = previous_end
+            if end is None:
+                # No sentence boundary fits, cut after a full window of tokens
+                end = start + window
+
+            chunks.append(self._make_chunk(text, offsets, start, end))
+            if end >= n_tokens:
+                break
+            start = self._next_start(start, end, boundaries)
+            previous_end = end
+
+        logger.debug(
+            "Created %d chunks from %d tokens (max_tokens=%d)",
+            len(chunks),
+            n_tokens,
+            self.max_tokens,
+        )
+        return chunks
+
+    @staticmethod
+    def _sentence_end(
+        start: int,
+        previous_end: int,
+        window: int,
+        n_tokens: int,
+        boundaries: List[int],
+    ) -> Optional[int]:
+        """Get the end of a chunk starting at token start, if one fits.
+
+        :return: n_tokens if the rest of the text fits in the chunk, else the
+            last sentence boundary which fits and adds tokens after
+            previous_end, or None if there is no such boundary
+        """
+        if start + window >= n_tokens:
+            return n_tokens
+        last_fitting = bisect_right(boundaries, start + window) - 1
+        if last_fitting >= 0 and boundaries[last_fitting] > max(start, previous_end):
+            return boundaries[last_fitting]
+        return None
+
+    def _next_start(self, start: int, end: int, boundaries: List[int]) -> int:
+        """Get the first token of the chunk following tokens [start, end)."""
+        if end in boundaries:
+            # The chunk ended on a sentence boundary, so only overlap
+            # with whole sentences that fit within token_overlap
+            first_fitting = bisect_left(boundaries, end - self._token_overlap)
+            next_start = boundaries[first_fitting]
+        else:
+            next_start = end - self._token_overlap
+        return next_start if next_start > start else end
+
+    def _window_size(self) -> int:
+        """Get the number of text tokens available per chunk."""
+        special_tokens = 0
+        if hasattr(self.tokenizer, "num_special_tokens_to_add"):
+            special_tokens = self.tokenizer.num_special_tokens_to_add()
+        window = self.max_tokens - special_tokens
+        if window <= self._token_overlap:
+            raise ValueError(
+                f"token_overlap ({self._token_overlap}) must be less than the "
+                f"number of tokens available per chunk ({window})"
+            )
+        return window
+
+    def _token_offsets(self, text: str) -> List[Tuple[int, int]]:
+        """Get the character offsets of the tokens of text."""
+        if self.tokenizer is None:
+            raise ValueError(
+                f"{self.__class__.__name__} requires a tokenizer. "
+                "Pass tokenizer or tokenizer_name, or use it with a recognizer "
+                "that provides its model's tokenizer."
+            )
+        try:
+            encoding = self.tokenizer(
+                text,
+                add_special_tokens=False,
+                return_offsets_mapping=True,
+                truncation=False,
+                verbose=False,
+            )
+        except NotImplementedError as exc:
+            raise ValueError(
+                "Token-based chunking requires a fast tokenizer "
+                "that supports return_offsets_mapping"
+            ) from exc
+        # Skip empty offsets, e.g. for tokens which do not map to text
+        return [
+            (int(start), int(end))
+            for start, end in encoding["offset_mapping"]
+            if end > start
+        ]
+
+    @staticmethod
+    def _make_chunk(
+        text: str, offsets: List[Tuple[int, int]], start: int, end: int
+    ) -> TextChunk:
+        char_start = offsets[start][0]
+        char_end = offsets[end - 1][1]
+        return TextChunk(text=text[char_start:char_end], start=char_start, end=char_end)
+
+    @staticmethod
+    def _load_tokenizer(tokenizer_name: str) -> Any:
+        try:
+            from transformers import AutoTokenizer
+        except ImportError as exc:
+            raise ImportError(
+                "transformers is not installed. Please install it "
+                "(pip install transformers) or pass a tokenizer instance."
+            ) from exc
+        return AutoTokenizer.from_pretrained(tokenizer_name, use_fast=True)
+
+
+class SentenceTokenBasedTextChunker(TokenBasedTextChunker):
+    """Token-based chunker which keeps sentences whole when possible.
+
+    Sentence boundaries are taken from the spaCy Doc in the NlpArtifacts
+    the analyzer already computed, so no additional NLP processing is needed.
+    Chunks are cut at the last sentence boundary that fits within max_tokens,
+    and overlap with whole preceding sentences that fit within token_overlap.
+    Sentences longer than a chunk, and texts without sentence information,
+    are split as in TokenBasedTextChunker.
+    """
+
+    def chunk_with_nlp_artifacts(
+        self, text: str, nlp_artifacts: Optional["NlpArtifacts"] = None
+    ) -> List[TextChunk]:
+        """Split text into chunks, cutting at sentence boundaries when possible.
+
+        :param text: The input text to chunk
+        :param nlp_artifacts: NLP artifacts computed for the same text
+        :return: List of TextChunk objects with text and position information
+        """
+        return self._chunk(text, self._sentence_starts(text, nlp_artifacts))
+
+    @staticmethod
+    def _sentence_starts(
+        text: str, nlp_artifacts: Optional["NlpArtifacts"]
+    ) -> List[int]:
+        """Get the character offsets of sentence starts from the spaCy Doc."""
+        doc = getattr(nlp_artifacts, "tokens", None)
+        if doc is None or not hasattr(doc, "has_annotation"):
+            return []
+        if doc.text != text or not doc.has_annotation("SENT_START"):
+            logger.debug("No sentence boundaries available, chunking by tokens")
+            return []
+        return [sent.start_char for sent in doc.sents]
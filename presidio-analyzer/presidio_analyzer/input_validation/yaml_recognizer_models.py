@@ -174,6 +174,9 @@ class HuggingFaceRecognizerConfig(PredefinedRecognizerConfig):
     label_prefixes: Optional[List[str]] = Field(
         default=None, description="Prefixes to strip from labels (e.g. B-, I-)"
     )
+    batch_size: Optional[int] = Field(
+        None, ge=1, description="Maximum number of chunks per model call"
+    )
 
     def model_dump(self, *args, **kwargs) -> Dict[str, Any]:
         """Serialize the config without None values by default.
@@ -200,6 +203,9 @@ class GLiNERRecognizerConfig(PredefinedRecognizerConfig):
     map_location: Optional[str] = Field(None, description="Device (cpu/gpu/etc.)")
     load_onnx_model: Optional[bool] = Field(None, description="Load ONNX model")
     onnx_model_file: Optional[str] = Field(None, description="ONNX model file name")
+    batch_size: Optional[int] = Field(
+        None, ge=1, description="Maximum number of chunks per model call"
+    )
     entity_mapping: Optional[Dict[str, str]] = Field(None, description="Entity mapping")
 
     @model_validator(mode="after")
@@ -0,0 +1,40 @@
+"""Lazy imports of the public names of a package (PEP 562)."""
+
+import importlib
+import sys
+from typing import Any, Callable, Dict, List, Tuple
+
+
+def lazy_imports(
+    package_name: str, imports: Dict[str, str]
+) -> Tuple[Callable[[str], Any], Callable[[], List[str]]]:
+    """Create the module __getattr__ and __dir__ of a package with lazy imports.
+
+    Each name is only imported from its module the first time it is accessed
+    (e.g. by ``from package import Name``), and then stored in the package so
+    later accesses are regular attribute lookups.
+
+    :param package_name: Name of the package (its __name__).
+    :param imports: Module of each name, relative to the package (e.g.
+        ".generic.email_recognizer") or absolute. A submodule of the package
+        is mapped to itself (e.g. "nlp_engine": ".nlp_engine").
+    :return: The __getattr__ and __dir__ functions to define in the package.
+    """
+    package = sys.modules[package_name]
+
+    def __getattr__(name: str) -> Any:  # noqa: N807
+        module_name = imports.get(name)
+        if module_name is None:
+            raise AttributeError(f"module {package_name!r} has no attribute {name!r}")
+        module = importlib.import_module(module_name, package_name)
+        if module.__name__ == f"{package_name}.{name}":
+            value = module
+        else:
+            value = getattr(module, name)
+        setattr(package, name, value)
+        return value
+
+    def __dir__() -> List[str]:  # noqa: N807
+        return sorted(set(vars(package)) | set(imports))
+
+    return __getattr__, __dir__
@@ -0,0 +1,158 @@
+"""Export AnalyzerMetrics to Prometheus or OpenTelemetry.
+
+Both exporters read the cumulative metrics when they are collected, so they
+add no cost to the analysis of each request. They require the optional
+``prometheus-client`` or ``opentelemetry-api`` packages
+(``pip install presidio-analyzer[prometheus]`` or
+``presidio-analyzer[opentelemetry]``).
+
+Usage:
+    from prometheus_client import REGISTRY
+    from presidio_analyzer.metrics_exporters import PrometheusMetricsCollector
+
+    REGISTRY.register(PrometheusMetricsCollector(analyzer.metrics))
+"""
+
+from typing import Iterable, List, Optional
+
+from presidio_analyzer.analyzer_metrics import RECOGNIZER_COUNTERS, AnalyzerMetrics
+
+try:
+    from prometheus_client.core import CounterMetricFamily, SummaryMetricFamily
+except ImportError:
+    CounterMetricFamily = None
+    SummaryMetricFamily = None
+
+try:
+    from opentelemetry import metrics as otel_metrics
+except ImportError:
+    otel_metrics = None
+
+METRICS_PREFIX = "presidio_analyzer"
+
+
+class PrometheusMetricsCollector:
+    """Prometheus collector of the metrics of an AnalyzerEngine.
+
+    :param metrics: The AnalyzerMetrics of the engine.
+    :param prefix: Prefix of the names of the Prometheus metrics.
+    """
+
+    def __init__(self, metrics: AnalyzerMetrics, prefix: str = METRICS_PREFIX):
+        if CounterMetricFamily is None:
+            raise ImportError(
+                "prometheus_client is not installed. "
+                "Install it with `pip install presidio-analyzer[prometheus]`"
+            )
+        self.metrics = metrics
+        self.prefix = prefix
+
+    def collect(self) -> Iterable:
+        """Collect the current metrics, as Prometheus metric families."""
+        stats = self.metrics.get_stats()
+
+        requests = CounterMetricFamily(
+            f"{self.prefix}_requests", "Number of analyzed requests"
+        )
+        requests.add_metric([], stats["requests"])
+        yield requests
+
+        stages = SummaryMetricFamily(
+            f"{self.prefix}_stage_seconds",
+            "Time spent in each stage of the analysis",
+            labels=["stage"],
+        )
+        for stage, totals in stats["stages"].items():
+            stages.add_metric([stage], totals["count"], totals["seconds"])
+        yield stages
+
+        labels = ["recognizer", "language"]
+        recognizers = SummaryMetricFamily(
+            f"{self.prefix}_recognizer_seconds",
+            "Time spent in the analyze method of each recognizer",
+            labels=labels,
+        )
+        counters = {
+            counter: CounterMetricFamily(
+                f"{self.prefix}_recognizer_{counter}",
+                f"Number of {counter} of each recognizer",
+                labels=labels,
+            )
+            for counter in RECOGNIZER_COUNTERS
+        }
+        for recognizer in stats["recognizers"]:
+            values = [recognizer["name"], recognizer["language"]]
+            recognizers.add_metric(values, recognizer["count"], recognizer["seconds"])
+            for counter, family in counters.items():
+                family.add_metric(values, recognizer[counter])
+        yield recognizers
+        yield from counters.values()
+
+
+def register_opentelemetry_metrics(
+    metrics: AnalyzerMetrics, meter: Optional["otel_metrics.Meter"] = None
+) -> List:
+    """
+    Register observable OpenTelemetry counters reporting the metrics of an engine.
+
+    :param metrics: The AnalyzerMetrics of the engine.
+    :param meter: The meter to create the instruments with, defaults to the
+        "presidio-analyzer" meter of the global meter provider.
+    :return: The created instruments.
+    """
+    if otel_metrics is None:
+        raise ImportError(
+            "opentelemetry-api is not installed. "
+            "Install it with `pip install presidio-analyzer[opentelemetry]`"
+        )
+    if meter is None:
+        meter = otel_metrics.get_meter("presidio-analyzer")
+
+    def observe_requests(options) -> Iterable:
+        yield otel_metrics.Observation(metrics.get_stats()["requests"])
+
+    def observe_stages(options) -> Iterable:
+        for stage, totals in metrics.get_stats()["stages"].items():
+            yield otel_metrics.Observation(totals["seconds"], {"stage": stage})
+
+    def observe_recognizers(key: str):
+        def observe(options) -> Iterable:
+            for recognizer in metrics.get_stats()["recognizers"]:
+                yield otel_metrics.Observation(
+                    recognizer[key],
+                    {
+                        "recognizer": recognizer["name"],
+                        "language": recognizer["language"],
+                    },
+                )
+
+        return observe
+
+    instruments = [
+        meter.create_observable_counter(
+            f"{METRICS_PREFIX}.requests",
+            callbacks=[observe_requests],
+            description="Number of analyzed requests",
+        ),
+        meter.create_observable_counter(
+            f"{METRICS_PREFIX}.stage.duration",
+            callbacks=[observe_stages],
+            unit="s",
+            description="Time spent in each stage of the analysis",
+        ),
+        meter.create_observable_counter(
+            f"{METRICS_PREFIX}.recognizer.duration",
+            callbacks=[observe_recognizers("seconds")],
+            unit="s",
+            description="Time spent in the analyze method of each recognizer",
+        ),
+    ]
+    for counter in RECOGNIZER_COUNTERS:
+        instruments.append(
+            meter.create_observable_counter(
+                f"{METRICS_PREFIX}.recognizer.{counter}",
+                callbacks=[observe_recognizers(counter)],
+                description=f"Number of {counter} of each recognizer",
+            )
+        )
+    return instruments
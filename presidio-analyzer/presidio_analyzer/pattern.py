@@ -3,6 +3,8 @@ from typing import Dict
 
 import regex as re
 
+from presidio_analyzer.regex_cache import regex_cache
+
 
 class Pattern:
     """
@@ -57,6 +59,17 @@ class Pattern:
         """
         return cls(**pattern_dict)
 
+    def __setstate__(self, state: Dict) -> None:
+        """
+        Restore a pickled pattern, e.g. from an analyzer engine snapshot.
+
+        Its compiled regex is added to the process-wide regex cache, so that it
+        is not compiled again on the first request.
+        """
+        self.__dict__.update(state)
+        if self.compiled_regex is not None:
+            regex_cache.add(self.regex, self.compiled_with_flags, self.compiled_regex)
+
     def __repr__(self):
         """Return string representation of instance."""
         return json.dumps(self.to_dict())
@@ -1,6 +1,6 @@
-import datetime
 import logging
 import os
+import time
 from typing import TYPE_CHECKING, Dict, List, Optional
 
 import regex as re
@@ -12,6 +12,8 @@ from presidio_analyzer import (
     Pattern,
     RecognizerResult,
 )
+from presidio_analyzer.analyzer_metrics import get_current_request_metrics
+from presidio_analyzer.regex_cache import regex_cache
 
 if TYPE_CHECKING:
     from presidio_analyzer.nlp_engine import NlpArtifacts
@@ -94,6 +96,21 @@ class PatternRecognizer(LocalRecognizer):
     def load(self):  # noqa: D102
         pass
 
+    def compile_patterns(self, flags: Optional[int] = None) -> None:
+        """
+        Compile the regexes of the patterns.
+
+        Compiled regexes are shared by all recognizers through the process-wide
+        regex cache, which analyze also compiles through, so compiling the
+        patterns ahead of time warms up the cache for the first request.
+
+        :param flags: regex flags (defaults to global_regex_flags)
+        """
+        flags = flags if flags else self.global_regex_flags
+        for pattern in self.patterns:
+            pattern.compiled_regex = regex_cache.compile(pattern.regex, flags)
+            pattern.compiled_with_flags = flags
+
     def analyze(
         self,
         text: str,
@@ -203,25 +220,20 @@ class PatternRecognizer(LocalRecognizer):
         :return: A list of RecognizerResult
         """
         flags = flags if flags else self.global_regex_flags
+
         results = []
+        n_matches = 0
+        n_validated = 0
+        n_invalidated = 0
         for pattern in self.patterns:
-            match_start_time = datetime.datetime.now()
-
-            # Compile regex if flags differ from flags the regex was compiled with
-            if not pattern.compiled_regex or pattern.compiled_with_flags != flags:
-                pattern.compiled_with_flags = flags
-                pattern.compiled_regex = re.compile(pattern.regex, flags=flags)
+            match_start_time = time.perf_counter()
+            # Not stored on the pattern, which is shared by concurrent requests
+            compiled_regex = regex_cache.compile(pattern.regex, flags)
 
             try:
-                matches = pattern.compiled_regex.finditer(
+                matches = compiled_regex.finditer(
                     text, timeout=REGEX_TIMEOUT_SECONDS
                 )
-                match_time = datetime.datetime.now() - match_start_time
-                logger.debug(
-                    "--- match_time[%s]: %.6f seconds",
-                    pattern.name,
-                    match_time.total_seconds(),
-                )
 
                 for match in matches:
                     start, end = match.span()
@@ -231,6 +243,7 @@ class PatternRecognizer(LocalRecognizer):
                     if current_match == "":
                         continue
 
+                    n_matches += 1
                     score = pattern.score
 
                     validation_result = self.validate_result(current_match)
@@ -264,11 +277,23 @@ class PatternRecognizer(LocalRecognizer):
                     if invalidation_result is not None and invalidation_result:
                         pattern_result.score = EntityRecognizer.MIN_SCORE
 
+                    if validation_result is False or invalidation_result:
+                        n_invalidated += 1
+                    elif validation_result:
+                        n_validated += 1
+
                     if pattern_result.score > EntityRecognizer.MIN_SCORE:
                         results.append(pattern_result)
 
                     # Update analysis explanation score after validation or invalidation
                     description.score = pattern_result.score
+
+                # The matches are found lazily, while iterating over them
+                logger.debug(
+                    "--- match_time[%s]: %.6f seconds",
+                    pattern.name,
+                    time.perf_counter() - match_start_time,
+                )
             except TimeoutError:
                 logger.warning(
                     "Regex pattern '%s' timed out after %s seconds, skipping.",
@@ -277,6 +302,10 @@ class PatternRecognizer(LocalRecognizer):
                     exc_info=True,
                 )
 
+        request_metrics = get_current_request_metrics()
+        if request_metrics is not None:
+            request_metrics.record_matches(self, n_matches, n_validated, n_invalidated)
+
         results = EntityRecognizer.remove_duplicates(results)
         return results
 
@@ -1,13 +1,20 @@
 """Generic recognizers package."""
 
-from .credit_card_recognizer import CreditCardRecognizer
-from .crypto_recognizer import CryptoRecognizer
-from .email_recognizer import EmailRecognizer
-from .iban_recognizer import IbanRecognizer
-from .ip_recognizer import IpRecognizer
-from .mac_recognizer import MacAddressRecognizer
-from .phone_recognizer import PhoneRecognizer
-from .url_recognizer import UrlRecognizer
+from presidio_analyzer.lazy_imports import lazy_imports
+
+__getattr__, __dir__ = lazy_imports(
+    __name__,
+    {
+        "CreditCardRecognizer": ".credit_card_recognizer",
+        "CryptoRecognizer": ".crypto_recognizer",
+        "EmailRecognizer": ".email_recognizer",
+        "IbanRecognizer": ".iban_recognizer",
+        "IpRecognizer": ".ip_recognizer",
+        "MacAddressRecognizer": ".mac_recognizer",
+        "PhoneRecognizer": ".phone_recognizer",
+        "UrlRecognizer": ".url_recognizer",
+    },
+)
 
 __all__ = [
     "CreditCardRecognizer",
@@ -17,6 +17,7 @@ from presidio_analyzer.predefined_recognizers.generic.iban_patterns import (
     EOS,
     regex_per_country,
 )
+from presidio_analyzer.regex_cache import regex_cache
 
 logger = logging.getLogger("presidio-analyzer")
 
@@ -144,11 +145,14 @@ class IbanRecognizer(PatternRecognizer):
         :return: A list of RecognizerResult
         """
         flags = flags if flags else self.global_regex_flags
+
         results = []
         for pattern in self.patterns:
+            # Not stored on the pattern, which is shared by concurrent requests
+            compiled_regex = regex_cache.compile(pattern.regex, flags)
             try:
-                matches = re.finditer(
-                    pattern.regex, text, flags=flags, timeout=REGEX_TIMEOUT_SECONDS
+                matches = compiled_regex.finditer(
+                    text, timeout=REGEX_TIMEOUT_SECONDS
                 )
 
                 for match in matches:
@@ -229,9 +233,9 @@ class IbanRecognizer(PatternRecognizer):
             if bos_eos and country_regex:
                 country_regex = bos_eos[0] + country_regex + bos_eos[1]
             try:
-                return country_regex and re.match(
-                    country_regex, iban, flags=flags, timeout=REGEX_TIMEOUT_SECONDS
-                )
+                return country_regex and regex_cache.compile(
+                    country_regex, flags
+                ).match(iban, timeout=REGEX_TIMEOUT_SECONDS)
             except TimeoutError:
                 logger.warning(
                     "IBAN format validation regex timed out after %s seconds.",
@@ -1,8 +1,15 @@
 """NER-based recognizers package."""
 
-from .gliner_recognizer import GLiNERRecognizer
-from .huggingface_ner_recognizer import HuggingFaceNerRecognizer
-from .medical_ner_recognizer import MedicalNERRecognizer
+from presidio_analyzer.lazy_imports import lazy_imports
+
+__getattr__, __dir__ = lazy_imports(
+    __name__,
+    {
+        "GLiNERRecognizer": ".gliner_recognizer",
+        "HuggingFaceNerRecognizer": ".huggingface_ner_recognizer",
+        "MedicalNERRecognizer": ".medical_ner_recognizer",
+    },
+)
 
 __all__ = [
     "GLiNERRecognizer",
@@ -1,13 +1,15 @@
 import json
 import logging
-from typing import Dict, List, Optional
+import re
+from functools import partial
+from typing import Any, Dict, List, Optional
 
 from presidio_analyzer import (
     AnalysisExplanation,
     LocalRecognizer,
     RecognizerResult,
 )
-from presidio_analyzer.chunkers import BaseTextChunker
+from presidio_analyzer.chunkers import BaseTextChunker, TokenBasedTextChunker
 from presidio_analyzer.nlp_engine import (
     NerModelConfiguration,
     NlpArtifacts,
@@ -22,6 +24,28 @@ except ImportError:
 
 logger = logging.getLogger("presidio-analyzer")
 
+# GLiNER splits texts into words with this regex, and truncates them to
+# config.max_len words (including the prompt of the labels)
+GLINER_WORD_REGEX = re.compile(r"\w+(?:[-_]\w+)*|\S")
+DEFAULT_GLINER_MAX_LEN = 384
+
+
+class _GLiNERWordTokenizer:
+    """Tokenizer measuring texts in GLiNER words, for TokenBasedTextChunker.
+
+    :param model_max_length: Maximum number of words of a chunk.
+    """
+
+    def __init__(self, model_max_length: int):
+        self.model_max_length = model_max_length
+
+    def __call__(self, text: str, **kwargs) -> Dict[str, List]:
+        return {
+            "offset_mapping": [
+                match.span() for match in GLINER_WORD_REGEX.finditer(text)
+            ]
+        }
+
 
 class GLiNERRecognizer(LocalRecognizer):
     """GLiNER model based entity recognizer."""
@@ -42,6 +66,7 @@ class GLiNERRecognizer(LocalRecognizer):
         text_chunker: Optional[BaseTextChunker] = None,
         load_onnx_model: bool = False,
         onnx_model_file: str = "model.onnx",
+        batch_size: int = 8,
         **model_kwargs,
     ):
         """GLiNER model based entity recognizer.
@@ -65,7 +90,8 @@ class GLiNERRecognizer(LocalRecognizer):
             If None, will auto-detect GPU or use CPU.
         :param text_chunker: Custom text chunking strategy. If None, uses
             CharacterBasedTextChunker with default settings (chunk_size=250,
-            chunk_overlap=50)
+            chunk_overlap=50). A TokenBasedTextChunker without a tokenizer
+            is given the model's tokenizer when the model is loaded.
         :param load_onnx_model: Whether to load the model using ONNX Runtime.
             If True, uses ONNX Runtime backend which supports CPUs without AVX2.
             Requires onnxruntime to be installed. Default is False.
@@ -73,6 +99,9 @@ class GLiNERRecognizer(LocalRecognizer):
             Only used when load_onnx_model is True. This is passed directly to
             GLiNER.from_pretrained(). GLiNER looks for this file in the model
             directory (downloaded or cached model path). Default is "model.onnx".
+        :param batch_size: Maximum number of chunks passed to the model
+            in a single call. Chunks of similar length are batched
+            together to minimize padding. Default is 8.
         :param model_kwargs: Additional keyword arguments to pass to
             GLiNER.from_pretrained(). This allows passing future parameters
             to the GLiNER model without explicit support in this recognizer.
@@ -117,6 +146,9 @@ class GLiNERRecognizer(LocalRecognizer):
         self.load_onnx_model = load_onnx_model
         self.onnx_model_file = onnx_model_file
         self.model_kwargs = model_kwargs
+        if batch_size < 1:
+            raise ValueError("batch_size must be greater than 0")
+        self.batch_size = batch_size
 
         # Use provided chunker or default to in-house character-based chunker
         if text_chunker is not None:
@@ -130,6 +162,7 @@ class GLiNERRecognizer(LocalRecognizer):
             )
 
         self.gliner = None
+        self.gliner_labels = list(self.model_to_presidio_entity_mapping.keys())
 
         super().__init__(
             supported_entities=supported_entities,
@@ -139,8 +172,6 @@ class GLiNERRecognizer(LocalRecognizer):
             context=context,
         )
 
-        self.gliner_labels = list(self.model_to_presidio_entity_mapping.keys())
-
     def load(self) -> None:
         """Load the GLiNER model."""
         if not GLiNER:
@@ -154,6 +185,15 @@ class GLiNERRecognizer(LocalRecognizer):
             **self.model_kwargs,
         )
 
+        if (
+            isinstance(self.text_chunker, TokenBasedTextChunker)
+            and not self.text_chunker.has_tokenizer
+        ):
+            # GLiNER truncates texts by words, not by transformer tokens
+            self.text_chunker.tokenizer = _GLiNERWordTokenizer(
+                self._get_max_words(self.gliner_labels)
+            )
+
     def analyze(
         self,
         text: str,
@@ -164,57 +204,168 @@ class GLiNERRecognizer(LocalRecognizer):
 
         :param text: The text to be analyzed
         :param entities: The list of entities this recognizer is requested to return
-        :param nlp_artifacts: N/A for this recognizer
+        :param nlp_artifacts: Only passed to the text chunker,
+            e.g. for sentence-aware chunking
+        """
+
+        return self.analyze_batch(
+            texts=[text], entities=entities, nlp_artifacts=[nlp_artifacts]
+        )[0]
+
+    def analyze_batch(
+        self,
+        texts: List[str],
+        entities: List[str],
+        nlp_artifacts: Optional[List[Optional[NlpArtifacts]]] = None,
+    ) -> List[List[RecognizerResult]]:
+        """Analyze multiple texts, batching the chunks of all texts together.
+
+        Chunks from all texts are passed to the model in batches of up to
+        `batch_size` chunks, which is significantly faster than calling
+        `analyze` for each text separately.
+
+        :param texts: The texts to be analyzed
+        :param entities: The list of entities this recognizer is requested to return
+        :param nlp_artifacts: Optional NLP artifacts, one per text,
+            passed to the text chunker
+        :return: List of RecognizerResult lists, one per text
         """
 
+        entities = entities or []
+        if nlp_artifacts is None:
+            nlp_artifacts = [None] * len(texts)
+        texts_to_analyze = [
+            (index, text) for index, text in enumerate(texts) if text and text.strip()
+        ]
+        batch_results: List[List[RecognizerResult]] = [[] for _ in texts]
+        if not texts_to_analyze:
+            return batch_results
+
+        if not self.gliner:
+            self.load()
+
         # combine the input labels as this model allows for ad-hoc labels
         labels = self.__create_input_labels(entities)
+        if isinstance(
+            getattr(self.text_chunker, "tokenizer", None), _GLiNERWordTokenizer
+        ):
+            self.text_chunker.tokenizer.model_max_length = self._get_max_words(labels)
+
+        # Process texts with automatic chunking and batching
+        results = self.text_chunker.predict_batch_with_chunking(
+            texts=[text for _, text in texts_to_analyze],
+            predict_batch_func=partial(
+                self._predict_chunks, labels=labels, entities=entities
+            ),
+            batch_size=self.batch_size,
+            nlp_artifacts=[nlp_artifacts[index] for index, _ in texts_to_analyze],
+        )
+        for (index, _), text_results in zip(texts_to_analyze, results):
+            batch_results[index] = text_results
+
+        return batch_results
+
+    def _get_max_words(self, labels: List[str]) -> int:
+        """Get the number of words of a chunk, given the labels of the prompt.
 
-        # Process text with automatic chunking
-        def predict_func(text: str) -> List[RecognizerResult]:
-            # Get predictions from GLiNER (returns dicts)
-            gliner_predictions = self.gliner.predict_entities(
-                text=text,
+        :param labels: The labels passed to the model
+        :return: The model's max_len, minus the words of the labels prompt
+            (each label, preceded by an entity token, and a separator token)
+        """
+        config = getattr(self.gliner, "config", None)
+        max_len = getattr(config, "max_len", None)
+        if not isinstance(max_len, int):
+            max_len = DEFAULT_GLINER_MAX_LEN
+        prompt_length = 1 + sum(
+            1 + len(GLINER_WORD_REGEX.findall(label)) for label in labels
+        )
+        max_words = max_len - prompt_length
+        min_words = getattr(self.text_chunker, "token_overlap", 0) + 1
+        if max_words < min_words:
+            logger.warning(
+                "The labels prompt (%d words) leaves no room for text within "
+                "the GLiNER max_len (%d words), using chunks of %d words",
+                prompt_length,
+                max_len,
+                min_words,
+            )
+            max_words = min_words
+        return max_words
+
+    def _predict_chunks(
+        self, chunk_texts: List[str], labels: List[str], entities: List[str]
+    ) -> List[List[RecognizerResult]]:
+        """Get GLiNER predictions for a batch of text chunks.
+
+        :param chunk_texts: The chunks of text to analyze
+        :param labels: The labels to pass to the model
+        :param entities: The list of entities this recognizer is requested to return
+        :return: List of RecognizerResult lists, one per chunk
+        """
+        if len(chunk_texts) == 1:
+            batch_predictions = [
+                self.gliner.predict_entities(
+                    text=chunk_texts[0],
+                    labels=labels,
+                    flat_ner=self.flat_ner,
+                    threshold=self.threshold,
+                    multi_label=self.multi_label,
+                )
+            ]
+        elif hasattr(self.gliner, "inference"):
+            batch_predictions = self.gliner.inference(
+                texts=chunk_texts,
+                labels=labels,
+                flat_ner=self.flat_ner,
+                threshold=self.threshold,
+                multi_label=self.multi_label,
+                batch_size=self.batch_size,
+            )
+        else:
+            # GLiNER versions without `inference`
+            batch_predictions = self.gliner.batch_predict_entities(
+                texts=chunk_texts,
                 labels=labels,
                 flat_ner=self.flat_ner,
                 threshold=self.threshold,
                 multi_label=self.multi_label,
             )
 
-            # Convert dicts to RecognizerResult objects
-            results = []
-            for pred in gliner_predictions:
-                presidio_entity = self.model_to_presidio_entity_mapping.get(
-                    pred["label"], pred["label"]
-                )
-
-                # Filter by requested entities
-                if entities and presidio_entity not in entities:
-                    continue
+        return [
+            self._to_recognizer_results(gliner_predictions, entities)
+            for gliner_predictions in batch_predictions
+        ]
 
-                analysis_explanation = AnalysisExplanation(
-                    recognizer=self.name,
-                    original_score=pred["score"],
-                    textual_explanation=f"Identified as {presidio_entity} by GLiNER",
-                )
+    def _to_recognizer_results(
+        self, gliner_predictions: List[Dict[str, Any]], entities: List[str]
+    ) -> List[RecognizerResult]:
+        """Convert GLiNER prediction dicts to RecognizerResult objects."""
+        results = []
+        for pred in gliner_predictions:
+            presidio_entity = self.model_to_presidio_entity_mapping.get(
+                pred["label"], pred["label"]
+            )
 
-                results.append(
-                    RecognizerResult(
-                        entity_type=presidio_entity,
-                        start=pred["start"],
-                        end=pred["end"],
-                        score=pred["score"],
-                        analysis_explanation=analysis_explanation,
-                    )
-                )
-            return results
+            # Filter by requested entities
+            if entities and presidio_entity not in entities:
+                continue
 
-        predictions = self.text_chunker.predict_with_chunking(
-            text=text,
-            predict_func=predict_func,
-        )
+            analysis_explanation = AnalysisExplanation(
+                recognizer=self.name,
+                original_score=pred["score"],
+                textual_explanation=f"Identified as {presidio_entity} by GLiNER",
+            )
 
-        return predictions
+            results.append(
+                RecognizerResult(
+                    entity_type=presidio_entity,
+                    start=pred["start"],
+                    end=pred["end"],
+                    score=pred["score"],
+                    analysis_explanation=analysis_explanation,
+                )
+            )
+        return results
 
     def __create_input_labels(self, entities):
         """Append the entities requested by the user to the list of labels if it's not there."""  # noqa: E501
@@ -22,7 +22,11 @@ from presidio_analyzer import (
     LocalRecognizer,
     RecognizerResult,
 )
-from presidio_analyzer.chunkers import BaseTextChunker, CharacterBasedTextChunker
+from presidio_analyzer.chunkers import (
+    BaseTextChunker,
+    CharacterBasedTextChunker,
+    TokenBasedTextChunker,
+)
 from presidio_analyzer.nlp_engine import NlpArtifacts, device_detector
 
 try:
@@ -117,6 +121,7 @@ class HuggingFaceNerRecognizer(LocalRecognizer):
         tokenizer_name: Optional[str] = None,
         text_chunker: Optional[BaseTextChunker] = None,
         label_prefixes: Optional[List[str]] = None,
+        batch_size: int = 8,
         **kwargs,
     ):
         """Initialize the HuggingFace NER Recognizer.
@@ -146,7 +151,12 @@ class HuggingFaceNerRecognizer(LocalRecognizer):
         :param tokenizer_name: Name of the tokenizer. Defaults to model_name.
         :param text_chunker: Custom text chunking strategy. If None, uses
             CharacterBasedTextChunker with provided chunk_size and chunk_overlap.
+            A TokenBasedTextChunker without a tokenizer is given the
+            model's tokenizer when the model is loaded.
         :param label_prefixes: List of label prefixes to strip (e.g., B-, I-).
+        :param batch_size: Maximum number of chunks passed to the model
+            in a single forward pass. Chunks of similar length are batched
+            together to minimize padding.
         :raises ImportError: If transformers or torch libraries are not installed.
         """
         # Early check for required dependencies
@@ -175,8 +185,20 @@ class HuggingFaceNerRecognizer(LocalRecognizer):
             )
         self.device = self._parse_device(device)
         self.label_prefixes = label_prefixes or ["B-", "I-", "U-", "L-"]
+        if batch_size < 1:
+            raise ValueError("batch_size must be greater than 0")
+        self.batch_size = batch_size
         self.ner_pipeline = None
 
+        # Initialize the text chunker before load() is called by the base class
+        if text_chunker:
+            self.text_chunker = text_chunker
+        else:
+            self.text_chunker = CharacterBasedTextChunker(
+                chunk_size=chunk_size,
+                chunk_overlap=chunk_overlap,
+            )
+
         if kwargs:
             logger.warning(
                 "Ignoring unsupported kwargs in %s: %s",
@@ -199,15 +221,6 @@ class HuggingFaceNerRecognizer(LocalRecognizer):
             context=context,
         )
 
-        # Initialize the text chunker
-        if text_chunker:
-            self.text_chunker = text_chunker
-        else:
-            self.text_chunker = CharacterBasedTextChunker(
-                chunk_size=chunk_size,
-                chunk_overlap=chunk_overlap,
-            )
-
         logger.info(
             f"Initialized {self.name} with model={self.model_name}, "
             f"threshold={self.threshold}, device={self.device}"
@@ -290,6 +303,12 @@ class HuggingFaceNerRecognizer(LocalRecognizer):
             logger.exception(f"Failed to load model {self.model_name}")
             raise
 
+        if (
+            isinstance(self.text_chunker, TokenBasedTextChunker)
+            and not self.text_chunker.has_tokenizer
+        ):
+            self.text_chunker.tokenizer = self.ner_pipeline.tokenizer
+
     def _normalize_label(self, label: str) -> str:
         """Normalize label by removing prefixes like B-/I-/U-/L-.
 
@@ -313,7 +332,6 @@ class HuggingFaceNerRecognizer(LocalRecognizer):
         :param chunk_text: The chunk of text to analyze.
         :return: List of RecognizerResult objects.
         """
-        chunk_results = []
         # Run inference on the chunk
         try:
             preds = self.ner_pipeline(chunk_text)
@@ -321,6 +339,44 @@ class HuggingFaceNerRecognizer(LocalRecognizer):
             logger.warning(f"NER prediction failed for chunk: {e}", exc_info=True)
             return []
 
+        return self._convert_predictions(preds)
+
+    def _predict_chunks(self, chunk_texts: List[str]) -> List[List[RecognizerResult]]:
+        """Perform NER prediction on a batch of text chunks in one pipeline call.
+
+        This is a callback method used by the text chunker's batch prediction.
+        If the batched call fails, chunks are predicted one by one so that
+        a single failing chunk does not discard the whole batch.
+
+        :param chunk_texts: The chunks of text to analyze.
+        :return: List of RecognizerResult lists, one per chunk.
+        """
+        if len(chunk_texts) == 1:
+            return [self._predict_chunk(chunk_texts[0])]
+
+        try:
+            batch_preds = self.ner_pipeline(chunk_texts, batch_size=self.batch_size)
+        except Exception as e:
+            logger.warning(
+                f"Batched NER prediction failed, predicting chunks one by one: {e}",
+                exc_info=True,
+            )
+            return [self._predict_chunk(chunk_text) for chunk_text in chunk_texts]
+
+        if not isinstance(batch_preds, list) or len(batch_preds) != len(chunk_texts):
+            logger.warning("Unexpected batched pipeline output: %s", type(batch_preds))
+            return [self._predict_chunk(chunk_text) for chunk_text in chunk_texts]
+
+        return [self._convert_predictions(preds) for preds in batch_preds]
+
+    def _convert_predictions(self, preds: Any) -> List[RecognizerResult]:
+        """Convert the pipeline output for one text to RecognizerResult objects.
+
+        :param preds: The HuggingFace pipeline output for a single text.
+        :return: List of RecognizerResult objects.
+        """
+        chunk_results = []
+
         # Helper to process a single prediction dictionary
         def process_pred(pred: Dict[str, Any]) -> None:
             """Convert a single HuggingFace prediction dict to RecognizerResult."""
@@ -399,12 +455,13 @@ class HuggingFaceNerRecognizer(LocalRecognizer):
     ) -> List[RecognizerResult]:
         """Analyze text for NER entities using HuggingFace model.
 
-        This method uses the CharacterBasedTextChunker to handle long texts
-        and ignores nlp_artifacts (spaCy results) to bypass tokenizer alignment issues.
+        This method uses the text chunker to handle long texts and does not
+        use spaCy tokens or entities, to bypass tokenizer alignment issues.
 
         :param text: The text to analyze
         :param entities: List of entity types to detect
-        :param nlp_artifacts: Ignored (spaCy artifacts not used)
+        :param nlp_artifacts: Only passed to the text chunker,
+            e.g. for sentence-aware chunking
         :return: List of RecognizerResult with detected entities
         """
         if not text or not text.strip():
@@ -416,13 +473,62 @@ class HuggingFaceNerRecognizer(LocalRecognizer):
         if not self.ner_pipeline:
             self.load()
 
-        # Use the standard predict_with_chunking method from BaseTextChunker
-        # This handles chunking, processing, and duplicating/merging results
-        results = self.text_chunker.predict_with_chunking(
-            text=text,
-            predict_func=self._predict_chunk,
+        # Use the batched prediction of BaseTextChunker, which handles chunking,
+        # batching the chunks through the model, and deduplicating results
+        results = self.text_chunker.predict_batch_with_chunking(
+            texts=[text],
+            predict_batch_func=self._predict_chunks,
+            batch_size=self.batch_size,
+            nlp_artifacts=[nlp_artifacts],
+        )[0]
+
+        return self._filter_entities(results, entities)
+
+    def analyze_batch(
+        self,
+        texts: List[str],
+        entities: List[str],
+        nlp_artifacts: Optional[List[Optional[NlpArtifacts]]] = None,
+    ) -> List[List[RecognizerResult]]:
+        """Analyze multiple texts, batching the chunks of all texts together.
+
+        Chunks from all texts are passed to the model in batches of up to
+        `batch_size` chunks, which is significantly faster than calling
+        `analyze` for each text separately.
+
+        :param texts: The texts to analyze
+        :param entities: List of entity types to detect
+        :param nlp_artifacts: Optional NLP artifacts, one per text,
+            passed to the text chunker
+        :return: List of RecognizerResult lists, one per text
+        """
+        entities = entities or []
+        if nlp_artifacts is None:
+            nlp_artifacts = [None] * len(texts)
+        texts_to_analyze = [
+            (index, text) for index, text in enumerate(texts) if text and text.strip()
+        ]
+        batch_results: List[List[RecognizerResult]] = [[] for _ in texts]
+        if not texts_to_analyze:
+            return batch_results
+
+        if not self.ner_pipeline:
+            self.load()
+
+        results = self.text_chunker.predict_batch_with_chunking(
+            texts=[text for _, text in texts_to_analyze],
+            predict_batch_func=self._predict_chunks,
+            batch_size=self.batch_size,
+            nlp_artifacts=[nlp_artifacts[index] for index, _ in texts_to_analyze],
         )
+        for (index, _), text_results in zip(texts_to_analyze, results):
+            batch_results[index] = self._filter_entities(text_results, entities)
+
+        return batch_results
 
+    def _filter_entities(
+        self, results: List[RecognizerResult], entities: List[str]
+    ) -> List[RecognizerResult]:
         # Filter policy:
         # 1. If an entity is requested, it is always kept.
         # 2. If it's a known 'supported' entity but NOT requested, it is filtered out.
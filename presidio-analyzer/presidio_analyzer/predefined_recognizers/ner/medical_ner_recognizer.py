@@ -40,6 +40,7 @@ class MedicalNERRecognizer(HuggingFaceNerRecognizer):
         threshold: float = 0.3,
         device: Optional[Union[str, int]] = None,
         text_chunker: Optional[BaseTextChunker] = None,
+        batch_size: int = 8,
     ):
         """Initialize the Medical NER recognizer.
 
@@ -54,6 +55,7 @@ class MedicalNERRecognizer(HuggingFaceNerRecognizer):
         :param threshold: Minimum confidence score (0.0 - 1.0)
         :param device: Device string/int (None = auto-detect)
         :param text_chunker: Custom text chunker (None = default)
+        :param batch_size: Maximum number of chunks per model call
         """
         super().__init__(
             model_name=model_name,
@@ -65,4 +67,5 @@ class MedicalNERRecognizer(HuggingFaceNerRecognizer):
             threshold=threshold,
             device=device,
             text_chunker=text_chunker,
+            batch_size=batch_size,
         )
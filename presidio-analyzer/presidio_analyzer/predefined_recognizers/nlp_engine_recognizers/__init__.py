@@ -1,8 +1,15 @@
 """NLP engine recognizers package."""
 
-from .spacy_recognizer import SpacyRecognizer
-from .stanza_recognizer import StanzaRecognizer
-from .transformers_recognizer import TransformersRecognizer
+from presidio_analyzer.lazy_imports import lazy_imports
+
+__getattr__, __dir__ = lazy_imports(
+    __name__,
+    {
+        "SpacyRecognizer": ".spacy_recognizer",
+        "StanzaRecognizer": ".stanza_recognizer",
+        "TransformersRecognizer": ".transformers_recognizer",
+    },
+)
 
 __all__ = [
     "SpacyRecognizer",
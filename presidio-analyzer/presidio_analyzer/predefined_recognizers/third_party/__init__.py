@@ -1,9 +1,16 @@
 """Third-party recognizers package."""
 
-from .ahds_recognizer import AzureHealthDeidRecognizer
-from .azure_ai_language import AzureAILanguageRecognizer
-from .azure_openai_langextract_recognizer import AzureOpenAILangExtractRecognizer
-from .langextract_recognizer import LangExtractRecognizer
+from presidio_analyzer.lazy_imports import lazy_imports
+
+__getattr__, __dir__ = lazy_imports(
+    __name__,
+    {
+        "AzureHealthDeidRecognizer": ".ahds_recognizer",
+        "AzureAILanguageRecognizer": ".azure_ai_language",
+        "AzureOpenAILangExtractRecognizer": ".azure_openai_langextract_recognizer",
+        "LangExtractRecognizer": ".langextract_recognizer",
+    },
+)
 
 __all__ = [
     "AzureAILanguageRecognizer",
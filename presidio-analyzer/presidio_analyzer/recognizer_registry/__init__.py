@@ -1,6 +1,15 @@
 """Recognizer Registry."""
 
-from .recognizer_registry import RecognizerRegistry
-from .recognizer_registry_provider import RecognizerRegistryProvider
+from presidio_analyzer.lazy_imports import lazy_imports
+
+# Imported lazily, as the registry imports the NLP engines and the configuration
+# validation, which itself imports recognizers_loader_utils from this package
+__getattr__, __dir__ = lazy_imports(
+    __name__,
+    {
+        "RecognizerRegistry": ".recognizer_registry",
+        "RecognizerRegistryProvider": ".recognizer_registry_provider",
+    },
+)
 
 __all__ = ["RecognizerRegistry", "RecognizerRegistryProvider"]
@@ -19,7 +19,11 @@ from typing import (
 
 import yaml
 
-from presidio_analyzer import EntityRecognizer, PatternRecognizer
+from presidio_analyzer import (
+    EntityRecognizer,
+    PatternRecognizer,
+    predefined_recognizers,
+)
 
 logger = logging.getLogger("presidio-analyzer")
 
@@ -251,12 +255,16 @@ class RecognizerListLoader:
         """
         Get the recognizer class by name.
 
-        Returns the requested recognizer class out of the list of all existing
+        Predefined recognizers are imported from their module on demand.
+        Other recognizers are looked up in the list of all existing
         recognizers currently inheriting from EntityRecognizer.
         Raises a ValueError if the recognizer is not found.
 
         :param recognizer_name: The name of the recognizer.
         """
+        if recognizer_name in predefined_recognizers.RECOGNIZER_MODULES:
+            return getattr(predefined_recognizers, recognizer_name)
+
         all_existing_recognizers = RecognizerListLoader.get_all_existing_recognizers()
         for recognizer in all_existing_recognizers:
             if recognizer_name == recognizer.__name__:
@@ -0,0 +1,119 @@
+"""Process-wide cache of compiled regexes.
+
+Compiled regexes are shared by all the pattern-based recognizers of the
+process, keyed by the regex and its flags, so that a regex used by several
+recognizers or engines, or with several flags (e.g. per-request
+``regex_flags``), is only compiled once per (regex, flags).
+
+The maximum number of compiled regexes kept can be set via the
+PRESIDIO_REGEX_CACHE_SIZE environment variable.
+
+Usage:
+    from presidio_analyzer.regex_cache import regex_cache
+    compiled_regex = regex_cache.compile("[0-9]+", re.IGNORECASE)
+    print(regex_cache.get_stats())
+"""
+
+import os
+import threading
+import time
+from collections import OrderedDict
+from typing import Dict, Tuple, Union
+
+import regex as re
+
+REGEX_CACHE_SIZE_ENV_VAR = "PRESIDIO_REGEX_CACHE_SIZE"
+
+# Flags used by default by PatternRecognizer
+DEFAULT_REGEX_FLAGS = re.DOTALL | re.MULTILINE | re.IGNORECASE
+
+
+class RegexCache:
+    """Thread-safe LRU cache of compiled regexes, keyed by (regex, flags).
+
+    :param max_size: Maximum number of compiled regexes to keep.
+    """
+
+    def __init__(self, max_size: int = 4096):
+        if max_size < 1:
+            raise ValueError("max_size must be positive")
+        self.max_size = max_size
+        self._compiled: "OrderedDict[Tuple[str, int], re.Pattern]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._compile_seconds = 0.0
+
+    def compile(self, regex: str, flags: int = 0) -> re.Pattern:
+        """
+        Return the compiled regex, compiling it on the first call.
+
+        :param regex: The regex to compile.
+        :param flags: Regex flags to compile the regex with.
+        :return: The compiled regex.
+        """
+        key = (regex, flags)
+        with self._lock:
+            compiled_regex = self._compiled.get(key)
+            if compiled_regex is not None:
+                self._compiled.move_to_end(key)
+                self._hits += 1
+                return compiled_regex
+
+        # Compiled outside of the lock, as compiling large regexes is slow
+        start_time = time.perf_counter()
+        compiled_regex = re.compile(regex, flags=flags)
+        compile_seconds = time.perf_counter() - start_time
+
+        with self._lock:
+            self._misses += 1
+            self._compile_seconds += compile_seconds
+            self._compiled[key] = compiled_regex
+            while len(self._compiled) > self.max_size:
+                self._compiled.popitem(last=False)
+        return compiled_regex
+
+    def add(self, regex: str, flags: int, compiled_regex: re.Pattern) -> None:
+        """
+        Add a regex compiled elsewhere, e.g. restored from a snapshot.
+
+        The statistics are not changed, and an already cached regex is kept.
+
+        :param regex: The regex.
+        :param flags: Regex flags the regex was compiled with.
+        :param compiled_regex: The compiled regex.
+        """
+        key = (regex, flags)
+        with self._lock:
+            if key in self._compiled:
+                return
+            self._compiled[key] = compiled_regex
+            while len(self._compiled) > self.max_size:
+                self._compiled.popitem(last=False)
+
+    def get_stats(self) -> Dict[str, Union[int, float]]:
+        """
+        Return statistics of the cache.
+
+        :return: Number of hits and misses (compilations), number of compiled
+        regexes kept, maximum size, and total time spent compiling.
+        """
+        with self._lock:
+            return {
+                "hits": self._hits,
+                "misses": self._misses,
+                "size": len(self._compiled),
+                "max_size": self.max_size,
+                "compile_seconds": self._compile_seconds,
+            }
+
+    def clear(self) -> None:
+        """Remove all compiled regexes and reset the statistics."""
+        with self._lock:
+            self._compiled.clear()
+            self._hits = 0
+            self._misses = 0
+            self._compile_seconds = 0.0
+
+
+regex_cache = RegexCache(max_size=int(os.environ.get(REGEX_CACHE_SIZE_ENV_VAR, 4096)))
@@ -19,6 +19,7 @@ from presidio_analyzer.nlp_engine import (
     SpacyNlpEngine,
 )
 from presidio_analyzer.recognizer_registry import RecognizerRegistryProvider
+from presidio_analyzer.regex_cache import regex_cache
 
 # noqa: F401
 from tests import assert_result
@@ -104,6 +105,23 @@ def test_when_analyze_with_unsupported_language_must_match(registry_config, anal
             nlp_engine=NlpEngineMock(),
         )
 
+def test_when_engine_created_then_pattern_recognizers_are_compiled():
+    regex = r"engine-warmup-test-\d+"
+    recognizer = PatternRecognizer(
+        supported_entity="WARMUP", patterns=[Pattern("warmup", regex, 0.5)]
+    )
+    registry = RecognizerRegistry()
+    registry.add_recognizer(recognizer)
+    AnalyzerEngine(registry=registry, nlp_engine=NlpEngineMock())
+
+    pattern = recognizer.patterns[0]
+    assert pattern.compiled_regex is not None
+    assert pattern.compiled_with_flags == recognizer.global_regex_flags
+    assert pattern.compiled_regex is regex_cache.compile(
+        regex, recognizer.global_regex_flags
+    )
+
+
 def test_when_analyze_with_defaults_success(
 ):
     registry = RecognizerRegistryProvider().create_recognizer_registry()
@@ -5,6 +5,8 @@ from unittest.mock import patch
 
 from presidio_analyzer import AnalyzerEngineProvider, RecognizerResult, PatternRecognizer
 from presidio_analyzer.nlp_engine import SpacyNlpEngine, NlpArtifacts
+from presidio_analyzer.regex_cache import regex_cache
+from tests.mocks import NlpEngineMock
 
 
 from presidio_analyzer.predefined_recognizers import (
@@ -691,3 +693,110 @@ def test_install_models_from_nlp_config_missing_models_raises_value_error():
     """nlp_configuration without models raises ValueError."""
     with pytest.raises(ValueError, match="models"):
         _install_models_from_nlp_config({"nlp_engine_name": "spacy"})
+
+
+@pytest.fixture
+def load_nlp_engine_mock():
+    with patch.object(
+        AnalyzerEngineProvider, "_load_nlp_engine", return_value=NlpEngineMock()
+    ) as load_nlp_engine:
+        yield load_nlp_engine
+
+
+def test_analyzer_engine_provider_snapshot_is_saved_and_restored(
+    tmp_path, load_nlp_engine_mock
+):
+    snapshot_path = tmp_path / "snapshot" / "analyzer.pkl"
+    engine = AnalyzerEngineProvider().create_engine(snapshot_path=snapshot_path)
+    assert snapshot_path.exists()
+    assert load_nlp_engine_mock.call_count == 1
+
+    restored = AnalyzerEngineProvider().create_engine(snapshot_path=snapshot_path)
+    assert load_nlp_engine_mock.call_count == 1
+    assert restored is not engine
+    assert sorted(r.name for r in restored.registry.recognizers) == sorted(
+        r.name for r in engine.registry.recognizers
+    )
+
+    # Patterns are saved compiled
+    pattern_recognizers = [
+        r for r in restored.registry.recognizers if isinstance(r, PatternRecognizer)
+    ]
+    assert pattern_recognizers
+    for recognizer in pattern_recognizers:
+        assert all(pattern.compiled_regex for pattern in recognizer.patterns)
+
+    text = "Email me at john@example.com"
+    assert restored.analyze(text, language="en") == engine.analyze(
+        text, language="en"
+    )
+
+
+def test_analyzer_engine_provider_restored_snapshot_compiles_no_patterns(
+    tmp_path, load_nlp_engine_mock
+):
+    snapshot_path = tmp_path / "analyzer.pkl"
+    engine = AnalyzerEngineProvider().create_engine(snapshot_path=snapshot_path)
+    deny_list_recognizer = PatternRecognizer(
+        supported_entity="TITLE", deny_list=["Snapshot-Dr", "Snapshot-Prof"]
+    )
+    engine.registry.add_recognizer(deny_list_recognizer)
+    provider = AnalyzerEngineProvider()
+    assert provider.save_snapshot(engine, snapshot_path)
+
+    # As in a new process
+    regex_cache.clear()
+    restored = provider.load_snapshot(snapshot_path)
+    results = restored.analyze(
+        "Snapshot-Dr John, john@example.com", language="en"
+    )
+
+    assert {r.entity_type for r in results} >= {"TITLE", "EMAIL_ADDRESS"}
+    assert regex_cache.get_stats()["misses"] == 0
+
+
+def test_analyzer_engine_provider_snapshot_with_other_configuration_is_ignored(
+    tmp_path, load_nlp_engine_mock
+):
+    snapshot_path = tmp_path / "analyzer.pkl"
+    AnalyzerEngineProvider().create_engine(snapshot_path=snapshot_path)
+
+    analyzer_yaml = tmp_path / "analyzer.yaml"
+    analyzer_yaml.write_text("supported_languages:\n- en\ndefault_score_threshold: 0.5\n")
+    provider = AnalyzerEngineProvider(analyzer_engine_conf_file=analyzer_yaml)
+    assert provider.load_snapshot(snapshot_path) is None
+
+    engine = provider.create_engine(snapshot_path=snapshot_path)
+    assert engine.default_score_threshold == 0.5
+    assert load_nlp_engine_mock.call_count == 2
+
+    # The snapshot was replaced with the new configuration
+    assert provider.load_snapshot(snapshot_path).default_score_threshold == 0.5
+
+
+def test_analyzer_engine_provider_snapshot_with_other_versions_is_ignored(
+    tmp_path, load_nlp_engine_mock
+):
+    snapshot_path = tmp_path / "analyzer.pkl"
+    provider = AnalyzerEngineProvider()
+    provider.create_engine(snapshot_path=snapshot_path)
+
+    versions = {**provider.get_snapshot_versions(), "presidio-analyzer": "0.0.1"}
+    with patch.object(
+        AnalyzerEngineProvider, "get_snapshot_versions", return_value=versions
+    ):
+        assert provider.load_snapshot(snapshot_path) is None
+
+
+def test_analyzer_engine_provider_invalid_snapshot_is_ignored(
+    tmp_path, load_nlp_engine_mock
+):
+    snapshot_path = tmp_path / "analyzer.pkl"
+    snapshot_path.write_bytes(b"not a snapshot")
+    provider = AnalyzerEngineProvider()
+    assert provider.load_snapshot(snapshot_path) is None
+    assert provider.load_snapshot(tmp_path / "missing.pkl") is None
+
+    engine = provider.create_engine(snapshot_path=snapshot_path)
+    assert engine is not None
+    assert provider.load_snapshot(snapshot_path) is not None
@@ -0,0 +1,166 @@
+import pickle
+
+import pytest
+from presidio_analyzer import (
+    AnalyzerEngine,
+    AnalyzerMetrics,
+    Pattern,
+    PatternRecognizer,
+    RecognizerRegistry,
+)
+from presidio_analyzer.analyzer_metrics import (
+    NLP_STAGE,
+    RECOGNIZERS_STAGE,
+    TOTAL_STAGE,
+    get_current_request_metrics,
+)
+from presidio_analyzer.nlp_engine import NlpArtifacts
+from presidio_analyzer.predefined_recognizers import CreditCardRecognizer
+
+from tests.mocks import NlpEngineMock
+
+
+@pytest.fixture
+def metrics_analyzer_engine():
+    registry = RecognizerRegistry(
+        recognizers=[
+            CreditCardRecognizer(),
+            PatternRecognizer(
+                supported_entity="ZIP",
+                name="ZipRecognizer",
+                patterns=[Pattern(name="zip", regex=r"\b\d{5}\b", score=0.5)],
+            ),
+        ]
+    )
+    nlp_artifacts = NlpArtifacts([], [], [], [], None, "en")
+    return AnalyzerEngine(
+        registry=registry,
+        nlp_engine=NlpEngineMock(
+            stopwords=[], punct_words=[], nlp_artifacts=nlp_artifacts
+        ),
+        metrics=AnalyzerMetrics(),
+    )
+
+
+def get_recognizer_stats(stats, name):
+    return next(r for r in stats["recognizers"] if r["name"] == name)
+
+
+def test_when_no_metrics_then_engine_metrics_is_none(mock_registry, mock_nlp_engine):
+    analyzer = AnalyzerEngine(registry=mock_registry, nlp_engine=mock_nlp_engine)
+    analyzer.analyze("My zip is 12345", language="en")
+
+    assert analyzer.metrics is None
+    assert get_current_request_metrics() is None
+
+
+def test_when_analyze_then_stages_are_recorded(metrics_analyzer_engine):
+    metrics_analyzer_engine.analyze("My zip is 12345", language="en")
+    metrics_analyzer_engine.analyze("My zip is 54321", language="en")
+
+    stats = metrics_analyzer_engine.metrics.get_stats()
+    assert stats["requests"] == 2
+    for stage in (NLP_STAGE, RECOGNIZERS_STAGE, TOTAL_STAGE):
+        assert stats["stages"][stage]["count"] == 2
+        assert stats["stages"][stage]["seconds"] >= 0
+    assert (
+        stats["stages"][TOTAL_STAGE]["seconds"]
+        >= stats["stages"][RECOGNIZERS_STAGE]["seconds"]
+    )
+    assert get_current_request_metrics() is None
+
+
+def test_when_analyze_then_recognizer_matches_are_counted(metrics_analyzer_engine):
+    text = "Cards 4012888888881881 and 4012888888881882, zip 12345"
+    results = metrics_analyzer_engine.analyze(text, language="en")
+
+    stats = metrics_analyzer_engine.metrics.get_stats()
+    credit_card = get_recognizer_stats(stats, "CreditCardRecognizer")
+    assert credit_card["count"] == 1
+    assert credit_card["language"] == "en"
+    assert credit_card["matches"] == 2
+    assert credit_card["validated"] == 1
+    assert credit_card["invalidated"] == 1
+    assert credit_card["results"] == 1
+
+    zip_code = get_recognizer_stats(stats, "ZipRecognizer")
+    assert zip_code["matches"] == 1
+    assert zip_code["validated"] == 0
+    assert zip_code["invalidated"] == 0
+    assert zip_code["results"] == 1
+    assert len(results) == 2
+
+
+def test_when_on_request_then_called_with_request_metrics(metrics_analyzer_engine):
+    requests = []
+    metrics_analyzer_engine.metrics.on_request = requests.append
+
+    metrics_analyzer_engine.analyze("My zip is 12345", language="en")
+
+    assert len(requests) == 1
+    request = requests[0].to_dict()
+    assert request["language"] == "en"
+    assert TOTAL_STAGE in request["stages"]
+    assert {r["name"] for r in request["recognizers"]} == {
+        "CreditCardRecognizer",
+        "ZipRecognizer",
+    }
+
+
+def test_when_analyze_fails_then_current_request_metrics_are_restored(
+    metrics_analyzer_engine, mocker
+):
+    mocker.patch.object(
+        metrics_analyzer_engine.nlp_engine,
+        "process_text",
+        side_effect=RuntimeError("nlp failed"),
+    )
+    outer_request_metrics = metrics_analyzer_engine.metrics.start_request("en")
+
+    with pytest.raises(RuntimeError):
+        metrics_analyzer_engine.analyze("My zip is 12345", language="en")
+
+    assert get_current_request_metrics() is outer_request_metrics
+    metrics_analyzer_engine.metrics.stop_request(outer_request_metrics)
+    assert get_current_request_metrics() is None
+    assert metrics_analyzer_engine.metrics.get_stats()["requests"] == 0
+
+
+def test_when_reset_then_metrics_are_empty(metrics_analyzer_engine):
+    metrics_analyzer_engine.analyze("My zip is 12345", language="en")
+
+    metrics_analyzer_engine.metrics.reset()
+
+    assert metrics_analyzer_engine.metrics.get_stats() == {
+        "requests": 0,
+        "stages": {},
+        "recognizers": [],
+    }
+
+
+def test_when_pickled_then_metrics_are_kept(metrics_analyzer_engine):
+    metrics_analyzer_engine.analyze("My zip is 12345", language="en")
+
+    metrics = pickle.loads(pickle.dumps(metrics_analyzer_engine.metrics))
+
+    assert metrics.get_stats() == metrics_analyzer_engine.metrics.get_stats()
+    metrics.reset()
+    assert metrics.get_stats()["requests"] == 0
+
+
+def test_when_prometheus_collector_then_metrics_are_exported(metrics_analyzer_engine):
+    prometheus_client = pytest.importorskip("prometheus_client")
+    from presidio_analyzer.metrics_exporters import PrometheusMetricsCollector
+
+    metrics_analyzer_engine.analyze("My zip is 12345", language="en")
+    registry = prometheus_client.CollectorRegistry(auto_describe=False)
+    registry.register(PrometheusMetricsCollector(metrics_analyzer_engine.metrics))
+
+    assert registry.get_sample_value("presidio_analyzer_requests_total") == 1
+    assert (
+        registry.get_sample_value(
+            "presidio_analyzer_recognizer_matches_total",
+            {"recognizer": "ZipRecognizer", "language": "en"},
+        )
+        == 1
+    )
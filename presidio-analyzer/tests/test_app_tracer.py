@@ -0,0 +1,131 @@
+import json
+import pickle
+from unittest.mock import patch
+
+import pytest
+from presidio_analyzer import (
+    AnalyzerEngine,
+    Pattern,
+    PatternRecognizer,
+    RecognizerRegistry,
+)
+from presidio_analyzer.app_tracer import AppTracer, SampledAppTracer
+from presidio_analyzer.nlp_engine import NlpArtifacts
+
+from tests.mocks import NlpEngineMock
+
+
+def create_engine(app_tracer: AppTracer) -> AnalyzerEngine:
+    registry = RecognizerRegistry(
+        recognizers=[
+            PatternRecognizer(
+                supported_entity="ZIP",
+                name="ZipRecognizer",
+                patterns=[Pattern(name="zip", regex=r"\b\d{5}\b", score=0.5)],
+            )
+        ]
+    )
+    nlp_artifacts = NlpArtifacts([], [], [], [], None, "en")
+    return AnalyzerEngine(
+        registry=registry,
+        nlp_engine=NlpEngineMock(
+            stopwords=[], punct_words=[], nlp_artifacts=nlp_artifacts
+        ),
+        app_tracer=app_tracer,
+        log_decision_process=True,
+    )
+
+
+def read_rows(path):
+    with open(path, encoding="utf-8") as f:
+        return [json.loads(line) for line in f]
+
+
+def test_when_sampled_tracer_then_events_are_written_as_json_lines(tmp_path):
+    output_path = tmp_path / "traces.jsonl"
+    engine = create_engine(SampledAppTracer(output_path=str(output_path)))
+
+    engine.analyze("My zip is 12345", language="en", correlation_id="abc")
+    engine.app_tracer.close()
+
+    rows = read_rows(output_path)
+    assert [row["event"] for row in rows] == [
+        "nlp",
+        "recognizer",
+        "context_enhancement",
+        "results",
+        "end",
+    ]
+    assert all(row["request_id"] == "abc" for row in rows)
+    assert rows[1]["recognizer"] == "ZipRecognizer"
+    assert rows[1]["results"] == 1
+    assert rows[3]["results"] == [["ZIP", 10, 15, 0.5, "ZipRecognizer"]]
+    assert rows[-1]["total_ms"] >= rows[2]["offset_ms"]
+
+
+def test_when_sample_rate_then_one_in_n_requests_is_traced(tmp_path):
+    output_path = tmp_path / "traces.jsonl"
+    engine = create_engine(
+        SampledAppTracer(sample_rate=3, output_path=str(output_path))
+    )
+
+    for i in range(7):
+        engine.analyze("My zip is 12345", language="en", correlation_id=str(i))
+
+    request_ids = {row["request_id"] for row in read_rows(output_path)}
+    assert request_ids == {"0", "3", "6"}
+
+
+def test_when_latency_threshold_then_fast_requests_are_not_exported(tmp_path):
+    output_path = tmp_path / "traces.jsonl"
+    engine = create_engine(
+        SampledAppTracer(latency_threshold=60, output_path=str(output_path))
+    )
+
+    engine.analyze("My zip is 12345", language="en")
+
+    assert not output_path.exists()
+
+
+def test_when_no_output_path_then_rows_are_traced():
+    engine = create_engine(SampledAppTracer())
+
+    with patch.object(engine.app_tracer, "trace") as trace:
+        engine.analyze("My zip is 12345", language="en", correlation_id="abc")
+
+    assert trace.call_count == 5
+    request_id, row = trace.call_args.args
+    assert request_id == "abc"
+    assert json.loads(row)["event"] == "end"
+
+
+def test_when_disabled_then_nothing_is_traced(tmp_path):
+    output_path = tmp_path / "traces.jsonl"
+    engine = create_engine(
+        SampledAppTracer(output_path=str(output_path), enabled=False)
+    )
+
+    engine.analyze("My zip is 12345", language="en")
+
+    assert not output_path.exists()
+
+
+@pytest.mark.parametrize(
+    "kwargs",
+    [{"sample_rate": 0}, {"latency_threshold": -1}],
+)
+def test_when_invalid_parameters_then_sampled_tracer_raises(kwargs):
+    with pytest.raises(ValueError):
+        SampledAppTracer(**kwargs)
+
+
+def test_when_pickled_then_sampled_tracer_can_export(tmp_path):
+    output_path = tmp_path / "traces.jsonl"
+    tracer = SampledAppTracer(sample_rate=2, output_path=str(output_path))
+    create_engine(tracer).analyze("My zip is 12345", language="en")
+
+    engine = create_engine(pickle.loads(pickle.dumps(tracer)))
+    engine.analyze("My zip is 12345", language="en")
+    engine.app_tracer.close()
+
+    assert len({row["timestamp"] for row in read_rows(output_path)}) == 2
@@ -1,4 +1,6 @@
 """Tests for BaseTextChunker methods."""
+import random
+
 import pytest
 
 from presidio_analyzer import RecognizerResult
@@ -40,6 +42,81 @@ class TestPredictWithChunking:
         assert result[0].start == text.index("Jane")
 
 
+class TestPredictBatchWithChunking:
+    """Test predict_batch_with_chunking orchestration."""
+
+    @staticmethod
+    def _find_names(chunks):
+        results = []
+        for chunk in chunks:
+            chunk_results = []
+            for name in ("John", "Jane"):
+                if name in chunk:
+                    idx = chunk.index(name)
+                    chunk_results.append(
+                        RecognizerResult(
+                            entity_type="PERSON", start=idx, end=idx + 4, score=0.9
+                        )
+                    )
+            results.append(chunk_results)
+        return results
+
+    def test_results_match_predict_with_chunking(self):
+        """Batched predictions are equal to per-text chunked predictions."""
+        chunker = CharacterBasedTextChunker(chunk_size=20, chunk_overlap=5)
+        texts = [
+            "John Smith lives in New York City with Jane Doe",
+            "Jane",
+            "",
+            "Nothing to see here, but John is around the corner",
+        ]
+
+        batch_results = chunker.predict_batch_with_chunking(
+            texts, self._find_names, batch_size=3
+        )
+
+        assert len(batch_results) == len(texts)
+        for text, results in zip(texts, batch_results):
+            expected = chunker.predict_with_chunking(
+                text, lambda chunk: self._find_names([chunk])[0]
+            )
+            assert [(r.start, r.end) for r in results] == [
+                (r.start, r.end) for r in expected
+            ]
+
+    def test_chunks_batched_by_length(self):
+        """Chunks of all texts are batched, longest first, up to batch_size."""
+        chunker = CharacterBasedTextChunker(chunk_size=20, chunk_overlap=5)
+        texts = ["a b", "John Smith lives in New York City with Jane Doe", "abcdef"]
+        batches = []
+
+        def predict_batch_func(chunks):
+            batches.append(chunks)
+            return [[] for _ in chunks]
+
+        chunker.predict_batch_with_chunking(texts, predict_batch_func, batch_size=2)
+
+        num_chunks = len(chunker.chunk(texts[1])) + 2
+        assert sum(len(batch) for batch in batches) == num_chunks
+        assert all(len(batch) <= 2 for batch in batches)
+        lengths = [len(chunk) for batch in batches for chunk in batch]
+        assert lengths == sorted(lengths, reverse=True)
+
+    def test_wrong_number_of_predictions_raises(self):
+        """A batch function returning a wrong number of results raises."""
+        chunker = CharacterBasedTextChunker(chunk_size=20, chunk_overlap=5)
+
+        with pytest.raises(ValueError):
+            chunker.predict_batch_with_chunking(["a", "b"], lambda chunks: [[]])
+
+    def test_invalid_batch_size_raises(self):
+        """batch_size must be positive."""
+        chunker = CharacterBasedTextChunker()
+
+        with pytest.raises(ValueError):
+            chunker.predict_batch_with_chunking(["a"], lambda c: [[]], batch_size=0)
+
+
 class TestDeduplicateOverlappingEntities:
     """Test deduplication of overlapping entities from chunk boundaries."""
 
@@ -105,6 +182,65 @@ class TestDeduplicateOverlappingEntities:
         result = chunker.deduplicate_overlapping_entities(predictions)
         assert len(result) == 2
 
+    def test_long_kept_span_still_deduplicates_later_starting_spans(self):
+        """A long kept span is found even when it starts well before the match."""
+        chunker = CharacterBasedTextChunker()
+        predictions = [
+            RecognizerResult(entity_type="PERSON", start=0, end=100, score=0.9),
+            RecognizerResult(entity_type="PERSON", start=90, end=95, score=0.5),
+            RecognizerResult(entity_type="PERSON", start=200, end=205, score=0.4),
+        ]
+
+        result = chunker.deduplicate_overlapping_entities(predictions)
+
+        assert [(r.start, r.end) for r in result] == [(0, 100), (200, 205)]
+
+    @pytest.mark.parametrize("seed", range(5))
+    @pytest.mark.parametrize("overlap_threshold", [0.0, 0.5, 0.9])
+    def test_matches_pairwise_comparison(self, seed, overlap_threshold):
+        """Result is identical to comparing each prediction with all kept ones."""
+
+        def pairwise_deduplicate(predictions):
+            unique = []
+            for pred in sorted(predictions, key=lambda p: p.score, reverse=True):
+                is_duplicate = False
+                for kept in unique:
+                    if pred.entity_type != kept.entity_type:
+                        continue
+                    overlap_len = min(pred.end, kept.end) - max(pred.start, kept.start)
+                    pred_len = pred.end - pred.start
+                    kept_len = kept.end - kept.start
+                    if overlap_len <= 0 or pred_len <= 0 or kept_len <= 0:
+                        continue
+                    if overlap_len / min(pred_len, kept_len) > overlap_threshold:
+                        is_duplicate = True
+                        break
+                if not is_duplicate:
+                    unique.append(pred)
+            return sorted(unique, key=lambda p: p.start)
+
+        rnd = random.Random(seed)
+        predictions = []
+        for _ in range(300):
+            start = rnd.randint(0, 2000)
+            predictions.append(
+                RecognizerResult(
+                    entity_type=rnd.choice(["PERSON", "LOCATION"]),
+                    start=start,
+                    end=start + rnd.choice([0, 1, 3, 8, 20, 60]),
+                    score=round(rnd.random(), 1),
+                )
+            )
+
+        chunker = CharacterBasedTextChunker()
+        result = chunker.deduplicate_overlapping_entities(
+            predictions, overlap_threshold=overlap_threshold
+        )
+
+        assert [id(r) for r in result] == [
+            id(r) for r in pairwise_deduplicate(predictions)
+        ]
+
 
 class TestPredictWithChunkingEdgeCases:
     """Test edge cases in predict_with_chunking."""
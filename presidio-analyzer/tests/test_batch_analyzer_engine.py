@@ -1,5 +1,14 @@
 import pytest
-from presidio_analyzer import RecognizerResult, BatchAnalyzerEngine, DictAnalyzerResult
+from presidio_analyzer import (
+    AnalyzerEngine,
+    BatchAnalyzerEngine,
+    DictAnalyzerResult,
+    EntityRecognizer,
+    RecognizerRegistry,
+    RecognizerResult,
+)
+
+from tests.mocks import NlpEngineMock
 
 
 @pytest.fixture(scope="module")
@@ -288,3 +297,132 @@ def test_batch_analyze_iterator_returns_list_of_recognizer_results(
     assert len(results) == len(expected_output)
     for result, expected_result in zip(results, expected_output):
         assert result == expected_result
+
+
+def test_analyze_dicts_returns_results_per_dict(batch_analyzer_engine_simple):
+    records = [
+        {"id": 1, "phone": "Call me at 212-124-1244", "url": ["bob.com"]},
+        {"id": 2, "phone": "Call me at 212-124-1244", "url": ["jane.com"]},
+        {"id": 3, "details": {"phone": "Phone: 5124421234"}},
+    ]
+
+    results = [
+        list(dict_results)
+        for dict_results in batch_analyzer_engine_simple.analyze_dicts(
+            input_dicts=records, language="en"
+        )
+    ]
+
+    assert len(results) == len(records)
+    for record, record_results in zip(records[:2], results[:2]):
+        assert [result.key for result in record_results] == list(record.keys())
+        assert not record_results[0].recognizer_results
+        assert record_results[1].recognizer_results[0].entity_type == "PHONE_NUMBER"
+        assert record_results[2].recognizer_results[0][0].entity_type == "URL"
+
+    nested_results = list(results[2][1].recognizer_results)
+    assert nested_results[0].key == "phone"
+    assert nested_results[0].recognizer_results[0].entity_type == "PHONE_NUMBER"
+
+
+def test_analyze_dicts_processes_each_distinct_text_once(
+    batch_analyzer_engine_simple, mocker
+):
+    nlp_engine = batch_analyzer_engine_simple.analyzer_engine.nlp_engine
+    process_batch_spy = mocker.spy(nlp_engine, "process_batch")
+    analyze_spy = mocker.spy(batch_analyzer_engine_simple.analyzer_engine, "analyze")
+
+    records = [{"phone": "212-124-1244", "status": "active"} for _ in range(10)]
+    results = [
+        list(dict_results)
+        for dict_results in batch_analyzer_engine_simple.analyze_dicts(
+            input_dicts=records, language="en"
+        )
+    ]
+
+    assert process_batch_spy.call_count == 1
+    assert process_batch_spy.call_args.kwargs["texts"] == ["212-124-1244", "active"]
+    assert analyze_spy.call_count == 2
+    phone_results = [record_results[0].recognizer_results for record_results in results]
+    assert all(len(res) == 1 for res in phone_results)
+    assert phone_results[0][0] is not phone_results[1][0]
+
+
+def test_analyze_dict_passes_key_context_per_value(batch_analyzer_engine_simple, mocker):
+    analyze_spy = mocker.spy(batch_analyzer_engine_simple.analyzer_engine, "analyze")
+    input_dict = {"name": "Dan", "user": {"phones": ["212-124-1244"]}}
+
+    list(
+        batch_analyzer_engine_simple.analyze_dict(
+            input_dict=input_dict, language="en", context=["customer"]
+        )
+    )
+
+    contexts = {
+        call.kwargs["text"]: call.kwargs["context"]
+        for call in analyze_spy.call_args_list
+    }
+    assert contexts == {"Dan": ["name"], "212-124-1244": ["customer", "user", "phones"]}
+
+
+class BatchNameRecognizer(EntityRecognizer):
+    """Recognizer of the word "David", implementing analyze_batch."""
+
+    def __init__(self):
+        super().__init__(supported_entities=["PERSON"], name="BatchNameRecognizer")
+        self.batches = []
+
+    def load(self):
+        pass
+
+    def analyze(self, text, entities, nlp_artifacts=None):
+        raise AssertionError("analyze_batch should be used")
+
+    def analyze_batch(self, texts, entities, nlp_artifacts=None):
+        self.batches.append(list(texts))
+        return [
+            [RecognizerResult("PERSON", text.find("David"), text.find("David") + 5, 0.8)]
+            if "David" in text
+            else []
+            for text in texts
+        ]
+
+
+@pytest.fixture
+def batch_recognizer_engine():
+    recognizer = BatchNameRecognizer()
+    analyzer_engine = AnalyzerEngine(
+        registry=RecognizerRegistry(recognizers=[recognizer]),
+        nlp_engine=NlpEngineMock(),
+    )
+    return BatchAnalyzerEngine(analyzer_engine=analyzer_engine), recognizer
+
+
+def test_analyze_iterator_calls_analyze_batch_once(batch_recognizer_engine):
+    batch_engine, recognizer = batch_recognizer_engine
+    texts = ["My name is David", "Call me at 2352351232", "David again"]
+
+    results = batch_engine.analyze_iterator(texts=texts, language="en")
+
+    assert recognizer.batches == [texts]
+    assert [[(r.start, r.end) for r in result] for result in results] == [
+        [(11, 16)],
+        [],
+        [(0, 5)],
+    ]
+
+
+def test_analyze_dict_calls_analyze_batch_once_per_distinct_text(
+    batch_recognizer_engine,
+):
+    batch_engine, recognizer = batch_recognizer_engine
+    input_dict = {"name": "David", "names": ["David", "Dan"], "id": 12}
+
+    results = list(batch_engine.analyze_dict(input_dict, language="en"))
+
+    assert recognizer.batches == [["David", "Dan", "12"]]
+    assert [r.start for r in results[0].recognizer_results] == [0]
+    assert [[r.start for r in rs] for rs in results[1].recognizer_results] == [
+        [0],
+        [],
+    ]
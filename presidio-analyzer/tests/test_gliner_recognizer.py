@@ -23,6 +23,18 @@ def mock_gliner():
         yield mock_gliner_instance
 
 
+def _batched(predict_entities):
+    """Wrap a single-text predict_entities mock as a batched inference mock."""
+
+    def inference(texts, labels, flat_ner, threshold, multi_label, batch_size):
+        return [
+            predict_entities(text, labels, flat_ner, threshold, multi_label)
+            for text in texts
+        ]
+
+    return inference
+
+
 def test_analyze_passed_entities_are_subset_of_entity_mapping(
     mock_gliner
 ):
@@ -157,7 +169,7 @@ def test_gliner_handles_long_text_with_chunking(mock_gliner):
             entities.append({"label": "person", "start": start, "end": start + 8, "score": 0.93})
         return entities
 
-    mock_gliner.predict_entities.side_effect = mock_predict_entities
+    mock_gliner.inference.side_effect = _batched(mock_predict_entities)
 
     gliner_recognizer = GLiNERRecognizer(
         entity_mapping={"person": "PERSON"},
@@ -167,8 +179,10 @@ def test_gliner_handles_long_text_with_chunking(mock_gliner):
 
     results = gliner_recognizer.analyze(text, ["PERSON"])
 
-    # Verify chunking occurred (predict_entities called multiple times)
-    assert mock_gliner.predict_entities.call_count == 2, f"Expected 2 chunks, got {mock_gliner.predict_entities.call_count}"
+    # Verify chunking occurred and both chunks were batched into a single call
+    assert mock_gliner.inference.call_count == 1
+    chunk_texts = mock_gliner.inference.call_args.kwargs["texts"]
+    assert len(chunk_texts) == 2, f"Expected 2 chunks, got {len(chunk_texts)}"
     
     # Verify exactly 2 entities were detected
     assert len(results) == 2, f"Expected 2 entities, found {len(results)}"
@@ -199,7 +213,7 @@ def test_gliner_detects_entity_split_across_chunk_boundary(mock_gliner):
             entities.append({"label": "person", "start": start, "end": start + 15, "score": 0.92})
         return entities
 
-    mock_gliner.predict_entities.side_effect = mock_predict_entities
+    mock_gliner.inference.side_effect = _batched(mock_predict_entities)
 
     gliner_recognizer = GLiNERRecognizer(
         entity_mapping={"person": "PERSON"},
@@ -235,7 +249,7 @@ def test_gliner_deduplicates_entities_in_overlap_region(mock_gliner):
             entities.append({"label": "person", "start": start, "end": start + 9, "score": score})
         return entities
 
-    mock_gliner.predict_entities.side_effect = mock_predict_entities
+    mock_gliner.inference.side_effect = _batched(mock_predict_entities)
 
     gliner_recognizer = GLiNERRecognizer(
         entity_mapping={"person": "PERSON"},
@@ -245,8 +259,8 @@ def test_gliner_deduplicates_entities_in_overlap_region(mock_gliner):
 
     results = gliner_recognizer.analyze(text, ["PERSON"])
 
-    # Verify: Called multiple times due to overlap
-    assert mock_gliner.predict_entities.call_count >= 2, "Should process multiple chunks"
+    # Verify: Processed multiple chunks due to overlap
+    assert call_count >= 2, "Should process multiple chunks"
     
     # Verify: Only 1 result after deduplication (not 2)
     assert len(results) == 1, f"Expected 1 deduplicated entity, found {len(results)}"
@@ -323,3 +337,83 @@ def test_when_model_kwargs_then_passes_to_from_pretrained():
         assert call_kwargs["custom_param2"] == 42
 
 
+
+
+def test_analyze_batch_batches_chunks_of_all_texts(mock_gliner):
+    """Test that chunks of multiple texts are passed to GLiNER in batches."""
+    if sys.version_info < (3, 10):
+        pytest.skip("gliner requires Python >= 3.10")
+
+    def mock_predict_entities(text, labels, flat_ner, threshold, multi_label):
+        if "John Smith" in text:
+            start = text.find("John Smith")
+            return [{"label": "person", "start": start, "end": start + 10, "score": 0.9}]
+        return []
+
+    mock_gliner.inference.side_effect = _batched(mock_predict_entities)
+
+    texts = [
+        "John Smith lives here. " + ("x " * 120),
+        "Nothing here. " + ("y " * 120),
+        "",
+    ]
+    gliner_recognizer = GLiNERRecognizer(
+        entity_mapping={"person": "PERSON"},
+        text_chunker=CharacterBasedTextChunker(chunk_size=100, chunk_overlap=20),
+        batch_size=32,
+    )
+    gliner_recognizer.gliner = mock_gliner
+
+    results = gliner_recognizer.analyze_batch(texts, ["PERSON"])
+
+    assert mock_gliner.inference.call_count == 1
+    assert mock_gliner.inference.call_args.kwargs["batch_size"] == 32
+    assert len(results) == 3
+    assert [texts[0][r.start:r.end] for r in results[0]] == ["John Smith"]
+    assert results[1] == []
+    assert results[2] == []
+
+
+def test_analyze_batch_skips_empty_texts(mock_gliner):
+    """Test that empty texts are not passed to GLiNER."""
+    if sys.version_info < (3, 10):
+        pytest.skip("gliner requires Python >= 3.10")
+
+    gliner_recognizer = GLiNERRecognizer(entity_mapping={"person": "PERSON"})
+    gliner_recognizer.gliner = mock_gliner
+
+    results = gliner_recognizer.analyze_batch(["", "   "], ["PERSON"])
+
+    assert results == [[], []]
+    mock_gliner.predict_entities.assert_not_called()
+    mock_gliner.inference.assert_not_called()
+
+
+def test_token_chunker_is_sized_by_words_minus_labels_prompt(mock_gliner):
+    """Test that token-based chunks fit in max_len with the labels prompt."""
+    if sys.version_info < (3, 10):
+        pytest.skip("gliner requires Python >= 3.10")
+
+    from presidio_analyzer.chunkers import TokenBasedTextChunker
+    from presidio_analyzer.predefined_recognizers.ner.gliner_recognizer import (
+        GLINER_WORD_REGEX,
+    )
+
+    mock_gliner.config.max_len = 20
+    mock_gliner.inference.side_effect = _batched(lambda *args: [])
+    text_chunker = TokenBasedTextChunker(token_overlap=2)
+    gliner_recognizer = GLiNERRecognizer(
+        entity_mapping={"person": "PERSON", "email address": "EMAIL_ADDRESS"},
+        text_chunker=text_chunker,
+    )
+
+    # 20 words, minus the separator and the entity token and words of each label
+    assert text_chunker.max_tokens == 20 - (1 + 2 + 3)
+
+    text = " ".join(f"word{i}" for i in range(50))
+    gliner_recognizer.analyze_batch([text], ["PERSON", "credit card number"])
+
+    assert text_chunker.max_tokens == 20 - (1 + 2 + 3 + 4)
+    chunk_texts = mock_gliner.inference.call_args.kwargs["texts"]
+    assert len(chunk_texts) > 1
+    assert all(len(GLINER_WORD_REGEX.findall(chunk)) <= 10 for chunk in chunk_texts)
@@ -4,6 +4,7 @@ import logging
 from unittest.mock import MagicMock, patch
 
 import pytest
+from presidio_analyzer.chunkers import TokenBasedTextChunker
 from presidio_analyzer.predefined_recognizers import (
     HuggingFaceNerRecognizer,
 )
@@ -280,11 +281,25 @@ def test_load_invokes_hf_pipeline_with_expected_args():
         )
 
 
+def _predictions_by_chunk_text(predictions_by_chunk):
+    """Create a pipeline side effect returning predictions per chunk text.
+
+    Supports both single-text and batched (list of texts) pipeline calls.
+    """
+
+    def _pipeline(inputs, **kwargs):
+        if isinstance(inputs, list):
+            return [predictions_by_chunk.get(chunk, []) for chunk in inputs]
+        return predictions_by_chunk.get(inputs, [])
+
+    return _pipeline
+
+
 def test_analyze_long_text_chunking(mock_recognizer):
     """Test that long text is split into chunks and offsets are corrected."""
     # Use text with spaces for predictable boundaries
-    # Text: "A A A A A A A A A A..." (Indices: 0, 2, 4, 6, 8...)
-    text = ("A " * 20).strip()  # Length 39
+    # Text: "A B C D E F ..." (Letters at indices: 0, 2, 4, 6, 8...)
+    text = " ".join("ABCDEFGHIJKLMNOPQRST")  # Length 39
 
     recognizer = mock_recognizer(
         model_name="test-sample-model", chunk_size=10, chunk_overlap=4
@@ -292,36 +307,30 @@ def test_analyze_long_text_chunking(mock_recognizer):
     # The CharacterBasedTextChunker is initialized inside the recognizer
     # using these parameters.
 
-    # Chunk 1: "A A A A A " (0-10). Extends to 11 (space at 11 is boundary).
+    # Chunk 1: "A B C D E " (0-10). Extends to 11 (space at 11 is boundary).
     # Range 0-11.
-    # Mock Entity: PER at 2-3 ("A"). Global 2-3.
+    # Mock Entity: PER at 2-3 ("B"). Global 2-3.
 
     # Next start: 11 - 4 = 7.
-    # Chunk 2 Start 7.
-    # Text[7] is ' '. Text[8] is 'A'.
+    # Chunk 2 Start 7, range 7-17.
+    # Text[7] is ' '. Text[8] is 'E'.
     # Mock Entity: LOC at 8-9 (Global).
     # Relative start for Global 8: 8 - 7 = 1.
     # Relative end for Global 9: 9 - 7 = 2.
-
-    # Extended returns
-    recognizer.ner_pipeline.side_effect = [
-        [{"entity_group": "PER", "start": 2, "end": 3, "score": 0.9}],
-        [{"entity_group": "LOC", "start": 1, "end": 2, "score": 0.9}],
-        [],
-        [],
-        [],
-        [],
-        [],
-        [],
-        [],
-        [],
-        [],
-        [],
-    ]
+    recognizer.ner_pipeline.side_effect = _predictions_by_chunk_text(
+        {
+            text[0:11]: [{"entity_group": "PER", "start": 2, "end": 3, "score": 0.9}],
+            text[7:17]: [{"entity_group": "LOC", "start": 1, "end": 2, "score": 0.9}],
+        }
+    )
 
     results = recognizer.analyze(text, ["PERSON", "LOCATION"])
     results.sort(key=lambda x: x.start)
 
+    # Chunks are passed to the model in batches rather than one by one
+    num_chunks = len(recognizer.text_chunker.chunk(text))
+    assert recognizer.ner_pipeline.call_count < num_chunks
+
     assert len(results) == 2
 
     # First entity: PERSON at 2-3
@@ -337,7 +346,7 @@ def test_analyze_long_text_chunking(mock_recognizer):
 
 def test_analyze_deduplication_keeps_highest_score(mock_recognizer):
     """Test deduplication keeps highest score when same span detected twice."""
-    text = ("A " * 20).strip()
+    text = " ".join("ABCDEFGHIJKLMNOPQRST")
 
     recognizer = mock_recognizer(
         model_name="test-sample-model",
@@ -349,25 +358,16 @@ def test_analyze_deduplication_keeps_highest_score(mock_recognizer):
     #   Mock: PER at 4-5 (Global 4-5). Score 0.6.
 
     # Next start: 11 - 8 = 3.
-    # Chunk 2 Start 3.
+    # Chunk 2 Start 3, range 3-13.
     #   Mock: PER at Global 4-5.
     #   Relative start: 4 - 3 = 1.
     #   Relative end: 5 - 3 = 2.
-
-    recognizer.ner_pipeline.side_effect = [
-        [{"entity_group": "PER", "start": 4, "end": 5, "score": 0.60}],
-        [{"entity_group": "PER", "start": 1, "end": 2, "score": 0.95}],
-        [],
-        [],
-        [],
-        [],
-        [],
-        [],
-        [],
-        [],
-        [],
-        [],
-    ]
+    recognizer.ner_pipeline.side_effect = _predictions_by_chunk_text(
+        {
+            text[0:11]: [{"entity_group": "PER", "start": 4, "end": 5, "score": 0.60}],
+            text[3:13]: [{"entity_group": "PER", "start": 1, "end": 2, "score": 0.95}],
+        }
+    )
 
     results = recognizer.analyze(text, ["PERSON"])
     results.sort(key=lambda x: x.start)
@@ -378,6 +378,60 @@ def test_analyze_deduplication_keeps_highest_score(mock_recognizer):
     assert results[0].end == 5
 
 
+def test_analyze_batch_chunks_of_all_texts_in_one_call(mock_recognizer):
+    """Test that chunks of multiple texts are batched into one pipeline call."""
+    long_text = " ".join("ABCDEFGHIJKLMNOPQRST")
+    texts = [long_text, "", "John Smith"]
+
+    recognizer = mock_recognizer(
+        model_name="test-sample-model", chunk_size=10, chunk_overlap=4, batch_size=64
+    )
+    recognizer.ner_pipeline.side_effect = _predictions_by_chunk_text(
+        {
+            long_text[0:11]: [
+                {"entity_group": "PER", "start": 2, "end": 3, "score": 0.9}
+            ],
+            "John Smith": [
+                {"entity_group": "PER", "start": 0, "end": 10, "score": 0.9}
+            ],
+        }
+    )
+
+    results = recognizer.analyze_batch(texts, ["PERSON"])
+
+    recognizer.ner_pipeline.assert_called_once()
+    batched_chunks = recognizer.ner_pipeline.call_args.args[0]
+    assert len(batched_chunks) == len(recognizer.text_chunker.chunk(long_text)) + 1
+    assert recognizer.ner_pipeline.call_args.kwargs["batch_size"] == 64
+
+    assert len(results) == 3
+    assert [(r.start, r.end) for r in results[0]] == [(2, 3)]
+    assert results[1] == []
+    assert [(r.start, r.end) for r in results[2]] == [(0, 10)]
+
+
+def test_analyze_batch_failure_falls_back_to_single_chunks(mock_recognizer):
+    """Test that a failing batched call falls back to per-chunk predictions."""
+    text = " ".join("ABCDEFGHIJKLMNOPQRST")
+    recognizer = mock_recognizer(
+        model_name="test-sample-model", chunk_size=10, chunk_overlap=4
+    )
+    single_chunk_predictions = _predictions_by_chunk_text(
+        {text[0:11]: [{"entity_group": "PER", "start": 2, "end": 3, "score": 0.9}]}
+    )
+
+    def _pipeline(inputs, **kwargs):
+        if isinstance(inputs, list):
+            raise RuntimeError("batch failed")
+        return single_chunk_predictions(inputs)
+
+    recognizer.ner_pipeline.side_effect = _pipeline
+
+    results = recognizer.analyze(text, ["PERSON"])
+
+    assert [(r.start, r.end) for r in results] == [(2, 3)]
+
+
 @pytest.mark.usefixtures("mock_torch_installed")
 def test_hf_recognizer_init_variations(caplog):
     """Test various initialization scenarios and warnings."""
@@ -491,6 +545,21 @@ def test_hf_recognizer_init_uses_provided_text_chunker():
     assert rec.text_chunker is mock_chunker
 
 
+@pytest.mark.usefixtures("mock_torch_installed")
+def test_hf_recognizer_load_injects_tokenizer_into_token_chunker(
+    mock_transformers_pipeline,
+):
+    """A TokenBasedTextChunker without a tokenizer uses the model's tokenizer."""
+    chunker = TokenBasedTextChunker(max_tokens=128, token_overlap=16)
+    rec = HuggingFaceNerRecognizer(model_name="test-model", text_chunker=chunker)
+    assert rec.text_chunker.tokenizer is mock_transformers_pipeline.tokenizer
+
+    own_tokenizer = MagicMock()
+    chunker = TokenBasedTextChunker(tokenizer=own_tokenizer)
+    rec = HuggingFaceNerRecognizer(model_name="test-model", text_chunker=chunker)
+    assert rec.text_chunker.tokenizer is own_tokenizer
+
+
 @pytest.mark.usefixtures("mock_torch_installed")
 def test_hf_recognizer_load_cuda_unavailable_fallback(caplog):
     """Test fallback to CPU if CUDA is requested but unavailable."""
@@ -1,10 +1,12 @@
 import re
+from contextlib import contextmanager
 from unittest.mock import MagicMock, patch
 
 import pytest
 
 from tests import assert_result
 from presidio_analyzer.predefined_recognizers.generic.iban_recognizer import IbanRecognizer
+from presidio_analyzer.regex_cache import regex_cache
 
 
 @pytest.fixture(scope="module")
@@ -17,6 +19,26 @@ def entities():
     return ["IBAN_CODE"]
 
 
+@contextmanager
+def patch_compiled_regex(recognizer, compiled_regex, country_regex=False):
+    """Replace the compiled regex of the recognizer's pattern (or of countries)."""
+    pattern_regex = recognizer.patterns[0].regex
+    original_compile = regex_cache.compile
+
+    def compile_side_effect(regex, flags):
+        if country_regex and regex != pattern_regex:
+            return compiled_regex
+        if not country_regex and regex == pattern_regex:
+            return compiled_regex
+        return original_compile(regex, flags)
+
+    with patch(
+        "presidio_analyzer.predefined_recognizers.generic.iban_recognizer.regex_cache.compile",
+        side_effect=compile_side_effect,
+    ):
+        yield
+
+
 def update_iban_checksum(iban):
     """
     Generates an IBAN, with checksum digits
@@ -399,10 +421,10 @@ def test_when_all_ibans_then_succeed(
 
 def test_when_finditer_times_out_then_returns_empty_results(recognizer, entities):
     """Test that a TimeoutError from re.finditer is caught and returns no results."""
-    with patch(
-        "presidio_analyzer.predefined_recognizers.generic.iban_recognizer.re.finditer",
-        side_effect=TimeoutError("regex timed out"),
-    ):
+    mock_compiled = MagicMock()
+    mock_compiled.finditer.side_effect = TimeoutError("regex timed out")
+
+    with patch_compiled_regex(recognizer, mock_compiled):
         results = recognizer.analyze("AL47212110090000000235698741", entities)
 
     assert results == []
@@ -410,10 +432,10 @@ def test_when_finditer_times_out_then_returns_empty_results(recognizer, entities
 
 def test_when_format_validation_times_out_then_returns_no_results(recognizer, entities):
     """Test that a TimeoutError from re.match in __is_valid_format is caught."""
-    with patch(
-        "presidio_analyzer.predefined_recognizers.generic.iban_recognizer.re.match",
-        side_effect=TimeoutError("regex timed out"),
-    ):
+    mock_compiled = MagicMock()
+    mock_compiled.match.side_effect = TimeoutError("regex timed out")
+
+    with patch_compiled_regex(recognizer, mock_compiled, country_regex=True):
         results = recognizer.analyze("AL47212110090000000235698741", entities)
 
     assert results == []
@@ -425,10 +447,10 @@ def test_when_iban_match_group_is_empty_string_then_skips(recognizer, entities):
     mock_match.groups.return_value = ("",)
     mock_match.span.return_value = (0, 0)
 
-    with patch(
-        "presidio_analyzer.predefined_recognizers.generic.iban_recognizer.re.finditer",
-        return_value=iter([mock_match]),
-    ):
+    mock_compiled = MagicMock()
+    mock_compiled.finditer.return_value = iter([mock_match])
+
+    with patch_compiled_regex(recognizer, mock_compiled):
         results = recognizer.analyze("AL47212110090000000235698741", entities)
 
     assert results == []
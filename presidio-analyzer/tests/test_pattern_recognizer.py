@@ -510,7 +510,7 @@ def test_when_regex_times_out_then_pattern_is_skipped():
     mock_compiled.finditer.side_effect = TimeoutError("regex timed out")
 
     with patch(
-        "presidio_analyzer.pattern_recognizer.re.compile",
+        "presidio_analyzer.pattern_recognizer.regex_cache.compile",
         return_value=mock_compiled,
     ):
         results = recognizer.analyze("Test 123", ["TEST"])
@@ -529,10 +529,10 @@ def test_when_regex_times_out_then_other_patterns_still_run():
     original_compile = regex_module.compile
     call_count = 0
 
-    def compile_side_effect(pattern_str, **kwargs):
+    def compile_side_effect(pattern_str, flags=0):
         nonlocal call_count
         call_count += 1
-        compiled = original_compile(pattern_str, **kwargs)
+        compiled = original_compile(pattern_str, flags=flags)
         if call_count == 1:
             mock_compiled = MagicMock()
             mock_compiled.finditer.side_effect = TimeoutError("regex timed out")
@@ -540,7 +540,7 @@ def test_when_regex_times_out_then_other_patterns_still_run():
         return compiled
 
     with patch(
-        "presidio_analyzer.pattern_recognizer.re.compile",
+        "presidio_analyzer.pattern_recognizer.regex_cache.compile",
         side_effect=compile_side_effect,
     ):
         results = recognizer.analyze("test123", ["TEST"])
@@ -549,6 +549,20 @@ def test_when_regex_times_out_then_other_patterns_still_run():
     assert len(results) >= 1
 
 
+def test_when_analyze_with_regex_flags_then_shared_patterns_are_not_modified():
+    pattern = Pattern(name="lower", regex=r"\b[a-z]+\b", score=0.5)
+    recognizer = PatternRecognizer(supported_entity="TEST", patterns=[pattern])
+    recognizer.compile_patterns()
+    compiled_regex = pattern.compiled_regex
+
+    results = recognizer.analyze("ABC", ["TEST"], regex_flags=re.MULTILINE)
+
+    assert results == []
+    assert pattern.compiled_regex is compiled_regex
+    assert pattern.compiled_with_flags == recognizer.global_regex_flags
+    assert len(recognizer.analyze("ABC", ["TEST"])) == 1
+
+
 def test_regex_timeout_seconds_value():
     """Test that REGEX_TIMEOUT_SECONDS is set to 60 seconds."""
     assert REGEX_TIMEOUT_SECONDS == 60
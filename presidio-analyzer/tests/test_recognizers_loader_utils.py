@@ -1,5 +1,7 @@
 import functools
 import re
+import subprocess
+import sys
 from pathlib import Path
 
 import pytest
@@ -454,3 +456,48 @@ def test_yaml_country_code_blank_value_raises():
             recognizer_cls=UsSsnRecognizer,
             recognizer_name="UsSsnRecognizer",
         )
+
+
+def test_predefined_recognizer_modules_match_the_recognizer_classes():
+    from presidio_analyzer import predefined_recognizers
+
+    for name, module in predefined_recognizers.RECOGNIZER_MODULES.items():
+        cls = RecognizerListLoader.get_existing_recognizer_cls(recognizer_name=name)
+        assert cls.__name__ == name
+        assert cls.__module__ == predefined_recognizers.__name__ + module
+
+
+def test_get_existing_recognizer_cls_finds_custom_subclasses():
+    class MyCustomRecognizer(PatternRecognizer):
+        pass
+
+    cls = RecognizerListLoader.get_existing_recognizer_cls("MyCustomRecognizer")
+    assert cls is MyCustomRecognizer
+
+
+def test_get_existing_recognizer_cls_only_imports_the_requested_recognizer():
+    code = (
+        "import sys\n"
+        "from presidio_analyzer.recognizer_registry.recognizers_loader_utils "
+        "import RecognizerListLoader\n"
+        "RecognizerListLoader.get_existing_recognizer_cls('EmailRecognizer')\n"
+        "print(sorted(m for m in sys.modules if m.endswith('_recognizer')))\n"
+    )
+    output = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    ).stdout
+
+    assert "email_recognizer" in output
+    assert "url_recognizer" not in output
+    assert "us_ssn_recognizer" not in output
+
+
+def test_presidio_analyzer_submodules_are_reachable_as_attributes():
+    code = (
+        "import presidio_analyzer\n"
+        "for name in ('nlp_engine', 'predefined_recognizers', "
+        "'context_aware_enhancers', 'chunkers', 'recognizer_registry'):\n"
+        "    module = getattr(presidio_analyzer, name)\n"
+        "    assert module.__name__ == 'presidio_analyzer.' + name, module\n"
+    )
+    subprocess.run([sys.executable, "-c", code], check=True)
@@ -0,0 +1,141 @@
+import threading
+
+import pytest
+import regex as re
+
+from presidio_analyzer import Pattern, PatternRecognizer
+from presidio_analyzer.regex_cache import DEFAULT_REGEX_FLAGS, RegexCache, regex_cache
+
+
+def test_when_regex_compiled_twice_then_compiled_once():
+    cache = RegexCache()
+    first = cache.compile(r"\d+", re.IGNORECASE)
+    second = cache.compile(r"\d+", re.IGNORECASE)
+
+    assert first is second
+    assert first.flags & re.IGNORECASE
+    stats = cache.get_stats()
+    assert stats["hits"] == 1
+    assert stats["misses"] == 1
+    assert stats["size"] == 1
+    assert stats["compile_seconds"] >= 0
+
+
+def test_when_flags_differ_then_compiled_per_flags():
+    cache = RegexCache()
+    case_sensitive = cache.compile("abc")
+    case_insensitive = cache.compile("abc", re.IGNORECASE)
+
+    assert case_sensitive is not case_insensitive
+    assert not case_sensitive.search("ABC")
+    assert case_insensitive.search("ABC")
+    assert cache.compile("abc") is case_sensitive
+    assert cache.get_stats()["size"] == 2
+
+
+def test_when_max_size_exceeded_then_least_recently_used_removed():
+    cache = RegexCache(max_size=2)
+    a = cache.compile("a")
+    cache.compile("b")
+    cache.compile("a")
+    cache.compile("c")
+
+    assert cache.get_stats()["size"] == 2
+    assert cache.compile("a") is a
+    assert cache.get_stats()["misses"] == 3
+    cache.compile("b")
+    assert cache.get_stats()["misses"] == 4
+
+
+def test_when_max_size_invalid_then_raises_value_error():
+    with pytest.raises(ValueError):
+        RegexCache(max_size=0)
+
+
+def test_when_regex_invalid_then_raises_error_and_not_cached():
+    cache = RegexCache()
+    with pytest.raises(re.error):
+        cache.compile("(")
+    assert cache.get_stats()["size"] == 0
+
+
+def test_when_cleared_then_stats_reset():
+    cache = RegexCache()
+    cache.compile("a")
+    cache.compile("a")
+    cache.clear()
+
+    assert cache.get_stats() == {
+        "hits": 0,
+        "misses": 0,
+        "size": 0,
+        "max_size": 4096,
+        "compile_seconds": 0.0,
+    }
+
+
+def test_when_compiled_from_threads_then_same_results():
+    cache = RegexCache()
+    compiled = []
+
+    def compile_regexes():
+        for i in range(50):
+            compiled.append(cache.compile(f"a{i % 10}"))
+
+    threads = [threading.Thread(target=compile_regexes) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len(compiled) == 200
+    assert {c.pattern for c in compiled} == {f"a{i}" for i in range(10)}
+    stats = cache.get_stats()
+    assert stats["hits"] + stats["misses"] == 200
+    assert stats["size"] == 10
+
+
+def test_when_compiled_regex_added_then_it_is_cached_without_compiling():
+    cache = RegexCache()
+    compiled_regex = re.compile(r"\d+", re.IGNORECASE)
+
+    cache.add(r"\d+", re.IGNORECASE, compiled_regex)
+    cache.add(r"\d+", re.IGNORECASE, re.compile(r"\d+", re.IGNORECASE))
+
+    assert cache.compile(r"\d+", re.IGNORECASE) is compiled_regex
+    assert cache.get_stats()["misses"] == 0
+
+
+def test_when_pattern_validated_then_regex_is_not_cached():
+    size = regex_cache.get_stats()["size"]
+
+    Pattern("one-off", r"one-off-validation-test-\d+", 0.5)
+
+    assert regex_cache.get_stats()["size"] == size
+
+
+def test_when_recognizers_share_regex_then_compiled_regex_is_shared():
+    regex = r"\bshared-regex-cache-test-\d{3}\b"
+    first = PatternRecognizer("A", patterns=[Pattern("a", regex, 0.5)])
+    second = PatternRecognizer("B", patterns=[Pattern("b", regex, 0.5)])
+    first.compile_patterns()
+    second.compile_patterns()
+
+    assert first.patterns[0].compiled_regex is second.patterns[0].compiled_regex
+    assert first.patterns[0].compiled_regex is regex_cache.compile(
+        regex, DEFAULT_REGEX_FLAGS
+    )
+
+
+def test_when_recognizer_analyzes_with_other_flags_then_uses_cache():
+    regex = r"regex-cache-flags-test"
+    recognizer = PatternRecognizer("A", patterns=[Pattern("a", regex, 0.5)])
+    text = "REGEX-CACHE-FLAGS-TEST"
+
+    assert recognizer.analyze(text, ["A"])
+    assert not recognizer.analyze(text, ["A"], regex_flags=re.DOTALL)
+    hits = regex_cache.get_stats()["hits"]
+    assert recognizer.analyze(text, ["A"])
+    assert regex_cache.get_stats()["hits"] > hits
+    # The shared pattern is not modified by analyze
+    assert recognizer.patterns[0].compiled_regex is None
@@ -5,6 +5,8 @@ import pytest
 from presidio_analyzer.chunkers import (
     TextChunkerProvider,
     CharacterBasedTextChunker,
+    SentenceTokenBasedTextChunker,
+    TokenBasedTextChunker,
 )
 
 
@@ -46,3 +48,24 @@ class TestTextChunkerProvider:
         assert isinstance(chunker, CharacterBasedTextChunker)
         assert chunker.chunk_size == 300
 
+
+    def test_token_chunker_type(self):
+        """Provider creates TokenBasedTextChunker when type is 'token'."""
+        provider = TextChunkerProvider(chunker_configuration={
+            "chunker_type": "token",
+            "max_tokens": 256,
+            "token_overlap": 16,
+        })
+        chunker = provider.create_chunker()
+        assert isinstance(chunker, TokenBasedTextChunker)
+        assert chunker.max_tokens == 256
+        assert chunker.token_overlap == 16
+
+    def test_sentence_chunker_type(self):
+        """Provider creates SentenceTokenBasedTextChunker for type 'sentence'."""
+        provider = TextChunkerProvider(chunker_configuration={
+            "chunker_type": "sentence",
+            "max_tokens": 256,
+        })
+        chunker = provider.create_chunker()
+        assert isinstance(chunker, SentenceTokenBasedTextChunker)
@@ -0,0 +1,242 @@
+"""Tests for TokenBasedTextChunker and SentenceTokenBasedTextChunker."""
+
+import re
+
+import pytest
+import spacy
+
+from presidio_analyzer.chunkers import (
+    SentenceTokenBasedTextChunker,
+    TokenBasedTextChunker,
+)
+from presidio_analyzer.nlp_engine import NlpArtifacts
+
+
+class WhitespaceTokenizer:
+    """Minimal fast-tokenizer stand-in: one token per whitespace-separated word."""
+
+    def __init__(self, model_max_length=512, special_tokens=2):
+        self.model_max_length = model_max_length
+        self.special_tokens = special_tokens
+
+    def __call__(self, text, **kwargs):
+        assert kwargs["return_offsets_mapping"]
+        assert not kwargs["add_special_tokens"]
+        offsets = [(m.start(), m.end()) for m in re.finditer(r"\S+", text)]
+        return {"offset_mapping": offsets}
+
+    def num_special_tokens_to_add(self):
+        return self.special_tokens
+
+
+def _words(n):
+    return " ".join(f"w{i}" for i in range(n))
+
+
+def _artifacts_with_sentences(text):
+    nlp = spacy.blank("en")
+    nlp.add_pipe("sentencizer")
+    doc = nlp(text)
+    return NlpArtifacts(
+        entities=[],
+        tokens=doc,
+        tokens_indices=[],
+        lemmas=[],
+        nlp_engine=None,
+        language="en",
+    )
+
+
+class TestTokenBasedTextChunkerInit:
+    """Tests for TokenBasedTextChunker initialization."""
+
+    def test_invalid_max_tokens_raises_error(self):
+        with pytest.raises(ValueError, match="max_tokens must be greater than 0"):
+            TokenBasedTextChunker(max_tokens=0)
+
+    def test_invalid_token_overlap_raises_error(self):
+        with pytest.raises(ValueError, match="token_overlap must be non-negative"):
+            TokenBasedTextChunker(token_overlap=-1)
+        with pytest.raises(ValueError, match="token_overlap must be less than"):
+            TokenBasedTextChunker(max_tokens=10, token_overlap=10)
+
+    def test_max_tokens_defaults_to_model_max_length(self):
+        chunker = TokenBasedTextChunker(tokenizer=WhitespaceTokenizer(128))
+        assert chunker.max_tokens == 128
+
+    def test_max_tokens_ignores_unbounded_model_max_length(self):
+        chunker = TokenBasedTextChunker(tokenizer=WhitespaceTokenizer(int(1e30)))
+        assert chunker.max_tokens == 512
+
+    def test_missing_tokenizer_raises_error(self):
+        chunker = TokenBasedTextChunker(max_tokens=10, token_overlap=2)
+        assert not chunker.has_tokenizer
+        with pytest.raises(ValueError, match="requires a tokenizer"):
+            chunker.chunk("some text")
+
+    def test_overlap_larger_than_window_raises_error(self):
+        chunker = TokenBasedTextChunker(
+            tokenizer=WhitespaceTokenizer(special_tokens=2),
+            max_tokens=6,
+            token_overlap=4,
+        )
+        with pytest.raises(ValueError, match="number of tokens available"):
+            chunker.chunk(_words(20))
+
+
+class TestTokenBasedTextChunkerChunk:
+    """Tests for TokenBasedTextChunker.chunk() method."""
+
+    def test_empty_text_returns_no_chunks(self):
+        chunker = TokenBasedTextChunker(tokenizer=WhitespaceTokenizer())
+        assert chunker.chunk("") == []
+        assert chunker.chunk("   ") == []
+
+    def test_short_text_returns_single_chunk(self):
+        chunker = TokenBasedTextChunker(tokenizer=WhitespaceTokenizer())
+        text = "John lives in Seattle"
+        chunks = chunker.chunk(text)
+        assert len(chunks) == 1
+        assert (chunks[0].start, chunks[0].end) == (0, len(text))
+
+    def test_chunks_respect_max_tokens_including_special_tokens(self):
+        tokenizer = WhitespaceTokenizer(special_tokens=2)
+        chunker = TokenBasedTextChunker(
+            tokenizer=tokenizer, max_tokens=12, token_overlap=3
+        )
+        text = _words(50)
+        chunks = chunker.chunk(text)
+
+        assert len(chunks) > 1
+        for chunk in chunks:
+            assert chunk.text == text[chunk.start : chunk.end]
+            assert len(chunk.text.split()) <= 10
+
+    def test_consecutive_chunks_overlap_by_token_overlap(self):
+        chunker = TokenBasedTextChunker(
+            tokenizer=WhitespaceTokenizer(special_tokens=0),
+            max_tokens=10,
+            token_overlap=3,
+        )
+        chunks = chunker.chunk(_words(24))
+
+        assert [chunk.text.split()[0] for chunk in chunks] == ["w0", "w7", "w14"]
+        for previous, current in zip(chunks, chunks[1:]):
+            assert previous.text.split()[-3:] == current.text.split()[:3]
+        assert chunks[-1].text.split()[-1] == "w23"
+
+    def test_token_dense_text_gets_more_chunks(self):
+        """Character-short but token-dense text is still split by token count."""
+        chunker = TokenBasedTextChunker(
+            tokenizer=WhitespaceTokenizer(special_tokens=0),
+            max_tokens=10,
+            token_overlap=0,
+        )
+        chunks = chunker.chunk(" ".join("1" * 30))
+        assert len(chunks) == 3
+
+    def test_nlp_artifacts_are_ignored(self):
+        chunker = TokenBasedTextChunker(
+            tokenizer=WhitespaceTokenizer(special_tokens=0),
+            max_tokens=10,
+            token_overlap=2,
+        )
+        text = "One two three. Four five six seven. Eight nine ten eleven twelve."
+        assert chunker.chunk_with_nlp_artifacts(
+            text, _artifacts_with_sentences(text)
+        ) == chunker.chunk(text)
+
+
+class TestSentenceTokenBasedTextChunker:
+    """Tests for SentenceTokenBasedTextChunker."""
+
+    text = (
+        "John Smith lives in Seattle. "
+        "His phone number is 555 1234. "
+        "He works at Contoso with Jane Doe."
+    )
+
+    def _chunker(self, max_tokens=12, token_overlap=6):
+        return SentenceTokenBasedTextChunker(
+            tokenizer=WhitespaceTokenizer(special_tokens=0),
+            max_tokens=max_tokens,
+            token_overlap=token_overlap,
+        )
+
+    def test_chunks_end_on_sentence_boundaries(self):
+        chunks = self._chunker(token_overlap=0).chunk_with_nlp_artifacts(
+            self.text, _artifacts_with_sentences(self.text)
+        )
+        assert [chunk.text for chunk in chunks] == [
+            "John Smith lives in Seattle. His phone number is 555 1234.",
+            "He works at Contoso with Jane Doe.",
+        ]
+
+    def test_overlap_with_whole_sentences_that_fit(self):
+        chunks = self._chunker(max_tokens=13).chunk_with_nlp_artifacts(
+            self.text, _artifacts_with_sentences(self.text)
+        )
+        assert [chunk.text for chunk in chunks] == [
+            "John Smith lives in Seattle. His phone number is 555 1234.",
+            "His phone number is 555 1234. He works at Contoso with Jane Doe.",
+        ]
+        for chunk in chunks:
+            assert chunk.text == self.text[chunk.start : chunk.end]
+
+    def test_overlap_is_dropped_when_no_whole_sentence_fits_after_it(self):
+        chunks = self._chunker(max_tokens=11).chunk_with_nlp_artifacts(
+            self.text, _artifacts_with_sentences(self.text)
+        )
+        assert [chunk.text for chunk in chunks] == [
+            "John Smith lives in Seattle. His phone number is 555 1234.",
+            "He works at Contoso with Jane Doe.",
+        ]
+
+    def test_long_sentence_is_split_by_tokens(self):
+        text = _words(30) + ". Short one."
+        chunks = self._chunker(max_tokens=10, token_overlap=2).chunk_with_nlp_artifacts(
+            text, _artifacts_with_sentences(text)
+        )
+        assert all(len(chunk.text.split()) <= 10 for chunk in chunks)
+        assert chunks[-1].text.endswith("Short one.")
+
+    def test_without_nlp_artifacts_falls_back_to_token_chunking(self):
+        chunker = self._chunker(token_overlap=2)
+        token_chunker = TokenBasedTextChunker(
+            tokenizer=WhitespaceTokenizer(special_tokens=0),
+            max_tokens=12,
+            token_overlap=2,
+        )
+        assert chunker.chunk_with_nlp_artifacts(self.text) == token_chunker.chunk(
+            self.text
+        )
+
+    def test_artifacts_without_sentences_fall_back_to_token_chunking(self):
+        doc = spacy.blank("en")(self.text)
+        artifacts = NlpArtifacts(
+            entities=[],
+            tokens=doc,
+            tokens_indices=[],
+            lemmas=[],
+            nlp_engine=None,
+            language="en",
+        )
+        chunker = self._chunker(token_overlap=2)
+        assert chunker.chunk_with_nlp_artifacts(
+            self.text, artifacts
+        ) == chunker.chunk(self.text)
+
+    def test_predict_batch_with_chunking_uses_nlp_artifacts(self):
+        chunker = self._chunker(token_overlap=0)
+        seen_chunks = []
+
+        def predict_batch(chunk_texts):
+            seen_chunks.extend(chunk_texts)
+            return [[] for _ in chunk_texts]
+
+        chunker.predict_batch_with_chunking(
+            [self.text],
+            predict_batch,
+            nlp_artifacts=[_artifacts_with_sentences(self.text)],
+        )
+        assert "He works at Contoso with Jane Doe." in seen_chunks
@@ -1,18 +1,49 @@
-from typing import Generator, Optional, Union
+from bisect import bisect_right
+from itertools import islice
+from typing import (
+    IO,
+    TYPE_CHECKING,
+    Generator,
+    Iterable,
+    List,
+    Optional,
+    Tuple,
+    Union,
+)
 
-from presidio_analyzer import RecognizerResult
+from presidio_analyzer import BatchAnalyzerEngine, RecognizerResult
 
 from presidio_cli.config import PresidioCLIConfig
 
+if TYPE_CHECKING:
+    from presidio_cli.cache import ResultCache
+
+# Number of lines (or windows of lines) sent together to the analyzer (NLP batch)
+LINE_BATCH_SIZE = 64
+
+# Maximum number of characters of a window of lines, below the maximum length
+# of a text processed by spaCy (1,000,000 characters by default)
+MAX_WINDOW_SIZE = 500_000
+
 
 class Line(object):
     """Represents a line of text source."""
 
-    def __init__(self, line_no: int, buffer: str, start: int, end: int) -> None:
+    def __init__(
+        self,
+        line_no: int,
+        buffer: str,
+        start: int,
+        end: int,
+        offset: Optional[int] = None,
+    ) -> None:
         self.line_no = line_no
         self.start = start
         self.end = end
         self.buffer = buffer
+        #: Offset of the line in the stream it was read from (in bytes for
+        #: binary streams), for lines generated by stream_line_generator
+        self.offset = offset
 
     @property
     def content(self):
@@ -45,6 +76,94 @@ def line_generator(buffer: str) -> Generator[Line, None, None]:
     yield Line(line_no, buffer, start=cur, end=len(buffer))
 
 
+def stream_line_generator(
+    stream: Union[IO[bytes], IO[str]],
+) -> Generator[Line, None, None]:
+    """Generate Line objects from a stream, reading one line at a time.
+
+    Generates the same lines as line_generator on the whole content of the
+    stream, without keeping more than one line in memory. Lines of binary
+    streams are decoded as UTF-8.
+
+    :param stream: binary or text stream to read from
+    """
+    line_no = 1
+    offset = 0
+    text = ""
+    size = 0
+    for raw in stream:
+        text += raw.decode("utf-8") if isinstance(raw, bytes) else raw
+        size += len(raw)
+        # Text streams opened with newline="" also end lines at a lone "\r",
+        # which line_generator keeps in the line
+        if not text.endswith("\n"):
+            continue
+        end = len(text) - 2 if text.endswith("\r\n") else len(text) - 1
+        yield Line(line_no, text, start=0, end=end, offset=offset)
+        offset += size
+        line_no += 1
+        text = ""
+        size = 0
+
+    # Last line, without a line break (empty after the last line break)
+    yield Line(line_no, text, start=0, end=len(text), offset=offset)
+
+
+class Window(object):
+    """Represents consecutive lines of text source, analyzed as one text."""
+
+    def __init__(self, lines: List[Line]) -> None:
+        #: Content of the lines, joined with line breaks
+        self.text = "\n".join(line.content for line in lines)
+        #: Number of each line
+        self.line_nos = [line.line_no for line in lines]
+        #: Offset of each line in the text (newline offset index)
+        self.line_starts = []
+        offset = 0
+        for line in lines:
+            self.line_starts.append(offset)
+            offset += len(line.content) + 1
+
+    def locate(self, offset: int) -> Tuple[int, int]:
+        """
+        Get the line of an offset in the text of the window.
+
+        :param offset: offset in the text of the window
+        :return: The line number, and the offset of the line in the text.
+        """
+        index = bisect_right(self.line_starts, offset) - 1
+        return self.line_nos[index], self.line_starts[index]
+
+
+def window_generator(
+    lines: Iterable[Line], window_lines: int
+) -> Generator[Window, None, None]:
+    """Generate windows of consecutive lines. Returns a generator of Window objects.
+
+    A window ends after window_lines lines (or at the end of the lines when
+    window_lines is 0), or before the line which would make it longer than
+    MAX_WINDOW_SIZE characters.
+
+    :param lines: Line objects to group
+    :param window_lines: maximum number of lines of a window, 0 for no maximum
+    """
+    window = []
+    size = 0
+    for line in lines:
+        if window and size + len(line.content) > MAX_WINDOW_SIZE:
+            yield Window(window)
+            window = []
+            size = 0
+        window.append(line)
+        size += len(line.content) + 1
+        if len(window) == window_lines:
+            yield Window(window)
+            window = []
+            size = 0
+    if window:
+        yield Window(window)
+
+
 class PIIProblem(object):
     """Represents a PII problem found by presidio-cli."""
 
@@ -62,6 +181,18 @@ class PIIProblem(object):
         # Score as a probability determined by the model
         self.score = self.recognizer_result["score"]
 
+    def to_dict(self) -> dict:
+        """Serialize the problem to a (JSON serializable) dictionary."""
+        return {"line": self.line, "recognizer_result": self.recognizer_result}
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "PIIProblem":
+        """Create a PIIProblem from a dictionary created by to_dict.
+
+        :param data: dictionary with the line and recognizer result of the problem
+        """
+        return cls(data["line"], RecognizerResult(**data["recognizer_result"]))
+
 
 def _analyze(
     buffer: str, conf: "PresidioCLIConfig"
@@ -75,16 +206,70 @@ def _analyze(
         buffer, "__getitem__"
     ), "_run() argument must be a buffer, not a stream"
 
-    for line in line_generator(buffer):
-        for result in conf.analyzer.analyze(
-            text=line.content,
-            entities=conf.entities,
+    return _analyze_lines(line_generator(buffer), conf)
+
+
+def _analyze_lines(
+    lines: Iterable[Line], conf: "PresidioCLIConfig"
+) -> Generator["PIIProblem", None, None]:
+    """Analyze lines of text. Returns a generator of PIIProblem objects.
+
+    Lines are analyzed in windows of conf.window_lines lines (one line at a
+    time by default), and the offsets of the results are remapped to the line
+    on which they start.
+
+    :param lines: Line objects to analyze
+    :param conf: presidio_cli configuration object
+    """
+    batch_analyzer = BatchAnalyzerEngine(conf.analyzer)
+    windows = window_generator(lines, conf.window_lines)
+    # Windows are analyzed in batches, so the NLP engine processes them together
+    while batch := list(islice(windows, LINE_BATCH_SIZE)):
+        results_per_window = batch_analyzer.analyze_iterator(
+            texts=[window.text for window in batch],
             language=conf.language,
+            batch_size=LINE_BATCH_SIZE,
+            entities=conf.entities,
             allow_list=conf.allow_list,
-        ):
-            p = PIIProblem(line.line_no, result)
-            if p.score >= conf.threshold:
-                yield p
+        )
+        for window, results in zip(batch, results_per_window):
+            for result in results:
+                # Offsets of the result are made relative to its first line
+                line_no, line_start = window.locate(result.start)
+                result.start -= line_start
+                result.end -= line_start
+                p = PIIProblem(line_no, result)
+                if p.score >= conf.threshold:
+                    yield p
+
+
+def analyze_file(
+    file: str, conf: "PresidioCLIConfig", cache: Optional["ResultCache"] = None
+) -> List["PIIProblem"]:
+    """Analyze a file. Returns the list of PIIProblem objects found in the file.
+
+    :param file: string, path of the file to analyze
+    :param conf: presidio_cli configuration object
+    :param cache: cache of the problems found in files, skipping the analysis
+        of files whose content was already analyzed with the same configuration
+    """
+    filepath = file[2:] if file.startswith("./") or file.startswith(".\\") else file
+    if conf.is_file_ignored(filepath):
+        return []
+
+    if cache is not None:
+        key = cache.get_file_key(file)
+        problems = cache.get(key)
+        if problems is not None:
+            return problems
+
+    # The file is read one line at a time, so that huge files are not loaded
+    # into memory
+    with open(file, "rb") as f:
+        problems = list(_analyze_lines(stream_line_generator(f), conf))
+    if cache is not None:
+        cache.set(key, problems)
+    return problems
 
 
 def analyze(
@@ -102,8 +287,7 @@ def analyze(
     if isinstance(input, (bytes, str)):
         return _analyze(input, conf)
     elif hasattr(input, "read"):  # Python 2's file or Python 3's io.IOBase
-        # We need to have everything in memory to parse correctly
-        content = input.read()
-        return _analyze(content, conf)
+        # The stream is read one line at a time, as the problems are generated
+        return _analyze_lines(stream_line_generator(input), conf)
     else:
         raise TypeError("input should be a string or a stream")
@@ -0,0 +1,108 @@
+import hashlib
+import json
+import os
+import tempfile
+from pathlib import Path
+from typing import List, Optional, Union
+
+from presidio_cli.analyzer import PIIProblem
+from presidio_cli.config import PresidioCLIConfig
+
+#: Default directory of the cache, relative to the current directory
+CACHE_DIR = ".presidiocli_cache"
+
+# Version of the cache keys and files, to change when their format changes
+CACHE_FORMAT_VERSION = "1"
+
+
+class ResultCache(object):
+    """On-disk cache of the problems found in files.
+
+    Problems are stored as a JSON file per analyzed content, keyed by a hash
+    of the content of the file and of the configuration (see
+    PresidioCLIConfig.get_hash), so that unchanged files are not analyzed
+    again by later runs with the same configuration, wherever they are.
+
+    :param conf: PresidioCLIConfig object the files are analyzed with
+    :param directory: directory of the cache
+    """
+
+    def __init__(
+        self, conf: PresidioCLIConfig, directory: Union[str, Path] = CACHE_DIR
+    ) -> None:
+        self.directory = Path(directory)
+        self.config_hash = conf.get_hash()
+
+    def get_key(self, content: bytes) -> str:
+        """
+        Compute the cache key of the problems found in a file.
+
+        :param content: content of the file
+        :return: Hexadecimal digest of the content and configuration.
+        """
+        digest = hashlib.blake2b(digest_size=20)
+        digest.update(f"{CACHE_FORMAT_VERSION}:{self.config_hash}:".encode())
+        digest.update(content)
+        return digest.hexdigest()
+
+    def get_file_key(self, filepath: str) -> str:
+        """
+        Compute the cache key of the problems found in a file, reading it in blocks.
+
+        :param filepath: path of the file
+        :return: Hexadecimal digest of the content and configuration, the same
+            as get_key of the content of the file.
+        """
+        digest = hashlib.blake2b(digest_size=20)
+        digest.update(f"{CACHE_FORMAT_VERSION}:{self.config_hash}:".encode())
+        with open(filepath, "rb") as f:
+            for block in iter(lambda: f.read(1 << 20), b""):
+                digest.update(block)
+        return digest.hexdigest()
+
+    def get(self, key: str) -> Optional[List[PIIProblem]]:
+        """
+        Get the cached problems of a key.
+
+        :param key: cache key (see get_key)
+        :return: The problems, or None if not cached (or unreadable).
+        """
+        try:
+            with open(self._get_path(key), encoding="utf-8") as f:
+                return [PIIProblem.from_dict(problem) for problem in json.load(f)]
+        except (OSError, ValueError, KeyError, TypeError):
+            return None
+
+    def set(self, key: str, problems: List[PIIProblem]) -> None:
+        """
+        Store the problems of a key in the cache.
+
+        :param key: cache key (see get_key)
+        :param problems: problems found in the file
+        """
+        try:
+            content = json.dumps([problem.to_dict() for problem in problems])
+        except TypeError:
+            # e.g. analysis explanations, which are not serializable
+            return
+
+        path = self._get_path(key)
+        if not self.directory.is_dir():
+            self.directory.mkdir(parents=True, exist_ok=True)
+            # Keep the cache out of version control
+            (self.directory / ".gitignore").write_text("*\n")
+        path.parent.mkdir(parents=True, exist_ok=True)
+
+        # Write to a temporary file first, so that other processes (--jobs)
+        # never read a partially written file
+        fd, tmp_path = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                f.write(content)
+            os.replace(tmp_path, path)
+        except OSError:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+
+    def _get_path(self, key: str) -> Path:
+        return self.directory / key[:2] / f"{key}.json"
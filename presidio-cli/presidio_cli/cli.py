@@ -1,17 +1,28 @@
 import argparse
-import io
 import json
 import locale
 import os
 import platform
+import subprocess
 import sys
 import traceback
-from typing import Generator, List
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from typing import Generator, Iterable, List, Optional, Set, Tuple
 
 from presidio_cli import APP_DESCRIPTION, APP_VERSION, SHELL_NAME
-from presidio_cli.analyzer import PIIProblem, analyze
+from presidio_cli.analyzer import PIIProblem, analyze, analyze_file
+from presidio_cli.cache import CACHE_DIR, ResultCache
 from presidio_cli.config import PresidioCLIConfig, PresidioCLIConfigError
 
+# Number of files submitted to the process pool ahead of the file being shown,
+# per worker process
+FILES_AHEAD_PER_JOB = 4
+
+# Configuration and cache of the worker processes of --jobs, set by _init_worker
+_worker_conf: Optional[PresidioCLIConfig] = None
+_worker_cache: Optional[ResultCache] = None
+
 
 class Format(object):
     """Class providing methods for formatting output, with information about discovered PII problems."""  # noqa: E501
@@ -81,6 +92,19 @@ class Format(object):
         return line
 
 
+def jobs_value(value: str) -> int:
+    """Parse a number of jobs (0 for the number of CPUs)."""
+    try:
+        jobs = int(value)
+    except ValueError as e:
+        raise argparse.ArgumentTypeError("jobs must be an integer") from e
+
+    if jobs < 0:
+        raise argparse.ArgumentTypeError("jobs must be 0 or more")
+
+    return jobs or os.cpu_count() or 1
+
+
 def threshold_value(value: str) -> float:
     """Parse a threshold value between 0.0 and 1.0."""
     try:
@@ -96,6 +120,19 @@ def threshold_value(value: str) -> float:
     return threshold
 
 
+def window_lines_value(value: str) -> int:
+    """Parse a number of lines analyzed together (0 for whole files)."""
+    try:
+        window_lines = int(value)
+    except ValueError as e:
+        raise argparse.ArgumentTypeError("window lines must be an integer") from e
+
+    if window_lines < 0:
+        raise argparse.ArgumentTypeError("window lines must be 0 or more")
+
+    return window_lines
+
+
 def supports_color() -> bool:
     """Check whether the platform supports colored output."""
     supported_platform = not (
@@ -162,26 +199,216 @@ def show_problems(
 
 
 def find_files_recursively(
-    items: List[str], conf: PresidioCLIConfig
+    items: List[str],
+    conf: PresidioCLIConfig,
+    changed_files: Optional[Set[str]] = None,
+    cache_dir: Optional[str] = None,
 ) -> Generator[str, None, None]:
     """
     Generate all file names inside the directories.
 
     :param items: List of directories containing files to be analyzed.
     :param conf: PresidioCLIConfig object
+    :param changed_files: If provided, only generate the files in this set
+        of real paths (see get_changed_files).
+    :param cache_dir: If provided, the directory of the result cache, which
+        is not walked.
     """
+    cache_path = os.path.realpath(cache_dir) if cache_dir is not None else None
     for item in items:
         if os.path.isdir(item):
             for root, dirnames, filenames in os.walk(item):
+                if cache_path is not None:
+                    dirnames[:] = [
+                        d
+                        for d in dirnames
+                        if os.path.realpath(os.path.join(root, d)) != cache_path
+                    ]
                 for f in filenames:
                     filepath = os.path.join(root, f)
+                    if changed_files is not None and (
+                        os.path.realpath(filepath) not in changed_files
+                    ):
+                        continue
                     if conf.is_text_file(filepath):
                         yield filepath
         else:
+            if changed_files is not None and (
+                os.path.realpath(item) not in changed_files
+            ):
+                continue
             if conf.is_text_file(item):
                 yield item
 
 
+def get_changed_files(revision: str) -> Set[str]:
+    """
+    Get the files changed since a git revision.
+
+    Includes the files modified (committed, staged or not) since the revision
+    and the untracked files which are not ignored, in the git repository of
+    the current directory.
+
+    :param revision: git revision, e.g. a branch, tag or commit
+    :return: Set of the real paths of the changed files.
+    """
+
+    def git(*git_args: str) -> List[str]:
+        try:
+            output = subprocess.run(
+                ["git", *git_args],
+                capture_output=True,
+                check=True,
+                text=True,
+            ).stdout
+        except FileNotFoundError as e:
+            raise ValueError("git is required for --changed-since") from e
+        except subprocess.CalledProcessError as e:
+            raise ValueError(e.stderr.strip() or str(e)) from e
+        return [line for line in output.splitlines() if line]
+
+    top_level = git("rev-parse", "--show-toplevel")[0]
+    changed = git(
+        "diff", "--name-only", "--no-renames", "--diff-filter=d", revision, "--"
+    )
+    untracked = git("-C", top_level, "ls-files", "--others", "--exclude-standard")
+    return {
+        os.path.realpath(os.path.join(top_level, path))
+        for path in changed + untracked
+    }
+
+
+def load_config(
+    config_data: Optional[str] = None,
+    config_file: Optional[str] = None,
+    threshold: Optional[float] = None,
+    window_lines: Optional[int] = None,
+) -> PresidioCLIConfig:
+    """
+    Load the configuration selected by the command line arguments.
+
+    :param config_data: custom configuration (as YAML source)
+    :param config_file: path to a custom configuration
+    :param threshold: threshold overriding the configuration threshold
+    :param window_lines: number of lines analyzed together overriding the
+        configuration window_lines
+    :return: PresidioCLIConfig object
+    """
+    if config_data is not None:
+        if config_data != "" and ":" not in config_data:
+            config_data = "extends: " + config_data
+        conf = PresidioCLIConfig(content=config_data)
+    elif config_file is not None:
+        conf = PresidioCLIConfig(file=config_file)
+    elif os.path.isfile(".presidiocli"):
+        conf = PresidioCLIConfig(file=".presidiocli")
+    else:
+        conf = PresidioCLIConfig(content="extends: default")
+
+    if threshold is not None:
+        conf.threshold = threshold
+    if window_lines is not None:
+        conf.window_lines = window_lines
+
+    return conf
+
+
+def _init_worker(
+    config_data: Optional[str],
+    config_file: Optional[str],
+    threshold: Optional[float],
+    cache_dir: Optional[str],
+    window_lines: Optional[int] = None,
+) -> None:
+    """Load the configuration (and analyzer engine) once per worker process."""
+    global _worker_conf, _worker_cache
+    _worker_conf = load_config(config_data, config_file, threshold, window_lines)
+    if _worker_conf.locale is not None:
+        locale.setlocale(locale.LC_ALL, _worker_conf.locale)
+    if cache_dir is not None:
+        _worker_cache = ResultCache(_worker_conf, cache_dir)
+
+
+def _analyze_file_in_worker(
+    file: str,
+) -> Tuple[Optional[List[PIIProblem]], Optional[str]]:
+    """Analyze a file in a worker process, returning errors instead of raising.
+
+    The problems are None when the file is not a text file.
+    """
+    try:
+        return analyze_file(file, _worker_conf, _worker_cache), None
+    except UnicodeDecodeError:
+        return None, None
+    except Exception:
+        return [], traceback.format_exc()
+
+
+def analyze_files(
+    files: Iterable[str], conf: PresidioCLIConfig, args: argparse.Namespace
+) -> Generator[Tuple[str, List[PIIProblem]], None, None]:
+    """
+    Analyze files, in args.jobs processes when more than one.
+
+    Files are analyzed in a process pool whose workers load the configuration
+    (and analyzer engine) once, and the problems of each file are yielded in
+    the order of the files, as soon as the file and all the files before it
+    are analyzed. Errors are printed and the file is skipped. Files found not
+    to be UTF-8 text past the prefix checked by is_text_file are skipped as
+    well, as binary files are by find_files_recursively. When args.cache
+    is set, the problems are cached in this directory (see ResultCache).
+
+    :param files: paths of the files to analyze
+    :param conf: PresidioCLIConfig object, used when analyzing in this process
+    :param args: parsed command line arguments
+    :return: generator of the path of each file with its problems
+    """
+    if args.jobs <= 1:
+        cache = ResultCache(conf, args.cache) if args.cache is not None else None
+        for file in files:
+            try:
+                problems = analyze_file(file, conf, cache)
+            except UnicodeDecodeError:
+                continue
+            except Exception:
+                traceback.print_exc()
+                continue
+            yield file, problems
+        return
+
+    with ProcessPoolExecutor(
+        max_workers=args.jobs,
+        initializer=_init_worker,
+        initargs=(
+            args.config_data,
+            args.config_file,
+            args.threshold,
+            args.cache,
+            args.window_lines,
+        ),
+    ) as executor:
+        # Submit a bounded number of files ahead, so results are not kept in
+        # memory for a whole repository when a file is slow to analyze
+        pending = deque()
+        files = iter(files)
+        while True:
+            while len(pending) < args.jobs * FILES_AHEAD_PER_JOB:
+                file = next(files, None)
+                if file is None:
+                    break
+                pending.append((file, executor.submit(_analyze_file_in_worker, file)))
+            if not pending:
+                break
+            file, future = pending.popleft()
+            problems, error = future.result()
+            if error is not None:
+                print(error, file=sys.stderr, end="")
+                continue
+            if problems is None:
+                continue
+            yield file, problems
+
+
 def run() -> None:
     """Entrypoint of Presidio CLI."""
     parser = argparse.ArgumentParser(prog=SHELL_NAME, description=APP_DESCRIPTION)
@@ -236,39 +463,62 @@ def run() -> None:
         default=None,
         help="override the config threshold for this run",
     )
+    parser.add_argument(
+        "--window-lines",
+        type=window_lines_value,
+        default=None,
+        metavar="LINES",
+        help="override the config number of lines analyzed together, "
+        "e.g. to find entities spanning several lines (0 for whole files)",
+    )
+    parser.add_argument(
+        "-j",
+        "--jobs",
+        type=jobs_value,
+        default=1,
+        help="number of processes analyzing files in parallel "
+        "(0 for the number of CPUs)",
+    )
+    parser.add_argument(
+        "--cache",
+        nargs="?",
+        const=CACHE_DIR,
+        default=None,
+        metavar="DIR",
+        help="cache the problems found in files, and skip files whose content "
+        f"was already analyzed with the same configuration (default: {CACHE_DIR})",
+    )
+    parser.add_argument(
+        "--changed-since",
+        metavar="GIT_REV",
+        default=None,
+        help="only check files changed since this git revision, and untracked files",
+    )
 
     args = parser.parse_args()
 
     try:
-        if args.config_data is not None:
-            if args.config_data != "" and ":" not in args.config_data:
-                args.config_data = "extends: " + args.config_data
-            conf = PresidioCLIConfig(content=args.config_data)
-        elif args.config_file is not None:
-            conf = PresidioCLIConfig(file=args.config_file)
-        elif os.path.isfile(".presidiocli"):
-            conf = PresidioCLIConfig(file=".presidiocli")
-        else:
-            conf = PresidioCLIConfig(content="extends: default")
+        conf = load_config(
+            args.config_data, args.config_file, args.threshold, args.window_lines
+        )
     except PresidioCLIConfigError as e:
         print(e, file=sys.stderr)
         sys.exit(1)
 
-    if args.threshold is not None:
-        conf.threshold = args.threshold
-
     if conf.locale is not None:
         locale.setlocale(locale.LC_ALL, conf.locale)
 
-    prob_num = 0
-    for file in find_files_recursively(args.files, conf):
-        filepath = file[2:] if file.startswith("./") or file.startswith(".\\") else file
+    changed_files = None
+    if args.changed_since is not None:
         try:
-            with io.open(file, newline="", encoding="utf-8") as f:
-                problems = analyze(f, conf, filepath)
-        except Exception:
-            traceback.print_exc()
-            continue
+            changed_files = get_changed_files(args.changed_since)
+        except ValueError as e:
+            print(e, file=sys.stderr)
+            sys.exit(1)
+
+    prob_num = 0
+    files = find_files_recursively(args.files, conf, changed_files, args.cache)
+    for file, problems in analyze_files(files, conf, args):
         prob_num = show_problems(
             problems, file, args_format=args.format, no_warn=args.no_warnings
         )
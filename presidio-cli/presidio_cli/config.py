@@ -1,3 +1,7 @@
+import codecs
+import hashlib
+import importlib.metadata
+import json
 import os
 from typing import Optional
 
@@ -5,6 +9,12 @@ import pathspec
 import yaml
 from presidio_analyzer import AnalyzerEngine
 
+# Number of bytes read from the start of a file to detect binary files
+TEXT_FILE_PREFIX_SIZE = 8192
+
+# Bytes found in text files
+TEXT_CHARS = bytes({7, 8, 9, 10, 12, 13, 27} | set(range(0x20, 0x100)) - {0x7F})
+
 
 class PresidioCLIConfigError(Exception):
     """Represents an error in the configuration file."""
@@ -25,6 +35,7 @@ class PresidioCLIConfig(object):
         self.threshold = 0
         self.language = "en"
         self.allow_list = []
+        self.window_lines = 1
         if file is not None:
             with open(file) as f:
                 content = f.read()
@@ -39,28 +50,57 @@ class PresidioCLIConfig(object):
         """
         return self.ignore and filepath and self.ignore.match_file(filepath)
 
+    def get_hash(self) -> str:
+        """
+        Return a hash of the configuration which affects the problems found in a file.
+
+        Includes the entities, language, allow list, threshold and window of
+        lines, and the versions of presidio-analyzer and presidio-cli.
+        """
+        versions = {}
+        for package in ("presidio-analyzer", "presidio-cli"):
+            try:
+                versions[package] = importlib.metadata.version(package)
+            except importlib.metadata.PackageNotFoundError:
+                versions[package] = None
+
+        content = {
+            "entities": sorted(self.entities),
+            "language": self.language,
+            "allow_list": self.allow_list,
+            "threshold": self.threshold,
+            "window_lines": self.window_lines,
+            "versions": versions,
+        }
+        return hashlib.sha256(
+            json.dumps(content, sort_keys=True, default=str).encode()
+        ).hexdigest()
+
     def is_text_file(self, filepath: str) -> bool:
         """Detect if file is a not a binary file.Based on https://stackoverflow.com/a/7392391.
 
+        Only the first TEXT_FILE_PREFIX_SIZE bytes of the file are read, so
+        the cost does not depend on the size of the file.
+
         :param filepath: Path of the configuration file.
         """
+        with open(filepath, "rb") as f:
+            prefix = f.read(TEXT_FILE_PREFIX_SIZE)
 
-        # Try to read the file as UTF-8.
+        # Binary files contain control characters
+        if prefix.translate(None, TEXT_CHARS):
+            return False
+
+        # Try to decode the prefix as UTF-8.
         # In case some invalid UTF-8 characters are found,
-        # an exception is caught and the file is not going
-        # to be processed.
+        # the file is not going to be processed. A character
+        # cut at the end of the prefix is not an error.
+        decoder = codecs.getincrementaldecoder("utf-8")()
         try:
-            with open(filepath, newline="", encoding="utf-8") as f:
-                _ = f.read()
+            decoder.decode(prefix, final=len(prefix) < TEXT_FILE_PREFIX_SIZE)
         except UnicodeDecodeError:
             return False
-
-        textchars = bytearray(
-            {7, 8, 9, 10, 12, 13, 27} | set(range(0x20, 0x100)) - {0x7F}
-        )
-        with open(filepath, "rb") as f:
-            # return true if it's not a binary
-            return not bool(f.read(1024).translate(None, textchars))
+        return True
 
     def extend(self, base_config: "PresidioCLIConfig") -> None:
         """
@@ -127,6 +167,18 @@ class PresidioCLIConfig(object):
                 "gitwildmatch", conf["ignore"].splitlines()
             )
 
+        if "window_lines" in conf:
+            window_lines = conf["window_lines"]
+            if (
+                not isinstance(window_lines, int)
+                or isinstance(window_lines, bool)
+                or window_lines < 0
+            ):
+                raise PresidioCLIConfigError(
+                    "invalid config: window_lines should be 0 or more"
+                )
+            self.window_lines = window_lines
+
         if "locale" in conf:
             if not isinstance(conf["locale"], str):
                 raise PresidioCLIConfigError(
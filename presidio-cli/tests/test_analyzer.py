@@ -1,5 +1,15 @@
+import io
+
 import pytest
-from presidio_cli.analyzer import analyze, line_generator
+from presidio_cli import analyzer
+from presidio_cli.analyzer import (
+    Window,
+    analyze,
+    line_generator,
+    stream_line_generator,
+    window_generator,
+)
+from presidio_cli.config import PresidioCLIConfig
 
 
 def test_line_generator():
@@ -35,6 +45,89 @@ def test_line_generator():
     assert e[2].content == "at the end"
 
 
+@pytest.mark.parametrize(
+    "buffer",
+    [
+        "",
+        "\n",
+        " \n",
+        "\n\n",
+        "---\n" "this is line 1\n" "line 2\n" "\n" "3\n",
+        "test with\n" "no newline\n" "at the end",
+        "dos\r\n" "line endings\r\n",
+        "non-ascii éçä\n" "γλνπ¥",
+        "lone\r" "carriage return\n" "c@x.com\n",
+        "old mac\r" "line endings\r",
+    ],
+)
+def test_stream_line_generator(buffer):
+    expected = [(e.line_no, e.content) for e in line_generator(buffer)]
+
+    for stream in (io.StringIO(buffer, newline=""), io.BytesIO(buffer.encode())):
+        lines = list(stream_line_generator(stream))
+        assert [(e.line_no, e.content) for e in lines] == expected
+        assert all(e.start == 0 and e.end == len(e.content) for e in lines)
+
+    raw = buffer.encode()
+    for line in stream_line_generator(io.BytesIO(raw)):
+        assert raw[line.offset :].decode().startswith(line.content)
+
+
+def test_window_generator(monkeypatch):
+    lines = list(line_generator("a\n" "bb\n" "ccc\n" "dddd"))
+
+    windows = list(window_generator(lines, 1))
+    assert [w.text for w in windows] == ["a", "bb", "ccc", "dddd"]
+
+    windows = list(window_generator(lines, 3))
+    assert [w.text for w in windows] == ["a\nbb\nccc", "dddd"]
+    assert windows[1].line_nos == [4]
+
+    windows = list(window_generator(lines, 0))
+    assert [w.text for w in windows] == ["a\nbb\nccc\ndddd"]
+
+    monkeypatch.setattr(analyzer, "MAX_WINDOW_SIZE", 6)
+    windows = list(window_generator(lines, 0))
+    assert [w.text for w in windows] == ["a\nbb", "ccc", "dddd"]
+
+
+def test_window_locate():
+    window = Window(list(line_generator("first\r\n" "\n" "third line"))[0:3])
+
+    assert window.text == "first\n\nthird line"
+    assert window.locate(0) == (1, 0)
+    assert window.locate(4) == (1, 0)
+    assert window.locate(5) == (1, 0)
+    assert window.locate(6) == (2, 6)
+    assert window.locate(7) == (3, 7)
+    assert window.locate(12) == (3, 7)
+
+
+def test_analyze_stream_with_lone_carriage_return(en_core_web_lg):
+    conf = PresidioCLIConfig(content="entities:\n  - EMAIL_ADDRESS\n")
+    stream = io.StringIO("a\rb\n" "my email is cdarwin@hmsbeagle.org\n", newline="")
+
+    problems = list(analyze(stream, conf))
+
+    assert [(p.line, p.type) for p in problems] == [(2, "EMAIL_ADDRESS")]
+
+
+@pytest.mark.parametrize("window_lines", [0, 2])
+def test_analyze_with_window_lines(en_core_web_lg, window_lines):
+    conf = PresidioCLIConfig(content="entities:\n  - EMAIL_ADDRESS\n")
+    text = (
+        "my email is cdarwin@hmsbeagle.org\n"
+        "no email here\n"
+        "  contact: jones@example.com or\n"
+        "charles@example.org\n"
+    )
+    expected = [(p.line, p.column, p.type) for p in analyze(text, conf)]
+    assert expected == [(1, 13, "EMAIL_ADDRESS"), (3, 12, "EMAIL_ADDRESS"), (4, 1, "EMAIL_ADDRESS")]
+
+    conf.window_lines = window_lines
+    assert [(p.line, p.column, p.type) for p in analyze(text, conf)] == expected
+
+
 def test_analyze(en_core_web_lg, config):
     result = list(
         analyze(
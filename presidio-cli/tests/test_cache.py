@@ -0,0 +1,104 @@
+from presidio_analyzer import RecognizerResult
+
+from presidio_cli.analyzer import PIIProblem, analyze_file
+from presidio_cli.cache import ResultCache
+
+
+def make_problem(line=1, start=6, entity_type="PERSON", score=0.85):
+    recognizer_result = RecognizerResult(
+        entity_type,
+        start,
+        start + 5,
+        score,
+        recognition_metadata={"recognizer_name": "SpacyRecognizer"},
+    )
+    return PIIProblem(line, recognizer_result)
+
+
+def make_conf(mocker, config_hash="config-hash"):
+    conf = mocker.Mock()
+    conf.get_hash.return_value = config_hash
+    conf.is_file_ignored.return_value = False
+    return conf
+
+
+def test_problem_to_dict_and_from_dict():
+    problem = make_problem(line=3, start=10)
+    restored = PIIProblem.from_dict(problem.to_dict())
+
+    assert restored.line == 3
+    assert restored.column == 11
+    assert restored.type == "PERSON"
+    assert restored.score == 0.85
+    assert restored.recognizer_result == problem.recognizer_result
+
+
+def test_cache_get_and_set(mocker, tmp_path):
+    cache = ResultCache(make_conf(mocker), tmp_path / "cache")
+    key = cache.get_key(b"Hello Paulo Santos")
+
+    assert cache.get(key) is None
+    cache.set(key, [make_problem(), make_problem(line=2, entity_type="LOCATION")])
+
+    problems = cache.get(key)
+    assert [(p.line, p.column, p.type, p.score) for p in problems] == [
+        (1, 7, "PERSON", 0.85),
+        (2, 7, "LOCATION", 0.85),
+    ]
+    assert (tmp_path / "cache" / ".gitignore").read_text() == "*\n"
+
+
+def test_cache_key_depends_on_content_and_config(mocker, tmp_path):
+    cache = ResultCache(make_conf(mocker), tmp_path)
+    other_config_cache = ResultCache(make_conf(mocker, "other-hash"), tmp_path)
+
+    key = cache.get_key(b"content")
+    assert cache.get_key(b"content") == key
+    assert cache.get_key(b"other content") != key
+    assert other_config_cache.get_key(b"content") != key
+
+
+def test_cache_file_key_equals_content_key(mocker, tmp_path):
+    cache = ResultCache(make_conf(mocker), tmp_path / "cache")
+    content = "Hello Paulo Santos\n".encode() * 100_000
+    file = tmp_path / "file.txt"
+    file.write_bytes(content)
+
+    assert cache.get_file_key(str(file)) == cache.get_key(content)
+
+
+def test_cache_ignores_unreadable_files(mocker, tmp_path):
+    cache = ResultCache(make_conf(mocker), tmp_path)
+    key = cache.get_key(b"content")
+    cache.set(key, [])
+    cache._get_path(key).write_text("not json")
+
+    assert cache.get(key) is None
+
+
+def test_analyze_file_with_cache(mocker, tmp_path):
+    conf = make_conf(mocker)
+    cache = ResultCache(conf, tmp_path / "cache")
+    file = tmp_path / "file.txt"
+    file.write_text("Hello Paulo Santos\n")
+    _analyze_lines = mocker.patch(
+        "presidio_cli.analyzer._analyze_lines", return_value=iter([make_problem()])
+    )
+
+    first = analyze_file(str(file), conf, cache)
+    second = analyze_file(str(file), conf, cache)
+
+    _analyze_lines.assert_called_once()
+    assert _analyze_lines.call_args.args[1] is conf
+    assert [p.recognizer_result for p in second] == [p.recognizer_result for p in first]
+
+
+def test_analyze_file_ignored(mocker, tmp_path):
+    conf = make_conf(mocker)
+    conf.is_file_ignored.return_value = True
+    file = tmp_path / "file.txt"
+    file.write_text("Hello Paulo Santos\n")
+    _analyze_lines = mocker.patch("presidio_cli.analyzer._analyze_lines")
+
+    assert analyze_file(str(file), conf) == []
+    _analyze_lines.assert_not_called()
@@ -1,5 +1,6 @@
 import argparse
 import os
+import subprocess
 import pytest
 from io import StringIO
 from presidio_cli import cli
@@ -36,6 +37,10 @@ def make_args(**overrides):
         "format": "auto",
         "no_warnings": False,
         "threshold": None,
+        "jobs": 1,
+        "cache": None,
+        "changed_since": None,
+        "window_lines": None,
     }
     args.update(overrides)
     return args
@@ -213,3 +218,175 @@ def test_run_with_stdin(mocker):
     ec = mocker.patch("sys.exit")
     cli.run()
     ec.assert_called_once_with(0)
+
+
+@pytest.mark.parametrize(
+    ("value", "expected"),
+    [("1", 1), ("4", 4)],
+)
+def test_jobs_value_accepts_valid_values(value, expected):
+    assert cli.jobs_value(value) == expected
+
+
+def test_jobs_value_zero_is_cpu_count(mocker):
+    mocker.patch("os.cpu_count", return_value=3)
+    assert cli.jobs_value("0") == 3
+
+
+@pytest.mark.parametrize("value", ["-1", "two"])
+def test_jobs_value_rejects_invalid_values(value):
+    with pytest.raises(argparse.ArgumentTypeError):
+        cli.jobs_value(value)
+
+
+@pytest.mark.parametrize(("value", "expected"), [("0", 0), ("1", 1), ("500", 500)])
+def test_window_lines_value_accepts_valid_values(value, expected):
+    assert cli.window_lines_value(value) == expected
+
+
+@pytest.mark.parametrize("value", ["-1", "all"])
+def test_window_lines_value_rejects_invalid_values(value):
+    with pytest.raises(argparse.ArgumentTypeError):
+        cli.window_lines_value(value)
+
+
+def test_analyze_files_skips_file_with_error(mocker, problems):
+    def analyze_file(file, conf, cache=None):
+        if file == "error.txt":
+            raise ValueError("cannot analyze")
+        return problems if file == "a.txt" else []
+
+    mocker.patch("presidio_cli.cli.analyze_file", side_effect=analyze_file)
+    args = argparse.Namespace(**make_args())
+
+    results = list(
+        cli.analyze_files(["a.txt", "error.txt", "b.txt"], make_conf(mocker), args)
+    )
+
+    assert results == [("a.txt", problems), ("b.txt", [])]
+
+
+def test_analyze_files_skips_file_not_utf8_after_prefix(mocker, tmp_path):
+    conf = make_conf(mocker)
+    conf.is_file_ignored.return_value = False
+    mocker.patch(
+        "presidio_cli.analyzer._analyze_lines", side_effect=lambda lines, conf: list(lines)
+    )
+    (tmp_path / "a.txt").write_text("a\n")
+    (tmp_path / "b.txt").write_bytes(b"b\n" * 10_000 + b"\xe9\n")
+    files = [str(tmp_path / "a.txt"), str(tmp_path / "b.txt")]
+    args = argparse.Namespace(**make_args())
+
+    assert [file for file, _ in cli.analyze_files(files, conf, args)] == files[:1]
+
+
+def test_analyze_files_in_parallel_keeps_file_order(en_core_web_lg, temp_workspace):
+    config_data = "entities:\n  - CREDIT_CARD\n  - PERSON"
+    conf = cli.load_config(config_data=config_data)
+    files = sorted(cli.find_files_recursively([temp_workspace], conf))
+
+    def scan(jobs):
+        args = argparse.Namespace(**make_args(config_data=config_data, jobs=jobs))
+        return [
+            (file, [(p.line, p.column, p.type, p.score) for p in file_problems])
+            for file, file_problems in cli.analyze_files(files, conf, args)
+        ]
+
+    sequential = scan(jobs=1)
+    assert [file for file, _ in sequential] == files
+    assert any(file_problems for _, file_problems in sequential)
+    assert scan(jobs=2) == sequential
+
+
+def test_load_config_prefixes_config_data_and_overrides_threshold(mocker):
+    conf = make_conf(mocker)
+    config = mocker.patch("presidio_cli.cli.PresidioCLIConfig", return_value=conf)
+
+    assert cli.load_config(config_data="limited", threshold=0.7) is conf
+    config.assert_called_once_with(content="extends: limited")
+    assert conf.threshold == 0.7
+
+
+def test_load_config_overrides_window_lines(mocker):
+    conf = make_conf(mocker)
+    mocker.patch("presidio_cli.cli.PresidioCLIConfig", return_value=conf)
+
+    assert cli.load_config(config_data="limited", window_lines=0).window_lines == 0
+
+
+def test_analyze_files_with_cache_analyzes_unchanged_files_once(mocker, tmp_path):
+    conf = make_conf(mocker)
+    conf.get_hash.return_value = "config-hash"
+    conf.is_file_ignored.return_value = False
+    (tmp_path / "a.txt").write_text("a")
+    (tmp_path / "b.txt").write_text("b")
+    files = [str(tmp_path / "a.txt"), str(tmp_path / "b.txt")]
+    _analyze_lines = mocker.patch(
+        "presidio_cli.analyzer._analyze_lines", return_value=iter([])
+    )
+    args = argparse.Namespace(**make_args(cache=str(tmp_path / "cache")))
+
+    assert list(cli.analyze_files(files, conf, args)) == [(f, []) for f in files]
+    assert _analyze_lines.call_count == 2
+
+    (tmp_path / "b.txt").write_text("changed")
+    assert list(cli.analyze_files(files, conf, args)) == [(f, []) for f in files]
+    assert _analyze_lines.call_count == 3
+
+
+def git(*args, cwd):
+    subprocess.run(["git", *args], cwd=cwd, check=True, capture_output=True)
+
+
+def test_get_changed_files(tmp_path, monkeypatch):
+    git("init", cwd=tmp_path)
+    git("config", "user.email", "test@example.com", cwd=tmp_path)
+    git("config", "user.name", "Test", cwd=tmp_path)
+    (tmp_path / "sub").mkdir()
+    for name in ("unchanged.txt", "modified.txt", "deleted.txt", "sub/staged.txt"):
+        (tmp_path / name).write_text("content\n")
+    git("add", ".", cwd=tmp_path)
+    git("commit", "-m", "initial", cwd=tmp_path)
+
+    (tmp_path / "modified.txt").write_text("modified\n")
+    (tmp_path / "sub" / "staged.txt").write_text("staged\n")
+    git("add", "sub/staged.txt", cwd=tmp_path)
+    (tmp_path / "deleted.txt").unlink()
+    (tmp_path / "untracked.txt").write_text("untracked\n")
+
+    monkeypatch.chdir(tmp_path / "sub")
+    changed = cli.get_changed_files("HEAD")
+
+    assert changed == {
+        os.path.realpath(tmp_path / name)
+        for name in ("modified.txt", "sub/staged.txt", "untracked.txt")
+    }
+
+    with pytest.raises(ValueError):
+        cli.get_changed_files("not-a-revision")
+
+
+def test_find_files_recursively_skips_cache_dir(temp_workspace, config):
+    cache_dir = os.path.join(temp_workspace, "sub", ".presidiocli_cache")
+    os.makedirs(os.path.join(cache_dir, "ab"))
+    for name in (".gitignore", os.path.join("ab", "cd.json")):
+        with open(os.path.join(cache_dir, name), "w") as f:
+            f.write("*\n")
+
+    all_files = list(cli.find_files_recursively([temp_workspace], config))
+    files = list(
+        cli.find_files_recursively([temp_workspace], config, cache_dir=cache_dir)
+    )
+
+    assert os.path.join(cache_dir, ".gitignore") in all_files
+    assert files == [file for file in all_files if not file.startswith(cache_dir)]
+
+
+def test_find_files_recursively_with_changed_files(temp_workspace, config):
+    changed = {
+        os.path.realpath(os.path.join(temp_workspace, "dos.yml")),
+        os.path.realpath(os.path.join(temp_workspace, "sub", "directory.txt", "empty.txt")),
+    }
+    assert sorted(
+        cli.find_files_recursively([temp_workspace], config, changed)
+    ) == sorted(changed)
@@ -2,6 +2,7 @@ import os
 import pytest
 
 from presidio_cli import config
+from presidio_cli.config import TEXT_FILE_PREFIX_SIZE
 
 
 def test_parse_config():
@@ -48,6 +49,23 @@ def test_is_file(temp_workspace, config):
     assert not config.is_text_file(os.path.join(temp_workspace, "binary_file"))
 
 
+def test_is_text_file_only_reads_prefix(temp_workspace, config):
+    path = os.path.join(temp_workspace, "large.txt")
+
+    # A multi-byte character cut at the end of the prefix is still text
+    with open(path, "wb") as f:
+        f.write(b"a" * (TEXT_FILE_PREFIX_SIZE - 1) + "é".encode() + b"\x00")
+    assert config.is_text_file(path)
+
+    with open(path, "wb") as f:
+        f.write(b"a" * 100 + b"\x00")
+    assert not config.is_text_file(path)
+
+    with open(path, "wb") as f:
+        f.write(b"invalid utf-8 \xe9")
+    assert not config.is_text_file(path)
+
+
 def test_invalid_value(temp_workspace):
     with pytest.raises(config.PresidioCLIConfigError):
         config.PresidioCLIConfig("ignore: 1\n")
@@ -61,3 +79,27 @@ def test_run_with_ignored_path(temp_workspace):
     assert new.is_file_ignored("./dos.yml")
     assert new.is_file_ignored("./.git/hooks/README.sample")
     assert not new.is_file_ignored("notignored")
+
+
+def test_get_hash():
+    conf = config.PresidioCLIConfig("entities:\n  - PERSON\n  - CREDIT_CARD\n")
+    same = config.PresidioCLIConfig("entities:\n  - CREDIT_CARD\n  - PERSON\n")
+    assert conf.get_hash() == same.get_hash()
+
+    same.threshold = 0.5
+    assert conf.get_hash() != same.get_hash()
+
+    other = config.PresidioCLIConfig("entities:\n  - PERSON\nallow:\n  - John\n")
+    assert conf.get_hash() != other.get_hash()
+
+    other = config.PresidioCLIConfig("entities:\n  - PERSON\nwindow_lines: 0\n")
+    assert conf.get_hash() != other.get_hash()
+
+
+def test_window_lines():
+    conf = config.PresidioCLIConfig("window_lines: 100\n")
+    assert conf.window_lines == 100
+
+    for value in ("-1", "two", "true"):
+        with pytest.raises(config.PresidioCLIConfigError):
+            config.PresidioCLIConfig(f"window_lines: {value}\n")
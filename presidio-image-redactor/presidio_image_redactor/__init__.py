@@ -6,17 +6,29 @@ import logging
 from .ocr import OCR
 from .tesseract_ocr import TesseractOCR
 from .document_intelligence_ocr import DocumentIntelligenceOCR
+from .text_region_detector import (
+    TextRegionDetector,
+    TemplateTextRegionDetector,
+    ContourTextRegionDetector,
+)
+from .region_ocr import RegionOCR
+from .cached_ocr import CachedOCR
 from .bbox import BboxProcessor
 from .image_processing_engine import ImagePreprocessor
 from .image_analyzer_engine import ImageAnalyzerEngine
 from .image_redactor_engine import ImageRedactorEngine
 from .image_pii_verify_engine import ImagePiiVerifyEngine
+from .metadata_phi_recognizer import MetadataPhiRecognizer
 from .dicom_image_redactor_engine import DicomImageRedactorEngine
 from .dicom_image_pii_verify_engine import DicomImagePiiVerifyEngine
 from .image_processing_engine import (
+    ImagePreprocessingPipeline,
+    ImageStatistics,
     ContrastSegmentedImageEnhancer,
     BilateralFilter,
+    LowContrastEnhancer,
     SegmentedAdaptiveThreshold,
+    OtsuThreshold,
     ImageRescaling,
 )
 
@@ -27,15 +39,25 @@ __all__ = [
     "OCR",
     "TesseractOCR",
     "DocumentIntelligenceOCR",
+    "TextRegionDetector",
+    "TemplateTextRegionDetector",
+    "ContourTextRegionDetector",
+    "RegionOCR",
+    "CachedOCR",
     "BboxProcessor",
     "ImageAnalyzerEngine",
     "ImageRedactorEngine",
     "ImagePreprocessor",
     "ImagePiiVerifyEngine",
+    "MetadataPhiRecognizer",
     "DicomImageRedactorEngine",
     "DicomImagePiiVerifyEngine",
+    "ImagePreprocessingPipeline",
+    "ImageStatistics",
     "ContrastSegmentedImageEnhancer",
     "BilateralFilter",
+    "LowContrastEnhancer",
     "SegmentedAdaptiveThreshold",
+    "OtsuThreshold",
     "ImageRescaling",
 ]
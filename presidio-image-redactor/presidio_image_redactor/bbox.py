@@ -1,6 +1,6 @@
 from typing import Dict, List, Tuple, Union
 
-from presidio_image_redactor.entities import ImageRecognizerResult
+from presidio_image_redactor.entities import ImageRecognizerResult, OcrResult
 
 
 class BboxProcessor:
@@ -8,28 +8,14 @@ class BboxProcessor:
 
     @staticmethod
     def get_bboxes_from_ocr_results(
-        ocr_results: Dict[str, List[Union[int, str]]],
+        ocr_results: Union[Dict[str, List[Union[int, str]]], OcrResult],
     ) -> List[Dict[str, Union[int, float, str]]]:
         """Get bounding boxes on padded image for all detected words from ocr_results.
 
         :param ocr_results: Raw results from OCR.
         :return: Bounding box information per word.
         """
-        bboxes = []
-        for i in range(len(ocr_results["text"])):
-            detected_text = ocr_results["text"][i]
-            if detected_text:
-                bbox = {
-                    "left": ocr_results["left"][i],
-                    "top": ocr_results["top"][i],
-                    "width": ocr_results["width"][i],
-                    "height": ocr_results["height"][i],
-                    "conf": float(ocr_results["conf"][i]),
-                    "label": detected_text,
-                }
-                bboxes.append(bbox)
-
-        return bboxes
+        return OcrResult.from_dict(ocr_results).to_bboxes()
 
     @staticmethod
     def get_bboxes_from_analyzer_results(
@@ -0,0 +1,216 @@
+import hashlib
+import json
+import logging
+import os
+import tempfile
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Optional, Union
+
+import numpy as np
+from PIL import Image
+
+from presidio_image_redactor import OCR
+
+logger = logging.getLogger("presidio-image-redactor")
+
+# Version of the cache keys and files, to change when their format changes
+CACHE_FORMAT_VERSION = "1"
+
+
+class CachedOCR(OCR):
+    """OCR class that caches the results of another OCR engine.
+
+    Results are cached by a hash of the pixels of the image passed to
+    perform_ocr (the preprocessed image, when used by ImageAnalyzerEngine),
+    the OCR kwargs and a namespace identifying the OCR engine, so OCR is not
+    run again on identical pixel data, e.g. when redacting again with other
+    analyzer settings or verifying a redacted image.
+
+    The most recent results are kept in memory, and all results are also
+    stored as JSON files in cache_dir if provided, so they can be shared
+    between processes and runs. The same CachedOCR can be used by several
+    engines, e.g. the ImageAnalyzerEngine of a redactor and the OCR engine of
+    a verify engine.
+
+    :param ocr: OCR engine whose results are cached.
+    :param cache_dir: Directory to store the results in (memory only if None).
+    :param max_entries: Maximum number of results kept in memory.
+    :param namespace: Identifier of the OCR engine and its configuration
+        (e.g. including a model version), part of the cache key. Defaults to
+        the class name of the OCR engine.
+    """
+
+    def __init__(
+        self,
+        ocr: OCR,
+        cache_dir: Optional[Union[str, Path]] = None,
+        max_entries: int = 256,
+        namespace: Optional[str] = None,
+    ):
+        if max_entries < 0:
+            raise ValueError("max_entries must be non-negative")
+        self.ocr = ocr
+        self.cache_dir = Path(cache_dir) if cache_dir is not None else None
+        self.max_entries = max_entries
+        if namespace is None:
+            namespace = f"{type(ocr).__module__}.{type(ocr).__qualname__}"
+        self.namespace = namespace
+        self.hits = 0
+        self.misses = 0
+        self._memory: "OrderedDict[str, dict]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def perform_ocr(self, image: object, **kwargs) -> dict:
+        """Perform OCR on a given image, or return the cached results.
+
+        :param image: PIL Image/numpy array or file path(str) to be processed
+        :param kwargs: Additional values for the perform_ocr method of the
+            wrapped OCR engine
+
+        :return: results dictionary containing bboxes and text for each detected word
+        """
+        key = self.get_cache_key(image, **kwargs)
+
+        ocr_result = self._get_from_memory(key)
+        if ocr_result is None:
+            ocr_result = self._get_from_disk(key)
+            if ocr_result is not None:
+                self._add_to_memory(key, ocr_result)
+        if ocr_result is not None:
+            with self._lock:
+                self.hits += 1
+            return self._copy(ocr_result)
+
+        with self._lock:
+            self.misses += 1
+        ocr_result = self.ocr.perform_ocr(image, **kwargs)
+        self._add_to_memory(key, self._copy(ocr_result))
+        self._add_to_disk(key, ocr_result)
+        return ocr_result
+
+    def get_cache_key(self, image: object, **kwargs) -> str:
+        """Compute the cache key of the OCR results of an image.
+
+        :param image: PIL Image/numpy array, encoded image (bytes) or file
+            path(str) to be processed
+        :param kwargs: Additional values for the perform_ocr method
+
+        :return: Hexadecimal digest of the image pixels, kwargs and namespace.
+        """
+        digest = hashlib.blake2b(digest_size=20)
+        header = {
+            "version": CACHE_FORMAT_VERSION,
+            "namespace": self.namespace,
+            "kwargs": kwargs,
+        }
+        if isinstance(image, Image.Image):
+            header["image"] = ["pil", image.mode, image.size]
+            digest.update(json.dumps(header, sort_keys=True, default=repr).encode())
+            if image.mode == "P":
+                digest.update(bytes(image.getpalette() or []))
+            digest.update(image.tobytes())
+        elif isinstance(image, np.ndarray):
+            header["image"] = ["array", image.dtype.str, image.shape]
+            digest.update(json.dumps(header, sort_keys=True, default=repr).encode())
+            digest.update(np.ascontiguousarray(image).data)
+        elif isinstance(image, (bytes, bytearray)):
+            header["image"] = ["bytes"]
+            digest.update(json.dumps(header, sort_keys=True, default=repr).encode())
+            digest.update(image)
+        else:
+            header["image"] = ["file"]
+            digest.update(json.dumps(header, sort_keys=True, default=repr).encode())
+            with open(image, "rb") as f:
+                for block in iter(lambda: f.read(1 << 20), b""):
+                    digest.update(block)
+
+        return digest.hexdigest()
+
+    def clear(self) -> None:
+        """Remove the results kept in memory (files in cache_dir are kept)."""
+        with self._lock:
+            self._memory.clear()
+
+    def _get_from_memory(self, key: str) -> Optional[dict]:
+        with self._lock:
+            ocr_result = self._memory.get(key)
+            if ocr_result is not None:
+                self._memory.move_to_end(key)
+            return ocr_result
+
+    def _add_to_memory(self, key: str, ocr_result: dict) -> None:
+        if not self.max_entries:
+            return
+        with self._lock:
+            self._memory[key] = ocr_result
+            self._memory.move_to_end(key)
+            while len(self._memory) > self.max_entries:
+                self._memory.popitem(last=False)
+
+    def _get_path(self, key: str) -> Path:
+        return self.cache_dir / key[:2] / f"{key}.json"
+
+    def _get_from_disk(self, key: str) -> Optional[dict]:
+        if self.cache_dir is None:
+            return None
+        path = self._get_path(key)
+        try:
+            with open(path, encoding="utf-8") as f:
+                return json.load(f)
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError):
+            logger.warning("Ignoring unreadable OCR cache file %s", path)
+            return None
+
+    def _add_to_disk(self, key: str, ocr_result: dict) -> None:
+        if self.cache_dir is None:
+            return
+        path = self._get_path(key)
+        try:
+            content = json.dumps(ocr_result, default=self._to_json)
+        except TypeError:
+            logger.debug("OCR results of %s cannot be stored in the cache", key)
+            return
+
+        # Write to a temporary file first, so that other processes never
+        # read a partially written file
+        tmp_path = None
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                f.write(content)
+            os.replace(tmp_path, path)
+        except OSError:
+            logger.warning("Could not write OCR cache file %s", path, exc_info=True)
+            if tmp_path is not None and os.path.exists(tmp_path):
+                os.remove(tmp_path)
+
+    @staticmethod
+    def _to_json(value: object) -> object:
+        """Convert numpy values (e.g. in OCR results) to JSON values."""
+        if isinstance(value, (np.generic, np.ndarray)):
+            return value.tolist()
+        raise TypeError(f"{type(value).__name__} is not JSON serializable")
+
+    @staticmethod
+    def _copy(ocr_result: dict) -> dict:
+        """Copy OCR results, so the cached lists are not modified by callers."""
+        return {
+            key: list(values) if isinstance(values, (list, tuple)) else values
+            for key, values in ocr_result.items()
+        }
+
+    def __getstate__(self) -> dict:
+        """Return the state to pickle (e.g. for process pools), without the lock."""
+        state = self.__dict__.copy()
+        del state["_lock"]
+        return state
+
+    def __setstate__(self, state: dict) -> None:
+        """Restore the pickled state and create a new lock."""
+        self.__dict__.update(state)
+        self._lock = threading.Lock()
@@ -1,4 +1,4 @@
-from copy import deepcopy
+from collections import OrderedDict
 from typing import List, Optional, Tuple
 
 import PIL
@@ -26,24 +26,31 @@ class DicomImagePiiVerifyEngine(ImagePiiVerifyEngine, DicomImageRedactorEngine):
     ):
         """Initialize DicomImagePiiVerifyEngine object.
 
-        :param ocr_engine: OCR engine to use.
+        :param ocr_engine: OCR engine to use. Defaults to the OCR engine of
+        image_analyzer_engine if provided (so that e.g. a CachedOCR is shared),
+        else TesseractOCR.
         :param image_analyzer_engine: Image analyzer engine to use.
         """
         # Initialize OCR engine
-        if not ocr_engine:
-            self.ocr_engine = TesseractOCR()
-        else:
+        if ocr_engine:
             self.ocr_engine = ocr_engine
+        elif image_analyzer_engine:
+            self.ocr_engine = image_analyzer_engine.ocr
+        else:
+            self.ocr_engine = TesseractOCR()
 
         # Initialize image analyzer engine
         if not image_analyzer_engine:
-            self.image_analyzer_engine = ImageAnalyzerEngine()
+            self.image_analyzer_engine = ImageAnalyzerEngine(ocr=self.ocr_engine)
         else:
             self.image_analyzer_engine = image_analyzer_engine
 
         # Initialize bbox processor
         self.bbox_processor = BboxProcessor()
 
+        # Cache of the recognizers of metadata PHI
+        self._metadata_recognizers = OrderedDict()
+
     def verify_dicom_instance(
         self,
         instance: pydicom.dataset.FileDataset,
@@ -73,14 +80,12 @@ class DicomImagePiiVerifyEngine(ImagePiiVerifyEngine, DicomImageRedactorEngine):
         :return: Image with boxes identifying PHI, OCR results,
         and analyzer results.
         """
-        instance_copy = deepcopy(instance)
-
         try:
-            instance_copy.PixelData
+            instance.PixelData
         except AttributeError:
             raise AttributeError("Provided DICOM instance lacks pixel data.")
 
-        is_greyscale = self._check_if_greyscale(instance_copy)
+        is_greyscale = self._check_if_greyscale(instance)
         image = self._rescale_dcm_pixel_array(instance, is_greyscale)
         if is_greyscale:
             # model L for grayscale, and has 8 bit-pixel to store the pixel value
@@ -1,9 +1,14 @@
+import hashlib
 import json
+import logging
 import os
 import shutil
+import time
+from collections import OrderedDict
 from copy import deepcopy
+from multiprocessing import Pool
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple, Union
+from typing import Dict, Iterator, List, Optional, Tuple, Union
 
 import numpy as np
 import pydicom
@@ -14,14 +19,81 @@ from pydicom.multival import MultiValue
 from pydicom.pixel_data_handlers.util import apply_voi_lut
 
 from presidio_image_redactor import (
-    ImageAnalyzerEngine,  # noqa: F401
+    ImageAnalyzerEngine,
     ImageRedactorEngine,
 )
-from presidio_image_redactor.entities import ImageRecognizerResult
+from presidio_image_redactor.entities import (
+    DicomRedactionReport,
+    ImageRecognizerResult,
+)
+from presidio_image_redactor.metadata_phi_recognizer import MetadataPhiRecognizer
+
+logger = logging.getLogger("presidio-image-redactor")
+
+# Number of pixels converted to float at a time when rescaling pixel data
+RESCALE_BLOCK_SIZE = 1 << 20
+
+# Size in pixels of the cells averaged when comparing frames
+FRAME_HASH_CELL_SIZE = 4
+
+# Number of metadata recognizers (one per study/series and metadata) kept in memory
+METADATA_RECOGNIZER_CACHE_SIZE = 64
+
+# Set in each worker process by _init_redaction_worker
+_worker_engine: Optional["DicomImageRedactorEngine"] = None
+_worker_redaction_kwargs: dict = {}
+
+
+def _init_redaction_worker(
+    engine: "DicomImageRedactorEngine", redaction_kwargs: dict
+) -> None:
+    global _worker_engine, _worker_redaction_kwargs
+    _worker_engine = engine
+    _worker_redaction_kwargs = redaction_kwargs
+
+
+def _redact_dicom_file_in_worker(
+    paths: Tuple[Path, Path],
+) -> Tuple[Path, Optional[str]]:
+    src_path, dst_path = paths
+    return src_path, _worker_engine._try_redact_dicom_file(
+        src_path, dst_path, **_worker_redaction_kwargs
+    )
 
 
 class DicomImageRedactorEngine(ImageRedactorEngine):
-    """Performs OCR + PII detection + bounding box redaction."""
+    """Performs OCR + PII detection + bounding box redaction.
+
+    Multi-frame instances (e.g. cine or ultrasound loops) are redacted frame by
+    frame. Only frames which differ from the frames already analyzed are OCRed,
+    and identical frames (e.g. static loops, or repeated frames) reuse the
+    bounding boxes of the matching frame.
+
+    The recognizer of the PHI found in the metadata of an instance is cached
+    per study, series and metadata, so instances of a series sharing the same
+    patient metadata reuse it instead of building it again.
+
+    :param image_analyzer_engine: Engine which performs OCR + PII detection.
+    :param deduplicate_frames: Whether to reuse bounding boxes for unchanged
+    frames. If False, every frame is OCRed.
+    :param frame_hash_tolerance: Maximum difference (0-255) in the mean pixel
+    value of any cell of the frames for two frames to be considered unchanged.
+    """
+
+    def __init__(
+        self,
+        image_analyzer_engine: Optional[ImageAnalyzerEngine] = None,
+        deduplicate_frames: bool = True,
+        frame_hash_tolerance: float = 8,
+    ):
+        super().__init__(image_analyzer_engine=image_analyzer_engine)
+        if frame_hash_tolerance < 0:
+            raise ValueError("frame_hash_tolerance must be non-negative")
+        self.deduplicate_frames = deduplicate_frames
+        self.frame_hash_tolerance = frame_hash_tolerance
+        self._metadata_recognizers: "OrderedDict[tuple, MetadataPhiRecognizer]" = (
+            OrderedDict()
+        )
 
     def redact_and_return_bbox(
         self,
@@ -66,35 +138,22 @@ class DicomImageRedactorEngine(ImageRedactorEngine):
         except IsADirectoryError as e:
             raise IsADirectoryError(f"DICOM instance is a directory: {e}")
 
-        instance = deepcopy(image)
-
-        is_greyscale = self._check_if_greyscale(instance)
-        image_np = self._rescale_dcm_pixel_array(instance, is_greyscale)
-        if is_greyscale:
-            # model L for grayscale, and has 8 bit-pixel to store the pixel value
-            image_pil = Image.fromarray(image_np, mode="L")
-        else:
-            # model RGB, has 3x8 bit pixel available to store the value
-            image_pil = Image.fromarray(image_np, mode="RGB")
-        padded_image_pil = self._add_padding(image_pil, is_greyscale, padding_width)
-
+        instance = self._copy_dicom_instance(image)
 
         # Detect PII
-        analyzer_results = self._get_analyzer_results(
-            padded_image_pil,
+        bboxes = self._get_redaction_bboxes(
             instance,
+            padding_width,
             use_metadata,
             ocr_kwargs,
             ad_hoc_recognizers,
             **text_analyzer_kwargs,
         )
 
-        # Redact all bounding boxes from DICOM file
-        analyzer_bboxes = self.bbox_processor.get_bboxes_from_analyzer_results(
-            analyzer_results
+        # The instance is already a copy, so its decoded pixel data is redacted
+        redacted_image = self._add_redact_box(
+            instance, bboxes, crop_ratio, fill, in_place=True
         )
-        bboxes = self.bbox_processor.remove_bbox_padding(analyzer_bboxes, padding_width)
-        redacted_image = self._add_redact_box(instance, bboxes, crop_ratio, fill)
 
         return redacted_image, bboxes
 
@@ -219,8 +278,11 @@ class DicomImageRedactorEngine(ImageRedactorEngine):
         save_bboxes: bool = False,
         ocr_kwargs: Optional[dict] = None,
         ad_hoc_recognizers: Optional[List[PatternRecognizer]] = None,
+        n_process: Optional[int] = 1,
+        resume: bool = False,
+        verbose: bool = True,
         **text_analyzer_kwargs,
-    ) -> None:
+    ) -> Optional[DicomRedactionReport]:
         """Redact method to redact from a directory of files.
 
         :param input_dicom_path: String path to directory of DICOM images.
@@ -236,12 +298,26 @@ class DicomImageRedactorEngine(ImageRedactorEngine):
         :param ocr_kwargs: Additional params for OCR methods.
         :param ad_hoc_recognizers: List of PatternRecognizer objects to use
         for ad-hoc recognizer.
+        :param n_process: Number of worker processes redacting files in
+        parallel. None uses one process per CPU core.
+        :param resume: Skip files whose redacted output already exists,
+        e.g. to continue an interrupted run.
+        :param verbose: True to print progress and where output was written to.
         :param text_analyzer_kwargs: Additional values for the analyze method
         in AnalyzerEngine.
 
-        Please notice, this method duplicates the files, creates
+        By default, this method duplicates the files, creates
         new instances and manipulate them.
 
+        When n_process is not 1 or resume is True, files are instead read
+        from input_dicom_path and written directly to output_dir, without
+        copying the directory first. Each output file is written atomically,
+        so an existing output is always complete. A file which fails to be
+        redacted is reported without stopping the others, and no output is
+        written for it.
+
+        :return: None by default, or a DicomRedactionReport summarizing the
+        run when n_process is not 1 or resume is True.
         """
         # Verify the given paths
         if Path(input_dicom_path).is_dir() is False:
@@ -253,6 +329,26 @@ class DicomImageRedactorEngine(ImageRedactorEngine):
                 "output_dir must be a directory (does not need to exist yet)"
             )
 
+        if n_process != 1 or resume:
+            report = self._redact_directory_to_output(
+                src_dir=Path(input_dicom_path),
+                dst_parent_dir=Path(output_dir),
+                n_process=n_process,
+                resume=resume,
+                verbose=verbose,
+                crop_ratio=crop_ratio,
+                fill=fill,
+                padding_width=padding_width,
+                use_metadata=use_metadata,
+                save_bboxes=save_bboxes,
+                ocr_kwargs=ocr_kwargs,
+                ad_hoc_recognizers=ad_hoc_recognizers,
+                **text_analyzer_kwargs,
+            )
+            if verbose:
+                print(f"Output written to {report.output_dir}")
+            return report
+
         # Create duplicates
         dst_path = self._copy_files_for_processing(input_dicom_path, output_dir)
 
@@ -271,7 +367,8 @@ class DicomImageRedactorEngine(ImageRedactorEngine):
             **text_analyzer_kwargs,
         )
 
-        print(f"Output written to {output_location}")
+        if verbose:
+            print(f"Output written to {output_location}")
 
         return None
 
@@ -332,22 +429,28 @@ class DicomImageRedactorEngine(ImageRedactorEngine):
         else:
             image_2d = instance.pixel_array
 
-        # Convert to float to avoid overflow or underflow losses.
-        image_2d_float = image_2d.astype(float)
-
-        if not is_greyscale:
-            image_2d_scaled = image_2d_float
-        else:
-            # Rescaling grey scale between 0-255
-            image_2d_scaled = (
-                (image_2d_float.max() - image_2d_float)
-                / (image_2d_float.max() - image_2d_float.min())
-            ) * 255.0
+        # Convert to float to avoid overflow or underflow losses. This is done
+        # block by block, so multi-frame images are not copied as a whole to a
+        # float array (8 bytes per pixel) before the conversion to uint.
+        image_flat = image_2d.reshape(-1)
+        image_2d_scaled = np.empty(image_flat.shape, dtype=np.uint8)
+        if is_greyscale and image_flat.size > 0:
+            max_value = float(image_flat.max())
+            min_value = float(image_flat.min())
+
+        for start in range(0, image_flat.size, RESCALE_BLOCK_SIZE):
+            end = start + RESCALE_BLOCK_SIZE
+            block_float = image_flat[start:end].astype(float)
+            if is_greyscale:
+                # Rescaling grey scale between 0-255
+                np.subtract(max_value, block_float, out=block_float)
+                block_float /= max_value - min_value
+                block_float *= 255.0
 
-        # Convert to uint
-        image_2d_scaled = np.uint8(image_2d_scaled)
+            # Convert to uint
+            image_2d_scaled[start:end] = np.uint8(block_float)
 
-        return image_2d_scaled
+        return image_2d_scaled.reshape(image_2d.shape)
 
     @staticmethod
     def _get_bg_color(
@@ -443,7 +546,9 @@ class DicomImageRedactorEngine(ImageRedactorEngine):
         :return: Most or least common pixel value (depending on fill).
         """
         # Crop down to just only look at image corners
-        cropped_array = cls._get_array_corners(instance.pixel_array, crop_ratio)
+        cropped_array = cls._get_array_corners(
+            cls._get_first_frame(instance), crop_ratio
+        )
 
         # Get flattened pixel array
         flat_pixel_array = np.array(cropped_array).flatten()
@@ -644,12 +749,16 @@ class DicomImageRedactorEngine(ImageRedactorEngine):
         return word_list
 
     @classmethod
-    def _process_names(cls, text_metadata: list, is_name: list) -> list:
+    def _process_names(
+        cls, text_metadata: list, is_name: list, case_sensitive: bool = False
+    ) -> list:
         """Process names to have multiple iterations in our PHI list.
 
         :param text_metadata: List of all the instance's element values
         (excluding pixel data).
         :param is_name: True if the element is specified as being a name.
+        :param case_sensitive: True to not add casing variants of the names
+        (e.g. when they are matched case-insensitively).
 
         :return: List of PHI strings for elements where is_name is True,
         with additional name augmentations appended.
@@ -669,7 +778,7 @@ class DicomImageRedactorEngine(ImageRedactorEngine):
                     text = str(item).strip()
                     if text:
                         phi_list.append(text)
-                        phi_list += cls.augment_word(text)
+                        phi_list += cls.augment_word(text, case_sensitive)
 
         return phi_list
 
@@ -692,6 +801,7 @@ class DicomImageRedactorEngine(ImageRedactorEngine):
         original_metadata: List[Union[pydicom.multival.MultiValue, list, tuple]],
         is_name: List[bool],
         is_patient: List[bool],
+        case_sensitive: bool = False,
     ) -> list:
         """Build a list of PHI strings for the ad-hoc recognizer.
 
@@ -704,13 +814,15 @@ class DicomImageRedactorEngine(ImageRedactorEngine):
         :param is_name: True if the element is specified as being a name.
         :param is_patient: True if the element is specified as being
         related to the patient.
+        :param case_sensitive: True to not add casing variants of the names
+        (e.g. when they are matched case-insensitively).
 
         :return: List of PHI (str) to use with Presidio ad-hoc recognizer.
         """
         # 1) Base PHI via existing helpers
         phi: list = []
-        phi.extend(cls._process_names(original_metadata, is_name))
-        phi.extend(cls._process_names(original_metadata, is_patient))
+        phi.extend(cls._process_names(original_metadata, is_name, case_sensitive))
+        phi.extend(cls._process_names(original_metadata, is_patient, case_sensitive))
         phi = cls._add_known_generic_phi(phi)
 
         # 2) Flatten safely (MultiValue/list/tuple) and stringify
@@ -761,12 +873,13 @@ class DicomImageRedactorEngine(ImageRedactorEngine):
             raise ValueError("fill must be 'contrast' or 'background'")
 
         is_greyscale = cls._check_if_greyscale(instance)
+        pixel_array = cls._get_first_frame(instance)
         if is_greyscale:
             # model L for grayscale, and has 8 bit-pixel to store the pixel value
-            image_pil = Image.fromarray(instance.pixel_array, mode="L")
+            image_pil = Image.fromarray(pixel_array, mode="L")
         else:
             # model RGB, has 3x8 bit pixel available to store the value
-            image_pil = Image.fromarray(instance.pixel_array, mode="RGB")
+            image_pil = Image.fromarray(pixel_array, mode="RGB")
         box_color = cls._get_bg_color(image_pil, is_greyscale, invert_flag)
 
         return box_color
@@ -839,6 +952,29 @@ class DicomImageRedactorEngine(ImageRedactorEngine):
 
         return has_image_icon_sequence
 
+    @staticmethod
+    def _copy_dicom_instance(
+        instance: pydicom.dataset.FileDataset,
+    ) -> pydicom.dataset.FileDataset:
+        """Copy a DICOM instance without duplicating its pixel data.
+
+        The PixelData bytes are immutable, so the copy shares them with the
+        original until new pixel data is set on either one. The pixel array
+        cached by pydicom and the buffer the instance was read from, if any,
+        are not copied, as they can be as large as the whole image.
+
+        :param instance: A single DICOM instance.
+
+        :return: Copy of the instance.
+        """
+        memo = {}
+        for attribute in ["_pixel_array", "buffer"]:
+            value = instance.__dict__.get(attribute)
+            if value is not None:
+                memo[id(value)] = None
+
+        return deepcopy(instance, memo)
+
     @classmethod
     def _add_redact_box(
         cls,
@@ -846,9 +982,16 @@ class DicomImageRedactorEngine(ImageRedactorEngine):
         bounding_boxes_coordinates: list,
         crop_ratio: float,
         fill: str = "contrast",
+        in_place: bool = False,
     ) -> pydicom.dataset.FileDataset:
         """Add redaction bounding boxes on a DICOM instance.
 
+        The pixel data is decoded once (or reused if already decoded, e.g. for
+        OCR) and is used both to select the box color and to apply the masks,
+        after which only PixelData is written back. For multi-frame instances,
+        bounding boxes with "frames" are applied to those frames only, and
+        bounding boxes without it to all frames.
+
         :param instance: A single DICOM instance.
         :param bounding_boxes_coordinates: Bounding box coordinates.
         :param crop_ratio: Portion of image to consider when selecting
@@ -856,35 +999,46 @@ class DicomImageRedactorEngine(ImageRedactorEngine):
         :param fill: Determines how box color is selected.
         'contrast' - Masks stand out relative to background.
         'background' - Masks are same color as background.
+        :param in_place: True to redact the given instance (and its decoded
+        pixel array) instead of a copy of it.
 
-        :return: A new dicom instance with redaction bounding boxes.
+        :return: A dicom instance with redaction bounding boxes.
         """
         # Copy instance
-        redacted_instance = deepcopy(instance)
+        if in_place:
+            redacted_instance = instance
+        else:
+            redacted_instance = cls._copy_dicom_instance(instance)
         is_compressed = cls._check_if_compressed(redacted_instance)
         has_image_icon_sequence = cls._check_if_has_image_icon_sequence(
             redacted_instance
         )
 
+        # Decode pixel data once, color selection below reuses it
+        pixel_array = redacted_instance.pixel_array
+
         # Select masking box color
         is_greyscale = cls._check_if_greyscale(instance)
         if is_greyscale:
-            box_color = cls._get_most_common_pixel_value(instance, crop_ratio, fill)
+            box_color = cls._get_most_common_pixel_value(
+                redacted_instance, crop_ratio, fill
+            )
         else:
             box_color = cls._set_bbox_color(redacted_instance, fill)
 
-        # Apply mask
-        for i in range(0, len(bounding_boxes_coordinates)):
-            bbox = bounding_boxes_coordinates[i]
-            top = bbox["top"]
-            left = bbox["left"]
-            width = bbox["width"]
-            height = bbox["height"]
-            redacted_instance.pixel_array[top : top + height, left : left + width] = (
-                box_color
-            )
+        # Apply masks, to all frames (or the frames they apply to) at once
+        is_multiframe = cls._get_number_of_frames(redacted_instance) > 1
+        frame_shape = pixel_array.shape[1:3] if is_multiframe else pixel_array.shape[:2]
+        masks = cls._get_redaction_masks(bounding_boxes_coordinates, frame_shape)
+        for frames, mask in masks.items():
+            if not is_multiframe:
+                pixel_array[mask] = box_color
+            elif frames is None:
+                pixel_array[:, mask] = box_color
+            else:
+                pixel_array[np.array(frames)[:, None], mask] = box_color
 
-        redacted_instance.PixelData = redacted_instance.pixel_array.tobytes()
+        redacted_instance.PixelData = pixel_array.tobytes()
 
         # If original pixel data is compressed, recompress after redaction
         if is_compressed or has_image_icon_sequence:
@@ -895,6 +1049,33 @@ class DicomImageRedactorEngine(ImageRedactorEngine):
 
         return redacted_instance
 
+    @staticmethod
+    def _get_redaction_masks(
+        bounding_boxes_coordinates: List[Dict[str, Union[int, List[int]]]],
+        frame_shape: Tuple[int, int],
+    ) -> Dict[Optional[Tuple[int, ...]], np.ndarray]:
+        """Combine bounding boxes into one mask per set of frames they apply to.
+
+        :param bounding_boxes_coordinates: Bounding box coordinates, with the
+        frames they apply to in "frames" if not all frames.
+        :param frame_shape: Number of rows and columns of a frame.
+
+        :return: Boolean mask of the pixels to redact, per tuple of frame indices
+        (None for all frames).
+        """
+        masks = {}
+        for bbox in bounding_boxes_coordinates:
+            frames = tuple(bbox["frames"]) if "frames" in bbox else None
+            if frames not in masks:
+                masks[frames] = np.zeros(frame_shape, dtype=bool)
+            top = bbox["top"]
+            left = bbox["left"]
+            width = bbox["width"]
+            height = bbox["height"]
+            masks[frames][top : top + height, left : left + width] = True
+
+        return masks
+
     def _get_analyzer_results(
         self,
         image: Image.Image,
@@ -923,16 +1104,12 @@ class DicomImageRedactorEngine(ImageRedactorEngine):
 
         # Create custom recognizer using DICOM metadata
         if use_metadata:
-            original_metadata, is_name, is_patient = self._get_text_metadata(instance)
-            phi_list = self._make_phi_list(original_metadata, is_name, is_patient)
-            deny_list_recognizer = PatternRecognizer(
-                supported_entity="PERSON", deny_list=phi_list
-            )
+            metadata_recognizer = self._get_metadata_recognizer(instance)
 
             if ad_hoc_recognizers is None:
-                ad_hoc_recognizers = [deny_list_recognizer]
+                ad_hoc_recognizers = [metadata_recognizer]
             elif isinstance(ad_hoc_recognizers, list):
-                ad_hoc_recognizers.append(deny_list_recognizer)
+                ad_hoc_recognizers = ad_hoc_recognizers + [metadata_recognizer]
 
         # Detect PII
         if ad_hoc_recognizers is None:
@@ -951,6 +1128,312 @@ class DicomImageRedactorEngine(ImageRedactorEngine):
 
         return analyzer_results
 
+    def _get_metadata_recognizer(
+        self, instance: pydicom.dataset.FileDataset
+    ) -> MetadataPhiRecognizer:
+        """Get the recognizer of the PHI found in the metadata of an instance.
+
+        Recognizers are cached per study, series and metadata values, so that
+        the PHI list is only built once for instances sharing the same metadata.
+
+        :param instance: DICOM instance (with metadata).
+
+        :return: Recognizer of the metadata PHI.
+        """
+        key = (
+            str(instance.get("StudyInstanceUID", "")),
+            str(instance.get("SeriesInstanceUID", "")),
+            self._get_metadata_hash(instance),
+        )
+
+        cache = self._metadata_recognizers
+        metadata_recognizer = cache.get(key)
+        if metadata_recognizer is None:
+            original_metadata, is_name, is_patient = self._get_text_metadata(instance)
+            phi_list = self._make_phi_list(
+                original_metadata, is_name, is_patient, case_sensitive=True
+            )
+            metadata_recognizer = MetadataPhiRecognizer(phi_list)
+            cache[key] = metadata_recognizer
+            if len(cache) > METADATA_RECOGNIZER_CACHE_SIZE:
+                cache.popitem(last=False)
+        else:
+            cache.move_to_end(key)
+
+        return metadata_recognizer
+
+    @staticmethod
+    def _get_metadata_hash(instance: pydicom.dataset.FileDataset) -> str:
+        """Hash the raw values of the metadata the PHI list is built from.
+
+        :param instance: DICOM instance (with metadata).
+
+        :return: sha256 of the tags and values of the elements specified as
+        being a name or related to the patient (see _get_text_metadata).
+        """
+        metadata_hash = hashlib.sha256()
+        for element in instance:
+            element_name = element.name.lower()
+            if "name" not in element_name and "patient" not in element_name:
+                continue
+            value = element.value
+            if not isinstance(value, bytes):
+                value = str(value).encode("utf-8")
+            metadata_hash.update(str(element.tag).encode("utf-8"))
+            metadata_hash.update(value)
+            metadata_hash.update(b"\0")
+        return metadata_hash.hexdigest()
+
+    def _get_redaction_bboxes(
+        self,
+        instance: pydicom.dataset.FileDataset,
+        padding_width: int,
+        use_metadata: bool,
+        ocr_kwargs: Optional[dict] = None,
+        ad_hoc_recognizers: Optional[List[PatternRecognizer]] = None,
+        **text_analyzer_kwargs,
+    ) -> List[Dict[str, int]]:
+        """Detect PHI in the pixel data and get the bounding boxes to redact.
+
+        :param instance: DICOM instance including pixel data and metadata.
+        :param padding_width: Pixel width of padding (uniform).
+        :param use_metadata: Whether to redact text in the image that
+        are present in the metadata.
+        :param ocr_kwargs: Additional params for OCR methods.
+        :param ad_hoc_recognizers: List of PatternRecognizer objects to use
+        for ad-hoc recognizer.
+        :param text_analyzer_kwargs: Additional values for the analyze method
+        in AnalyzerEngine.
+
+        :return: Bounding boxes to redact. For multi-frame instances, each
+        bounding box lists the indices of the frames it applies to in "frames".
+        """
+        is_greyscale = self._check_if_greyscale(instance)
+        image = self._rescale_dcm_pixel_array(instance, is_greyscale)
+        if self._get_number_of_frames(instance) > 1:
+            return self._get_multiframe_bboxes(
+                image,
+                is_greyscale,
+                instance,
+                padding_width,
+                use_metadata,
+                ocr_kwargs,
+                ad_hoc_recognizers,
+                **text_analyzer_kwargs,
+            )
+
+        padded_image = self._get_padded_image(image, is_greyscale, padding_width)
+        return self._get_image_bboxes(
+            padded_image,
+            instance,
+            padding_width,
+            use_metadata,
+            ocr_kwargs,
+            ad_hoc_recognizers,
+            **text_analyzer_kwargs,
+        )
+
+    def _get_multiframe_bboxes(
+        self,
+        frames: np.ndarray,
+        is_greyscale: bool,
+        instance: pydicom.dataset.FileDataset,
+        padding_width: int,
+        use_metadata: bool,
+        ocr_kwargs: Optional[dict] = None,
+        ad_hoc_recognizers: Optional[List[PatternRecognizer]] = None,
+        **text_analyzer_kwargs,
+    ) -> List[Dict[str, int]]:
+        """Get the bounding boxes to redact on each frame of a multi-frame instance.
+
+        The first frame not analyzed yet is OCRed, then all other frames which
+        are unchanged (according to a perceptual hash of the whole frame) reuse
+        its bounding boxes, until all frames have bounding boxes.
+
+        :param frames: Rescaled pixel data of all frames.
+        :param is_greyscale: Whether the frames are in grayscale or not.
+        :param instance: DICOM instance (with metadata).
+        :param padding_width: Pixel width of padding (uniform).
+        :param use_metadata: Whether to redact text in the image that
+        are present in the metadata.
+        :param ocr_kwargs: Additional params for OCR methods.
+        :param ad_hoc_recognizers: List of PatternRecognizer objects to use
+        for ad-hoc recognizer.
+        :param text_analyzer_kwargs: Additional values for the analyze method
+        in AnalyzerEngine.
+
+        :return: Bounding boxes to redact, with the frames they apply to.
+        """
+        n_frames = frames.shape[0]
+        frame_bboxes: List[List[Dict[str, int]]] = [[] for _ in range(n_frames)]
+        pending = np.ones(n_frames, dtype=bool)
+        hashes = self._get_frame_hashes(frames) if self.deduplicate_frames else None
+        n_analyzed = 0
+        while pending.any():
+            representative = int(np.argmax(pending))
+            padded_image = self._get_padded_image(
+                frames[representative], is_greyscale, padding_width
+            )
+            bboxes = self._get_image_bboxes(
+                padded_image,
+                instance,
+                padding_width,
+                use_metadata,
+                ocr_kwargs,
+                ad_hoc_recognizers,
+                **text_analyzer_kwargs,
+            )
+            n_analyzed += 1
+
+            unchanged = np.zeros(n_frames, dtype=bool)
+            unchanged[representative] = True
+            if hashes is not None:
+                distances = np.abs(hashes - hashes[representative]).max(axis=1)
+                unchanged |= pending & (distances <= self.frame_hash_tolerance)
+
+            for frame in np.flatnonzero(unchanged):
+                frame_bboxes[frame] = bboxes
+            pending &= ~unchanged
+
+        logger.debug("Analyzed %d of %d frames", n_analyzed, n_frames)
+        return self._merge_frame_bboxes(frame_bboxes)
+
+    @classmethod
+    def _get_padded_image(
+        cls, image: np.ndarray, is_greyscale: bool, padding_width: int
+    ) -> Image.Image:
+        """Convert rescaled pixel data of a single frame to a padded PIL image.
+
+        :param image: Rescaled pixel data of a single frame.
+        :param is_greyscale: Whether image is in grayscale or not.
+        :param padding_width: Pixel width of padding (uniform).
+
+        :return: Padded PIL image.
+        """
+        if is_greyscale:
+            # model L for grayscale, and has 8 bit-pixel to store the pixel value
+            image_pil = Image.fromarray(image, mode="L")
+        else:
+            # model RGB, has 3x8 bit pixel available to store the value
+            image_pil = Image.fromarray(image, mode="RGB")
+
+        return cls._add_padding(image_pil, is_greyscale, padding_width)
+
+    def _get_image_bboxes(
+        self,
+        image: Image.Image,
+        instance: pydicom.dataset.FileDataset,
+        padding_width: int,
+        use_metadata: bool,
+        ocr_kwargs: Optional[dict] = None,
+        ad_hoc_recognizers: Optional[List[PatternRecognizer]] = None,
+        **text_analyzer_kwargs,
+    ) -> List[Dict[str, int]]:
+        """Detect PHI in a padded image and get the bounding boxes to redact.
+
+        :param image: Padded PIL image of a single frame.
+        :param instance: DICOM instance (with metadata).
+        :param padding_width: Pixel width of padding (uniform).
+        :param use_metadata: Whether to redact text in the image that
+        are present in the metadata.
+        :param ocr_kwargs: Additional params for OCR methods.
+        :param ad_hoc_recognizers: List of PatternRecognizer objects to use
+        for ad-hoc recognizer.
+        :param text_analyzer_kwargs: Additional values for the analyze method
+        in AnalyzerEngine.
+
+        :return: Bounding boxes to redact, without padding.
+        """
+        analyzer_results = self._get_analyzer_results(
+            image,
+            instance,
+            use_metadata,
+            ocr_kwargs,
+            ad_hoc_recognizers,
+            **text_analyzer_kwargs,
+        )
+        analyzer_bboxes = self.bbox_processor.get_bboxes_from_analyzer_results(
+            analyzer_results
+        )
+
+        return self.bbox_processor.remove_bbox_padding(analyzer_bboxes, padding_width)
+
+    @staticmethod
+    def _get_frame_hashes(frames: np.ndarray) -> np.ndarray:
+        """Compute a perceptual hash of each frame.
+
+        The hash is the mean pixel value of each cell of FRAME_HASH_CELL_SIZE
+        pixels of the whole frame, so that any change (even a single character
+        of text anywhere on the frame) changes the hash while compression noise
+        barely does.
+
+        :param frames: Rescaled pixel data of all frames.
+
+        :return: Array with the hash of each frame in a row.
+        """
+        n_frames, rows, columns = frames.shape[:3]
+        if frames.ndim == 4:
+            # Compare RGB frames on their mean intensity
+            frames = frames.mean(axis=3)
+
+        # Sum the pixels of each cell, then divide by the cell sizes
+        row_starts = np.arange(0, rows, FRAME_HASH_CELL_SIZE)
+        column_starts = np.arange(0, columns, FRAME_HASH_CELL_SIZE)
+        cells = np.add.reduceat(frames, row_starts, axis=1, dtype=float)
+        cells = np.add.reduceat(cells, column_starts, axis=2)
+        cell_rows = np.diff(row_starts, append=rows)
+        cell_columns = np.diff(column_starts, append=columns)
+        cells /= np.outer(cell_rows, cell_columns)
+        return cells.reshape(n_frames, -1)
+
+    @staticmethod
+    def _merge_frame_bboxes(
+        frame_bboxes: List[List[Dict[str, int]]],
+    ) -> List[Dict[str, Union[int, List[int]]]]:
+        """Merge the bounding boxes of each frame into a single list.
+
+        :param frame_bboxes: Bounding boxes to redact on each frame.
+
+        :return: Unique bounding boxes, with the frames they apply to.
+        """
+        merged_bboxes = {}
+        for frame, bboxes in enumerate(frame_bboxes):
+            for bbox in bboxes:
+                key = tuple(sorted(bbox.items()))
+                if key not in merged_bboxes:
+                    merged_bboxes[key] = {**bbox, "frames": []}
+                frames = merged_bboxes[key]["frames"]
+                if not frames or frames[-1] != frame:
+                    frames.append(frame)
+
+        return list(merged_bboxes.values())
+
+    @staticmethod
+    def _get_number_of_frames(instance: pydicom.dataset.FileDataset) -> int:
+        """Get the number of frames in the pixel data of a DICOM instance.
+
+        :param instance: A single DICOM instance.
+
+        :return: Number of frames (1 if not specified).
+        """
+        try:
+            return max(int(instance.get("NumberOfFrames", 1) or 1), 1)
+        except (TypeError, ValueError):
+            return 1
+
+    @classmethod
+    def _get_first_frame(cls, instance: pydicom.dataset.FileDataset) -> np.ndarray:
+        """Get the pixel array of the first frame of a DICOM instance.
+
+        :param instance: A single DICOM instance.
+
+        :return: Pixel array of the first frame (or the only one).
+        """
+        pixel_array = instance.pixel_array
+        if cls._get_number_of_frames(instance) > 1:
+            return pixel_array[0]
+        return pixel_array
+
     @staticmethod
     def _save_bbox_json(output_dcm_path: str, bboxes: List[Dict[str, int]]) -> None:
         """Save the redacted bounding box info as a json file.
@@ -964,6 +1447,58 @@ class DicomImageRedactorEngine(ImageRedactorEngine):
         with open(output_json_path, "w") as write_file:
             json.dump(bboxes, write_file, indent=4)
 
+    def _redact_loaded_instance(
+        self,
+        instance: pydicom.dataset.FileDataset,
+        crop_ratio: float,
+        fill: str,
+        padding_width: int,
+        use_metadata: bool,
+        ocr_kwargs: Optional[dict] = None,
+        ad_hoc_recognizers: Optional[List[PatternRecognizer]] = None,
+        **text_analyzer_kwargs,
+    ) -> Tuple[pydicom.dataset.FileDataset, List[Dict[str, int]]]:
+        """Redact text PHI present on a DICOM instance read from a file.
+
+        :param instance: DICOM instance loaded from a file.
+        :param crop_ratio: Portion of image to consider when selecting
+        most common pixel value as the background color value.
+        :param fill: Color setting to use for bounding boxes
+        ("contrast" or "background").
+        :param padding_width: Pixel width of padding (uniform).
+        :param use_metadata: Whether to redact text in the image that
+        are present in the metadata.
+        :param ocr_kwargs: Additional params for OCR methods.
+        :param ad_hoc_recognizers: List of PatternRecognizer objects to use
+        for ad-hoc recognizer.
+        :param text_analyzer_kwargs: Additional values for the analyze method
+        in AnalyzerEngine.
+
+        :return: Redacted DICOM instance and the redacted bounding boxes.
+        """
+        try:
+            instance.PixelData
+        except AttributeError:
+            raise AttributeError("Provided DICOM file lacks pixel data.")
+
+        # Detect PII
+        bboxes = self._get_redaction_bboxes(
+            instance,
+            padding_width,
+            use_metadata,
+            ocr_kwargs,
+            ad_hoc_recognizers,
+            **text_analyzer_kwargs,
+        )
+
+        # The instance was loaded for redaction, so redact it in place,
+        # reusing the pixel data decoded for OCR
+        redacted_dicom_instance = self._add_redact_box(
+            instance, bboxes, crop_ratio, fill, in_place=True
+        )
+
+        return redacted_dicom_instance, bboxes
+
     def _redact_single_dicom_image(
         self,
         dcm_path: str,
@@ -1014,39 +1549,16 @@ class DicomImageRedactorEngine(ImageRedactorEngine):
 
         # Load instance
         instance = pydicom.dcmread(dst_path)
-
-        try:
-            instance.PixelData
-        except AttributeError:
-            raise AttributeError("Provided DICOM file lacks pixel data.")
-
-        is_greyscale = self._check_if_greyscale(instance)
-        image = self._rescale_dcm_pixel_array(instance, is_greyscale)
-        if is_greyscale:
-            # model L for grayscale, and has 8 bit-pixel to store the pixel value
-            loaded_image = Image.fromarray(image, mode="L")
-        else:
-            loaded_image = Image.fromarray(image, mode="RGB")
-        image = self._add_padding(loaded_image, is_greyscale, padding_width)
-
-        # Detect PII
-        analyzer_results = self._get_analyzer_results(
-            image,
+        redacted_dicom_instance, bboxes = self._redact_loaded_instance(
             instance,
+            crop_ratio,
+            fill,
+            padding_width,
             use_metadata,
-            ocr_kwargs,
-            ad_hoc_recognizers,
+            ocr_kwargs=ocr_kwargs,
+            ad_hoc_recognizers=ad_hoc_recognizers,
             **text_analyzer_kwargs,
         )
-
-        # Redact all bounding boxes from DICOM file
-        analyzer_bboxes = self.bbox_processor.get_bboxes_from_analyzer_results(
-            analyzer_results
-        )
-        bboxes = self.bbox_processor.remove_bbox_padding(analyzer_bboxes, padding_width)
-        redacted_dicom_instance = self._add_redact_box(
-            instance, bboxes, crop_ratio, fill
-        )
         redacted_dicom_instance.save_as(dst_path)
 
         # Save redacted bboxes
@@ -1122,3 +1634,171 @@ class DicomImageRedactorEngine(ImageRedactorEngine):
             )
 
         return dst_dir
+
+    def _redact_dicom_file(
+        self,
+        src_path: Path,
+        dst_path: Path,
+        crop_ratio: float,
+        fill: str,
+        padding_width: int,
+        use_metadata: bool,
+        save_bboxes: bool,
+        ocr_kwargs: Optional[dict] = None,
+        ad_hoc_recognizers: Optional[List[PatternRecognizer]] = None,
+        **text_analyzer_kwargs,
+    ) -> None:
+        """Redact a DICOM file and write the result to another path.
+
+        The redacted instance is written to a temporary file next to dst_path
+        which is then renamed, so dst_path only exists once fully written.
+        The bounding boxes JSON, if requested, is written before the rename.
+
+        :param src_path: Path to the DICOM file to redact.
+        :param dst_path: Path to write the redacted DICOM file to.
+        :param crop_ratio: Portion of image to consider when selecting
+        most common pixel value as the background color value.
+        :param fill: Color setting to use for bounding boxes
+        ("contrast" or "background").
+        :param padding_width: Pixel width of padding (uniform).
+        :param use_metadata: Whether to redact text in the image that
+        are present in the metadata.
+        :param save_bboxes: True if we want to save boundings boxes.
+        :param ocr_kwargs: Additional params for OCR methods.
+        :param ad_hoc_recognizers: List of PatternRecognizer objects to use
+        for ad-hoc recognizer.
+        :param text_analyzer_kwargs: Additional values for the analyze method
+        in AnalyzerEngine.
+        """
+        instance = pydicom.dcmread(src_path)
+        redacted_dicom_instance, bboxes = self._redact_loaded_instance(
+            instance,
+            crop_ratio,
+            fill,
+            padding_width,
+            use_metadata,
+            ocr_kwargs=ocr_kwargs,
+            # The metadata recognizer is appended to this list, so copy it
+            ad_hoc_recognizers=(
+                list(ad_hoc_recognizers) if ad_hoc_recognizers is not None else None
+            ),
+            **text_analyzer_kwargs,
+        )
+
+        os.makedirs(dst_path.parent, exist_ok=True)
+        tmp_path = dst_path.with_name(f"{dst_path.name}.partial")
+        try:
+            redacted_dicom_instance.save_as(tmp_path)
+            if save_bboxes:
+                self._save_bbox_json(dst_path, bboxes)
+            os.replace(tmp_path, dst_path)
+        finally:
+            if tmp_path.exists():
+                tmp_path.unlink()
+
+    def _try_redact_dicom_file(
+        self, src_path: Path, dst_path: Path, **redaction_kwargs
+    ) -> Optional[str]:
+        """Redact a DICOM file, returning the error instead of raising it.
+
+        :param src_path: Path to the DICOM file to redact.
+        :param dst_path: Path to write the redacted DICOM file to.
+        :param redaction_kwargs: Arguments of _redact_dicom_file.
+
+        :return: None on success, else a description of the error.
+        """
+        try:
+            self._redact_dicom_file(src_path, dst_path, **redaction_kwargs)
+        except Exception as e:
+            logger.warning("Failed to redact %s: %s", src_path, e)
+            return f"{type(e).__name__}: {e}"
+        return None
+
+    def _redact_directory_to_output(
+        self,
+        src_dir: Path,
+        dst_parent_dir: Path,
+        n_process: Optional[int],
+        resume: bool,
+        verbose: bool,
+        **redaction_kwargs,
+    ) -> DicomRedactionReport:
+        """Redact all DICOM files in a directory, writing to an output directory.
+
+        Files are read from src_dir and written to the same relative path
+        under dst_parent_dir/<name of src_dir>, in parallel if n_process > 1.
+
+        :param src_dir: Directory containing DICOM files (can be nested).
+        :param dst_parent_dir: Parent directory of the output directory.
+        :param n_process: Number of worker processes. None uses all CPU cores.
+        :param resume: Skip files whose output already exists.
+        :param verbose: True to print progress.
+        :param redaction_kwargs: Arguments of _redact_dicom_file.
+
+        :return: Report of the redaction.
+        """
+        n_process = n_process or os.cpu_count() or 1
+        if n_process < 1:
+            raise ValueError("n_process must be greater than 0")
+
+        dst_dir = Path(dst_parent_dir, src_dir.name)
+        if dst_dir.exists() and not resume:
+            raise FileExistsError(
+                "Destination files already exist. Please clear the destination files, specify a different dst_parent_dir or set resume=True."  # noqa: E501
+            )
+
+        all_dcm_files = self._get_all_dcm_files(src_dir)
+        report = DicomRedactionReport(output_dir=str(dst_dir), total=len(all_dcm_files))
+        tasks = []
+        for src_path in all_dcm_files:
+            dst_path = Path(dst_dir, src_path.relative_to(src_dir))
+            if resume and dst_path.is_file():
+                report.skipped += 1
+            else:
+                tasks.append((src_path, dst_path))
+
+        start_time = time.perf_counter()
+        progress_interval = max(1, len(tasks) // 100)
+        for i, (src_path, error) in enumerate(
+            self._redact_dicom_files(tasks, n_process, redaction_kwargs), start=1
+        ):
+            if error is None:
+                report.redacted += 1
+            else:
+                report.failed[str(src_path)] = error
+            report.elapsed_seconds = time.perf_counter() - start_time
+            if i % progress_interval == 0 or i == len(tasks):
+                logger.info("Redacting DICOM files: %s", report)
+                if verbose:
+                    print(report)
+
+        return report
+
+    def _redact_dicom_files(
+        self,
+        tasks: List[Tuple[Path, Path]],
+        n_process: int,
+        redaction_kwargs: dict,
+    ) -> Iterator[Tuple[Path, Optional[str]]]:
+        """Redact (source, destination) file pairs, in completion order.
+
+        :param tasks: Pairs of paths of the file to redact and of the output.
+        :param n_process: Number of worker processes.
+        :param redaction_kwargs: Arguments of _redact_dicom_file.
+
+        :return: Iterator of the source path and error (or None) per file.
+        """
+        if n_process == 1 or len(tasks) <= 1:
+            for src_path, dst_path in tasks:
+                yield (
+                    src_path,
+                    self._try_redact_dicom_file(src_path, dst_path, **redaction_kwargs),
+                )
+            return
+
+        with Pool(
+            processes=min(n_process, len(tasks)),
+            initializer=_init_redaction_worker,
+            initargs=(self, redaction_kwargs),
+        ) as pool:
+            yield from pool.imap_unordered(_redact_dicom_file_in_worker, tasks)
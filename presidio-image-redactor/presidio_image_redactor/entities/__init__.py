@@ -1,9 +1,13 @@
 """Image Redactor entities."""
 
+from .dicom_redaction_report import DicomRedactionReport
 from .image_recognizer_result import ImageRecognizerResult
 from .invalid_exception import InvalidParamError
+from .ocr_result import OcrResult
 
 __all__ = [
     "ImageRecognizerResult",
     "InvalidParamError",
+    "DicomRedactionReport",
+    "OcrResult",
 ]
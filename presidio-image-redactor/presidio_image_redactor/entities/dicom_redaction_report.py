@@ -0,0 +1,46 @@
+"""Summary of redacting a directory of DICOM files."""
+
+from dataclasses import dataclass, field
+from typing import Dict
+
+
+@dataclass
+class DicomRedactionReport:
+    """
+    DicomRedactionReport summarizes the redaction of a directory of DICOM files.
+
+    :param output_dir: Path to the output directory
+    :param total: Number of DICOM files found in the input directory
+    :param redacted: Number of files redacted and written to the output directory
+    :param skipped: Number of files skipped because their output already existed
+    :param failed: Mapping of input file path to the error raised for that file
+    :param elapsed_seconds: Wall-clock duration of the redaction
+    """
+
+    output_dir: str
+    total: int = 0
+    redacted: int = 0
+    skipped: int = 0
+    failed: Dict[str, str] = field(default_factory=dict)
+    elapsed_seconds: float = 0.0
+
+    @property
+    def processed(self) -> int:
+        """Number of files redacted, skipped or failed so far."""
+        return self.redacted + self.skipped + len(self.failed)
+
+    @property
+    def files_per_second(self) -> float:
+        """Throughput of redacted files per second."""
+        if self.elapsed_seconds <= 0:
+            return 0.0
+        return self.redacted / self.elapsed_seconds
+
+    def __str__(self) -> str:
+        """Return a one-line summary of the report."""
+        return (
+            f"{self.processed}/{self.total} files processed "
+            f"({self.redacted} redacted, {self.skipped} skipped, "
+            f"{len(self.failed)} failed) in {self.elapsed_seconds:.1f}s "
+            f"({self.files_per_second:.2f} files/s)"
+        )
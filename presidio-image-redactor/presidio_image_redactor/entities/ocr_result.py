@@ -0,0 +1,224 @@
+"""Columnar representation of OCR results."""
+
+from collections.abc import Mapping
+from typing import Dict, Iterable, Iterator, List, Union
+
+import numpy as np
+
+# Columns of OCR results stored as numeric arrays (other columns, e.g. the text,
+# are stored as object arrays so that their values are kept as is)
+NUMERIC_KEYS = ("left", "top", "width", "height", "conf")
+
+
+class OcrResult(Mapping):
+    """
+    OcrResult holds the results of OCR as one numpy array per key.
+
+    OCR engines return a dict of lists, with one item per detected word in each
+    of the lists (left, top, width, height, conf, text and any engine-specific
+    keys). OcrResult stores each list as a numpy array, so that filtering,
+    scaling and building bounding boxes are vectorized, and new results are
+    returned instead of modifying the arrays in place.
+
+    OcrResult is also a read-only mapping of each key to the list of its values,
+    so it can be used wherever a dict of OCR results is expected.
+
+    :param columns: Mapping of each key to the values of each word.
+    """
+
+    def __init__(self, columns: Mapping):
+        self._columns: Dict[str, np.ndarray] = {}
+        for key, values in columns.items():
+            array = None
+            if key in NUMERIC_KEYS:
+                array = np.asarray(values)
+            # e.g. confidences returned as strings
+            if array is None or array.dtype.kind not in "biuf":
+                array = self._to_object_array(values)
+            self._columns[key] = array
+
+        lengths = {len(values) for values in self._columns.values()}
+        if len(lengths) > 1:
+            raise ValueError(
+                "All the values of the OCR results must have the same length"
+            )
+        self._lists: Dict[str, list] = {}
+
+    @classmethod
+    def from_dict(cls, ocr_result: Union[dict, "OcrResult"]) -> "OcrResult":
+        """Create an OcrResult from a dict of OCR results.
+
+        :param ocr_result: dict of lists (or OcrResult, returned as is).
+
+        :return: OcrResult with the same values.
+        """
+        if isinstance(ocr_result, OcrResult):
+            return ocr_result
+        return cls(ocr_result)
+
+    def to_dict(self) -> Dict[str, list]:
+        """Return the OCR results as a dict of lists of Python values."""
+        return {key: list(self[key]) for key in self._columns}
+
+    def __getitem__(self, key: str) -> list:
+        """Return the values of a key, as a list."""
+        if key not in self._lists:
+            self._lists[key] = self._columns[key].tolist()
+        return self._lists[key]
+
+    def __contains__(self, key: object) -> bool:
+        """Check if the OCR results have a key."""
+        return key in self._columns
+
+    def __iter__(self) -> Iterator[str]:
+        """Iterate over the keys of the OCR results."""
+        return iter(self._columns)
+
+    def __len__(self) -> int:
+        """Return the number of keys of the OCR results."""
+        return len(self._columns)
+
+    def __repr__(self) -> str:
+        """Return a string representation of the instance."""
+        return f"OcrResult({self.to_dict()})"
+
+    @property
+    def columns(self) -> Dict[str, np.ndarray]:
+        """Arrays of values of each key, which should not be modified."""
+        return self._columns
+
+    @property
+    def word_count(self) -> int:
+        """Number of words (items) in the OCR results."""
+        return len(next(iter(self._columns.values()), ()))
+
+    @property
+    def offsets(self) -> np.ndarray:
+        """Start offset of each word in the text returned by get_text."""
+        lengths = np.fromiter(
+            (len(word) for word in self._columns["text"]),
+            dtype=np.int64,
+            count=self.word_count,
+        )
+        offsets = np.zeros(self.word_count, dtype=np.int64)
+        np.cumsum(lengths[:-1] + 1, out=offsets[1:])
+        return offsets
+
+    def get_text(self, separator: str = " ") -> str:
+        """Combine the text of all words to full text.
+
+        :param separator: separator to use when joining the words
+
+        :return: str containing the full extracted text
+        """
+        return separator.join(self["text"])
+
+    def select(self, selection: Union[np.ndarray, List[int]]) -> "OcrResult":
+        """Return the OCR results of a subset of the words.
+
+        :param selection: Boolean mask or indices of the words to keep.
+
+        :return: OCR results of the selected words.
+        """
+        selection = np.asarray(selection)
+        if selection.dtype != bool:
+            selection = selection.astype(np.intp)
+        return self._with_columns(
+            {key: values[selection] for key, values in self._columns.items()}
+        )
+
+    def remove_spaces(self) -> "OcrResult":
+        """Remove the words which are empty or only whitespace.
+
+        :return: OCR results with empty words removed.
+        """
+        text = self._columns["text"]
+        if not len(text):
+            return self
+        stripped = np.char.strip(text.astype(str))
+        return self.select(np.char.str_len(stripped) > 0)
+
+    def threshold(self, ocr_threshold: float) -> "OcrResult":
+        """Remove the words with a confidence below a threshold.
+
+        :param ocr_threshold: Threshold value between -1 and 100.
+
+        :return: OCR results with low confidence items removed.
+        """
+        if ocr_threshold < -1 or ocr_threshold > 100:
+            raise ValueError("ocr_threshold must be between -1 and 100")
+
+        return self.select(self._columns["conf"].astype(float) >= ocr_threshold)
+
+    def scale(self, scale_factor: float) -> "OcrResult":
+        """Scale down the bounding boxes by a scale factor.
+
+        :param scale_factor: Factor the image was resized by before OCR.
+
+        :return: OCR results with bounding boxes in the original image size.
+        """
+        columns = dict(self._columns)
+        for key in ("left", "top"):
+            columns[key] = np.ceil(columns[key] / scale_factor).astype(int)
+        for key in ("width", "height"):
+            columns[key] = np.maximum(
+                1, np.ceil(columns[key] / scale_factor).astype(int)
+            )
+        return self._with_columns(columns)
+
+    def remove_padding(self, padding_width: int) -> "OcrResult":
+        """Remove added padding from the bounding box coordinates.
+
+        :param padding_width: Pixel width used for padding (0 if no padding).
+
+        :return: OCR results with bounding boxes in the unpadded image.
+        """
+        if padding_width < 0:
+            raise ValueError("Padding width must be a non-negative integer.")
+
+        columns = dict(self._columns)
+        for key in ("left", "top"):
+            columns[key] = np.maximum(0, columns[key] - padding_width)
+        return self._with_columns(columns)
+
+    def to_bboxes(self) -> List[Dict[str, Union[int, float, str]]]:
+        """Get the bounding boxes of all detected (non-empty) words.
+
+        :return: Bounding box information per word, with its confidence (conf)
+            and text (label).
+        """
+        words = self.select(self._columns["text"].astype(bool))
+        columns = words.columns
+        return [
+            {
+                "left": left,
+                "top": top,
+                "width": width,
+                "height": height,
+                "conf": conf,
+                "label": label,
+            }
+            for left, top, width, height, conf, label in zip(
+                words["left"],
+                words["top"],
+                words["width"],
+                words["height"],
+                columns["conf"].astype(float).tolist(),
+                words["text"],
+            )
+        ]
+
+    def _with_columns(self, columns: Dict[str, np.ndarray]) -> "OcrResult":
+        """Return OCR results with the given arrays, without converting them."""
+        ocr_result = OcrResult.__new__(OcrResult)
+        ocr_result._columns = columns
+        ocr_result._lists = {}
+        return ocr_result
+
+    @staticmethod
+    def _to_object_array(values: Iterable) -> np.ndarray:
+        """Convert values to a 1-D object array, keeping each value as is."""
+        values = list(values)
+        array = np.empty(len(values), dtype=object)
+        array[:] = values
+        return array
@@ -1,15 +1,45 @@
 import io
-from copy import deepcopy
-from typing import Dict, List, Optional, Tuple, Union
+from bisect import bisect_right, insort
+from collections import deque
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from itertools import islice
+from typing import Iterable, Iterator, List, Optional, Tuple, Union
 
 import matplotlib
 import matplotlib.pyplot as plt
-import numpy as np
 from PIL import Image, ImageChops
-from presidio_analyzer import AnalyzerEngine, RecognizerResult
+from presidio_analyzer import AnalyzerEngine, BatchAnalyzerEngine, RecognizerResult
 
-from presidio_image_redactor import OCR, ImagePreprocessor, TesseractOCR
-from presidio_image_redactor.entities import ImageRecognizerResult
+from presidio_image_redactor import (
+    OCR,
+    ImagePreprocessor,
+    RegionOCR,
+    TesseractOCR,
+    TextRegionDetector,
+)
+from presidio_image_redactor.entities import ImageRecognizerResult, OcrResult
+
+# Set in each worker process by _init_ocr_worker
+_worker_ocr: Optional[OCR] = None
+_worker_image_preprocessor: Optional[ImagePreprocessor] = None
+
+
+def _init_ocr_worker(ocr: OCR, image_preprocessor: ImagePreprocessor) -> None:
+    global _worker_ocr, _worker_image_preprocessor
+    _worker_ocr = ocr
+    _worker_image_preprocessor = image_preprocessor
+
+
+def _ocr_image_in_worker(
+    image: object, perform_ocr_kwargs: dict, ocr_threshold: Optional[float]
+) -> OcrResult:
+    return ImageAnalyzerEngine._ocr_image(
+        image,
+        _worker_ocr,
+        _worker_image_preprocessor,
+        perform_ocr_kwargs,
+        ocr_threshold,
+    )
 
 
 class ImageAnalyzerEngine:
@@ -20,6 +50,10 @@ class ImageAnalyzerEngine:
     :param ocr: the OCR object to be used to detect text in images.
     :param image_preprocessor: The ImagePreprocessor object to be
         used to preprocess the image
+    :param text_region_detector: If provided, only the regions of the
+        preprocessed image found by this detector (e.g. templates of known
+        zones, or ContourTextRegionDetector) are OCRed, in parallel.
+        See RegionOCR.
     """
 
     def __init__(
@@ -27,6 +61,7 @@ class ImageAnalyzerEngine:
         analyzer_engine: Optional[AnalyzerEngine] = None,
         ocr: Optional[OCR] = None,
         image_preprocessor: Optional[ImagePreprocessor] = None,
+        text_region_detector: Optional[TextRegionDetector] = None,
     ):
         if not analyzer_engine:
             analyzer_engine = AnalyzerEngine()
@@ -34,6 +69,8 @@ class ImageAnalyzerEngine:
 
         if not ocr:
             ocr = TesseractOCR()
+        if text_region_detector:
+            ocr = RegionOCR(ocr, text_region_detector)
         self.ocr = ocr
 
         if not image_preprocessor:
@@ -54,18 +91,13 @@ class ImageAnalyzerEngine:
         """
         # Perform OCR
         perform_ocr_kwargs, ocr_threshold = self._parse_ocr_kwargs(ocr_kwargs)
-        image, preprocessing_metadata = self.image_preprocessor.preprocess_image(image)
-        ocr_result = self.ocr.perform_ocr(image, **perform_ocr_kwargs)
-        ocr_result = self.remove_space_boxes(ocr_result)
-
-        if preprocessing_metadata and ("scale_factor" in preprocessing_metadata):
-            ocr_result = self._scale_bbox_results(
-                ocr_result, preprocessing_metadata["scale_factor"]
-            )
-
-        # Apply OCR confidence threshold if it is passed in
-        if ocr_threshold:
-            ocr_result = self.threshold_ocr_result(ocr_result, ocr_threshold)
+        ocr_result = self._ocr_image(
+            image,
+            self.ocr,
+            self.image_preprocessor,
+            perform_ocr_kwargs,
+            ocr_threshold,
+        )
 
         # Analyze text
         text = self.ocr.get_text_from_ocr_dict(ocr_result)
@@ -83,8 +115,178 @@ class ImageAnalyzerEngine:
 
         return bboxes
 
+    def analyze_batch(
+        self,
+        images: Iterable[object],
+        ocr_kwargs: Optional[dict] = None,
+        batch_size: int = 8,
+        n_process: int = 1,
+        max_queue_size: Optional[int] = None,
+        **text_analyzer_kwargs,
+    ) -> Iterator[List[ImageRecognizerResult]]:
+        """Analyse a stream of images, e.g. the pages of a document.
+
+        Preprocessing and OCR run in the background (in a thread, or in a pool
+        of n_process processes) while the text of the images already OCRed is
+        analyzed in batches of batch_size texts with BatchAnalyzerEngine.
+        At most max_queue_size images are being OCRed or waiting for text
+        analysis at any time, so images can be a lazy iterator of any length.
+
+        With n_process > 1, the OCR engine, the image preprocessor and the
+        images must be picklable.
+
+        :param images: PIL Images/numpy arrays or file paths(str) to be processed.
+        :param ocr_kwargs: Additional params for OCR methods.
+        :param batch_size: Number of texts analyzed together by the NLP engine.
+        :param n_process: Number of processes used for preprocessing and OCR.
+            With 1, OCR runs in a background thread.
+        :param max_queue_size: Maximum number of images OCRed ahead of the text
+            analysis. Defaults to twice the larger of batch_size and n_process.
+        :param text_analyzer_kwargs: Additional values for the analyze method
+        in AnalyzerEngine.
+
+        :return: Iterator of the entities with image bounding boxes of each image,
+            in the order of the images, yielded as soon as their batch is analyzed.
+        """
+        for _, bboxes in self._analyze_batch(
+            images,
+            ocr_kwargs,
+            batch_size,
+            n_process,
+            max_queue_size,
+            **text_analyzer_kwargs,
+        ):
+            yield bboxes
+
+    def _analyze_batch(
+        self,
+        images: Iterable[object],
+        ocr_kwargs: Optional[dict],
+        batch_size: int,
+        n_process: int,
+        max_queue_size: Optional[int],
+        **text_analyzer_kwargs,
+    ) -> Iterator[Tuple[object, List[ImageRecognizerResult]]]:
+        """Analyse a stream of images, see analyze_batch.
+
+        :return: Iterator of each image and its entities with image bounding boxes.
+        """
+        if batch_size < 1:
+            raise ValueError("batch_size must be greater than 0")
+        if n_process < 1:
+            raise ValueError("n_process must be greater than 0")
+        if max_queue_size is None:
+            max_queue_size = 2 * max(batch_size, n_process)
+        if max_queue_size < 1:
+            raise ValueError("max_queue_size must be greater than 0")
+
+        language = text_analyzer_kwargs.pop("language", "en")
+        allow_list = self._check_for_allow_list(text_analyzer_kwargs)
+        batch_analyzer = BatchAnalyzerEngine(analyzer_engine=self.analyzer_engine)
+
+        ocr_results = self._ocr_images(images, ocr_kwargs, n_process, max_queue_size)
+        while True:
+            batch = list(islice(ocr_results, batch_size))
+            if not batch:
+                return
+
+            texts = [self.ocr.get_text_from_ocr_dict(result) for _, result in batch]
+            analyzer_results = batch_analyzer.analyze_iterator(
+                texts, language=language, batch_size=batch_size, **text_analyzer_kwargs
+            )
+            for (image, ocr_result), text, analyzer_result in zip(
+                batch, texts, analyzer_results
+            ):
+                bboxes = self.map_analyzer_results_to_bounding_boxes(
+                    analyzer_result, ocr_result, text, allow_list
+                )
+                yield image, bboxes
+
+    def _ocr_images(
+        self,
+        images: Iterable[object],
+        ocr_kwargs: Optional[dict],
+        n_process: int,
+        max_queue_size: int,
+    ) -> Iterator[Tuple[object, OcrResult]]:
+        """Preprocess and OCR images in the background, in the order of the images.
+
+        :param images: PIL Images/numpy arrays or file paths(str) to be processed.
+        :param ocr_kwargs: Additional params for OCR methods.
+        :param n_process: Number of worker processes (a thread if 1).
+        :param max_queue_size: Maximum number of images submitted for OCR
+            and not yet consumed.
+
+        :return: Iterator of each image and its OCR results.
+        """
+        perform_ocr_kwargs, ocr_threshold = self._parse_ocr_kwargs(ocr_kwargs)
+        if n_process == 1:
+            executor: Executor = ThreadPoolExecutor(max_workers=1)
+            ocr_args = (self.ocr, self.image_preprocessor)
+            ocr_func = self._ocr_image
+        else:
+            executor = ProcessPoolExecutor(
+                max_workers=n_process,
+                initializer=_init_ocr_worker,
+                initargs=(self.ocr, self.image_preprocessor),
+            )
+            ocr_args = ()
+            ocr_func = _ocr_image_in_worker
+
+        pending = deque()
+        try:
+            for image in images:
+                if len(pending) >= max_queue_size:
+                    done_image, future = pending.popleft()
+                    yield done_image, future.result()
+                future = executor.submit(
+                    ocr_func, image, *ocr_args, perform_ocr_kwargs, ocr_threshold
+                )
+                pending.append((image, future))
+            while pending:
+                done_image, future = pending.popleft()
+                yield done_image, future.result()
+        finally:
+            for _, future in pending:
+                future.cancel()
+            executor.shutdown(wait=True)
+
+    @classmethod
+    def _ocr_image(
+        cls,
+        image: object,
+        ocr: OCR,
+        image_preprocessor: ImagePreprocessor,
+        perform_ocr_kwargs: dict,
+        ocr_threshold: Optional[float],
+    ) -> OcrResult:
+        """Preprocess and OCR an image.
+
+        :param image: PIL Image/numpy array or file path(str) to be processed.
+        :param ocr: OCR engine.
+        :param image_preprocessor: Preprocessor applied before OCR.
+        :param perform_ocr_kwargs: Additional values for ocr.perform_ocr.
+        :param ocr_threshold: OCR confidence threshold, if any.
+
+        :return: OCR results without spaces, in the coordinates of the image.
+        """
+        image, preprocessing_metadata = image_preprocessor.preprocess_image(image)
+        ocr_result = OcrResult.from_dict(ocr.perform_ocr(image, **perform_ocr_kwargs))
+        ocr_result = ocr_result.remove_spaces()
+
+        if preprocessing_metadata and ("scale_factor" in preprocessing_metadata):
+            ocr_result = ocr_result.scale(preprocessing_metadata["scale_factor"])
+
+        # Apply OCR confidence threshold if it is passed in
+        if ocr_threshold:
+            ocr_result = ocr_result.threshold(ocr_threshold)
+
+        return ocr_result
+
     @staticmethod
-    def threshold_ocr_result(ocr_result: dict, ocr_threshold: float) -> dict:
+    def threshold_ocr_result(
+        ocr_result: Union[dict, OcrResult], ocr_threshold: float
+    ) -> dict:
         """Filter out OCR results below confidence threshold.
 
         :param ocr_result: OCR results (raw).
@@ -92,42 +294,16 @@ class ImageAnalyzerEngine:
 
         :return: OCR results with low confidence items removed.
         """
-        if ocr_threshold < -1 or ocr_threshold > 100:
-            raise ValueError("ocr_threshold must be between -1 and 100")
-
-        # Get indices of items above threshold
-        idx = list()
-        for i, val in enumerate(ocr_result["conf"]):
-            if float(val) >= ocr_threshold:
-                idx.append(i)
-
-        # Only retain high confidence items
-        filtered_ocr_result = {}
-        for key in list(ocr_result.keys()):
-            filtered_ocr_result[key] = [ocr_result[key][i] for i in idx]
-
-        return filtered_ocr_result
+        return OcrResult.from_dict(ocr_result).threshold(ocr_threshold).to_dict()
 
     @staticmethod
-    def remove_space_boxes(ocr_result: dict) -> dict:
+    def remove_space_boxes(ocr_result: Union[dict, OcrResult]) -> dict:
         """Remove OCR bboxes that are for spaces.
 
         :param ocr_result: OCR results (raw or thresholded).
         :return: OCR results with empty words removed.
         """
-        # Get indices of items with no text
-        idx = list()
-        for i, text in enumerate(ocr_result["text"]):
-            is_not_space = text.isspace() is False
-            if text != "" and is_not_space:
-                idx.append(i)
-
-        # Only retain items with text
-        filtered_ocr_result = {}
-        for key in list(ocr_result.keys()):
-            filtered_ocr_result[key] = [ocr_result[key][i] for i in idx]
-
-        return filtered_ocr_result
+        return OcrResult.from_dict(ocr_result).remove_spaces().to_dict()
 
     @staticmethod
     def map_analyzer_results_to_bounding_boxes(
@@ -141,6 +317,12 @@ class ImageAnalyzerEngine:
         Matching is based on the position of the recognized entity from analyzer
         and word (in ocr dict) in the text.
 
+        Words are visited in order, and each word is only compared with the
+        entities overlapping it, which are found from the start offset of each
+        word in the text (jumping over the words before the next entity with
+        a binary search), so mapping runs in linear time in the number of
+        words and entities.
+
         :param text_analyzer_results: PII entities recognized by presidio analyzer
         :param ocr_result: dict results with words and bboxes from OCR
         :param text: text the results are based on
@@ -151,109 +333,130 @@ class ImageAnalyzerEngine:
         if (not ocr_result) or (not text_analyzer_results):
             return []
 
+        words = ocr_result["text"]
+        offsets = [0]
+        for word in words:
+            offsets.append(offsets[-1] + (len(word) if word else 0) + 1)
+
+        def is_redacted(word: str) -> bool:
+            # Do not add bbox for standalone spaces / empty strings
+            return (
+                (word is not None)
+                and (word != "")
+                and (word.isspace() is False)
+                and (word not in allow_list)
+            )
+
+        def make_bbox(element: RecognizerResult, index: int) -> ImageRecognizerResult:
+            return ImageRecognizerResult(
+                element.entity_type,
+                element.start,
+                element.end,
+                element.score,
+                ocr_result["left"][index],
+                ocr_result["top"][index],
+                ocr_result["width"][index],
+                ocr_result["height"][index],
+            )
+
+        # Entities by start offset, added to the active entities once a word
+        # ends after their start, and dropped once a word starts after their end
+        by_start = sorted(
+            range(len(text_analyzer_results)),
+            key=lambda i: text_analyzer_results[i].start,
+        )
+        starts = [text_analyzer_results[i].start for i in by_start]
+        next_start = 0
+        active: List[int] = []
+
         bboxes = []
         proc_indexes = 0
         indexes = len(text_analyzer_results)
 
-        pos = 0
-        iter_ocr = enumerate(ocr_result["text"])
-        for index, word in iter_ocr:
+        index = 0
+        while index < len(words):
+            word = words[index]
             if not word:
-                pos += 1
-            else:
-                for element in text_analyzer_results:
-                    text_element = text[element.start : element.end]
-                    # check position and text of ocr word matches recognized entity
-                    if (
-                        max(pos, element.start) < min(element.end, pos + len(word))
-                    ) and ((text_element in word) or (word in text_element)):
-                        yes_make_bbox_for_word = (
-                            (word is not None)
-                            and (word != "")
-                            and (word.isspace() is False)
-                            and (word not in allow_list)
-                        )
-                        # Do not add bbox for standalone spaces / empty strings
-                        if yes_make_bbox_for_word:
-                            bboxes.append(
-                                ImageRecognizerResult(
-                                    element.entity_type,
-                                    element.start,
-                                    element.end,
-                                    element.score,
-                                    ocr_result["left"][index],
-                                    ocr_result["top"][index],
-                                    ocr_result["width"][index],
-                                    ocr_result["height"][index],
-                                )
-                            )
-
-                            # add bounding boxes for all words in ocr dict
-                            # contained within the text of recognized entity
-                            # based on relative position in the full text
-                            while pos + len(word) < element.end:
-                                prev_word = word
-                                index, word = next(iter_ocr)
-                                yes_make_bbox_for_word = (
-                                    (word is not None)
-                                    and (word != "")
-                                    and (word.isspace() is False)
-                                    and (word not in allow_list)
-                                )
-                                if yes_make_bbox_for_word:
-                                    bboxes.append(
-                                        ImageRecognizerResult(
-                                            element.entity_type,
-                                            element.start,
-                                            element.end,
-                                            element.score,
-                                            ocr_result["left"][index],
-                                            ocr_result["top"][index],
-                                            ocr_result["width"][index],
-                                            ocr_result["height"][index],
-                                        )
-                                    )
-                                pos += len(prev_word) + 1
-                            proc_indexes += 1
-
-                if proc_indexes == indexes:
+                index += 1
+                continue
+
+            pos = offsets[index]
+            while next_start < indexes and starts[next_start] < pos + len(word):
+                insort(active, by_start[next_start])
+                next_start += 1
+            active = [i for i in active if text_analyzer_results[i].end > pos]
+            if not active:
+                if next_start == indexes:
                     break
-                pos += len(word) + 1
+                # Jump to the last word starting before the next entity
+                next_index = bisect_right(offsets, starts[next_start], hi=len(words))
+                if next_index - 1 > index:
+                    index = next_index - 1
+                    continue
+
+            # Compare the word with the overlapping entities, in the order of the
+            # analyzer results. Words of a multi-word entity are consumed with it,
+            # and the remaining entities are compared with its last word.
+            last_checked = -1
+            while True:
+                candidates = [
+                    i
+                    for i in active
+                    if i > last_checked
+                    and max(pos, text_analyzer_results[i].start)
+                    < min(text_analyzer_results[i].end, pos + len(word))
+                ]
+                if not candidates:
+                    break
+                last_checked = candidates[0]
+                element = text_analyzer_results[last_checked]
+                text_element = text[element.start : element.end]
+                # check text of ocr word matches recognized entity
+                if not ((text_element in word) or (word in text_element)):
+                    continue
+                if not is_redacted(word):
+                    continue
+
+                bboxes.append(make_bbox(element, index))
+                # add bounding boxes for all words in ocr dict
+                # contained within the text of recognized entity
+                # based on relative position in the full text
+                while pos + len(word) < element.end and index + 1 < len(words):
+                    index += 1
+                    word = words[index]
+                    pos = offsets[index]
+                    if is_redacted(word):
+                        bboxes.append(make_bbox(element, index))
+                proc_indexes += 1
+
+                while next_start < indexes and starts[next_start] < pos + len(word):
+                    insort(active, by_start[next_start])
+                    next_start += 1
+
+            if proc_indexes == indexes:
+                break
+            index += 1
 
         return bboxes
 
     @staticmethod
     def _scale_bbox_results(
-        ocr_result: Dict[str, List[Union[int, str]]], scale_factor: float
-    ) -> Dict[str, float]:
+        ocr_result: Union[dict, OcrResult], scale_factor: float
+    ) -> dict:
         """Scale down the bounding box results based on a scale percentage.
 
         :param ocr_result: OCR results (raw).
-        :param scale_percent: Scale percentage for resizing the bounding box.
+        :param scale_factor: Scale factor for resizing the bounding box.
 
         :return: OCR results (scaled).
         """
-        scaled_results = deepcopy(ocr_result)
-        coordinate_keys = ["left", "top"]
-        dimension_keys = ["width", "height"]
-
-        for coord_key in coordinate_keys:
-            scaled_results[coord_key] = [
-                int(np.ceil((x) / (scale_factor))) for x in scaled_results[coord_key]
-            ]
-
-        for dim_key in dimension_keys:
-            scaled_results[dim_key] = [
-                max(1, int(np.ceil(x / (scale_factor))))
-                for x in scaled_results[dim_key]
-            ]
-        return scaled_results
+        return OcrResult.from_dict(ocr_result).scale(scale_factor).to_dict()
 
     @staticmethod
     def _remove_bbox_padding(
-        analyzer_bboxes: List[Dict[str, Union[str, float, int]]],
+        analyzer_bboxes: Union[dict, OcrResult],
         padding_width: int,
-    ) -> List[Dict[str, int]]:
+    ) -> dict:
         """Remove added padding in bounding box coordinates.
 
         :param analyzer_bboxes: The bounding boxes from analyzer results.
@@ -261,18 +464,8 @@ class ImageAnalyzerEngine:
 
         :return: Bounding box information per word.
         """
-
-        unpadded_results = deepcopy(analyzer_bboxes)
-        if padding_width < 0:
-            raise ValueError("Padding width must be a non-negative integer.")
-
-        coordinate_keys = ["left", "top"]
-        for coord_key in coordinate_keys:
-            unpadded_results[coord_key] = [
-                max(0, x - padding_width) for x in unpadded_results[coord_key]
-            ]
-
-        return unpadded_results
+        unpadded_results = OcrResult.from_dict(analyzer_bboxes)
+        return unpadded_results.remove_padding(padding_width).to_dict()
 
     @staticmethod
     def _parse_ocr_kwargs(ocr_kwargs: dict) -> Tuple[dict, float]:
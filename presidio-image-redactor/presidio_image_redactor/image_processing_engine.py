@@ -1,10 +1,70 @@
-from typing import Optional, Tuple, Union
+import logging
+import threading
+import time
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Tuple, Union
 
 import cv2
 import numpy as np
 import PIL
 from PIL import Image
 
+logger = logging.getLogger("presidio-image-redactor")
+
+
+@dataclass
+class ImageStatistics:
+    """
+    Cheap statistics of a greyscale image, used to skip preprocessing stages.
+
+    :param mean: Mean intensity of the image.
+    :param contrast: Standard deviation of the intensity of the image.
+    :param background_color: Most common intensity of the image.
+    :param is_binary: Whether (almost) all pixels are close to black or white,
+        e.g. for scans which are already thresholded.
+    """
+
+    mean: float
+    contrast: float
+    background_color: int
+    is_binary: bool
+
+    @classmethod
+    def probe(
+        cls,
+        image: np.ndarray,
+        max_pixels: int = 65536,
+        binary_fraction: float = 0.98,
+        binary_margin: int = 32,
+    ) -> "ImageStatistics":
+        """Estimate the statistics of an image from a subsample of its pixels.
+
+        :param image: Greyscale uint8 image pixels.
+        :param max_pixels: Maximum number of pixels sampled (on a regular grid).
+        :param binary_fraction: Minimum fraction of pixels within binary_margin
+            of black or white for the image to be considered binary.
+        :param binary_margin: Maximum distance of a pixel to black or white
+            to be considered black or white.
+
+        :return: Statistics of the image.
+        """
+        step = max(1, int(np.ceil(np.sqrt(image.size / max_pixels))))
+        histogram = np.bincount(image[::step, ::step].ravel(), minlength=256)
+        count = histogram.sum()
+        if count == 0:
+            return cls(mean=0.0, contrast=0.0, background_color=0, is_binary=False)
+
+        values = np.arange(256)
+        mean = float(histogram @ values / count)
+        contrast = float(np.sqrt(histogram @ (values - mean) ** 2 / count))
+        extremes = histogram[:binary_margin].sum() + histogram[-binary_margin:].sum()
+        return cls(
+            mean=mean,
+            contrast=contrast,
+            background_color=int(histogram.argmax()),
+            is_binary=bool(extremes >= binary_fraction * count),
+        )
+
 
 class ImagePreprocessor:
     """ImagePreprocessor class.
@@ -29,6 +89,33 @@ class ImagePreprocessor:
         """
         return image, {}
 
+    def preprocess_array(
+        self, image: np.ndarray, dst: Optional[np.ndarray] = None
+    ) -> Tuple[np.ndarray, dict]:
+        """Preprocess image pixels, as a stage of an ImagePreprocessingPipeline.
+
+        Subclasses working on numpy arrays should override this method, so that
+        pipelines do not convert images to PIL between stages.
+
+        :param image: Image pixels (as a numpy array).
+        :param dst: Optional scratch array with the shape and type of image,
+            which the output may be written to instead of a new array.
+
+        :return: The processed image pixels (which may be image itself or dst)
+            and any metadata regarding the preprocessing approach.
+        """
+        processed_image, metadata = self.preprocess_image(image)
+        return self.convert_image_to_array(processed_image), metadata
+
+    def skip_stage(self, statistics: ImageStatistics) -> bool:
+        """Check if this preprocessing stage is unnecessary for an image.
+
+        :param statistics: Statistics of the image before preprocessing.
+
+        :return: True to skip this stage in an ImagePreprocessingPipeline.
+        """
+        return False
+
     def convert_image_to_array(self, image: Image.Image) -> np.ndarray:
         """Convert PIL image to numpy array.
 
@@ -96,6 +183,39 @@ class ImagePreprocessor:
         mean_intensity = np.mean(image)
         return contrast, mean_intensity
 
+    @staticmethod
+    def _get_histogram(image: np.ndarray) -> Optional[np.ndarray]:
+        """Count the pixels of each intensity of a greyscale uint8 image.
+
+        :param image: Input image pixels (as a numpy array).
+
+        :return: Histogram of the 256 intensities, or None for other images.
+        """
+        if not isinstance(image, np.ndarray) or image.ndim != 2:
+            return None
+        if image.dtype != np.uint8:
+            return None
+        return np.bincount(image.ravel(), minlength=256)
+
+    @staticmethod
+    def _get_histogram_contrast(histogram: np.ndarray) -> Tuple[float, float]:
+        """Compute the contrast level and mean intensity from an image histogram.
+
+        Same as _get_image_contrast, but from the histogram of the image, with
+        exact integer sums instead of another two passes over the pixels.
+
+        :param histogram: Number of pixels of each intensity.
+
+        :return: A tuple containing the contrast level and mean intensity of the image.
+        """
+        values = np.arange(len(histogram), dtype=np.int64)
+        count = int(histogram.sum())
+        total = int(histogram @ values)
+        squares = int(histogram @ (values * values))
+        mean_intensity = np.float64(total / count)
+        variance = (count * squares - total * total) / (count * count)
+        return np.sqrt(np.float64(variance)), mean_intensity
+
 
 class BilateralFilter(ImagePreprocessor):
     """BilateralFilter class.
@@ -127,13 +247,27 @@ class BilateralFilter(ImagePreprocessor):
         :return: The processed image and metadata (diameter, sigma_color, sigma_space).
         """
         image = self.convert_image_to_array(image)
+        filtered_image, metadata = self.preprocess_array(image)
+
+        return Image.fromarray(filtered_image), metadata
 
-        # Apply bilateral filtering
+    def preprocess_array(
+        self, image: np.ndarray, dst: Optional[np.ndarray] = None
+    ) -> Tuple[np.ndarray, dict]:
+        """Apply bilateral filtering to image pixels.
+
+        :param image: Image pixels (as a numpy array).
+        :param dst: Optional array to write the filtered image to.
+
+        :return: The filtered pixels and metadata (diameter, sigma_color,
+            sigma_space).
+        """
         filtered_image = cv2.bilateralFilter(
             image,
             self.diameter,
             self.sigma_color,
             self.sigma_space,
+            dst=dst,
         )
 
         metadata = {
@@ -142,7 +276,16 @@ class BilateralFilter(ImagePreprocessor):
             "sigma_space": self.sigma_space,
         }
 
-        return Image.fromarray(filtered_image), metadata
+        return filtered_image, metadata
+
+    def skip_stage(self, statistics: ImageStatistics) -> bool:
+        """Skip denoising images which are already binary.
+
+        :param statistics: Statistics of the image before preprocessing.
+
+        :return: True if the image is binary.
+        """
+        return statistics.is_binary
 
 
 class SegmentedAdaptiveThreshold(ImagePreprocessor):
@@ -190,9 +333,28 @@ class SegmentedAdaptiveThreshold(ImagePreprocessor):
         if not isinstance(image, np.ndarray):
             image = self.convert_image_to_array(image)
 
+        adaptive_threshold_image, metadata = self.preprocess_array(image)
+        return Image.fromarray(adaptive_threshold_image), metadata
+
+    def preprocess_array(
+        self, image: np.ndarray, dst: Optional[np.ndarray] = None
+    ) -> Tuple[np.ndarray, dict]:
+        """Apply adaptive thresholding to greyscale image pixels.
+
+        :param image: Greyscale image pixels (as a numpy array).
+        :param dst: Optional array to write the thresholded image to.
+
+        :return: The thresholded pixels and metadata (C, background_color,
+            contrast).
+        """
         # Determine background color
-        background_color = self._get_bg_color(image, True)
-        contrast, _ = self._get_image_contrast(image)
+        histogram = self._get_histogram(image)
+        if histogram is not None:
+            background_color = int(histogram.argmax())
+            contrast, _ = self._get_histogram_contrast(histogram)
+        else:
+            background_color = self._get_bg_color(image, True)
+            contrast, _ = self._get_image_contrast(image)
 
         c = (
             self.c_low_contrast
@@ -208,6 +370,7 @@ class SegmentedAdaptiveThreshold(ImagePreprocessor):
                 cv2.THRESH_BINARY_INV,
                 self.block_size,
                 -c,
+                dst=dst,
             )
         else:
             adaptive_threshold_image = cv2.adaptiveThreshold(
@@ -217,10 +380,23 @@ class SegmentedAdaptiveThreshold(ImagePreprocessor):
                 cv2.THRESH_BINARY,
                 self.block_size,
                 c,
+                dst=dst,
             )
 
         metadata = {"C": c, "background_color": background_color, "contrast": contrast}
-        return Image.fromarray(adaptive_threshold_image), metadata
+        return adaptive_threshold_image, metadata
+
+    def skip_stage(self, statistics: ImageStatistics) -> bool:
+        """Skip binary images with a light background.
+
+        Such images already have dark text on a light background, which
+        adaptive thresholding would only hollow out.
+
+        :param statistics: Statistics of the image before preprocessing.
+
+        :return: True if the image is binary with a light background.
+        """
+        return statistics.is_binary and statistics.background_color >= self.bg_threshold
 
 
 class ImageRescaling(ImagePreprocessor):
@@ -254,7 +430,34 @@ class ImageRescaling(ImagePreprocessor):
 
         :return: The processed image and metadata (scale_factor).
         """
+        rescaled_image, metadata = self._rescale(image)
+        return Image.fromarray(rescaled_image), metadata
+
+    def preprocess_array(
+        self, image: np.ndarray, dst: Optional[np.ndarray] = None
+    ) -> Tuple[np.ndarray, dict]:
+        """Rescale image pixels based on their size.
+
+        :param image: Image pixels (as a numpy array).
+        :param dst: Optional array to write the rescaled image to, only used
+            if the image size is unchanged.
+
+        :return: The rescaled pixels (image itself if the size is unchanged)
+            and metadata (scale_factor).
+        """
+        return self._rescale(image, dst, copy=False)
+
+    def _rescale(
+        self, image: np.ndarray, dst: Optional[np.ndarray] = None, copy: bool = True
+    ) -> Tuple[np.ndarray, dict]:
+        """Rescale image pixels based on their size.
+
+        :param image: Image pixels (as a numpy array).
+        :param dst: Optional array to write the rescaled image to.
+        :param copy: Whether to copy the image if its size is unchanged.
 
+        :return: The rescaled pixels and metadata (scale_factor).
+        """
         scale_factor = 1
         if image.size < self.small_size:
             scale_factor = self.factor
@@ -265,19 +468,284 @@ class ImageRescaling(ImagePreprocessor):
         height = int(image.shape[0] * scale_factor)
         dimensions = (width, height)
 
-        # resize image
-        rescaled_image = cv2.resize(image, dimensions, interpolation=self.interpolation)
         metadata = {"scale_factor": scale_factor}
-        return Image.fromarray(rescaled_image), metadata
+        if scale_factor == 1 and not copy:
+            return image, metadata
+
+        # resize image
+        if dst is not None and dst.shape[:2] != (height, width):
+            dst = None
+        rescaled_image = cv2.resize(
+            image, dimensions, dst=dst, interpolation=self.interpolation
+        )
+        return rescaled_image, metadata
 
 
-class ContrastSegmentedImageEnhancer(ImagePreprocessor):
+class LowContrastEnhancer(ImagePreprocessor):
+    """LowContrastEnhancer class.
+
+    The class stretches the intensities of greyscale images with a low contrast
+    level around their mean intensity, and keeps other images as is.
+    """
+
+    def __init__(self, low_contrast_threshold: int = 40, alpha: float = 1.5) -> None:
+        """Initialize the LowContrastEnhancer class.
+
+        :param low_contrast_threshold: Threshold for low contrast images.
+        :param alpha: Scale factor applied to the intensities of low contrast images.
+        """
+        super().__init__(use_greyscale=True)
+        self.low_contrast_threshold = low_contrast_threshold
+        self.alpha = alpha
+
+    def preprocess_image(self, image: Image.Image) -> Tuple[Image.Image, dict]:
+        """Preprocess the image to be analyzed.
+
+        :param image: Loaded PIL image.
+
+        :return: The processed image and metadata (contrast, adjusted_contrast).
+        """
+        image = self.convert_image_to_array(image)
+        adjusted_image, metadata = self.preprocess_array(image)
+        return Image.fromarray(adjusted_image), metadata
+
+    def preprocess_array(
+        self, image: np.ndarray, dst: Optional[np.ndarray] = None
+    ) -> Tuple[np.ndarray, dict]:
+        """Improve the contrast of greyscale image pixels.
+
+        :param image: Greyscale image pixels (as a numpy array).
+        :param dst: Optional array to write the adjusted image to.
+
+        :return: The adjusted pixels (image itself if its contrast is not low)
+            and metadata (contrast, adjusted_contrast).
+        """
+        adjusted_image, contrast, adjusted_contrast = self.improve_contrast(image, dst)
+        metadata = {"contrast": contrast, "adjusted_contrast": adjusted_contrast}
+        return adjusted_image, metadata
+
+    def improve_contrast(
+        self, image: np.ndarray, dst: Optional[np.ndarray] = None
+    ) -> Tuple[np.ndarray, float, float]:
+        """Improve the contrast of an image based on its initial contrast level.
+
+        :param image: Input image.
+        :param dst: Optional array to write the adjusted image to.
+
+        :return: A tuple containing the improved image, the initial contrast level,
+             and the adjusted contrast level.
+        """
+        contrast, mean_intensity = self._get_contrast(image)
+
+        if contrast <= self.low_contrast_threshold:
+            alpha = self.alpha
+            beta = -mean_intensity * alpha
+            adjusted_image = cv2.convertScaleAbs(image, dst=dst, alpha=alpha, beta=beta)
+            adjusted_contrast, _ = self._get_contrast(adjusted_image)
+        else:
+            adjusted_image = image
+            adjusted_contrast = contrast
+        return adjusted_image, contrast, adjusted_contrast
+
+    def _get_contrast(self, image: np.ndarray) -> Tuple[float, float]:
+        """Compute the contrast level and mean intensity of an image.
+
+        :param image: Input image pixels.
+
+        :return: A tuple containing the contrast level and mean intensity of the image.
+        """
+        histogram = self._get_histogram(image)
+        if histogram is None:
+            return self._get_image_contrast(image)
+        return self._get_histogram_contrast(histogram)
+
+    def skip_stage(self, statistics: ImageStatistics) -> bool:
+        """Skip images which are already binary.
+
+        :param statistics: Statistics of the image before preprocessing.
+
+        :return: True if the image is binary.
+        """
+        return statistics.is_binary
+
+
+class OtsuThreshold(ImagePreprocessor):
+    """OtsuThreshold class. Binarizes images with Otsu's threshold."""
+
+    def __init__(self) -> None:
+        """Initialize the OtsuThreshold class."""
+        super().__init__(use_greyscale=True)
+
+    def preprocess_image(self, image: Image.Image) -> Tuple[Image.Image, dict]:
+        """Preprocess the image to be analyzed.
+
+        :param image: Loaded PIL image.
+
+        :return: The processed image and metadata (otsu_threshold).
+        """
+        image = self.convert_image_to_array(image)
+        threshold_image, metadata = self.preprocess_array(image)
+        return Image.fromarray(threshold_image), metadata
+
+    def preprocess_array(
+        self, image: np.ndarray, dst: Optional[np.ndarray] = None
+    ) -> Tuple[np.ndarray, dict]:
+        """Binarize greyscale image pixels with Otsu's threshold.
+
+        :param image: Greyscale image pixels (as a numpy array).
+        :param dst: Optional array to write the binarized image to.
+
+        :return: The binarized pixels and metadata (otsu_threshold).
+        """
+        threshold, threshold_image = cv2.threshold(
+            image, 0, 255, cv2.THRESH_BINARY | cv2.THRESH_OTSU, dst=dst
+        )
+        return threshold_image, {"otsu_threshold": threshold}
+
+
+class ImagePreprocessingPipeline(ImagePreprocessor):
+    """ImagePreprocessingPipeline class.
+
+    Runs a sequence of preprocessors (stages) on the pixels of an image, which
+    is converted to a greyscale numpy array once, passed from stage to stage
+    without converting it to PIL, and converted back to PIL once at the end.
+    Intermediate results are written to scratch arrays, which are reused for
+    the following images of the same size (per thread).
+
+    If skip_binary_images is set, cheap statistics of the input image are
+    estimated first (see ImageStatistics), and stages which are unnecessary
+    for the image (e.g. denoising scans which are already binary) are skipped.
+
+    The returned metadata combines the metadata of all stages (later stages
+    override keys of earlier ones), the time spent in each stage in seconds
+    (stage_seconds) and the names of the skipped stages (skipped_stages).
+    """
+
+    def __init__(
+        self,
+        stages: Optional[List[ImagePreprocessor]] = None,
+        skip_binary_images: bool = True,
+    ) -> None:
+        """Initialize the ImagePreprocessingPipeline class.
+
+        :param stages: Preprocessors to run, in order.
+        :param skip_binary_images: Whether to skip the stages unnecessary for
+            binary images, based on a probe of the image statistics.
+        """
+        super().__init__(use_greyscale=True)
+        self._stages = stages if stages else []
+        self.skip_binary_images = skip_binary_images
+        self._scratch = threading.local()
+
+    @property
+    def stages(self) -> List[ImagePreprocessor]:
+        """Preprocessors run by the pipeline, in order."""
+        return self._stages
+
+    def preprocess_image(self, image: Image.Image) -> Tuple[Image.Image, dict]:
+        """Preprocess the image to be analyzed.
+
+        :param image: Loaded PIL image.
+
+        :return: The processed image and the metadata of all stages.
+        """
+        image = self.convert_image_to_array(image)
+        processed_image, metadata = self.preprocess_array(image)
+        return Image.fromarray(processed_image), metadata
+
+    def preprocess_array(
+        self, image: np.ndarray, dst: Optional[np.ndarray] = None
+    ) -> Tuple[np.ndarray, dict]:
+        """Run the stages of the pipeline on image pixels.
+
+        :param image: Image pixels (as a numpy array).
+        :param dst: Optional array to write the output of the last stage to.
+
+        :return: The processed pixels, in a new array (or dst), and the
+            metadata of all stages.
+        """
+        stages = self.stages
+        skipped_stages = []
+        if self.skip_binary_images and image.ndim == 2 and image.dtype == np.uint8:
+            statistics = ImageStatistics.probe(image)
+            skipped_stages = [
+                type(stage).__name__ for stage in stages if stage.skip_stage(statistics)
+            ]
+            stages = [stage for stage in stages if not stage.skip_stage(statistics)]
+
+        metadata = {}
+        stage_seconds: Dict[str, float] = {}
+        for i, stage in enumerate(stages):
+            is_last = i == len(stages) - 1
+            stage_dst = dst if is_last else self._get_scratch_array(image)
+
+            start = time.perf_counter()
+            processed_image, stage_metadata = stage.preprocess_array(
+                image, dst=stage_dst
+            )
+            name = type(stage).__name__
+            stage_seconds[name] = (
+                stage_seconds.get(name, 0.0) + time.perf_counter() - start
+            )
+
+            # The output must not be overwritten when preprocessing other images
+            if is_last and np.may_share_memory(processed_image, image):
+                processed_image = processed_image.copy()
+            metadata.update(stage_metadata)
+            image = processed_image
+
+        if not stages:
+            image = image.copy()
+
+        logger.debug("Preprocessing stage durations (seconds): %s", stage_seconds)
+        metadata["stage_seconds"] = stage_seconds
+        metadata["skipped_stages"] = skipped_stages
+        return image, metadata
+
+    def _get_scratch_array(self, image: np.ndarray) -> Optional[np.ndarray]:
+        """Get a scratch array for the output of a stage run on image.
+
+        Two arrays are kept per image shape (and thread), so that the output of
+        a stage is never written over its input.
+
+        :param image: Input of the stage.
+
+        :return: A uint8 array with the shape of image which does not share
+            memory with image, or None for images of another type.
+        """
+        if image.dtype != np.uint8:
+            return None
+        arrays = getattr(self._scratch, "arrays", None)
+        if arrays is None or arrays[0].shape != image.shape:
+            arrays = [np.empty_like(image), np.empty_like(image)]
+            self._scratch.arrays = arrays
+        if np.may_share_memory(arrays[0], image):
+            return arrays[1]
+        return arrays[0]
+
+    def __getstate__(self) -> dict:
+        """Return the state to pickle, without the scratch arrays."""
+        state = self.__dict__.copy()
+        del state["_scratch"]
+        return state
+
+    def __setstate__(self, state: dict) -> None:
+        """Restore a pickled pipeline."""
+        self.__dict__.update(state)
+        self._scratch = threading.local()
+
+
+class ContrastSegmentedImageEnhancer(ImagePreprocessingPipeline):
     """Class containing all logic to perform contrastive segmentation.
 
     Contrastive segmentation is a preprocessing step that aims to enhance the
     text in an image by increasing the contrast between the text and the
     background. The parameters used to run the preprocessing are selected based
     on the contrast level of the image.
+
+    The image goes through bilateral filtering, contrast enhancement, adaptive
+    thresholding, Otsu thresholding and rescaling, as stages of an
+    ImagePreprocessingPipeline.
     """
 
     def __init__(
@@ -286,6 +754,7 @@ class ContrastSegmentedImageEnhancer(ImagePreprocessor):
         adaptive_threshold: Optional[SegmentedAdaptiveThreshold] = None,
         image_rescaling: Optional[ImageRescaling] = None,
         low_contrast_threshold: int = 40,
+        skip_binary_images: bool = False,
     ) -> None:
         """Initialize the class.
 
@@ -293,9 +762,12 @@ class ContrastSegmentedImageEnhancer(ImagePreprocessor):
         :param adaptive_threshold: Optional AdaptiveThreshold instance.
         :param image_rescaling: Optional ImageRescaling instance.
         :param low_contrast_threshold: Threshold for low contrast images.
+        :param skip_binary_images: Whether to skip filtering, contrast
+            enhancement and (for light backgrounds) adaptive thresholding of
+            images which are already binary.
         """
 
-        super().__init__(use_greyscale=True)
+        super().__init__(skip_binary_images=skip_binary_images)
         if not bilateral_filter:
             self.bilateral_filter = BilateralFilter()
         else:
@@ -312,46 +784,29 @@ class ContrastSegmentedImageEnhancer(ImagePreprocessor):
             self.image_rescaling = image_rescaling
 
         self.low_contrast_threshold = low_contrast_threshold
-
-    def preprocess_image(self, image: Image.Image) -> Tuple[Image.Image, dict]:
-        """Preprocess the image to be analyzed.
-
-        :param image: Loaded PIL image.
-
-        :return: The processed image and metadata (background color, scale percentage,
-             contrast level, and C value).
+        self.low_contrast_enhancer = LowContrastEnhancer(low_contrast_threshold)
+        self.otsu_threshold = OtsuThreshold()
+        self._stages = [
+            self.bilateral_filter,
+            self.low_contrast_enhancer,
+            self.adaptive_threshold,
+            self.otsu_threshold,
+            self.image_rescaling,
+        ]
+
+    def preprocess_array(
+        self, image: np.ndarray, dst: Optional[np.ndarray] = None
+    ) -> Tuple[np.ndarray, dict]:
+        """Run the stages of the pipeline on image pixels.
+
+        :param image: Image pixels (as a numpy array).
+        :param dst: Optional array to write the output of the last stage to.
+
+        :return: The processed pixels, in a new array (or dst), and the
+            metadata of the rescaling (scale_factor).
         """
-        image = self.convert_image_to_array(image)
-
-        # Apply bilateral filtering
-        filtered_image, _ = self.bilateral_filter.preprocess_image(image)
-
-        # Convert to grayscale
-        pil_filtered_image = Image.fromarray(np.uint8(filtered_image))
-        pil_grayscale_image = pil_filtered_image.convert("L")
-        grayscale_image = np.asarray(pil_grayscale_image)
-
-        # Improve contrast
-        adjusted_image, _, adjusted_contrast = self._improve_contrast(grayscale_image)
-
-        # Adaptive Thresholding
-        adaptive_threshold_image, _ = self.adaptive_threshold.preprocess_image(
-            adjusted_image
-        )
-        # Increase contrast
-        _, threshold_image = cv2.threshold(
-            np.asarray(adaptive_threshold_image),
-            0,
-            255,
-            cv2.THRESH_BINARY | cv2.THRESH_OTSU,
-        )
-
-        # Rescale image
-        rescaled_image, scale_metadata = self.image_rescaling.preprocess_image(
-            threshold_image
-        )
-
-        return rescaled_image, scale_metadata
+        processed_image, metadata = super().preprocess_array(image, dst)
+        return processed_image, {"scale_factor": metadata["scale_factor"]}
 
     def _improve_contrast(self, image: np.ndarray) -> Tuple[np.ndarray, str, str]:
         """Improve the contrast of an image based on its initial contrast level.
@@ -361,14 +816,4 @@ class ContrastSegmentedImageEnhancer(ImagePreprocessor):
         :return: A tuple containing the improved image, the initial contrast level,
              and the adjusted contrast level.
         """
-        contrast, mean_intensity = self._get_image_contrast(image)
-
-        if contrast <= self.low_contrast_threshold:
-            alpha = 1.5
-            beta = -mean_intensity * alpha
-            adjusted_image = cv2.convertScaleAbs(image, alpha=alpha, beta=beta)
-            adjusted_contrast, _ = self._get_image_contrast(adjusted_image)
-        else:
-            adjusted_image = image
-            adjusted_contrast = contrast
-        return adjusted_image, contrast, adjusted_contrast
+        return self.low_contrast_enhancer.improve_contrast(image)
@@ -1,4 +1,4 @@
-from typing import List, Optional, Tuple, Union
+from typing import Iterable, Iterator, List, Optional, Tuple, Union
 
 import presidio_analyzer  # required for isinstance check which throws an error when trying to specify PatternRecognizer  # noqa: E501
 from PIL import Image, ImageChops, ImageDraw
@@ -69,14 +69,7 @@ class ImageRedactorEngine:
                 **text_analyzer_kwargs,
             )
 
-        draw = ImageDraw.Draw(image)
-
-        for box in bboxes:
-            x0 = box.left
-            y0 = box.top
-            x1 = x0 + box.width
-            y1 = y0 + box.height
-            draw.rectangle([x0, y0, x1, y1], fill=fill)
+        self._draw_redaction_boxes(image, bboxes, fill)
 
         return image, bboxes
 
@@ -114,6 +107,75 @@ class ImageRedactorEngine:
 
         return redacted_image
 
+    def redact_batch(
+        self,
+        images: Iterable[Image.Image],
+        fill: Union[int, Tuple[int, int, int]] = (0, 0, 0),
+        ocr_kwargs: Optional[dict] = None,
+        ad_hoc_recognizers: Optional[List[PatternRecognizer]] = None,
+        batch_size: int = 8,
+        n_process: int = 1,
+        max_queue_size: Optional[int] = None,
+        **text_analyzer_kwargs,
+    ) -> Iterator[Image.Image]:
+        """Redact a stream of images, e.g. the pages of a document.
+
+        OCR of the next images is pipelined with the text analysis of the
+        images already OCRed, see ImageAnalyzerEngine.analyze_batch.
+        Please notice, this method duplicates each image, creates a new
+        instance and manipulate it.
+        :param images: PIL Images to be processed.
+        :param fill: colour to fill the shape - int (0-255) for
+        grayscale or Tuple(R, G, B) for RGB.
+        :param ocr_kwargs: Additional params for OCR methods.
+        :param ad_hoc_recognizers: List of PatternRecognizer objects to use
+        for ad-hoc recognizer.
+        :param batch_size: Number of texts analyzed together by the NLP engine.
+        :param n_process: Number of processes used for preprocessing and OCR.
+        :param max_queue_size: Maximum number of images OCRed ahead of the text
+        analysis.
+        :param text_analyzer_kwargs: Additional values for the analyze method
+        in AnalyzerEngine.
+
+        :return: Iterator of the redacted images, in the order of the images.
+        """
+        self._check_ad_hoc_recognizer_list(ad_hoc_recognizers)
+        if ad_hoc_recognizers is not None:
+            text_analyzer_kwargs["ad_hoc_recognizers"] = ad_hoc_recognizers
+
+        for image, bboxes in self.image_analyzer_engine._analyze_batch(
+            images,
+            ocr_kwargs,
+            batch_size,
+            n_process,
+            max_queue_size,
+            **text_analyzer_kwargs,
+        ):
+            image = ImageChops.duplicate(image)
+            self._draw_redaction_boxes(image, bboxes, fill)
+            yield image
+
+    @staticmethod
+    def _draw_redaction_boxes(
+        image: Image.Image,
+        bboxes: List[ImageRecognizerResult],
+        fill: Union[int, Tuple[int, int, int]],
+    ) -> None:
+        """Draw filled rectangles over the bounding boxes, in place.
+
+        :param image: PIL Image to redact.
+        :param bboxes: Bounding boxes of the entities to redact.
+        :param fill: colour to fill the shape.
+        """
+        draw = ImageDraw.Draw(image)
+
+        for box in bboxes:
+            x0 = box.left
+            y0 = box.top
+            x1 = x0 + box.width
+            y1 = y0 + box.height
+            draw.rectangle([x0, y0, x1, y1], fill=fill)
+
     @staticmethod
     def _check_ad_hoc_recognizer_list(
         ad_hoc_recognizers: Optional[List[PatternRecognizer]] = None,
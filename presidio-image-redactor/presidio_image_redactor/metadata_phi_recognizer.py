@@ -0,0 +1,145 @@
+import re
+from typing import TYPE_CHECKING, Dict, Iterable, List, Optional, Tuple
+
+from presidio_analyzer import AnalysisExplanation, LocalRecognizer, RecognizerResult
+
+if TYPE_CHECKING:
+    from presidio_analyzer.nlp_engine import NlpArtifacts
+
+# Characters which delimit the terms (same as \W in the deny-list regex
+# built by PatternRecognizer)
+_NON_WORD = re.compile(r"\W")
+
+# Key of the trie nodes which end a term
+_TERM_END = ""
+
+
+class MetadataPhiRecognizer(LocalRecognizer):
+    """Recognize the PHI found in DICOM metadata, e.g. patient names.
+
+    Equivalent to a PatternRecognizer with a deny list, but the terms are
+    stored in a trie (a deterministic automaton over case-folded characters)
+    instead of being compiled into a single regex alternation. Matching walks
+    the trie from each word boundary, so its cost does not grow with the
+    number of terms, and the terms do not need to be expanded into casing
+    variants as matching is case-insensitive. At each position, the longest
+    term ending at a word boundary is matched.
+
+    :param phi_list: Terms to detect.
+    :param supported_entity: Entity type of the detected terms.
+    :param score: Confidence score of the detected terms.
+    :param supported_language: Language of the recognizer.
+    :param name: Name of the recognizer.
+    """
+
+    def __init__(
+        self,
+        phi_list: Iterable[str],
+        supported_entity: str = "PERSON",
+        score: float = 1.0,
+        supported_language: str = "en",
+        name: Optional[str] = None,
+    ):
+        self.phi_list = list(phi_list)
+        self.score = score
+        self._trie: Dict[str, dict] = {}
+        for term in self.phi_list:
+            self._add_term(term)
+        super().__init__(
+            supported_entities=[supported_entity],
+            name=name,
+            supported_language=supported_language,
+        )
+
+    def load(self) -> None:  # noqa: D102
+        pass
+
+    def analyze(
+        self,
+        text: str,
+        entities: List[str],
+        nlp_artifacts: Optional["NlpArtifacts"] = None,
+    ) -> List[RecognizerResult]:
+        """Detect the metadata terms in the text.
+
+        :param text: Text to analyze.
+        :param entities: Entities this recognizer can detect.
+        :param nlp_artifacts: Not used by this recognizer.
+
+        :return: Results of the terms found in the text.
+        """
+        return [
+            RecognizerResult(
+                entity_type=self.supported_entities[0],
+                start=start,
+                end=end,
+                score=self.score,
+                analysis_explanation=AnalysisExplanation(
+                    recognizer=self.name,
+                    original_score=self.score,
+                    textual_explanation=(
+                        f"Detected by `{self.name}` using DICOM metadata"
+                    ),
+                ),
+                recognition_metadata={
+                    RecognizerResult.RECOGNIZER_NAME_KEY: self.name,
+                    RecognizerResult.RECOGNIZER_IDENTIFIER_KEY: self.id,
+                },
+            )
+            for start, end in self.find_terms(text)
+        ]
+
+    def find_terms(self, text: str) -> List[Tuple[int, int]]:
+        """Find the spans of the terms in the text, from left to right.
+
+        Terms must start and end at a word boundary (the start or end of the
+        text, or a non-word character). Matches do not overlap.
+
+        :param text: Text to search.
+
+        :return: Start and end offsets of each match.
+        """
+        folded = text.casefold()
+        if len(folded) != len(text):
+            # Some characters fold to several characters (e.g. "ß" to "ss")
+            folded = [char.casefold() for char in text]
+
+        length = len(text)
+        is_non_word = [False] * length
+        for match in _NON_WORD.finditer(text):
+            is_non_word[match.start()] = True
+
+        matches = []
+        start = 0
+        while start < length:
+            # Terms start at the start of the text or after a non-word character
+            if start == 0 or is_non_word[start - 1]:
+                node = self._trie
+                end = None
+                position = start
+                while position < length:
+                    node = node.get(folded[position])
+                    if node is None:
+                        break
+                    position += 1
+                    # Terms end at the end of the text or before a non-word character
+                    if _TERM_END in node and (
+                        position == length or is_non_word[position]
+                    ):
+                        end = position
+                if end is not None:
+                    matches.append((start, end))
+                    start = end
+                    continue
+            start += 1
+
+        return matches
+
+    def _add_term(self, term: str) -> None:
+        """Add a term to the trie, one case-folded character per node."""
+        if not term:
+            return
+        node = self._trie
+        for char in term:
+            node = node.setdefault(char.casefold(), {})
+        node[_TERM_END] = {}
@@ -0,0 +1,114 @@
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Optional
+
+import numpy as np
+from PIL import Image
+
+from presidio_image_redactor import OCR, TextRegionDetector
+
+
+class RegionOCR(OCR):
+    """OCR class that only performs OCR on the regions of an image with text.
+
+    Regions are found by a TextRegionDetector (e.g. fixed templates or
+    contour-based detection), cropped and OCRed in parallel with the wrapped
+    OCR engine. The word bounding boxes are then mapped back to the coordinates
+    of the whole image, so RegionOCR can be used wherever an OCR engine is.
+
+    :param ocr: OCR engine used on each region.
+    :param text_region_detector: Detector of the regions to OCR.
+    :param max_workers: Maximum number of regions to OCR in parallel
+        (defaults to the ThreadPoolExecutor default).
+    """
+
+    def __init__(
+        self,
+        ocr: OCR,
+        text_region_detector: TextRegionDetector,
+        max_workers: Optional[int] = None,
+    ):
+        self.ocr = ocr
+        self.text_region_detector = text_region_detector
+        self.max_workers = max_workers
+
+    def perform_ocr(self, image: object, **kwargs) -> dict:
+        """Perform OCR on the text regions of a given image.
+
+        :param image: PIL Image/numpy array or file path(str) to be processed
+        :param kwargs: Additional values for the perform_ocr method of the
+            wrapped OCR engine
+
+        :return: results dictionary containing bboxes and text for each detected word
+        """
+        image = self._load_image(image)
+        regions = self.text_region_detector.detect(image)
+        if not regions:
+            return {
+                key: [] for key in ["left", "top", "width", "height", "conf", "text"]
+            }
+
+        def ocr_region(region: Dict[str, int]) -> dict:
+            crop = image.crop(
+                (
+                    region["left"],
+                    region["top"],
+                    region["left"] + region["width"],
+                    region["top"] + region["height"],
+                )
+            )
+            return self.ocr.perform_ocr(crop, **kwargs)
+
+        if len(regions) == 1:
+            region_results = [ocr_region(regions[0])]
+        else:
+            with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+                region_results = list(executor.map(ocr_region, regions))
+
+        return self._merge_region_results(regions, region_results)
+
+    @staticmethod
+    def _merge_region_results(
+        regions: List[Dict[str, int]], region_results: List[dict]
+    ) -> dict:
+        """Combine the OCR results of each region into results for the whole image.
+
+        Blocks are numbered after those of the previous regions, so that the
+        (block_num, par_num, line_num, word_num) of tesseract-like results,
+        which are numbered within their block, stay unique in the whole image.
+
+        :param regions: Regions as bounding boxes (left, top, width, height).
+        :param region_results: OCR results of each region, in region coordinates.
+
+        :return: OCR results in the coordinates of the whole image.
+        """
+        ocr_result = {key: [] for key in region_results[0]}
+        block_offset = 0
+        for region, region_result in zip(regions, region_results):
+            last_block = block_offset
+            for key, values in region_result.items():
+                if key == "left":
+                    values = [x + region["left"] for x in values]
+                elif key == "top":
+                    values = [y + region["top"] for y in values]
+                elif key == "block_num":
+                    # Block 0 is the page itself
+                    values = [block + block_offset if block else 0 for block in values]
+                    last_block = max([block_offset, *values])
+                ocr_result.setdefault(key, []).extend(values)
+            block_offset = last_block
+
+        return ocr_result
+
+    @staticmethod
+    def _load_image(image: object) -> Image.Image:
+        """Load the image to process as a PIL image.
+
+        :param image: PIL Image/numpy array or file path(str) to be processed
+
+        :return: Loaded PIL image.
+        """
+        if isinstance(image, Image.Image):
+            return image
+        if isinstance(image, np.ndarray):
+            return Image.fromarray(image)
+        return Image.open(image)
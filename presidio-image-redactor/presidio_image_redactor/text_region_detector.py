@@ -0,0 +1,230 @@
+from abc import ABC, abstractmethod
+from typing import Dict, List
+
+import cv2
+import numpy as np
+from PIL import Image
+
+
+class TextRegionDetector(ABC):
+    """TextRegionDetector class that finds the regions of an image to OCR.
+
+    Used by RegionOCR to only OCR the parts of an image which may contain text,
+    instead of the whole image.
+    """
+
+    @abstractmethod
+    def detect(self, image: Image.Image) -> List[Dict[str, int]]:
+        """Detect the regions of the image which may contain text.
+
+        :param image: Loaded PIL image.
+
+        :return: Regions as bounding boxes (left, top, width, height) in pixels.
+        """
+        pass
+
+    @staticmethod
+    def merge_regions(
+        regions: List[Dict[str, int]], distance: int = 0
+    ) -> List[Dict[str, int]]:
+        """Merge regions which overlap or are closer than distance pixels.
+
+        :param regions: Regions as bounding boxes (left, top, width, height).
+        :param distance: Maximum gap in pixels between regions to merge.
+
+        :return: Merged regions, in reading order (rows of vertically
+        overlapping regions, top to bottom, each from left to right).
+        """
+        boxes = [
+            [r["left"], r["top"], r["left"] + r["width"], r["top"] + r["height"]]
+            for r in regions
+            if r["width"] > 0 and r["height"] > 0
+        ]
+
+        merged = True
+        while merged:
+            merged = False
+            remaining = []
+            for box in boxes:
+                for other in remaining:
+                    if (
+                        box[0] <= other[2] + distance
+                        and other[0] <= box[2] + distance
+                        and box[1] <= other[3] + distance
+                        and other[1] <= box[3] + distance
+                    ):
+                        other[0] = min(other[0], box[0])
+                        other[1] = min(other[1], box[1])
+                        other[2] = max(other[2], box[2])
+                        other[3] = max(other[3], box[3])
+                        merged = True
+                        break
+                else:
+                    remaining.append(box)
+            boxes = remaining
+
+        rows = []
+        for box in sorted(boxes, key=lambda b: b[1]):
+            if rows and box[1] < rows[-1][0]:
+                rows[-1][0] = max(rows[-1][0], box[3])
+                rows[-1][1].append(box)
+            else:
+                rows.append([box[3], [box]])
+
+        return [
+            {"left": left, "top": top, "width": right - left, "height": bottom - top}
+            for _, row in rows
+            for left, top, right, bottom in sorted(row, key=lambda b: b[0])
+        ]
+
+
+class TemplateTextRegionDetector(TextRegionDetector):
+    """Return fixed regions of interest, e.g. the header or corners of a form.
+
+    Regions are given relative to the image size, so that a template applies to
+    images of any resolution, e.g. {"left": 0, "top": 0, "width": 1, "height": 0.1}
+    for the top 10% of the image.
+
+    :param regions: Regions of interest as bounding boxes (left, top, width,
+        height) with values between 0 and 1.
+    """
+
+    def __init__(self, regions: List[Dict[str, float]]):
+        if not regions:
+            raise ValueError("At least one region must be provided")
+        for region in regions:
+            left, top = region["left"], region["top"]
+            width, height = region["width"], region["height"]
+            if min(left, top) < 0 or width <= 0 or height <= 0:
+                raise ValueError(f"Invalid region {region}")
+            if left + width > 1 or top + height > 1:
+                raise ValueError(
+                    f"Region {region} must be relative to the image size (0-1)"
+                )
+        self.regions = regions
+
+    def detect(self, image: Image.Image) -> List[Dict[str, int]]:
+        """Scale the template regions to the image size.
+
+        :param image: Loaded PIL image.
+
+        :return: Regions as bounding boxes (left, top, width, height) in pixels.
+        """
+        image_width, image_height = image.size
+        regions = []
+        for region in self.regions:
+            left = int(np.floor(region["left"] * image_width))
+            top = int(np.floor(region["top"] * image_height))
+            right = int(np.ceil((region["left"] + region["width"]) * image_width))
+            bottom = int(np.ceil((region["top"] + region["height"]) * image_height))
+            regions.append(
+                {
+                    "left": left,
+                    "top": top,
+                    "width": min(right, image_width) - left,
+                    "height": min(bottom, image_height) - top,
+                }
+            )
+
+        return self.merge_regions(regions)
+
+
+class ContourTextRegionDetector(TextRegionDetector):
+    """Detect text blocks from the contours of high-contrast strokes.
+
+    The image is downscaled, its morphological gradient is binarized and
+    closed horizontally and vertically so that characters merge into text
+    blocks, and the bounding boxes of the resulting contours are kept if they
+    are dense enough to be text. Regions are padded by margin pixels and merged
+    when closer than merge_distance pixels, so that the OCR gets whole blocks
+    of text with some background around them.
+
+    The detector favors recall: regions with any text-like strokes are kept,
+    so photos and medical images with a lot of texture may end up being
+    OCRed almost entirely.
+
+    :param max_size: Size in pixels to downscale the longest image side to
+        before detection.
+    :param min_height: Minimum height in pixels of a text region (at full size).
+    :param min_density: Minimum fraction of stroke pixels in a text region.
+    :param margin: Padding in pixels added around each region (at full size).
+    :param merge_distance: Maximum gap in pixels between regions to merge
+        (at full size).
+    """
+
+    def __init__(
+        self,
+        max_size: int = 1600,
+        min_height: int = 8,
+        min_density: float = 0.1,
+        margin: int = 10,
+        merge_distance: int = 50,
+    ):
+        if max_size <= 0:
+            raise ValueError("max_size must be greater than 0")
+        if not 0 <= min_density <= 1:
+            raise ValueError("min_density must be between 0 and 1")
+        if margin < 0 or merge_distance < 0:
+            raise ValueError("margin and merge_distance must be non-negative")
+        self.max_size = max_size
+        self.min_height = min_height
+        self.min_density = min_density
+        self.margin = margin
+        self.merge_distance = merge_distance
+
+    def detect(self, image: Image.Image) -> List[Dict[str, int]]:
+        """Detect the text blocks of the image.
+
+        :param image: Loaded PIL image.
+
+        :return: Regions as bounding boxes (left, top, width, height) in pixels.
+        """
+        image_width, image_height = image.size
+        scale = min(1.0, self.max_size / max(image_width, image_height))
+        gray = np.asarray(image.convert("L"))
+        if scale < 1.0:
+            gray = cv2.resize(
+                gray, None, fx=scale, fy=scale, interpolation=cv2.INTER_AREA
+            )
+
+        # Strokes: pixels at a sharp change of intensity
+        gradient = cv2.morphologyEx(
+            gray,
+            cv2.MORPH_GRADIENT,
+            cv2.getStructuringElement(cv2.MORPH_ELLIPSE, (3, 3)),
+        )
+        _, strokes = cv2.threshold(
+            gradient, 0, 255, cv2.THRESH_BINARY | cv2.THRESH_OTSU
+        )
+
+        # Connect the characters of words and lines into blocks
+        blocks = cv2.morphologyEx(
+            strokes, cv2.MORPH_CLOSE, cv2.getStructuringElement(cv2.MORPH_RECT, (9, 3))
+        )
+        contours, _ = cv2.findContours(
+            blocks, cv2.RETR_EXTERNAL, cv2.CHAIN_APPROX_SIMPLE
+        )
+
+        regions = []
+        for contour in contours:
+            x, y, w, h = cv2.boundingRect(contour)
+            if h < self.min_height * scale:
+                continue
+            density = cv2.countNonZero(strokes[y : y + h, x : x + w]) / (w * h)
+            if density < self.min_density:
+                continue
+
+            left = max(0, int(np.floor(x / scale)) - self.margin)
+            top = max(0, int(np.floor(y / scale)) - self.margin)
+            right = min(image_width, int(np.ceil((x + w) / scale)) + self.margin)
+            bottom = min(image_height, int(np.ceil((y + h) / scale)) + self.margin)
+            regions.append(
+                {
+                    "left": left,
+                    "top": top,
+                    "width": right - left,
+                    "height": bottom - top,
+                }
+            )
+
+        return self.merge_regions(regions, self.merge_distance)
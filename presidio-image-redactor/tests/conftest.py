@@ -2,10 +2,13 @@ import pydicom
 import json
 import os
 
+import numpy as np
 from PIL import Image
+from presidio_analyzer import AnalyzerEngine, PatternRecognizer
+from presidio_analyzer.recognizer_registry import RecognizerRegistry
 from presidio_analyzer.recognizer_result import RecognizerResult
 
-from presidio_image_redactor import ImageAnalyzerEngine
+from presidio_image_redactor import OCR, ImageAnalyzerEngine
 from presidio_image_redactor.entities import ImageRecognizerResult
 import pytest
 
@@ -122,3 +125,33 @@ def get_dummy_nlp_engine():
             return ["en"]
 
     return DummyNlpEngine()
+
+
+class PixelValueOCR(OCR):
+    """Fake OCR reading the name written as the value of the first pixel."""
+
+    names = {1: "John", 2: "Jane", 3: "Bob"}
+
+    def perform_ocr(self, image, **kwargs):
+        name = self.names[int(np.asarray(image)[0, 0])]
+        return {
+            "left": [10, 50],
+            "top": [5, 5],
+            "width": [35, 30],
+            "height": [12, 12],
+            "conf": [95, 95],
+            "text": ["Patient", name],
+        }
+
+
+@pytest.fixture(scope="function")
+def batch_image_analyzer_engine(get_dummy_nlp_engine, monkeypatch):
+    monkeypatch.setattr(
+        get_dummy_nlp_engine,
+        "process_batch",
+        lambda texts, language, **kwargs: ((text, None) for text in texts),
+    )
+    recognizer = PatternRecognizer(supported_entity="PERSON", deny_list=["John", "Bob"])
+    registry = RecognizerRegistry(recognizers=[recognizer])
+    analyzer_engine = AnalyzerEngine(nlp_engine=get_dummy_nlp_engine, registry=registry)
+    return ImageAnalyzerEngine(analyzer_engine=analyzer_engine, ocr=PixelValueOCR())
@@ -12,6 +12,10 @@ from presidio_image_redactor import (
     BilateralFilter,
     SegmentedAdaptiveThreshold,
     ImageRescaling,
+    ImagePreprocessingPipeline,
+    ImageStatistics,
+    LowContrastEnhancer,
+    OtsuThreshold,
 )
 
 
@@ -98,6 +102,14 @@ def test_contrast_segmented_image_enhancer_preprocess_image():
     assert "scale_factor" in metadata
 
 
+def test_contrast_segmented_image_enhancer_builds_its_stages_once():
+    preprocessor = ContrastSegmentedImageEnhancer(skip_binary_images=True)
+    stages = preprocessor.stages
+    _, metadata = preprocessor.preprocess_image(get_resource_image("ocr_test.png"))
+    assert list(metadata) == ["scale_factor"]
+    assert all(a is b for a, b in zip(preprocessor.stages, stages))
+
+
 def test_contrast_segmented_image_enhancer__improve_contrast():
     preprocessor = ContrastSegmentedImageEnhancer()
     image = get_resource_image("ocr_test.png")
@@ -135,3 +147,61 @@ def test_preprocess_image_with_ndarray():
 
         # Assert 'convert_image_to_array' was not called
         mocked_function.assert_not_called()
+
+
+def _make_scan(binary: bool) -> np.ndarray:
+    rnd = np.random.default_rng(0)
+    if binary:
+        image = np.full((200, 300), 255, dtype=np.uint8)
+        image[50:60, 20:280] = 0
+        image[100:110, 20:200] = 0
+        return image
+    return rnd.integers(60, 200, (200, 300), dtype=np.uint8)
+
+
+def test_given_binary_image_then_image_statistics_probe_detects_it():
+    statistics = ImageStatistics.probe(_make_scan(binary=True))
+    assert statistics.is_binary
+    assert statistics.background_color == 255
+
+
+def test_given_noisy_image_then_image_statistics_probe_is_not_binary():
+    statistics = ImageStatistics.probe(_make_scan(binary=False))
+    assert not statistics.is_binary
+    assert 120 < statistics.mean < 140
+
+
+def test_given_binary_image_then_pipeline_skips_stages_and_times_the_others():
+    pipeline = ImagePreprocessingPipeline(
+        [BilateralFilter(), SegmentedAdaptiveThreshold(), OtsuThreshold()]
+    )
+    _, metadata = pipeline.preprocess_image(Image.fromarray(_make_scan(binary=True)))
+    assert metadata["skipped_stages"] == ["BilateralFilter", "SegmentedAdaptiveThreshold"]
+    assert list(metadata["stage_seconds"]) == ["OtsuThreshold"]
+
+
+def test_given_consecutive_calls_then_pipeline_outputs_are_not_overwritten():
+    pipeline = ImagePreprocessingPipeline(
+        [BilateralFilter(), LowContrastEnhancer(), OtsuThreshold()],
+        skip_binary_images=False,
+    )
+    first, _ = pipeline.preprocess_array(_make_scan(binary=False))
+    expected = first.copy()
+    pipeline.preprocess_array(_make_scan(binary=True))
+    np.testing.assert_array_equal(first, expected)
+
+
+def test_contrast_segmented_image_enhancer_matches_its_stages_applied_in_order():
+    image = get_resource_image("ocr_test.png")
+    expected = np.asarray(image.convert("L"))
+    for stage in [
+        BilateralFilter(),
+        LowContrastEnhancer(),
+        SegmentedAdaptiveThreshold(),
+        OtsuThreshold(),
+        ImageRescaling(),
+    ]:
+        expected = stage.preprocess_array(expected)[0]
+
+    preprocessed_image, _ = ContrastSegmentedImageEnhancer().preprocess_image(image)
+    np.testing.assert_array_equal(np.asarray(preprocessed_image), expected)
@@ -0,0 +1,126 @@
+import pickle
+
+import numpy as np
+import pytest
+from PIL import Image
+
+from presidio_image_redactor import OCR, CachedOCR
+
+
+class CountingOCR(OCR):
+    """Fake OCR which counts its calls and returns the mean pixel value"""
+
+    def __init__(self):
+        self.calls = 0
+
+    def perform_ocr(self, image, **kwargs):
+        self.calls += 1
+        return {
+            "left": [np.int64(1)],
+            "top": [2],
+            "width": [3],
+            "height": [4],
+            "conf": [kwargs.get("conf", 90.0)],
+            "text": [str(int(np.asarray(image).mean()))],
+        }
+
+
+def make_image(value: int) -> Image.Image:
+    return Image.fromarray(np.full((20, 30), value, dtype=np.uint8))
+
+
+def test_given_identical_pixels_then_ocr_is_performed_once():
+    ocr = CountingOCR()
+    cached_ocr = CachedOCR(ocr)
+
+    first = cached_ocr.perform_ocr(make_image(10))
+    second = cached_ocr.perform_ocr(make_image(10))
+
+    assert ocr.calls == 1
+    assert first == second
+    assert (cached_ocr.hits, cached_ocr.misses) == (1, 1)
+
+
+@pytest.mark.parametrize(
+    "image, kwargs",
+    [
+        (make_image(11), {}),
+        (make_image(10), {"conf": 50.0}),
+        (np.full((20, 30), 10, dtype=np.uint8), {}),
+        (make_image(10).convert("RGB"), {}),
+    ],
+)
+def test_given_other_pixels_or_kwargs_then_ocr_is_performed_again(image, kwargs):
+    ocr = CountingOCR()
+    cached_ocr = CachedOCR(ocr)
+
+    cached_ocr.perform_ocr(make_image(10))
+    cached_ocr.perform_ocr(image, **kwargs)
+
+    assert ocr.calls == 2
+
+
+def test_given_cached_results_modified_by_caller_then_cache_is_unchanged():
+    cached_ocr = CachedOCR(CountingOCR())
+
+    cached_ocr.perform_ocr(make_image(10))["text"].clear()
+
+    assert cached_ocr.perform_ocr(make_image(10))["text"] == ["10"]
+
+
+def test_given_cache_dir_then_results_are_shared_between_instances(tmp_path):
+    CachedOCR(CountingOCR(), cache_dir=tmp_path).perform_ocr(make_image(10))
+
+    ocr = CountingOCR()
+    results = CachedOCR(ocr, cache_dir=tmp_path).perform_ocr(make_image(10))
+
+    assert ocr.calls == 0
+    assert results["left"] == [1]
+    assert results["text"] == ["10"]
+
+
+def test_given_other_namespace_then_disk_results_are_not_shared(tmp_path):
+    CachedOCR(CountingOCR(), cache_dir=tmp_path).perform_ocr(make_image(10))
+
+    ocr = CountingOCR()
+    CachedOCR(ocr, cache_dir=tmp_path, namespace="other").perform_ocr(make_image(10))
+
+    assert ocr.calls == 1
+
+
+def test_given_unwritable_cache_dir_then_ocr_results_are_returned(tmp_path):
+    # A file instead of a directory, as permissions are ignored when run as root
+    cache_dir = tmp_path / "cache"
+    cache_dir.write_text("")
+    ocr = CountingOCR()
+
+    results = CachedOCR(ocr, cache_dir=cache_dir).perform_ocr(make_image(10))
+
+    assert ocr.calls == 1
+    assert results["text"] == ["10"]
+
+
+def test_given_max_entries_then_least_recently_used_results_are_evicted():
+    ocr = CountingOCR()
+    cached_ocr = CachedOCR(ocr, max_entries=2)
+
+    for value in [1, 2, 1, 3, 1, 2]:
+        cached_ocr.perform_ocr(make_image(value))
+
+    # 2 was evicted by 3 as 1 was used more recently
+    assert ocr.calls == 4
+
+
+def test_given_pickled_cached_ocr_then_results_are_kept():
+    cached_ocr = CachedOCR(CountingOCR())
+    cached_ocr.perform_ocr(make_image(10))
+
+    unpickled = pickle.loads(pickle.dumps(cached_ocr))
+    unpickled.perform_ocr(make_image(10))
+
+    assert unpickled.ocr.calls == 1
+
+
+def test_given_negative_max_entries_then_raises_error():
+    with pytest.raises(ValueError):
+        CachedOCR(CountingOCR(), max_entries=-1)
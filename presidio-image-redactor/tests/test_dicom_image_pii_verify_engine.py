@@ -52,6 +52,18 @@ def test_init_happy_path(ocr_engine: TesseractOCR, image_analyzer_engine: ImageA
         raise TypeError("Invalid input into initializing")
 
 
+def test_init_uses_ocr_engine_of_image_analyzer_engine(mocker):
+    """Test that the OCR engine (e.g. a CachedOCR) is shared with the analyzer"""
+    ocr_engine = TesseractOCR()
+    image_analyzer_engine = ImageAnalyzerEngine(
+        analyzer_engine=mocker.MagicMock(), ocr=ocr_engine
+    )
+
+    test_engine = DicomImagePiiVerifyEngine(image_analyzer_engine=image_analyzer_engine)
+
+    assert test_engine.ocr_engine is ocr_engine
+
+
 # ------------------------------------------------------
 # DicomImagePiiVerifyEngine.verify_dicom_instance()
 # ------------------------------------------------------
@@ -1131,6 +1131,195 @@ def test_add_redact_box_happy_path(
     assert box_color_pixels_redacted > box_color_pixels_original
 
 
+def test_copy_dicom_instance_shares_pixel_data_bytes_only():
+    """Test _copy_dicom_instance copies elements but not the decoded pixels"""
+    # Arrange
+    test_instance = pydicom.dcmread(Path(TEST_DICOM_DIR_2, "2_ORIGINAL.dicom"))
+    original_pixel_array = test_instance.pixel_array
+
+    # Act
+    test_copy = DicomImageRedactorEngine._copy_dicom_instance(test_instance)
+    test_copy.PatientName = "REDACTED"
+
+    # Assert
+    assert test_copy is not test_instance
+    assert test_instance.PatientName != "REDACTED"
+    assert test_copy.PixelData is test_instance.PixelData
+    assert test_copy.pixel_array is not original_pixel_array
+    assert np.array_equal(test_copy.pixel_array, original_pixel_array)
+
+
+@pytest.mark.parametrize("in_place", [True, False])
+def test_add_redact_box_in_place(in_place: bool):
+    """Test _add_redact_box only modifies the given instance if in_place"""
+    # Arrange
+    test_instance = pydicom.dcmread(Path(TEST_DICOM_DIR_2, "2_ORIGINAL.dicom"))
+    original_pixel_data = test_instance.PixelData
+    bboxes = [{"top": 0, "left": 0, "width": 100, "height": 100}]
+
+    # Act
+    test_redacted_instance = DicomImageRedactorEngine._add_redact_box(
+        test_instance, bboxes, 0.75, "contrast", in_place=in_place
+    )
+
+    # Assert
+    assert test_redacted_instance.PixelData != original_pixel_data
+    assert (test_redacted_instance is test_instance) == in_place
+    assert (test_instance.PixelData == original_pixel_data) != in_place
+
+
+@pytest.mark.parametrize("is_greyscale", [True, False])
+def test_rescale_dcm_pixel_array_in_blocks(mocker, is_greyscale: bool):
+    """Test rescaling block by block gives the same result as in one block"""
+    # Arrange
+    dcm_file = "2_ORIGINAL.dicom" if is_greyscale else "RGB_ORIGINAL.dcm"
+    dcm_dir = TEST_DICOM_DIR_2 if is_greyscale else TEST_DICOM_PARENT_DIR
+    test_instance = pydicom.dcmread(Path(dcm_dir, dcm_file))
+    expected_array = DicomImageRedactorEngine._rescale_dcm_pixel_array(
+        test_instance, is_greyscale
+    )
+    mocker.patch(
+        "presidio_image_redactor.dicom_image_redactor_engine.RESCALE_BLOCK_SIZE",
+        1000,
+    )
+
+    # Act
+    test_array = DicomImageRedactorEngine._rescale_dcm_pixel_array(
+        test_instance, is_greyscale
+    )
+
+    # Assert
+    assert test_array.dtype == np.uint8
+    assert np.array_equal(test_array, expected_array)
+
+
+def _make_multiframe_instance(pixels: np.ndarray) -> pydicom.dataset.FileDataset:
+    """Create an uncompressed 8-bit greyscale multi-frame instance"""
+    file_meta = pydicom.dataset.FileMetaDataset()
+    file_meta.TransferSyntaxUID = pydicom.uid.ExplicitVRLittleEndian
+    instance = pydicom.dataset.FileDataset(None, {}, file_meta=file_meta, preamble=b"\0" * 128)
+    instance.NumberOfFrames = pixels.shape[0]
+    instance.Rows = pixels.shape[1]
+    instance.Columns = pixels.shape[2]
+    instance.SamplesPerPixel = 1
+    instance.PhotometricInterpretation = "MONOCHROME2"
+    instance.BitsAllocated = 8
+    instance.BitsStored = 8
+    instance.HighBit = 7
+    instance.PixelRepresentation = 0
+    instance.PixelData = pixels.astype(np.uint8).tobytes()
+    return instance
+
+
+def test_get_frame_hashes_changes_with_text_anywhere_on_the_frame():
+    """Test _get_frame_hashes changes when text is added anywhere on a frame"""
+    # Arrange
+    frames = np.zeros((4, 64, 64), dtype=np.uint8)
+    frames[:, 5:15, 5:30] = 200
+    frames[2, 8:10, 12:14] = 0  # A different character in frame 2
+    frames[3, 50:58, 40:60] = 255  # New text elsewhere in frame 3
+
+    # Act
+    hashes = DicomImageRedactorEngine._get_frame_hashes(frames)
+    distances = np.abs(hashes - hashes[0]).max(axis=1)
+
+    # Assert
+    assert hashes.shape == (4, 256)
+    assert distances[1] == 0
+    assert distances[2] > 8
+    assert distances[3] > 8
+
+
+def test_get_frame_hashes_of_rgb_frames():
+    """Test _get_frame_hashes compares RGB frames on their mean intensity"""
+    # Arrange
+    frames = np.zeros((2, 10, 10, 3), dtype=np.uint8)
+    frames[1, 9, 9] = 255
+
+    # Act
+    hashes = DicomImageRedactorEngine._get_frame_hashes(frames)
+
+    # Assert
+    assert hashes.shape == (2, 9)
+    assert np.abs(hashes[1] - hashes[0]).max() > 8
+
+
+@pytest.mark.parametrize(
+    "deduplicate_frames, expected_analyzed_frames",
+    [(True, [0, 3, 5]), (False, [0, 1, 2, 3, 4, 5])],
+)
+def test_get_multiframe_bboxes_reuses_bboxes_of_unchanged_frames(
+    mocker,
+    monkeypatch,
+    mock_engine: DicomImageRedactorEngine,
+    deduplicate_frames: bool,
+    expected_analyzed_frames: list,
+):
+    """Test _get_multiframe_bboxes only analyzes frames which changed"""
+    # Arrange
+    frames = np.zeros((6, 64, 64), dtype=np.uint8)
+    frames[:, 40:, :] = np.random.randint(255, size=(24, 64))
+    frames[:, 5:15, 5:30] = 200
+    frames[3:, 5:15, 5:30] = 100  # The overlay changes from frame 3
+    frames[5, 50:58, 40:60] = 255  # New text appears elsewhere in frame 5
+    frames[:, 0, 0] = np.arange(6)  # Tell frames apart, within the tolerance
+    monkeypatch.setattr(mock_engine, "deduplicate_frames", deduplicate_frames)
+    mocker.patch.object(
+        DicomImageRedactorEngine, "_get_padded_image", side_effect=lambda frame, *args: frame
+    )
+    analyzed_frames = []
+
+    def mock_get_image_bboxes(frame, *args, **kwargs):
+        analyzed_frames.append(int(np.flatnonzero((frames == frame).all(axis=(1, 2)))[0]))
+        return [{"left": 5, "top": 5, "width": 25, "height": 10, "entity_type": "PERSON"}]
+
+    mocker.patch.object(
+        DicomImageRedactorEngine, "_get_image_bboxes", side_effect=mock_get_image_bboxes
+    )
+
+    # Act
+    test_bboxes = mock_engine._get_multiframe_bboxes(frames, True, None, 0, False)
+
+    # Assert
+    assert analyzed_frames == expected_analyzed_frames
+    assert test_bboxes == [
+        {
+            "left": 5,
+            "top": 5,
+            "width": 25,
+            "height": 10,
+            "entity_type": "PERSON",
+            "frames": [0, 1, 2, 3, 4, 5],
+        }
+    ]
+
+
+def test_add_redact_box_multiframe():
+    """Test _add_redact_box masks each bounding box on its frames only"""
+    # Arrange
+    pixels = np.full((3, 20, 30), 50, dtype=np.uint8)
+    pixels[:, 0, 0] = 60
+    test_instance = _make_multiframe_instance(pixels)
+    bboxes = [
+        {"left": 2, "top": 2, "width": 5, "height": 3, "frames": [0, 2]},
+        {"left": 10, "top": 10, "width": 4, "height": 4},
+    ]
+
+    # Act
+    test_redacted_instance = DicomImageRedactorEngine._add_redact_box(
+        test_instance, bboxes, 0.75, "contrast"
+    )
+
+    # Assert
+    redacted_pixels = test_redacted_instance.pixel_array
+    assert redacted_pixels.shape == pixels.shape
+    assert (redacted_pixels[[0, 2], 2:5, 2:7] == 10).all()
+    assert (redacted_pixels[1, 2:5, 2:7] == 50).all()
+    assert (redacted_pixels[:, 10:14, 10:14] == 10).all()
+    assert np.count_nonzero(redacted_pixels != pixels) == 2 * 15 + 3 * 16
+    assert test_instance.PixelData == pixels.tobytes()
+
+
 # ------------------------------------------------------
 # DicomImageRedactorEngine._get_analyzer_results()
 # ------------------------------------------------------
@@ -1191,10 +1380,10 @@ def test_get_analyzer_results_happy_path(
     )
     mock_make_phi_list = mocker.patch(
         "presidio_image_redactor.dicom_image_redactor_engine.DicomImageRedactorEngine._make_phi_list",
-        return_value=None,
+        return_value=[],
     )
-    mock_pattern_recognizer = mocker.patch(
-        "presidio_image_redactor.dicom_image_redactor_engine.PatternRecognizer",
+    mock_metadata_recognizer = mocker.patch(
+        "presidio_image_redactor.dicom_image_redactor_engine.MetadataPhiRecognizer",
         return_value=None,
     )
     test_instance = pydicom.dcmread(dcm_path)
@@ -1213,12 +1402,59 @@ def test_get_analyzer_results_happy_path(
         mock_analyze.assert_called_once()
         mock_get_text_metadata.assert_not_called()
         mock_make_phi_list.assert_not_called()
-        mock_pattern_recognizer.assert_not_called()
+        mock_metadata_recognizer.assert_not_called()
     elif use_metadata is True:
         mock_analyze.assert_called_once()
         mock_get_text_metadata.assert_called_once()
         mock_make_phi_list.assert_called_once()
-        mock_pattern_recognizer.assert_called_once()
+        mock_metadata_recognizer.assert_called_once()
+
+
+def test_get_metadata_recognizer_is_cached_per_series_and_metadata(
+    mock_engine: DicomImageRedactorEngine,
+):
+    """Test that instances of a series sharing metadata reuse the recognizer"""
+    # Arrange
+    def make_instance(sop_instance_uid: str, patient_name: str) -> pydicom.Dataset:
+        instance = pydicom.Dataset()
+        instance.StudyInstanceUID = "1.2.3"
+        instance.SeriesInstanceUID = "1.2.3.4"
+        instance.SOPInstanceUID = sop_instance_uid
+        instance.PatientName = patient_name
+        return instance
+
+    # Act
+    first = mock_engine._get_metadata_recognizer(make_instance("1", "DOE^JOHN"))
+    second = mock_engine._get_metadata_recognizer(make_instance("2", "DOE^JOHN"))
+    other = mock_engine._get_metadata_recognizer(make_instance("3", "ROE^JANE"))
+
+    # Assert
+    assert first is second
+    assert other is not first
+    assert first.find_terms("Patient: doe john") == [(9, 17)]
+    assert other.find_terms("Patient: doe john") == []
+
+
+def test_get_metadata_recognizer_builds_phi_list_only_on_cache_miss(
+    mock_engine: DicomImageRedactorEngine, mocker
+):
+    """Test that the PHI list is not built again for cached metadata"""
+    # Arrange
+    mock_engine._metadata_recognizers.clear()
+    instance = pydicom.Dataset()
+    instance.StudyInstanceUID = "1.2.3"
+    instance.SeriesInstanceUID = "1.2.3.4"
+    instance.PatientName = "DOE^JOHN"
+    spy_make_phi_list = mocker.spy(DicomImageRedactorEngine, "_make_phi_list")
+
+    # Act
+    mock_engine._get_metadata_recognizer(instance)
+    mock_engine._get_metadata_recognizer(instance)
+    instance.PatientName = "ROE^JANE"
+    mock_engine._get_metadata_recognizer(instance)
+
+    # Assert
+    assert spy_make_phi_list.call_count == 2
 
 
 @pytest.mark.parametrize(
@@ -1861,3 +2097,172 @@ def test_DicomImageRedactorEngine_redact_from_directory_exceptions(
 
     # Assert
     assert expected_error_type == exc_info.typename
+
+
+@pytest.mark.parametrize(
+    "n_process, resume",
+    [
+        (2, False),
+        (None, False),
+        (1, True),
+    ],
+)
+def test_DicomImageRedactorEngine_redact_from_directory_without_copy(
+    mocker,
+    mock_engine: DicomImageRedactorEngine,
+    n_process: Optional[int],
+    resume: bool,
+):
+    """Test redact_from_directory() streams to the output dir without copying
+
+    Args:
+        mock_engine (DicomImageRedactorEngine): DicomImageRedactorEngine object.
+        n_process (int): Number of worker processes.
+        resume (bool): True if skipping already redacted files.
+    """
+    # Arrange
+    mock_copy_files = mocker.patch(
+        "presidio_image_redactor.dicom_image_redactor_engine.DicomImageRedactorEngine._copy_files_for_processing",
+    )
+    mock_report = mocker.MagicMock(output_dir="output/dicom_dir_1")
+    mock_redact_to_output = mocker.patch(
+        "presidio_image_redactor.dicom_image_redactor_engine.DicomImageRedactorEngine._redact_directory_to_output",
+        return_value=mock_report,
+    )
+
+    # Act
+    report = mock_engine.redact_from_directory(
+        TEST_DICOM_DIR_1, "output", n_process=n_process, resume=resume
+    )
+
+    # Assert
+    assert report is mock_report
+    assert mock_copy_files.call_count == 0
+    assert mock_redact_to_output.call_count == 1
+    assert mock_redact_to_output.call_args.kwargs["n_process"] == n_process
+    assert mock_redact_to_output.call_args.kwargs["resume"] == resume
+
+
+def _fake_redact_dicom_file(self, src_path: Path, dst_path: Path, **kwargs):
+    """Copy the file instead of redacting it, failing for files named 'bad'."""
+    if src_path.stem == "bad":
+        raise ValueError("cannot redact")
+    dst_path.parent.mkdir(parents=True, exist_ok=True)
+    dst_path.write_bytes(src_path.read_bytes())
+
+
+@pytest.mark.parametrize("n_process", [1, 2])
+def test_DicomImageRedactorEngine_redact_directory_to_output_isolates_errors(
+    mocker,
+    mock_engine: DicomImageRedactorEngine,
+    n_process: int,
+):
+    """Test _redact_directory_to_output() reports failed files and continues
+
+    Args:
+        mock_engine (DicomImageRedactorEngine): DicomImageRedactorEngine object.
+        n_process (int): Number of worker processes.
+    """
+    # Arrange
+    mocker.patch(
+        "presidio_image_redactor.dicom_image_redactor_engine.DicomImageRedactorEngine._redact_dicom_file",
+        new=_fake_redact_dicom_file,
+    )
+
+    with tempfile.TemporaryDirectory() as tmpdirname:
+        src_dir = Path(tmpdirname, "src")
+        for name in ["a.dcm", "bad.dcm", "nested/b.DCM", "nested/c.dicom"]:
+            Path(src_dir, name).parent.mkdir(parents=True, exist_ok=True)
+            Path(src_dir, name).write_bytes(name.encode())
+
+        # Act
+        report = mock_engine._redact_directory_to_output(
+            src_dir=src_dir,
+            dst_parent_dir=Path(tmpdirname, "out"),
+            n_process=n_process,
+            resume=False,
+            verbose=False,
+        )
+
+        # Assert
+        assert report.total == 4
+        assert report.redacted == 3
+        assert list(report.failed) == [str(Path(src_dir, "bad.dcm"))]
+        assert "ValueError: cannot redact" in report.failed[str(Path(src_dir, "bad.dcm"))]
+        assert Path(tmpdirname, "out", "src", "nested", "c.dicom").read_bytes() == b"nested/c.dicom"
+        assert not Path(tmpdirname, "out", "src", "bad.dcm").exists()
+
+
+def test_DicomImageRedactorEngine_redact_directory_to_output_resume(
+    mocker,
+    mock_engine: DicomImageRedactorEngine,
+):
+    """Test _redact_directory_to_output() skips existing outputs when resuming
+
+    Args:
+        mock_engine (DicomImageRedactorEngine): DicomImageRedactorEngine object.
+    """
+    # Arrange
+    mock_redact_file = mocker.patch(
+        "presidio_image_redactor.dicom_image_redactor_engine.DicomImageRedactorEngine._redact_dicom_file",
+    )
+
+    with tempfile.TemporaryDirectory() as tmpdirname:
+        src_dir = Path(tmpdirname, "src")
+        src_dir.mkdir()
+        Path(src_dir, "done.dcm").write_bytes(b"")
+        Path(src_dir, "todo.dcm").write_bytes(b"")
+        Path(tmpdirname, "out", "src").mkdir(parents=True)
+        Path(tmpdirname, "out", "src", "done.dcm").write_bytes(b"")
+
+        # Act
+        with pytest.raises(FileExistsError):
+            mock_engine._redact_directory_to_output(
+                src_dir, Path(tmpdirname, "out"), n_process=1, resume=False, verbose=False
+            )
+        report = mock_engine._redact_directory_to_output(
+            src_dir, Path(tmpdirname, "out"), n_process=1, resume=True, verbose=False
+        )
+
+    # Assert
+    assert (report.total, report.redacted, report.skipped) == (2, 1, 1)
+    assert mock_redact_file.call_count == 1
+    assert mock_redact_file.call_args.args[0] == Path(src_dir, "todo.dcm")
+
+
+def test_DicomImageRedactorEngine_redact_dicom_file_writes_atomically(
+    mocker,
+    mock_engine: DicomImageRedactorEngine,
+):
+    """Test _redact_dicom_file() leaves no output when writing fails
+
+    Args:
+        mock_engine (DicomImageRedactorEngine): DicomImageRedactorEngine object.
+    """
+    # Arrange
+    src_path = Path(TEST_DICOM_PARENT_DIR, "RGB_ORIGINAL.dcm")
+    instance = pydicom.dcmread(src_path)
+    mocker.patch(
+        "presidio_image_redactor.dicom_image_redactor_engine.DicomImageRedactorEngine._redact_loaded_instance",
+        return_value=(instance, [{"top": 0, "left": 0, "width": 1, "height": 1}]),
+    )
+
+    with tempfile.TemporaryDirectory() as tmpdirname:
+        dst_path = Path(tmpdirname, "nested", "RGB_ORIGINAL.dcm")
+
+        # Act
+        mock_engine._redact_dicom_file(
+            src_path, dst_path, 0.75, "contrast", 25, True, save_bboxes=True
+        )
+        mocker.patch.object(instance, "save_as", side_effect=OSError("disk full"))
+        failed_dst_path = Path(tmpdirname, "failed.dcm")
+        with pytest.raises(OSError):
+            mock_engine._redact_dicom_file(
+                src_path, failed_dst_path, 0.75, "contrast", 25, True, save_bboxes=False
+            )
+
+        # Assert
+        assert pydicom.dcmread(dst_path).SOPInstanceUID == instance.SOPInstanceUID
+        assert dst_path.with_suffix(".json").is_file()
+        assert sorted(os.listdir(tmpdirname)) == ["nested"]
+        assert sorted(os.listdir(dst_path.parent)) == ["RGB_ORIGINAL.dcm", "RGB_ORIGINAL.json"]
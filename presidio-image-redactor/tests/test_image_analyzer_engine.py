@@ -1,3 +1,5 @@
+import json
+
 import pytest
 from presidio_analyzer import RecognizerResult, AnalyzerEngine, PatternRecognizer, Pattern
 from presidio_analyzer.recognizer_registry import RecognizerRegistry
@@ -115,6 +117,30 @@ def test_given_dif_len_entities_then_map_analyzer_returns_correct_outputand_len(
     assert expected_result == mapped_entities
 
 
+def test_given_sparse_entities_on_long_page_then_map_analyzer_returns_bboxes_in_word_order():
+    words = ["word"] * 1000
+    words[10], words[500], words[501], words[998] = "John", "Jane", "Dave", "Bobo"
+    ocr_result = {
+        "text": words,
+        "left": list(range(1000)),
+        "top": [0] * 1000,
+        "width": [10] * 1000,
+        "height": [10] * 1000,
+    }
+    text = " ".join(words)
+    recognizer_result = [
+        RecognizerResult("PERSON", 998 * 5, 998 * 5 + 4, 0.85),
+        RecognizerResult("PERSON", 10 * 5, 10 * 5 + 4, 0.85),
+        RecognizerResult("PERSON", 500 * 5, 501 * 5 + 4, 0.85),
+    ]
+
+    mapped_entities = ImageAnalyzerEngine.map_analyzer_results_to_bounding_boxes(
+        recognizer_result, ocr_result, text, ["Dave"]
+    )
+
+    assert [bbox.left for bbox in mapped_entities] == [10, 500, 998]
+
+
 @pytest.mark.parametrize(
     "ocr_threshold, expected_length",
     [(-1, 9), (50, 7), (80, 2), (100, 0)],
@@ -160,6 +186,25 @@ def test_remove_space_boxes_happy_path(image_analyzer_engine):
     assert test_results["top"] == [5, 900]
 
 
+def test_ocr_result_helpers_return_dicts(image_analyzer_engine):
+    # Arrange
+    ocr_result = {"text": ["John", " "], "left": [100, 0], "top": [5, 315], "width": [20, 5], "height": [10, 10], "conf": [90, 95]}
+
+    # Act
+    test_results = [
+        image_analyzer_engine.remove_space_boxes(ocr_result),
+        image_analyzer_engine.threshold_ocr_result(ocr_result, 50),
+        image_analyzer_engine._scale_bbox_results(ocr_result, 0.5),
+        image_analyzer_engine._remove_bbox_padding(ocr_result, 10),
+    ]
+
+    # Assert
+    for test_result in test_results:
+        assert type(test_result) is dict
+        json.dumps(test_result)
+        test_result["left"][0] = 0
+
+
 @pytest.mark.parametrize(
     "text_analyzer_kwargs, expected_allow_list",
     [
@@ -390,3 +435,89 @@ def test_use_other_language_in_analyze(get_dummy_nlp_engine, get_mock_png):
     )
     # There aren't the dummy pattern in the image, so the redacted should be empty
     assert len(redacted) == 0
+
+
+def test_given_text_region_detector_then_analyze_ocrs_regions_only(get_dummy_nlp_engine):
+    """Test ImageAnalyzerEngine with a text region detector maps regions back."""
+    from presidio_image_redactor import OCR, RegionOCR, TemplateTextRegionDetector
+
+    class RegionOCRStub(OCR):
+        def __init__(self):
+            self.sizes = []
+
+        def perform_ocr(self, image, **kwargs):
+            self.sizes.append(image.size)
+            return {
+                "left": [2, 30],
+                "top": [4, 4],
+                "width": [25, 40],
+                "height": [12, 12],
+                "conf": [95, 95],
+                "text": ["John", "Smith"],
+            }
+
+    recognizer = PatternRecognizer(supported_entity="PERSON", deny_list=["John"])
+    registry = RecognizerRegistry(recognizers=[recognizer])
+    analyzer_engine = AnalyzerEngine(nlp_engine=get_dummy_nlp_engine, registry=registry)
+    ocr = RegionOCRStub()
+    detector = TemplateTextRegionDetector(
+        [{"left": 0.5, "top": 0.75, "width": 0.5, "height": 0.25}]
+    )
+    engine = ImageAnalyzerEngine(
+        analyzer_engine=analyzer_engine, ocr=ocr, text_region_detector=detector
+    )
+    image = PIL.Image.fromarray(np.zeros((400, 800), dtype=np.uint8))
+
+    results = engine.analyze(image)
+
+    assert isinstance(engine.ocr, RegionOCR)
+    assert ocr.sizes == [(400, 100)]
+    assert [(r.left, r.top, r.width, r.height) for r in results] == [(402, 304, 25, 12)]
+
+
+@pytest.mark.parametrize("n_process, batch_size", [(1, 1), (1, 2), (2, 2)])
+def test_given_images_then_analyze_batch_returns_analyze_results_in_order(
+    batch_image_analyzer_engine, n_process, batch_size
+):
+    images = [
+        PIL.Image.fromarray(np.full((20, 100), value, dtype=np.uint8))
+        for value in [1, 2, 3, 1, 2]
+    ]
+
+    results = list(
+        batch_image_analyzer_engine.analyze_batch(
+            images, batch_size=batch_size, n_process=n_process
+        )
+    )
+
+    assert results == [batch_image_analyzer_engine.analyze(image) for image in images]
+    assert [len(bboxes) for bboxes in results] == [1, 0, 1, 1, 0]
+
+
+def test_given_lazy_images_then_analyze_batch_reads_at_most_queue_size_ahead(
+    batch_image_analyzer_engine,
+):
+    read = []
+
+    def images():
+        for value in [1, 2, 3, 1, 2, 3]:
+            read.append(value)
+            yield PIL.Image.fromarray(np.full((20, 100), value, dtype=np.uint8))
+
+    results = batch_image_analyzer_engine.analyze_batch(
+        images(), batch_size=1, max_queue_size=2
+    )
+
+    assert len(next(results)) == 1
+    assert len(read) == 3
+    assert len(list(results)) == 5
+
+
+@pytest.mark.parametrize(
+    "kwargs", [{"batch_size": 0}, {"n_process": 0}, {"max_queue_size": 0}]
+)
+def test_given_invalid_params_then_analyze_batch_raises(
+    batch_image_analyzer_engine, kwargs
+):
+    with pytest.raises(ValueError):
+        list(batch_image_analyzer_engine.analyze_batch([], **kwargs))
@@ -0,0 +1,32 @@
+import numpy as np
+import PIL
+from presidio_analyzer import PatternRecognizer
+
+from presidio_image_redactor import ImageRedactorEngine
+
+
+def test_given_images_then_redact_batch_returns_redact_results_in_order(
+    batch_image_analyzer_engine,
+):
+    engine = ImageRedactorEngine(batch_image_analyzer_engine)
+    ad_hoc_recognizers = [PatternRecognizer("PERSON", deny_list=["Jane"])]
+    images = [
+        PIL.Image.fromarray(np.full((20, 100), value, dtype=np.uint8))
+        for value in [1, 2, 3]
+    ]
+
+    redacted = list(
+        engine.redact_batch(
+            images, fill=255, ad_hoc_recognizers=ad_hoc_recognizers, batch_size=2
+        )
+    )
+
+    expected = [
+        engine.redact(image, fill=255, ad_hoc_recognizers=ad_hoc_recognizers)
+        for image in images
+    ]
+    assert [np.asarray(image).tolist() for image in redacted] == [
+        np.asarray(image).tolist() for image in expected
+    ]
+    assert all(np.asarray(image)[5:18, 50:81].min() == 255 for image in redacted)
+    assert np.asarray(images[1]).max() == 2
@@ -0,0 +1,31 @@
+import pytest
+
+from presidio_image_redactor import MetadataPhiRecognizer
+
+
+@pytest.mark.parametrize(
+    "phi_list, text, expected_spans",
+    [
+        (["John"], "JOHN john John", [(0, 4), (5, 9), (10, 14)]),
+        (["John"], "Johnny and xJohn", []),
+        (["John", "John Doe"], "Dr. john doe.", [(4, 12)]),
+        (["[M]", "M"], "Sex: [M] m", [(5, 8), (9, 10)]),
+        (["Straße"], "STRASSE, STRAßE", [(9, 15)]),
+        ([], "John", []),
+    ],
+)
+def test_given_phi_list_then_find_terms_returns_longest_case_insensitive_matches(
+    phi_list, text, expected_spans
+):
+    recognizer = MetadataPhiRecognizer(phi_list)
+    assert recognizer.find_terms(text) == expected_spans
+
+
+def test_given_text_then_analyze_returns_results_of_supported_entity():
+    recognizer = MetadataPhiRecognizer(["Jane Doe"], supported_entity="PATIENT")
+    results = recognizer.analyze("Seen by JANE DOE", entities=["PATIENT"])
+
+    assert len(results) == 1
+    assert results[0].entity_type == "PATIENT"
+    assert (results[0].start, results[0].end) == (8, 16)
+    assert results[0].score == 1.0
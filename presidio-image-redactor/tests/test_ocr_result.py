@@ -0,0 +1,99 @@
+"""Test suite for ocr_result.py"""
+
+import numpy as np
+import pytest
+
+from presidio_image_redactor.entities import OcrResult
+
+
+@pytest.fixture(scope="function")
+def ocr_dict():
+    return {
+        "level": [5, 5, 5, 5, 5],
+        "left": [10, 0, 60, 120, 200],
+        "top": [4, 0, 5, 6, 4],
+        "width": [40, 5, 50, 70, 30],
+        "height": [12, 10, 12, 13, 12],
+        "conf": ["95", -1, 40.5, 88, 91],
+        "text": ["John", " ", "Smith", "", "42"],
+    }
+
+
+def test_given_ocr_dict_then_ocr_result_is_a_dict_view(ocr_dict):
+    ocr_result = OcrResult.from_dict(ocr_dict)
+
+    assert ocr_result == ocr_dict
+    assert ocr_result.to_dict() == ocr_dict
+    assert list(ocr_result) == list(ocr_dict)
+    assert ocr_result["conf"] == ["95", -1, 40.5, 88, 91]
+    assert "text" in ocr_result and "page_num" not in ocr_result
+    assert ocr_result.word_count == 5
+    assert OcrResult.from_dict(ocr_result) is ocr_result
+
+
+def test_given_values_of_different_lengths_then_ocr_result_raises():
+    with pytest.raises(ValueError):
+        OcrResult({"left": [1, 2], "text": ["a"]})
+
+
+def test_given_ocr_result_then_filtering_returns_new_results(ocr_dict):
+    ocr_result = OcrResult.from_dict(ocr_dict)
+
+    without_spaces = ocr_result.remove_spaces()
+    thresholded = without_spaces.threshold(50)
+
+    assert without_spaces["text"] == ["John", "Smith", "42"]
+    assert thresholded["text"] == ["John", "42"]
+    assert thresholded["level"] == [5, 5]
+    assert thresholded["conf"] == ["95", 91]
+    assert ocr_result == ocr_dict
+    assert ocr_result.select([4, 0])["left"] == [200, 10]
+
+
+@pytest.mark.parametrize("ocr_threshold", [-2, 101])
+def test_given_invalid_threshold_then_ocr_result_raises(ocr_dict, ocr_threshold):
+    with pytest.raises(ValueError):
+        OcrResult.from_dict(ocr_dict).threshold(ocr_threshold)
+
+
+def test_given_ocr_result_then_boxes_are_scaled_and_unpadded(ocr_dict):
+    ocr_result = OcrResult.from_dict(ocr_dict)
+
+    scaled = ocr_result.scale(2)
+    unpadded = ocr_result.remove_padding(8)
+
+    assert scaled["left"] == [5, 0, 30, 60, 100]
+    assert scaled["width"] == [20, 3, 25, 35, 15]
+    assert scaled["height"] == [6, 5, 6, 7, 6]
+    assert unpadded["left"] == [2, 0, 52, 112, 192]
+    assert unpadded["top"] == [0, 0, 0, 0, 0]
+    assert unpadded["width"] == ocr_dict["width"]
+    with pytest.raises(ValueError):
+        ocr_result.remove_padding(-1)
+
+
+def test_given_ocr_result_then_offsets_index_the_joined_text(ocr_dict):
+    ocr_result = OcrResult.from_dict(ocr_dict)
+    text = ocr_result.get_text()
+
+    assert text == "John   Smith  42"
+    assert ocr_result.offsets.tolist() == [0, 5, 7, 13, 14]
+    for offset, word in zip(ocr_result.offsets, ocr_result["text"]):
+        assert text[offset : offset + len(word)] == word
+    assert OcrResult({"text": []}).offsets.tolist() == []
+
+
+def test_given_ocr_result_then_to_bboxes_returns_words_with_text(ocr_dict):
+    bboxes = OcrResult.from_dict(ocr_dict).to_bboxes()
+
+    assert [bbox["label"] for bbox in bboxes] == ["John", " ", "Smith", "42"]
+    assert bboxes[0] == {
+        "left": 10,
+        "top": 4,
+        "width": 40,
+        "height": 12,
+        "conf": 95.0,
+        "label": "John",
+    }
+    assert all(isinstance(bbox["left"], int) for bbox in bboxes)
+    assert OcrResult.from_dict({key: [] for key in ocr_dict}).to_bboxes() == []
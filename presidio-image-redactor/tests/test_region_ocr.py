@@ -0,0 +1,117 @@
+import threading
+
+import numpy as np
+import pytest
+from PIL import Image
+
+from presidio_image_redactor import OCR, RegionOCR, TemplateTextRegionDetector
+
+
+class WordPerRegionOCR(OCR):
+    """Fake OCR which finds a word at (5, 3) of each region it is given"""
+
+    def __init__(self):
+        self.sizes = []
+        self.threads = set()
+
+    def perform_ocr(self, image, **kwargs):
+        self.sizes.append(image.size)
+        self.threads.add(threading.get_ident())
+        return {
+            "left": [5],
+            "top": [3],
+            "width": [20],
+            "height": [10],
+            "conf": [kwargs.get("conf", 90)],
+            "text": [f"word{image.size[0]}"],
+        }
+
+
+@pytest.fixture
+def regions_detector():
+    return TemplateTextRegionDetector(
+        [
+            {"left": 0.5, "top": 0.5, "width": 0.5, "height": 0.5},
+            {"left": 0, "top": 0, "width": 0.25, "height": 0.25},
+        ]
+    )
+
+
+@pytest.mark.parametrize(
+    "image",
+    [
+        Image.fromarray(np.zeros((200, 400), dtype=np.uint8)),
+        np.zeros((200, 400), dtype=np.uint8),
+    ],
+)
+def test_given_regions_then_perform_ocr_maps_boxes_to_whole_image(image, regions_detector):
+    ocr = WordPerRegionOCR()
+
+    ocr_result = RegionOCR(ocr, regions_detector).perform_ocr(image, conf=50)
+
+    assert sorted(ocr.sizes) == [(100, 50), (200, 100)]
+    assert ocr_result == {
+        "left": [5, 205],
+        "top": [3, 103],
+        "width": [20, 20],
+        "height": [10, 10],
+        "conf": [50, 50],
+        "text": ["word100", "word200"],
+    }
+
+
+def test_given_max_workers_then_regions_are_ocred_in_worker_threads(regions_detector):
+    ocr = WordPerRegionOCR()
+    image = Image.fromarray(np.zeros((200, 400), dtype=np.uint8))
+
+    RegionOCR(ocr, regions_detector, max_workers=2).perform_ocr(image)
+
+    assert threading.get_ident() not in ocr.threads
+
+
+def test_given_no_regions_then_perform_ocr_returns_empty_results(mocker):
+    ocr = WordPerRegionOCR()
+    detector = mocker.Mock(detect=mocker.Mock(return_value=[]))
+    image = Image.fromarray(np.zeros((200, 400), dtype=np.uint8))
+
+    ocr_result = RegionOCR(ocr, detector).perform_ocr(image)
+
+    assert ocr.sizes == []
+    assert ocr_result["text"] == []
+    assert OCR.get_text_from_ocr_dict(ocr_result) == ""
+
+
+def test_given_tesseract_numbering_then_blocks_are_unique_across_regions():
+    region_result = {
+        "level": [1, 2, 5],
+        "block_num": [0, 1, 1],
+        "par_num": [0, 0, 1],
+        "line_num": [0, 0, 1],
+        "word_num": [0, 0, 1],
+        "left": [0, 0, 5],
+        "top": [0, 0, 3],
+        "text": ["", "", "word"],
+    }
+
+    ocr_result = RegionOCR._merge_region_results(
+        [
+            {"left": 0, "top": 0, "width": 100, "height": 50},
+            {"left": 200, "top": 100, "width": 200, "height": 100},
+        ],
+        [region_result, region_result],
+    )
+
+    assert ocr_result["block_num"] == [0, 1, 1, 0, 2, 2]
+    assert ocr_result["left"] == [0, 0, 5, 200, 200, 205]
+    words = [
+        (block, par, line, word)
+        for block, par, line, word, level in zip(
+            ocr_result["block_num"],
+            ocr_result["par_num"],
+            ocr_result["line_num"],
+            ocr_result["word_num"],
+            ocr_result["level"],
+        )
+        if level == 5
+    ]
+    assert words == [(1, 1, 1, 1), (2, 1, 1, 1)]
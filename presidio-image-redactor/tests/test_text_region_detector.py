@@ -0,0 +1,111 @@
+import cv2
+import numpy as np
+import pytest
+from PIL import Image
+
+from presidio_image_redactor import (
+    ContourTextRegionDetector,
+    TemplateTextRegionDetector,
+    TextRegionDetector,
+)
+
+
+def _contains(region, left, top, right, bottom):
+    return (
+        region["left"] <= left
+        and region["top"] <= top
+        and region["left"] + region["width"] >= right
+        and region["top"] + region["height"] >= bottom
+    )
+
+
+@pytest.fixture(scope="module")
+def scanned_page():
+    """Large synthetic scan with text in the header, the middle and a corner"""
+    page = np.full((2000, 3000), 240, dtype=np.uint8)
+    page -= np.random.default_rng(0).integers(0, 6, page.shape, dtype=np.uint8)
+    text_boxes = []
+    for text, (x, y), scale, thickness in [
+        ("Patient: John Smith", (100, 150), 2, 4),
+        ("note", (1500, 1000), 0.8, 2),
+        ("MRN 123-456", (2400, 1900), 1.5, 3),
+    ]:
+        cv2.putText(page, text, (x, y), cv2.FONT_HERSHEY_SIMPLEX, scale, 0, thickness)
+        (width, height), baseline = cv2.getTextSize(
+            text, cv2.FONT_HERSHEY_SIMPLEX, scale, thickness
+        )
+        text_boxes.append((x, y - height, x + width, y + baseline))
+    return Image.fromarray(page), text_boxes
+
+
+def test_given_text_then_contour_detector_returns_text_regions(scanned_page):
+    image, text_boxes = scanned_page
+
+    regions = ContourTextRegionDetector().detect(image)
+
+    assert len(regions) == len(text_boxes)
+    for region, text_box in zip(regions, text_boxes):
+        assert _contains(region, *text_box)
+    total_area = sum(region["width"] * region["height"] for region in regions)
+    assert total_area < 0.05 * image.size[0] * image.size[1]
+
+
+def test_given_blank_image_then_contour_detector_returns_no_regions():
+    image = Image.fromarray(np.full((500, 500), 255, dtype=np.uint8))
+
+    assert ContourTextRegionDetector().detect(image) == []
+
+
+@pytest.mark.parametrize(
+    "kwargs",
+    [{"max_size": 0}, {"min_density": 1.5}, {"margin": -1}, {"merge_distance": -1}],
+)
+def test_given_invalid_params_then_contour_detector_raises_error(kwargs):
+    with pytest.raises(ValueError):
+        ContourTextRegionDetector(**kwargs)
+
+
+def test_given_relative_regions_then_template_detector_scales_to_image():
+    image = Image.fromarray(np.zeros((400, 1000), dtype=np.uint8))
+    detector = TemplateTextRegionDetector(
+        [
+            {"left": 0.75, "top": 0.9, "width": 0.25, "height": 0.1},
+            {"left": 0, "top": 0, "width": 1, "height": 0.1},
+        ]
+    )
+
+    assert detector.detect(image) == [
+        {"left": 0, "top": 0, "width": 1000, "height": 40},
+        {"left": 750, "top": 360, "width": 250, "height": 40},
+    ]
+
+
+@pytest.mark.parametrize(
+    "regions",
+    [
+        [],
+        [{"left": -0.1, "top": 0, "width": 0.5, "height": 0.5}],
+        [{"left": 0, "top": 0, "width": 0, "height": 0.5}],
+        [{"left": 0, "top": 0, "width": 100, "height": 50}],
+    ],
+)
+def test_given_invalid_regions_then_template_detector_raises_error(regions):
+    with pytest.raises(ValueError):
+        TemplateTextRegionDetector(regions)
+
+
+def test_given_close_regions_then_merge_regions_merges_them_in_reading_order():
+    regions = [
+        {"left": 500, "top": 12, "width": 100, "height": 20},
+        {"left": 0, "top": 10, "width": 100, "height": 20},
+        {"left": 105, "top": 15, "width": 100, "height": 20},
+        {"left": 0, "top": 200, "width": 50, "height": 20},
+    ]
+
+    merged = TextRegionDetector.merge_regions(regions, distance=10)
+
+    assert merged == [
+        {"left": 0, "top": 10, "width": 205, "height": 25},
+        {"left": 500, "top": 12, "width": 100, "height": 20},
+        {"left": 0, "top": 200, "width": 50, "height": 20},
+    ]
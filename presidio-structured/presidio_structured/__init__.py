@@ -2,11 +2,18 @@
 
 import logging
 
-from .analysis_builder import JsonAnalysisBuilder, PandasAnalysisBuilder
+from .analysis_builder import (
+    JsonAnalysisBuilder,
+    JsonLinesAnalysisBuilder,
+    PandasAnalysisBuilder,
+)
 from .config import StructuredAnalysis
 from .data import (
     CsvReader,
     JsonDataProcessor,
+    JsonLinesDataProcessor,
+    JsonLinesReader,
+    JsonLinesWriter,
     JsonReader,
     PandasDataProcessor,
 )
@@ -17,10 +24,14 @@ logging.getLogger("presidio-structured").addHandler(logging.NullHandler())
 __all__ = [
     "StructuredEngine",
     "JsonAnalysisBuilder",
+    "JsonLinesAnalysisBuilder",
     "PandasAnalysisBuilder",
     "StructuredAnalysis",
     "CsvReader",
     "JsonReader",
+    "JsonLinesReader",
+    "JsonLinesWriter",
     "PandasDataProcessor",
     "JsonDataProcessor",
+    "JsonLinesDataProcessor",
 ]
@@ -1,8 +1,9 @@
 import logging
 from abc import ABC, abstractmethod
-from collections import Counter
+from collections import Counter, defaultdict
 from collections.abc import Iterable
-from typing import Dict, Iterator, List, Optional, Union
+from itertools import islice
+from typing import Any, Dict, Iterator, List, Optional, Union
 
 from pandas import DataFrame
 from presidio_analyzer import (
@@ -15,6 +16,7 @@ from presidio_analyzer import (
 from presidio_structured.config import StructuredAnalysis
 
 NON_PII_ENTITY_TYPE = "NON_PII"
+DEFAULT_SAMPLE_SIZE = 1000
 
 logger = logging.getLogger("presidio-structured")
 
@@ -416,3 +418,92 @@ class PandasAnalysisBuilder(TabularAnalysisBuilder):
             for cell_idx, cell_results in enumerate(analyzer_results)
             for res in cell_results
         ]
+
+
+class JsonLinesAnalysisBuilder(PandasAnalysisBuilder):
+    """
+    Concrete configuration generator for streams of JSON records (JSON Lines).
+
+    Each key path (e.g. ``user.address.city``) is treated as a column:
+    the values of a sample of records are batched per key through the
+    BatchAnalyzerEngine, and an entity is selected per key using the
+    same selection strategies as the PandasAnalysisBuilder.
+    Objects nested in lists are flattened into the list's key path
+    (e.g. ``users.name``), matching the JsonDataProcessor key format.
+    """
+
+    def generate_analysis(
+        self,
+        records: Iterable[Dict],
+        n: Optional[int] = DEFAULT_SAMPLE_SIZE,
+        language: str = "en",
+        selection_strategy: str = "most_common",
+        mixed_strategy_threshold: float = 0.5,
+    ) -> StructuredAnalysis:
+        """
+        Generate a configuration from a sample of the given JSON records.
+
+        :param records: Iterable of JSON records (dictionaries),
+        e.g. the output of JsonLinesReader.read.
+        :param n: The number of records to sample from the beginning of the stream.
+        If `None`, all records are used.
+        :param language: The language to be used for analysis.
+        :param selection_strategy: A string that specifies the entity selection strategy
+        ('highest_confidence', 'mixed', or default to most common).
+        :param mixed_strategy_threshold: A float value for the threshold to be used in
+        the entity selection mixed strategy.
+        :return: A StructuredAnalysis object containing the analysis results.
+        """
+        if n is not None and n < 1:
+            raise ValueError(f"Number of samples must be positive, got {n}")
+
+        sample = islice(records, n)
+        key_values_map = self._collect_key_values(sample)
+
+        key_entity_map = {}
+        for key, values in key_values_map.items():
+            logger.debug(f"Finding PII entity for key {key}")
+            analyzer_results = self.batch_analyzer.analyze_iterator(
+                values,
+                language=language,
+                n_process=self.n_process,
+                batch_size=self.batch_size,
+            )
+            result = self._find_entity_based_on_strategy(
+                analyzer_results, selection_strategy, mixed_strategy_threshold
+            )
+            if result.entity_type != NON_PII_ENTITY_TYPE:
+                key_entity_map[key] = result.entity_type
+
+        return StructuredAnalysis(entity_mapping=key_entity_map)
+
+    @classmethod
+    def _collect_key_values(cls, records: Iterable[Dict]) -> Dict[str, List[Any]]:
+        """
+        Group the scalar values of all records by their dotted key path.
+
+        :param records: Iterable of JSON records.
+        :return: A dictionary mapping key paths to the list of their values.
+        """
+        key_values_map = defaultdict(list)
+        for record in records:
+            if not isinstance(record, dict):
+                raise ValueError("Records must be JSON objects (dictionaries)")
+            cls._collect_values(record, "", key_values_map)
+        return key_values_map
+
+    @classmethod
+    def _collect_values(
+        cls, value: Any, key: str, key_values_map: Dict[str, List[Any]]
+    ) -> None:
+        if isinstance(value, dict):
+            for nested_key, nested_value in value.items():
+                nested_path = f"{key}.{nested_key}" if key else nested_key
+                cls._collect_values(nested_value, nested_path, key_values_map)
+        elif isinstance(value, list):
+            # Only objects nested in lists are supported by JsonDataProcessor
+            for item in value:
+                if isinstance(item, dict):
+                    cls._collect_values(item, key, key_values_map)
+        elif type(value) in (str, int, float, bool) and value != "":
+            key_values_map[key].append(value)
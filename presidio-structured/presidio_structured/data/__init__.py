@@ -1,11 +1,19 @@
 """Data module."""
 
-from .data_processors import JsonDataProcessor, PandasDataProcessor
-from .data_reader import CsvReader, JsonReader
+from .data_processors import (
+    JsonDataProcessor,
+    JsonLinesDataProcessor,
+    PandasDataProcessor,
+)
+from .data_reader import CsvReader, JsonLinesReader, JsonReader
+from .data_writer import JsonLinesWriter
 
 __all__ = [
     "CsvReader",
     "JsonReader",
+    "JsonLinesReader",
+    "JsonLinesWriter",
     "PandasDataProcessor",
     "JsonDataProcessor",
+    "JsonLinesDataProcessor",
 ]
@@ -1,6 +1,8 @@
 import logging
+import multiprocessing
 from abc import ABC, abstractmethod
-from typing import Any, Callable, Dict, List, Union
+from itertools import islice
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Union
 
 from pandas import DataFrame
 from presidio_anonymizer.entities import OperatorConfig
@@ -220,3 +222,112 @@ class JsonDataProcessor(DataProcessorBase):
                         )
                         self._set_nested_value(data, keys, operated_text)
         return data
+
+
+class JsonLinesDataProcessor(JsonDataProcessor):
+    """
+    JSON Lines Data Processor, operates on a stream of JSON records.
+
+    Records are processed lazily and returned as an iterator in input order.
+    When ``n_process`` is larger than 1, records are grouped into batches of
+    ``batch_size`` and dispatched to a pool of worker processes, each holding
+    its own operators. Operators must then be picklable
+    (e.g. ``custom`` operators with lambdas are only supported with
+    ``n_process=1``).
+
+    :param n_process: Number of processes to use. Defaults to `1`.
+    If `None`, uses the number of CPUs.
+    :param batch_size: Number of records sent to a worker in a single task.
+    """
+
+    def __init__(self, n_process: Optional[int] = 1, batch_size: int = 1000) -> None:
+        super().__init__()
+        if batch_size < 1:
+            raise ValueError("batch_size must be a positive integer")
+        self.n_process = n_process if n_process else multiprocessing.cpu_count()
+        self.batch_size = batch_size
+
+    def operate(
+        self,
+        data: Iterable[Dict],
+        structured_analysis: StructuredAnalysis,
+        operators: Dict[str, OperatorConfig],
+    ) -> Iterator[Dict]:
+        """
+        Perform operations over a stream of records, as per the structured analysis.
+
+        :param data: Iterable of JSON-like records to be operated on.
+        :param structured_analysis: Analysis schema as per the structured data.
+        :param operators: Dictionary containing operator configuration objects.
+        :return: Iterator over the records after being operated upon.
+        """
+        if isinstance(data, (dict, DataFrame)):
+            raise ValueError("Data must be an iterable of JSON-like records")
+
+        key_to_operator_mapping = self._generate_operator_mapping(
+            structured_analysis, operators
+        )
+        if self.n_process == 1:
+            return self._process_records(data, key_to_operator_mapping)
+
+        return self._operate_in_pool(data, structured_analysis, operators)
+
+    def _process_records(
+        self,
+        data: Iterable[Dict],
+        key_to_operator_mapping: Dict[str, Callable],
+    ) -> Iterator[Dict]:
+        """
+        Operates on each record of the given stream.
+
+        :param data: Iterable of JSON-like records to be operated on.
+        :param key_to_operator_mapping: maps keys to Callable operators.
+        :return: Iterator over the records after the operation.
+        """
+        for record in data:
+            yield self._process(record, key_to_operator_mapping)
+
+    def _operate_in_pool(
+        self,
+        data: Iterable[Dict],
+        structured_analysis: StructuredAnalysis,
+        operators: Dict[str, OperatorConfig],
+    ) -> Iterator[Dict]:
+        with multiprocessing.Pool(
+            processes=self.n_process,
+            initializer=_init_json_lines_worker,
+            initargs=(structured_analysis, operators),
+        ) as pool:
+            batches = self._batched(data, self.batch_size)
+            for processed_batch in pool.imap(_process_json_lines_batch, batches):
+                yield from processed_batch
+
+    @staticmethod
+    def _batched(data: Iterable[Dict], batch_size: int) -> Iterator[List[Dict]]:
+        iterator = iter(data)
+        while True:
+            batch = list(islice(iterator, batch_size))
+            if not batch:
+                return
+            yield batch
+
+
+# Per-process state for JsonLinesDataProcessor workers
+_worker_processor: Optional[JsonDataProcessor] = None
+_worker_operator_mapping: Optional[Dict[str, Callable]] = None
+
+
+def _init_json_lines_worker(
+    structured_analysis: StructuredAnalysis, operators: Dict[str, OperatorConfig]
+) -> None:
+    global _worker_processor, _worker_operator_mapping
+    _worker_processor = JsonDataProcessor()
+    _worker_operator_mapping = _worker_processor._generate_operator_mapping(
+        structured_analysis, operators
+    )
+
+
+def _process_json_lines_batch(batch: List[Dict]) -> List[Dict]:
+    return [
+        _worker_processor._process(record, _worker_operator_mapping) for record in batch
+    ]
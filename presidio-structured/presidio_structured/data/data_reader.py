@@ -3,7 +3,7 @@
 import json
 from abc import ABC, abstractmethod
 from pathlib import Path
-from typing import Any, Dict, Union
+from typing import Any, Dict, Iterator, Union
 
 import pandas as pd
 
@@ -68,3 +68,39 @@ class JsonReader(ReaderBase):
         with open(path) as f:
             data = json.load(f, **kwargs)
         return data
+
+
+class JsonLinesReader(ReaderBase):
+    """
+    Reader for streaming JSON Lines (NDJSON) files, one JSON object per line.
+
+    Records are yielded lazily, so arbitrarily large files can be processed
+    with constant memory. Blank lines are skipped.
+
+    Usage::
+
+        reader = JsonLinesReader()
+        for record in reader.read(path="events.jsonl"):
+            ...
+
+    """
+
+    def read(self, path: Union[str, Path], **kwargs) -> Iterator[Dict[str, Any]]:
+        """
+        Read a JSON Lines file as a stream of dictionaries.
+
+        :param path: String defining the location of the JSON Lines file to read.
+        :param kwargs: Additional arguments passed to `json.loads` for each line.
+        :return: Iterator over the records (dictionaries) in the file.
+        """
+        with open(path, encoding="utf-8") as f:
+            for line_number, line in enumerate(f, start=1):
+                line = line.strip()
+                if not line:
+                    continue
+                record = json.loads(line, **kwargs)
+                if not isinstance(record, dict):
+                    raise ValueError(
+                        f"Line {line_number} in {path} is not a JSON object"
+                    )
+                yield record
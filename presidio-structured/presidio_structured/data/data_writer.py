@@ -0,0 +1,59 @@
+"""Helper data classes for writing structured data back to files."""
+
+import json
+from abc import ABC, abstractmethod
+from pathlib import Path
+from typing import Any, Dict, Iterable, Union
+
+
+class WriterBase(ABC):
+    """
+    Base class for data writers.
+
+    This class should not be instantiated directly, instead init a subclass.
+    """
+
+    @abstractmethod
+    def write(self, data: Any, path: Union[str, Path], **kwargs) -> Any:
+        """
+        Write data to a file located at path.
+
+        :param data: The data to write.
+        :param path: String defining the location of the file to write.
+        """
+        pass
+
+
+class JsonLinesWriter(WriterBase):
+    """
+    Writer for JSON Lines (NDJSON) files, one JSON object per line.
+
+    Records are consumed lazily from the input iterable, so the output
+    of a streaming pipeline can be written without materializing it.
+
+    Usage::
+
+        writer = JsonLinesWriter()
+        writer.write(records, path="anonymized.jsonl")
+
+    """
+
+    def write(
+        self, data: Iterable[Dict[str, Any]], path: Union[str, Path], **kwargs
+    ) -> int:
+        """
+        Write an iterable of dictionaries to a JSON Lines file.
+
+        :param data: Iterable of records (dictionaries) to write.
+        :param path: String defining the location of the JSON Lines file to write.
+        :param kwargs: Additional arguments passed to `json.dumps` for each record.
+        :return: The number of records written.
+        """
+        kwargs.setdefault("ensure_ascii", False)
+        count = 0
+        with open(path, "w", encoding="utf-8") as f:
+            for record in data:
+                f.write(json.dumps(record, **kwargs))
+                f.write("\n")
+                count += 1
+        return count
@@ -3,7 +3,11 @@
 import pandas as pd
 import pytest
 from presidio_anonymizer.entities import OperatorConfig
-from presidio_structured import PandasAnalysisBuilder, JsonAnalysisBuilder
+from presidio_structured import (
+    PandasAnalysisBuilder,
+    JsonAnalysisBuilder,
+    JsonLinesAnalysisBuilder,
+)
 from presidio_structured.config import StructuredAnalysis
 
 
@@ -61,11 +65,35 @@ def sample_json_with_array():
     return data
 
 
+@pytest.fixture
+def sample_json_lines():
+    return [
+        {"id": 1, "user": {"name": "John Doe", "email": "john.doe@example.com"}},
+        {"id": 2, "user": {"name": "Jane Smith", "email": "jane.smith@example.com"}},
+        {"id": 3, "user": {"name": "Alice Johnson", "email": "alice@example.com"}},
+    ]
+
+
+@pytest.fixture
+def json_lines_analysis():
+    return StructuredAnalysis(
+        entity_mapping={
+            "user.name": "PERSON",
+            "user.email": "EMAIL_ADDRESS",
+        }
+    )
+
+
 @pytest.fixture
 def json_analysis_builder():
     return JsonAnalysisBuilder()
 
 
+@pytest.fixture
+def json_lines_analysis_builder():
+    return JsonLinesAnalysisBuilder()
+
+
 @pytest.fixture
 def tabular_analysis_builder():
     return PandasAnalysisBuilder()
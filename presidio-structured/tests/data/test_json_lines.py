@@ -0,0 +1,79 @@
+import json
+
+import pytest
+from presidio_structured.data import (
+    JsonLinesDataProcessor,
+    JsonLinesReader,
+    JsonLinesWriter,
+)
+
+
+@pytest.fixture
+def json_lines_file(tmp_path, sample_json_lines):
+    path = tmp_path / "records.jsonl"
+    lines = [json.dumps(record) for record in sample_json_lines]
+    path.write_text("\n".join(lines[:2]) + "\n\n" + lines[2] + "\n")
+    return path
+
+
+class TestJsonLinesReader:
+    def test_read_streams_records(self, json_lines_file, sample_json_lines):
+        records = JsonLinesReader().read(json_lines_file)
+        assert not isinstance(records, list)
+        assert list(records) == sample_json_lines
+
+    def test_read_non_object_line_raises(self, tmp_path):
+        path = tmp_path / "invalid.jsonl"
+        path.write_text('{"a": 1}\n[1, 2]\n')
+        with pytest.raises(ValueError):
+            list(JsonLinesReader().read(path))
+
+
+class TestJsonLinesWriter:
+    def test_write_round_trip(self, tmp_path, sample_json_lines):
+        path = tmp_path / "out.jsonl"
+        count = JsonLinesWriter().write(iter(sample_json_lines), path)
+        assert count == len(sample_json_lines)
+        assert list(JsonLinesReader().read(path)) == sample_json_lines
+
+
+class TestJsonLinesDataProcessor:
+    @pytest.mark.parametrize("n_process, batch_size", [(1, 1000), (2, 1)])
+    def test_process(
+        self, sample_json_lines, operators, json_lines_analysis, n_process, batch_size
+    ):
+        processor = JsonLinesDataProcessor(n_process=n_process, batch_size=batch_size)
+        result = list(
+            processor.operate(iter(sample_json_lines), json_lines_analysis, operators)
+        )
+        assert [record["id"] for record in result] == [1, 2, 3]
+        for record in result:
+            assert record["user"]["name"] == "PERSON_REPLACEMENT"
+            assert record["user"]["email"] == "DEFAULT_REPLACEMENT"
+
+    @pytest.mark.parametrize("n_process", [1, 2])
+    def test_process_list_records(self, operators, json_lines_analysis, n_process):
+        processor = JsonLinesDataProcessor(n_process=n_process)
+        records = [[{"user": {"name": "John", "email": "john@example.com"}}]]
+        result = list(processor.operate(records, json_lines_analysis, operators))
+        assert result == [
+            [{"user": {"name": "PERSON_REPLACEMENT", "email": "DEFAULT_REPLACEMENT"}}]
+        ]
+
+    def test_process_no_default_should_raise(
+        self, sample_json_lines, operators_no_default, json_lines_analysis
+    ):
+        processor = JsonLinesDataProcessor(n_process=2)
+        with pytest.raises(ValueError):
+            processor.operate(
+                sample_json_lines, json_lines_analysis, operators_no_default
+            )
+
+    def test_process_invalid_data(self, sample_json, json_lines_analysis, operators):
+        processor = JsonLinesDataProcessor()
+        with pytest.raises(ValueError):
+            processor.operate(sample_json, json_lines_analysis, operators)
+
+    def test_invalid_batch_size_raises(self):
+        with pytest.raises(ValueError):
+            JsonLinesDataProcessor(batch_size=0)
@@ -5,7 +5,11 @@ import pytest
 
 from presidio_analyzer import AnalyzerEngine
 
-from presidio_structured import JsonAnalysisBuilder, PandasAnalysisBuilder
+from presidio_structured import (
+    JsonAnalysisBuilder,
+    JsonLinesAnalysisBuilder,
+    PandasAnalysisBuilder,
+)
 
 # NOTE: we won't go into depth unit-testing all analyzers, as that is covered in the presidio-analyzer tests
 
@@ -153,3 +157,35 @@ def test_analysis_json_when_default_threshold_is_high_then_only_email_passes(
     structured_analysis = json_analysis_builder.generate_analysis(sample_json)
 
     assert len(structured_analysis.entity_mapping) == 1
+
+
+def test_generate_analysis_json_lines(json_lines_analysis_builder, sample_json_lines):
+    structured_analysis = json_lines_analysis_builder.generate_analysis(
+        iter(sample_json_lines)
+    )
+
+    assert structured_analysis.entity_mapping["user.name"] == "PERSON"
+    assert "id" not in structured_analysis.entity_mapping
+
+
+def test_generate_analysis_json_lines_with_list_of_objects(json_lines_analysis_builder, sample_json_with_array):
+    structured_analysis = json_lines_analysis_builder.generate_analysis(
+        [sample_json_with_array]
+    )
+
+    assert structured_analysis.entity_mapping["users.name"] == "PERSON"
+
+
+def test_generate_analysis_json_lines_with_invalid_sampling(json_lines_analysis_builder, sample_json_lines):
+    with pytest.raises(ValueError):
+        json_lines_analysis_builder.generate_analysis(sample_json_lines, n=0)
+
+
+def test_collect_key_values_json_lines_groups_values_by_key_path(sample_json_lines):
+    key_values_map = JsonLinesAnalysisBuilder._collect_key_values(
+        sample_json_lines + [{"user": {"name": "", "tags": ["a", "b"]}}]
+    )
+
+    assert key_values_map["id"] == [1, 2, 3]
+    assert key_values_map["user.name"] == ["John Doe", "Jane Smith", "Alice Johnson"]
+    assert "user.tags" not in key_values_map